@@ -14,6 +14,7 @@ Requirements: 1.1, 1.4, 4.1 구현
 """
 
 import os
+import bisect
 import json
 import time
 import threading
@@ -93,9 +94,19 @@ class IntegratedDeploymentSystem:
         self.log_file = os.path.join(self.script_dir, "integrated_deployment.log")
         
         # 배포 세션 관리
+        # - sessions_file: 압축된 스냅샷 (세션 ID → 최신 상태)
+        # - session_log_file: 스냅샷 이후 저장 기록 (추가 전용, 한 줄에 세션 하나)
         self.sessions_file = os.path.join(self.script_dir, "deployment_sessions.json")
+        self.session_log_file = os.path.join(self.script_dir, "deployment_sessions.jsonl")
+        self.session_compaction_threshold = 200  # 로그가 이 줄 수에 도달하면 스냅샷으로 압축
         self.current_session: Optional[DeploymentSession] = None
-        self.session_lock = threading.Lock()
+        self.session_lock = threading.RLock()
+        
+        # 세션 인덱스 (첫 사용 시 로드, 이후 메모리에서 조회)
+        self._sessions: Dict[str, Dict] = {}
+        self._session_order: List[tuple] = []  # (start_time, session_id) 오름차순
+        self._session_log_entries = 0
+        self._sessions_loaded = False
         
         # GUI 콜백 함수들
         self.progress_callbacks: List[Callable] = []
@@ -165,13 +176,58 @@ class IntegratedDeploymentSystem:
             except Exception as e:
                 self.log_message(f"❌ 오류 콜백 오류: {e}")
     
+    def _ensure_sessions_loaded(self):
+        """
+        세션 인덱스 초기 로드 (프로세스당 한 번)
+        
+        압축된 스냅샷(deployment_sessions.json)을 읽은 뒤 추가 전용 로그(.jsonl)를 순서대로 재생
+        """
+        with self.session_lock:
+            if self._sessions_loaded:
+                return
+            
+            sessions: Dict[str, Dict] = {}
+            try:
+                if os.path.exists(self.sessions_file):
+                    with open(self.sessions_file, 'r', encoding='utf-8') as f:
+                        sessions.update(json.load(f))
+            except Exception as e:
+                self.log_message(f"❌ 세션 로드 실패: {e}")
+            
+            log_entries = 0
+            try:
+                if os.path.exists(self.session_log_file):
+                    with open(self.session_log_file, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            try:
+                                session_dict = json.loads(line)
+                            except ValueError:
+                                # 쓰는 도중 중단된 마지막 줄 등은 건너뜀
+                                continue
+                            sessions[session_dict['session_id']] = session_dict
+                            log_entries += 1
+            except Exception as e:
+                self.log_message(f"❌ 세션 로그 로드 실패: {e}")
+            
+            self._sessions = {}
+            self._session_order = []
+            for session_dict in sessions.values():
+                self._index_session(session_dict)
+            self._session_log_entries = log_entries
+            self._sessions_loaded = True
+    
+    def _index_session(self, session_dict: Dict):
+        """세션 인덱스 갱신 (처음 보는 세션은 시작 시간 순서 목록에 삽입)"""
+        session_id = session_dict['session_id']
+        if session_id not in self._sessions:
+            bisect.insort(self._session_order, (session_dict.get('start_time') or '', session_id))
+        self._sessions[session_id] = session_dict
+    
     def save_session(self, session: DeploymentSession):
-        """배포 세션 저장"""
+        """배포 세션 저장 (로그에 한 줄 추가, 주기적으로 스냅샷 압축)"""
         try:
+            self._ensure_sessions_loaded()
             with self.session_lock:
-                # 기존 세션들 로드
-                sessions = self.load_all_sessions()
-                
                 # 현재 세션을 JSON 직렬화 가능한 형태로 변환
                 session_dict = asdict(session)
                 
@@ -180,58 +236,82 @@ class IntegratedDeploymentSystem:
                 for step_dict in session_dict['steps']:
                     step_dict['status'] = step_dict['status'].value
                 
-                sessions[session.session_id] = session_dict
+                # 로그에 추가 (마지막 기록이 세션의 최신 상태)
+                with open(self.session_log_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(session_dict, ensure_ascii=False) + '\n')
+                
+                self._index_session(session_dict)
+                self._session_log_entries += 1
                 
-                # 파일에 저장
-                with open(self.sessions_file, 'w', encoding='utf-8') as f:
-                    json.dump(sessions, f, ensure_ascii=False, indent=2)
+                if self._session_log_entries >= self.session_compaction_threshold:
+                    self._compact_sessions()
                     
         except Exception as e:
             self.log_message(f"❌ 세션 저장 실패: {e}")
     
-    def load_all_sessions(self) -> Dict[str, Dict]:
-        """모든 배포 세션 로드"""
+    def _compact_sessions(self):
+        """최신 상태만 스냅샷 파일에 쓰고 로그 비우기 (session_lock 안에서 호출)"""
+        temp_file = self.sessions_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._sessions, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, self.sessions_file)
+        
+        # 스냅샷 교체 후 로그 비우기 (그 사이 중단되면 재생해도 같은 최신 상태)
+        open(self.session_log_file, 'w', encoding='utf-8').close()
+        self._session_log_entries = 0
+    
+    def compact_sessions(self):
+        """세션 로그 즉시 압축"""
         try:
-            if os.path.exists(self.sessions_file):
-                with open(self.sessions_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            self._ensure_sessions_loaded()
+            with self.session_lock:
+                self._compact_sessions()
         except Exception as e:
-            self.log_message(f"❌ 세션 로드 실패: {e}")
-        
-        return {}
+            self.log_message(f"❌ 세션 압축 실패: {e}")
+    
+    def load_all_sessions(self) -> Dict[str, Dict]:
+        """모든 배포 세션 로드"""
+        self._ensure_sessions_loaded()
+        with self.session_lock:
+            return dict(self._sessions)
     
     def get_session_by_id(self, session_id: str) -> Optional[DeploymentSession]:
         """세션 ID로 배포 세션 조회"""
         try:
-            sessions = self.load_all_sessions()
-            if session_id in sessions:
-                session_data = sessions[session_id]
-                # DeploymentStep 객체들 복원
-                steps = []
-                for step_data in session_data.get('steps', []):
-                    step = DeploymentStep(**step_data)
-                    step.status = DeploymentStatus(step.status)
-                    steps.append(step)
-                
-                session = DeploymentSession(
-                    session_id=session_data['session_id'],
-                    start_time=session_data['start_time'],
-                    end_time=session_data.get('end_time'),
-                    status=DeploymentStatus(session_data['status']),
-                    steps=steps,
-                    total_progress=session_data.get('total_progress', 0),
-                    success_count=session_data.get('success_count', 0),
-                    failure_count=session_data.get('failure_count', 0),
-                    rollback_available=session_data.get('rollback_available', False),
-                    rollback_data=session_data.get('rollback_data'),
-                    error_message=session_data.get('error_message')
-                )
-                return session
+            self._ensure_sessions_loaded()
+            with self.session_lock:
+                session_data = self._sessions.get(session_id)
+            if session_data is not None:
+                return self._session_from_dict(session_data)
         except Exception as e:
             self.log_message(f"❌ 세션 조회 실패: {e}")
         
         return None
     
+    def _session_from_dict(self, session_data: Dict) -> DeploymentSession:
+        """저장된 세션 딕셔너리를 DeploymentSession으로 복원"""
+        # DeploymentStep 객체들 복원
+        steps = []
+        for step_data in session_data.get('steps', []):
+            step = DeploymentStep(**step_data)
+            step.status = DeploymentStatus(step.status)
+            step.details = dict(step.details or {})
+            steps.append(step)
+        
+        return DeploymentSession(
+            session_id=session_data['session_id'],
+            start_time=session_data['start_time'],
+            end_time=session_data.get('end_time'),
+            status=DeploymentStatus(session_data['status']),
+            steps=steps,
+            total_progress=session_data.get('total_progress', 0),
+            success_count=session_data.get('success_count', 0),
+            failure_count=session_data.get('failure_count', 0),
+            rollback_available=session_data.get('rollback_available', False),
+            rollback_data=dict(session_data['rollback_data']) if session_data.get('rollback_data') else None,
+            error_message=session_data.get('error_message')
+        )
+    
     def create_deployment_session(self) -> DeploymentSession:
         """새 배포 세션 생성"""
         session_id = f"deploy_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -777,23 +857,15 @@ class IntegratedDeploymentSystem:
     def get_deployment_history(self, limit: int = 10) -> List[DeploymentSession]:
         """배포 히스토리 조회"""
         try:
-            sessions = self.load_all_sessions()
+            self._ensure_sessions_loaded()
             
-            # 시간순 정렬 (최신순)
-            sorted_sessions = sorted(
-                sessions.values(),
-                key=lambda x: x['start_time'],
-                reverse=True
-            )
+            # 시작 시간 순서 목록의 끝에서 limit개 (최신순)
+            with self.session_lock:
+                latest = self._session_order[-limit:] if limit > 0 else []
+                recent = [self._sessions[session_id] for _, session_id in reversed(latest)]
             
             # DeploymentSession 객체로 변환
-            history = []
-            for session_data in sorted_sessions[:limit]:
-                session = self.get_session_by_id(session_data['session_id'])
-                if session:
-                    history.append(session)
-            
-            return history
+            return [self._session_from_dict(session_data) for session_data in recent]
             
         except Exception as e:
             self.log_message(f"❌ 배포 히스토리 조회 실패: {e}")
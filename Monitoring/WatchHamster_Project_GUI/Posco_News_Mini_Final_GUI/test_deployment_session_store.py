@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+배포 세션 저장소 테스트
+추가 전용 세션 로그, 메모리 인덱스 조회, 스냅샷 압축 검증
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# 현재 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import integrated_deployment_system
+from integrated_deployment_system import DeploymentStatus, IntegratedDeploymentSystem
+
+
+class _QuietDeploymentSystem(IntegratedDeploymentSystem):
+    """로그 파일을 남기지 않는 테스트용 배포 시스템"""
+
+    def log_message(self, message: str):
+        pass
+
+
+def _log_to_dir(log_dir: str, original):
+    """첫 로그 기록 때 관리자의 로그 파일을 log_dir 아래로 옮기는 log_message"""
+    def log_message(manager, message: str):
+        manager.log_file = os.path.join(log_dir, os.path.basename(manager.log_file))
+        original(manager, message)
+    return log_message
+
+
+class DeploymentSessionStoreTest(unittest.TestCase):
+    """세션 저장소 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="deployment_sessions_test_")
+        self.system = self.create_system()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def create_system(self) -> IntegratedDeploymentSystem:
+        # 하위 관리자(Git 배포, POSCO 알림)는 생성 중에도 로그를 쓰므로 생성 전에 임시 디렉토리로 돌림
+        managers = (integrated_deployment_system.GitDeploymentManager,
+                    integrated_deployment_system.PoscoMainNotifier)
+        with mock.patch.object(managers[0], 'log_message', _log_to_dir(self.temp_dir, managers[0].log_message)), \
+                mock.patch.object(managers[1], 'log_message', _log_to_dir(self.temp_dir, managers[1].log_message)):
+            system = _QuietDeploymentSystem(self.temp_dir)
+        system.sessions_file = os.path.join(self.temp_dir, "deployment_sessions.json")
+        system.session_log_file = os.path.join(self.temp_dir, "deployment_sessions.jsonl")
+        return system
+
+    def test_updates_append_and_latest_wins(self):
+        """단계 갱신마다 한 줄 추가, 조회는 마지막 상태"""
+        session = self.system.create_deployment_session()
+        self.system.update_step_status(session, "pre_check", DeploymentStatus.RUNNING, 10)
+        self.system.update_step_status(session, "pre_check", DeploymentStatus.SUCCESS, 100)
+
+        with open(self.system.session_log_file, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 2)
+        self.assertFalse(os.path.exists(self.system.sessions_file))
+
+        # 새 프로세스처럼 로그를 재생해도 같은 최신 상태
+        loaded = self.create_system().get_session_by_id(session.session_id)
+        self.assertEqual(loaded.steps[0].status, DeploymentStatus.SUCCESS)
+        self.assertEqual(loaded.success_count, 1)
+
+    def test_compaction_and_history(self):
+        """임계값에서 스냅샷으로 압축, 히스토리는 최신순"""
+        self.system.session_compaction_threshold = 5
+        sessions = []
+        for index in range(3):
+            session = self.system.create_deployment_session()
+            session.session_id = f"deploy_{index}"
+            session.start_time = f"2025-01-0{index + 1}T00:00:00"
+            sessions.append(session)
+            self.system.save_session(session)
+            self.system.save_session(session)
+
+        with open(self.system.sessions_file, encoding='utf-8') as f:
+            self.assertEqual(set(json.load(f)), {"deploy_0", "deploy_1", "deploy_2"})
+        with open(self.system.session_log_file, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+        reloaded = self.create_system()
+        history = reloaded.get_deployment_history(limit=2)
+        self.assertEqual([s.session_id for s in history], ["deploy_2", "deploy_1"])
+        self.assertEqual(reloaded.get_deployment_statistics()['total_deployments'], 3)
+
+    def test_truncated_log_line_skipped(self):
+        """쓰는 도중 중단된 마지막 줄은 무시"""
+        session = self.system.create_deployment_session()
+        self.system.save_session(session)
+        with open(self.system.session_log_file, 'a', encoding='utf-8') as f:
+            f.write('{"session_id": "broken"')
+
+        reloaded = self.create_system()
+        self.assertIsNotNone(reloaded.get_session_by_id(session.session_id))
+        self.assertIsNone(reloaded.get_session_by_id("broken"))
+
+    def test_manager_logs_stay_in_temp_dir(self):
+        """하위 관리자 로그는 추적되는 로그 파일이 아닌 임시 디렉토리에 기록"""
+        managers = (self.system.git_manager, self.system.posco_notifier, self.system.posco_notifier.git_manager)
+        for manager in managers:
+            self.assertEqual(os.path.dirname(manager.log_file), self.temp_dir)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "git_deployment.log")))
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "posco_deployment.log")))
+
+
+if __name__ == "__main__":
+    unittest.main()
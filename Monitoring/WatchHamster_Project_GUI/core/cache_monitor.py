@@ -9,6 +9,7 @@ kospi, exchange 데이터를 data/ 폴더에서 캐시 관리
 - ⚠️ 데이터 부족 시 GUI 경고 알림 및 자동 전송
 - 📅 과거 데이터 사용 시 GUI에서 명시적 표시
 - 🔄 캐시 데이터 자동 갱신 및 품질 관리
+- 👀 변경 감지 기반 분석 (파일 감시 또는 stat 폴링, (mtime, size)가 바뀔 때만 JSON 파싱)
 
 Requirements: 5.3 구현
 """
@@ -25,6 +26,16 @@ import tkinter as tk
 from tkinter import messagebox
 import logging
 
+# 파일 감시 (선택 의존성 - 없으면 stat 폴링으로 변경 감지)
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    WATCHDOG_AVAILABLE = False
+
 
 class CacheStatus(Enum):
     """캐시 상태"""
@@ -68,6 +79,42 @@ class CacheAlert:
     auto_action: Optional[str] = None
 
 
+@dataclass
+class CacheFileSnapshot:
+    """캐시 파일 파싱 결과 (같은 파일을 쓰는 데이터 타입이 공유)"""
+    file_path: str
+    signature: Optional[Tuple[int, int]]  # (mtime_ns, size), 파일이 없으면 None
+    size_bytes: int
+    data: Optional[Dict] = None
+    error: Optional[str] = None  # 'missing', 'empty', 'decode' 또는 오류 메시지
+
+
+@dataclass
+class CacheRecord:
+    """데이터 타입별 파싱 결과 (나이/상태는 평가 시점에 계산)"""
+    data_type: DataType
+    file_path: str
+    size_bytes: int
+    last_updated: Optional[datetime] = None
+    quality_score: float = 0.0
+    confidence: float = 0.0
+    error_message: Optional[str] = None  # 있으면 파싱 단계에서 이미 상태 결정
+
+
+class _CacheFileEventHandler(FileSystemEventHandler):
+    """감시 대상 캐시 파일 변경 시 모니터 깨우기"""
+    
+    def __init__(self, file_paths, on_change: Callable[[], None]):
+        super().__init__()
+        self.file_paths = {os.path.abspath(path) for path in file_paths}
+        self.on_change = on_change
+    
+    def on_any_event(self, event):
+        paths = [getattr(event, 'src_path', None), getattr(event, 'dest_path', None)]
+        if any(path and os.path.abspath(path) in self.file_paths for path in paths):
+            self.on_change()
+
+
 class CacheMonitor:
     """캐시 데이터 모니터링 시스템"""
     
@@ -90,7 +137,8 @@ class CacheMonitor:
         
         # 모니터링 설정
         self.monitoring_config = {
-            'check_interval_seconds': 30,      # 30초마다 체크
+            'check_interval_seconds': 30,      # 30초마다 나이/상태 재평가 (파일 I/O 없음)
+            'poll_interval_seconds': 2,        # 파일 감시를 못 쓸 때 stat 폴링 간격
             'fresh_threshold_minutes': 5,      # 5분 이내는 신선
             'stale_threshold_minutes': 15,     # 15분 이내는 오래됨
             'expired_threshold_minutes': 60,   # 60분 이후는 만료
@@ -107,6 +155,14 @@ class CacheMonitor:
         self.alert_history = []
         self.last_check_time = None
         
+        # 변경 감지 상태
+        self._file_snapshots: Dict[str, CacheFileSnapshot] = {}  # 파일 경로 → 파싱 결과
+        self._records: Dict[DataType, CacheRecord] = {}  # 데이터 타입 → 파싱 결과
+        self._state_lock = threading.RLock()
+        self._wake_event = threading.Event()
+        self._observer = None
+        self.parse_count = 0  # 실제 JSON 파싱 횟수
+        
         # 로깅 설정
         self.setup_logging()
         
@@ -140,6 +196,7 @@ class CacheMonitor:
             return
         
         self.monitoring_active = True
+        self._start_file_watch()
         self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self.monitoring_thread.start()
         
@@ -149,148 +206,223 @@ class CacheMonitor:
     def stop_monitoring(self):
         """모니터링 중지"""
         self.monitoring_active = False
+        self._wake_event.set()
+        self._stop_file_watch()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5)
         
         self.logger.info("⏹️ 캐시 모니터링 중지")
         print("⏹️ 캐시 모니터링 중지")
     
+    def _start_file_watch(self):
+        """캐시 파일 감시 시작 (watchdog이 없으면 루프의 stat 폴링 사용)"""
+        if not WATCHDOG_AVAILABLE:
+            self.logger.info(f"파일 감시 없음 - {self.monitoring_config['poll_interval_seconds']}초 stat 폴링 사용")
+            return
+        
+        try:
+            watched_files = set(self.cache_files.values())
+            handler = _CacheFileEventHandler(watched_files, self._wake_event.set)
+            self._observer = Observer()
+            for directory in {os.path.dirname(os.path.abspath(path)) for path in watched_files}:
+                self._observer.schedule(handler, directory, recursive=False)
+            self._observer.daemon = True
+            self._observer.start()
+            self.logger.info("캐시 파일 감시 시작")
+        except Exception as e:
+            self.logger.warning(f"캐시 파일 감시 시작 실패, stat 폴링 사용: {e}")
+            self._observer = None
+    
+    def _stop_file_watch(self):
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=5)
+            except Exception as e:
+                self.logger.error(f"캐시 파일 감시 중지 오류: {e}")
+            self._observer = None
+    
     def _monitoring_loop(self):
-        """모니터링 루프"""
+        """
+        모니터링 루프
+        
+        - 파일 변경 (감시 이벤트 또는 stat 폴링에서 (mtime, size) 변화) 시에만 다시 파싱
+        - check_interval마다 파싱 결과로 나이/상태만 재평가
+        """
+        last_evaluation = 0.0
         while self.monitoring_active:
             try:
-                self.check_cache_status()
-                time.sleep(self.monitoring_config['check_interval_seconds'])
+                # 감시 중이면 폴링 간격은 안전망 (이벤트 누락 대비)
+                poll_interval = self.monitoring_config['poll_interval_seconds']
+                if self._observer is not None:
+                    poll_interval = max(poll_interval, self.monitoring_config['check_interval_seconds'])
+                
+                self._wake_event.wait(poll_interval)
+                self._wake_event.clear()
+                if not self.monitoring_active:
+                    break
+                
+                changed = self._reload_changed_files()
+                if changed or time.monotonic() - last_evaluation >= self.monitoring_config['check_interval_seconds']:
+                    self._evaluate_status()
+                    last_evaluation = time.monotonic()
             except Exception as e:
                 self.logger.error(f"모니터링 루프 오류: {e}")
                 time.sleep(10)  # 오류 시 10초 대기
     
     def check_cache_status(self) -> Dict[DataType, CacheInfo]:
-        """캐시 상태 확인"""
-        self.last_check_time = datetime.now()
-        current_status = {}
-        
-        for data_type in DataType:
-            cache_info = self._analyze_cache_file(data_type)
-            current_status[data_type] = cache_info
+        """캐시 상태 확인 (바뀐 파일만 다시 파싱)"""
+        self._reload_changed_files()
+        return self._evaluate_status()
+    
+    def _reload_changed_files(self) -> bool:
+        """
+        (mtime, size)가 바뀐 캐시 파일만 다시 파싱해 데이터 타입별 파싱 결과 갱신
+        
+        Returns:
+            bool: 바뀐 파일이 있었는지
+        """
+        changed = False
+        with self._state_lock:
+            for file_path in set(self.cache_files.values()):
+                previous = self._file_snapshots.get(file_path)
+                signature = self._file_signature(file_path)
+                if previous is not None and previous.signature == signature:
+                    continue
+                self._file_snapshots[file_path] = self._parse_cache_file(file_path, signature)
+                changed = True
             
-            # 상태 변화 감지 및 알림
-            self._check_status_changes(data_type, cache_info)
-        
-        self.cache_status = current_status
-        return current_status
+            if changed or not self._records:
+                for data_type in DataType:
+                    self._records[data_type] = self._build_record(data_type)
+        return changed
     
-    def _analyze_cache_file(self, data_type: DataType) -> CacheInfo:
-        """개별 캐시 파일 분석"""
-        file_path = self.cache_files[data_type]
+    @staticmethod
+    def _file_signature(file_path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(file_path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def _parse_cache_file(self, file_path: str, signature: Optional[Tuple[int, int]]) -> CacheFileSnapshot:
+        """캐시 파일 파싱 (파일당 한 번, 데이터 타입이 결과 공유)"""
+        if signature is None:
+            return CacheFileSnapshot(file_path, None, 0, error='missing')
         
-        # 파일 존재 여부 확인
-        if not os.path.exists(file_path):
-            return CacheInfo(
-                data_type=data_type,
-                status=CacheStatus.MISSING,
-                last_updated=None,
-                age_minutes=float('inf'),
-                quality_score=0.0,
-                confidence=0.0,
-                size_bytes=0,
-                file_path=file_path,
-                warning_message="캐시 파일이 존재하지 않습니다"
-            )
+        file_size = signature[1]
+        if file_size == 0:
+            return CacheFileSnapshot(file_path, signature, 0, error='empty')
         
         try:
-            # 파일 크기 확인
-            file_size = os.path.getsize(file_path)
-            if file_size == 0:
-                return CacheInfo(
-                    data_type=data_type,
-                    status=CacheStatus.CORRUPTED,
-                    last_updated=None,
-                    age_minutes=float('inf'),
-                    quality_score=0.0,
-                    confidence=0.0,
-                    size_bytes=0,
-                    file_path=file_path,
-                    warning_message="캐시 파일이 비어있습니다"
-                )
-            
-            # JSON 파일 로드 및 분석
             with open(file_path, 'r', encoding='utf-8') as f:
                 cache_data = json.load(f)
-            
+            self.parse_count += 1
+            return CacheFileSnapshot(file_path, signature, file_size, data=cache_data)
+        except json.JSONDecodeError:
+            return CacheFileSnapshot(file_path, signature, file_size, error='decode')
+        except Exception as e:
+            return CacheFileSnapshot(file_path, signature, 0, error=f"파일 분석 오류: {str(e)}")
+    
+    def _build_record(self, data_type: DataType) -> CacheRecord:
+        """공유 파싱 결과에서 데이터 타입 정보 추출"""
+        file_path = self.cache_files[data_type]
+        snapshot = self._file_snapshots.get(file_path)
+        if snapshot is None:
+            snapshot = CacheFileSnapshot(file_path, None, 0, error='missing')
+        
+        record = CacheRecord(data_type=data_type, file_path=file_path, size_bytes=snapshot.size_bytes)
+        
+        if snapshot.error == 'missing':
+            record.error_message = "캐시 파일이 존재하지 않습니다"
+        elif snapshot.error == 'empty':
+            record.error_message = "캐시 파일이 비어있습니다"
+        elif snapshot.error == 'decode':
+            record.error_message = "JSON 파일이 손상되었습니다"
+        elif snapshot.error:
+            record.error_message = snapshot.error
+        else:
             # 데이터 타입별 정보 추출
-            data_info = self._extract_data_info(cache_data, data_type)
-            
+            data_info = self._extract_data_info(snapshot.data, data_type)
             if not data_info:
-                return CacheInfo(
-                    data_type=data_type,
-                    status=CacheStatus.CORRUPTED,
-                    last_updated=None,
-                    age_minutes=float('inf'),
-                    quality_score=0.0,
-                    confidence=0.0,
-                    size_bytes=file_size,
-                    file_path=file_path,
-                    warning_message=f"{data_type.value} 데이터를 찾을 수 없습니다"
-                )
+                record.error_message = f"{data_type.value} 데이터를 찾을 수 없습니다"
+                return record
             
             # 타임스탬프 분석
-            last_updated = None
-            age_minutes = float('inf')
-            
             if 'timestamp' in data_info:
                 try:
-                    last_updated = datetime.fromisoformat(data_info['timestamp'])
-                    age_minutes = (datetime.now() - last_updated).total_seconds() / 60
+                    record.last_updated = datetime.fromisoformat(data_info['timestamp'])
                 except:
                     pass
             
             # 품질 및 신뢰도 추출
-            quality_score = data_info.get('quality_score', 0.0)
-            confidence = data_info.get('confidence', 0.0)
-            
-            # 상태 결정
-            status = self._determine_cache_status(age_minutes, quality_score, confidence)
+            record.quality_score = data_info.get('quality_score', 0.0)
+            record.confidence = data_info.get('confidence', 0.0)
+        
+        return record
+    
+    def _evaluate_status(self) -> Dict[DataType, CacheInfo]:
+        """파싱 결과로 나이/상태 재평가 후 변화 알림 (파일 I/O 없음)"""
+        with self._state_lock:
+            if not self._records:
+                self._reload_changed_files()
             
-            # 경고 메시지 생성
-            warning_message = self._generate_warning_message(status, age_minutes, quality_score, confidence)
+            self.last_check_time = datetime.now()
+            current_status = {}
             
-            return CacheInfo(
-                data_type=data_type,
-                status=status,
-                last_updated=last_updated,
-                age_minutes=age_minutes,
-                quality_score=quality_score,
-                confidence=confidence,
-                size_bytes=file_size,
-                file_path=file_path,
-                warning_message=warning_message
-            )
+            for data_type in DataType:
+                cache_info = self._record_to_info(self._records[data_type], self.last_check_time)
+                current_status[data_type] = cache_info
+                
+                # 상태 변화 감지 및 알림
+                self._check_status_changes(data_type, cache_info)
             
-        except json.JSONDecodeError:
-            return CacheInfo(
-                data_type=data_type,
-                status=CacheStatus.CORRUPTED,
-                last_updated=None,
-                age_minutes=float('inf'),
-                quality_score=0.0,
-                confidence=0.0,
-                size_bytes=file_size,
-                file_path=file_path,
-                warning_message="JSON 파일이 손상되었습니다"
-            )
-        except Exception as e:
+            self.cache_status = current_status
+            return current_status
+    
+    def _record_to_info(self, record: CacheRecord, now: datetime) -> CacheInfo:
+        """파싱 결과 + 현재 시각 → 캐시 정보"""
+        if record.error_message:
+            missing = record.error_message == "캐시 파일이 존재하지 않습니다"
             return CacheInfo(
-                data_type=data_type,
-                status=CacheStatus.CORRUPTED,
+                data_type=record.data_type,
+                status=CacheStatus.MISSING if missing else CacheStatus.CORRUPTED,
                 last_updated=None,
                 age_minutes=float('inf'),
                 quality_score=0.0,
                 confidence=0.0,
-                size_bytes=0,
-                file_path=file_path,
-                warning_message=f"파일 분석 오류: {str(e)}"
+                size_bytes=record.size_bytes,
+                file_path=record.file_path,
+                warning_message=record.error_message
             )
+        
+        age_minutes = float('inf')
+        if record.last_updated is not None:
+            age_minutes = (now - record.last_updated).total_seconds() / 60
+        
+        # 상태 결정
+        status = self._determine_cache_status(age_minutes, record.quality_score, record.confidence)
+        
+        # 경고 메시지 생성
+        warning_message = self._generate_warning_message(status, age_minutes, record.quality_score, record.confidence)
+        
+        return CacheInfo(
+            data_type=record.data_type,
+            status=status,
+            last_updated=record.last_updated,
+            age_minutes=age_minutes,
+            quality_score=record.quality_score,
+            confidence=record.confidence,
+            size_bytes=record.size_bytes,
+            file_path=record.file_path,
+            warning_message=warning_message
+        )
+    
+    def _analyze_cache_file(self, data_type: DataType) -> CacheInfo:
+        """개별 캐시 파일 분석 (바뀐 경우에만 파싱)"""
+        self._reload_changed_files()
+        with self._state_lock:
+            return self._record_to_info(self._records[data_type], datetime.now())
     
     def _extract_data_info(self, cache_data: Dict, data_type: DataType) -> Optional[Dict]:
         """캐시 데이터에서 특정 데이터 타입 정보 추출"""
@@ -9,6 +9,7 @@ Performance Optimizer - GUI 성능 최적화 시스템
 - 📊 대용량 로그 표시 성능 최적화
 - ⚡ 실시간 모니터링 데이터 업데이트 최적화
 - 🔄 백그라운드 작업 스케줄링
+- 💾 LRU/TTL 데이터 캐시 (직렬화 크기 기반 용량 제한, 네임스페이스별 TTL)
 
 Requirements: 6.4, 5.1, 5.2 구현
 """
@@ -19,9 +20,11 @@ import time
 import sys
 import os
 import gc
+import pickle
 import psutil
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Hashable
 import os
 import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -29,6 +32,204 @@ import weakref
 import gc
 
 
+# 네임스페이스별 캐시 유효 시간 (초)
+DEFAULT_CACHE_TTLS = {
+    'log_tail': 5,      # 로그 끝부분 (파일 변경 시 버전으로도 무효화)
+    'log_chunk': 30,    # 로그 청크
+    'json': 300,        # JSON 파일 (파일 변경 시 버전으로도 무효화)
+    'api': 60,          # API 응답 데이터
+    'default': 30,
+}
+
+
+class CacheEntry:
+    """캐시 항목"""
+    
+    __slots__ = ('value', 'size', 'namespace', 'expires_at', 'version')
+    
+    def __init__(self, value: Any, size: int, namespace: str, expires_at: float, version: Optional[Hashable]):
+        self.value = value
+        self.size = size
+        self.namespace = namespace
+        self.expires_at = expires_at
+        self.version = version
+
+
+class LRUCache:
+    """
+    LRU + TTL 캐시 (스레드 안전)
+    
+    - OrderedDict로 O(1) 조회/갱신/제거
+    - 용량은 항목의 직렬화 크기 합으로 제한 (중첩 데이터 포함)
+    - 네임스페이스별 TTL, 버전(파일 mtime 등)이 다르면 무효
+    """
+    
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: int = 1000,
+                 namespace_ttls: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            max_bytes: 전체 용량 한도 (직렬화 바이트)
+            max_entries: 최대 항목 수
+            namespace_ttls: 네임스페이스별 유효 시간 (초)
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_bytes // 4  # 이보다 큰 항목은 캐시하지 않음
+        self.namespace_ttls = dict(DEFAULT_CACHE_TTLS)
+        if namespace_ttls:
+            self.namespace_ttls.update(namespace_ttls)
+        
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        
+        # 메트릭
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.rejected = 0
+        self.namespace_stats: Dict[str, Dict[str, int]] = {}
+    
+    @staticmethod
+    def measure_size(value: Any) -> int:
+        """직렬화 크기 (pickle 불가 객체는 JSON, 그마저 안 되면 getsizeof)"""
+        try:
+            return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            try:
+                return len(json.dumps(value, default=str, ensure_ascii=False).encode('utf-8'))
+            except Exception:
+                return sys.getsizeof(value)
+    
+    def _count(self, namespace: str, field: str):
+        stats = self.namespace_stats.get(namespace)
+        if stats is None:
+            stats = self.namespace_stats[namespace] = {'hits': 0, 'misses': 0}
+        stats[field] += 1
+    
+    def get(self, key: str, version: Optional[Hashable] = None,
+            namespace: Optional[str] = None) -> Optional[Any]:
+        """
+        캐시 조회
+        
+        Args:
+            key: 캐시 키
+            version: 기대 버전 (저장 시 버전과 다르면 무효)
+            namespace: 통계 네임스페이스 (항목이 없을 때의 미스도 이 단위로 집계,
+                None이면 저장된 항목의 네임스페이스 또는 'default')
+        
+        Returns:
+            Optional[Any]: 캐시 값 (없거나 만료되면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                self._count(namespace or 'default', 'misses')
+                return None
+            
+            namespace = namespace or entry.namespace
+            if entry.expires_at <= time.monotonic() or (version is not None and entry.version != version):
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                self._count(namespace, 'misses')
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._count(namespace, 'hits')
+            return entry.value
+    
+    def set(self, key: str, value: Any, namespace: str = 'default',
+            ttl: Optional[float] = None, version: Optional[Hashable] = None) -> bool:
+        """
+        캐시 저장 (용량 초과 시 가장 오래 사용하지 않은 항목부터 제거)
+        
+        Args:
+            key: 캐시 키
+            value: 값
+            namespace: 네임스페이스 (TTL 및 통계 단위)
+            ttl: 유효 시간 (None이면 네임스페이스 기본값)
+            version: 버전 (파일 mtime 등)
+        
+        Returns:
+            bool: 저장 여부 (단일 항목이 너무 크면 False)
+        """
+        size = self.measure_size(value)
+        if ttl is None:
+            ttl = self.namespace_ttls.get(namespace, self.namespace_ttls['default'])
+        
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            
+            if size > self.max_entry_bytes:
+                self.rejected += 1
+                return False
+            
+            self._entries[key] = CacheEntry(value, size, namespace, time.monotonic() + ttl, version)
+            self.total_bytes += size
+            
+            while self.total_bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+            return True
+    
+    def delete(self, key: str) -> bool:
+        """항목 제거"""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+    
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+    
+    def purge_expired(self) -> int:
+        """만료 항목 정리 후 정리 수 반환"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+            return len(expired)
+    
+    def clear(self):
+        """전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (상태 대시보드 표시용)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups * 100 if lookups else 0.0,
+                'expirations': self.expirations,
+                'evictions': self.evictions,
+                'rejected': self.rejected,
+                'namespaces': {name: dict(stats) for name, stats in self.namespace_stats.items()},
+            }
+
+
 class PerformanceOptimizer:
     """GUI 성능 최적화 관리자"""
     
@@ -55,11 +256,8 @@ class PerformanceOptimizer:
             'thread_count': 0
         }
         
-        # 캐시 관리
-        self.data_cache = {}
-        self.cache_timestamps = {}
-        self.cache_max_age = 30  # 30초
-        self.cache_max_size = 1000
+        # 캐시 관리 (LRU + 네임스페이스별 TTL, 직렬화 크기 기준 용량 제한)
+        self.cache = LRUCache(max_bytes=64 * 1024 * 1024, max_entries=1000)
         
         # 로그 처리 최적화
         self.log_chunk_size = 1000  # 한 번에 처리할 로그 라인 수
@@ -188,11 +386,10 @@ class PerformanceOptimizer:
             print(f"📊 종료 시 시스템 상태 - 메모리: {final_memory:.1f}%, CPU: {final_cpu:.1f}%")
             
             # 캐시 정리
-            cache_size = len(self.data_cache)
+            cache_size = len(self.cache)
             if cache_size > 0:
                 print(f"🧹 캐시 정리: {cache_size}개 항목")
-                self.data_cache.clear()
-                self.cache_timestamps.clear()
+                self.cache.clear()
             
             print("🏁 성능 최적화 시스템 종료됨")
             
@@ -250,47 +447,43 @@ class PerformanceOptimizer:
         except queue.Full:
             print("⚠️ 로그 처리 큐가 가득참")
     
-    def get_cached_data(self, key: str) -> Optional[Any]:
-        """캐시된 데이터 조회 (완전 구현)"""
+    def get_cached_data(self, key: str, version: Optional[Hashable] = None,
+                        namespace: Optional[str] = None) -> Optional[Any]:
+        """
+        캐시된 데이터 조회 (히트/미스는 get_cache_stats()로 집계)
+        
+        Args:
+            key: 캐시 키
+            version: 기대 버전 (파일 mtime 등, 저장 시 버전과 다르면 미스)
+            namespace: 통계 네임스페이스 (저장 시 네임스페이스와 같게 전달해야 미스가 정확히 집계됨)
+        """
         try:
-            if key not in self.data_cache:
-                print(f"🔍 캐시 미스: {key}")
-                return None
-            
-            # 캐시 만료 확인
-            if key in self.cache_timestamps:
-                age = time.time() - self.cache_timestamps[key]
-                if age > self.cache_max_age:
-                    print(f"⏰ 캐시 만료: {key} (나이: {age:.1f}초)")
-                    self._remove_from_cache(key)
-                    return None
-            
-            print(f"✅ 캐시 히트: {key}")
-            return self.data_cache[key]
-            
+            return self.cache.get(key, version, namespace)
         except Exception as e:
             print(f"❌ 캐시 조회 오류: {key} - {e}")
             return None
     
-    def set_cached_data(self, key: str, data: Any):
-        """데이터 캐시 저장 (완전 구현)"""
+    def set_cached_data(self, key: str, data: Any, namespace: str = 'default',
+                        ttl: Optional[float] = None, version: Optional[Hashable] = None) -> bool:
+        """
+        데이터 캐시 저장
+        
+        Args:
+            key: 캐시 키
+            data: 저장할 데이터
+            namespace: 'log_tail', 'log_chunk', 'json', 'api', 'default' (네임스페이스별 TTL)
+            ttl: 유효 시간 (초, None이면 네임스페이스 기본값)
+            version: 버전 (파일 mtime 등)
+        """
         try:
-            # 캐시 크기 제한 확인
-            if len(self.data_cache) >= self.cache_max_size:
-                print(f"🧹 캐시 크기 제한 도달, 정리 실행 (현재: {len(self.data_cache)})")
-                self._cleanup_old_cache_entries()
-            
-            # 데이터 크기 확인 (메모리 효율성)
-            data_size = sys.getsizeof(data)
-            if data_size > 10 * 1024 * 1024:  # 10MB 초과
-                print(f"⚠️ 대용량 데이터 캐시: {key} ({data_size / 1024 / 1024:.1f}MB)")
-            
-            self.data_cache[key] = data
-            self.cache_timestamps[key] = time.time()
-            print(f"💾 캐시 저장: {key}")
-            
+            return self.cache.set(key, data, namespace=namespace, ttl=ttl, version=version)
         except Exception as e:
             print(f"❌ 캐시 저장 오류: {key} - {e}")
+            return False
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """캐시 히트/미스/제거 통계"""
+        return self.cache.get_stats()
     
     def process_large_log_file(self, file_path: str, callback: Callable, 
                               start_line: int = 0, max_lines: int = 10000) -> List[str]:
@@ -301,8 +494,9 @@ class PerformanceOptimizer:
         # 캐시 키 생성
         cache_key = f"log_{file_path}_{start_line}_{max_lines}"
         
-        # 캐시된 데이터 확인
-        cached_result = self.get_cached_data(cache_key)
+        # 캐시된 데이터 확인 (파일이 바뀌면 무효)
+        version = self._file_version(file_path)
+        cached_result = self.get_cached_data(cache_key, version, namespace='log_chunk')
         if cached_result is not None:
             return cached_result
         
@@ -321,7 +515,7 @@ class PerformanceOptimizer:
                     lines.append(line.rstrip('\n\r'))
             
             # 결과 캐시 저장
-            self.set_cached_data(cache_key, lines)
+            self.set_cached_data(cache_key, lines, namespace='log_chunk', version=version)
             
             return lines
             
@@ -336,16 +530,11 @@ class PerformanceOptimizer:
         
         cache_key = f"log_tail_{file_path}_{num_lines}"
         
-        # 파일 수정 시간 확인
-        try:
-            file_mtime = os.path.getmtime(file_path)
-            if cache_key in self.cache_timestamps:
-                if file_mtime <= self.cache_timestamps[cache_key]:
-                    cached_result = self.get_cached_data(cache_key)
-                    if cached_result is not None:
-                        return cached_result
-        except OSError:
-            pass
+        # 파일 수정 시간/크기가 같으면 캐시 사용
+        version = self._file_version(file_path)
+        cached_result = self.get_cached_data(cache_key, version, namespace='log_tail')
+        if cached_result is not None:
+            return cached_result
         
         try:
             lines = []
@@ -386,8 +575,7 @@ class PerformanceOptimizer:
                                 break
                 
                 # 결과 캐시 저장
-                self.set_cached_data(cache_key, lines)
-                self.cache_timestamps[cache_key] = file_mtime
+                self.set_cached_data(cache_key, lines, namespace='log_tail', version=version)
                 
                 return lines
                 
@@ -402,24 +590,18 @@ class PerformanceOptimizer:
         
         cache_key = f"json_{file_path}"
         
-        # 파일 수정 시간 확인
-        try:
-            file_mtime = os.path.getmtime(file_path)
-            if cache_key in self.cache_timestamps:
-                if file_mtime <= self.cache_timestamps[cache_key]:
-                    cached_result = self.get_cached_data(cache_key)
-                    if cached_result is not None:
-                        return cached_result
-        except OSError:
-            pass
+        # 파일 수정 시간/크기가 같으면 캐시 사용
+        version = self._file_version(file_path)
+        cached_result = self.get_cached_data(cache_key, version, namespace='json')
+        if cached_result is not None:
+            return cached_result
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
             # 결과 캐시 저장
-            self.set_cached_data(cache_key, data)
-            self.cache_timestamps[cache_key] = file_mtime
+            self.set_cached_data(cache_key, data, namespace='json', version=version)
             
             return data
             
@@ -427,6 +609,15 @@ class PerformanceOptimizer:
             print(f"❌ JSON 로딩 오류: {e}")
             return None
     
+    @staticmethod
+    def _file_version(file_path: str) -> Optional[tuple]:
+        """파일 캐시 버전 (수정 시간, 크기)"""
+        try:
+            stat = os.stat(file_path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
     def batch_ui_updates(self, updates: List[Callable], delay: float = 0.1):
         """UI 업데이트 배치 처리"""
         def batch_executor():
@@ -493,7 +684,9 @@ class PerformanceOptimizer:
         self.performance_metrics['memory_usage_mb'] = process.memory_info().rss / 1024 / 1024
         self.performance_metrics['thread_count'] = threading.active_count()
         
-        return self.performance_metrics.copy()
+        metrics = self.performance_metrics.copy()
+        metrics['cache'] = self.cache.get_stats()
+        return metrics
     
     def _ui_update_worker(self):
         """UI 업데이트 워커 스레드"""
@@ -617,32 +810,12 @@ class PerformanceOptimizer:
                 print(f"❌ 메모리 정리 오류: {e}")
     
     def _cleanup_old_cache_entries(self):
-        """오래된 캐시 항목 정리"""
-        current_time = time.time()
-        keys_to_remove = []
-        
-        for key, timestamp in self.cache_timestamps.items():
-            if current_time - timestamp > self.cache_max_age:
-                keys_to_remove.append(key)
-        
-        for key in keys_to_remove:
-            self._remove_from_cache(key)
-        
-        # 캐시 크기 제한
-        if len(self.data_cache) > self.cache_max_size:
-            # 가장 오래된 항목들 제거
-            sorted_items = sorted(self.cache_timestamps.items(), key=lambda x: x[1])
-            remove_count = len(self.data_cache) - self.cache_max_size + 100  # 여유분 확보
-            
-            for key, _ in sorted_items[:remove_count]:
-                self._remove_from_cache(key)
+        """만료된 캐시 항목 정리 (용량/개수 한도는 저장 시 LRU로 유지)"""
+        return self.cache.purge_expired()
     
     def _remove_from_cache(self, key: str):
         """캐시에서 항목 제거"""
-        if key in self.data_cache:
-            del self.data_cache[key]
-        if key in self.cache_timestamps:
-            del self.cache_timestamps[key]
+        self.cache.delete(key)
 
 
 # 전역 성능 최적화 인스턴스
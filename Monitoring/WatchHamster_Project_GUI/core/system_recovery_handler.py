@@ -152,6 +152,7 @@ class SystemRecoveryHandler:
             # 임시 세션 파일들 정리
             session_files = [
                 os.path.join(os.path.dirname(self.script_dir), "Posco_News_Mini_Final_GUI", "deployment_sessions.json"),
+                os.path.join(os.path.dirname(self.script_dir), "Posco_News_Mini_Final_GUI", "deployment_sessions.jsonl"),
                 os.path.join(os.path.dirname(self.script_dir), "Posco_News_Mini_Final_GUI", "posco_deployment_state.json")
             ]
             
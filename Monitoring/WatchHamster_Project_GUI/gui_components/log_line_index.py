@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Log Line Index - mmap 기반 로그 라인 오프셋 인덱스
+수 GB 로그도 전체를 메모리에 올리지 않고 임의 라인 접근/검색
+
+주요 기능:
+- 📑 파일당 한 번 라인 시작 오프셋 인덱스 생성 (파일이 커지면 늘어난 부분만 추가)
+- 🪟 보이는 범위의 라인만 mmap에서 디코딩
+- 🔍 블록 단위 사전 검사 후 라인 매칭 (매칭 없는 블록은 라인 분리 없이 건너뜀)
+"""
+
+import mmap
+import os
+import re
+import threading
+from array import array
+from itertools import accumulate
+from typing import Callable, Iterator, List, Optional, Tuple
+
+# 인덱스 생성 시 한 번에 스캔할 바이트 수
+SCAN_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+class LogLineMatcher:
+    """필터 조건 (일반 텍스트 또는 'regex:' 접두사 정규식)"""
+
+    def __init__(self, filter_text: str, case_sensitive: bool = False):
+        self.filter_text = filter_text
+        self.case_sensitive = case_sensitive
+        self.pattern = None
+        self.block_pattern = None
+        self.needle = filter_text if case_sensitive else filter_text.lower()
+
+        if filter_text.startswith('regex:'):
+            flags = 0 if case_sensitive else re.IGNORECASE
+            try:
+                self.pattern = re.compile(filter_text[6:], flags)
+                # 블록 사전 검사용: ^/$가 라인 경계에서 맞도록 MULTILINE (\A, \Z는 블록 검사 불가)
+                if '\\A' not in filter_text and '\\Z' not in filter_text:
+                    self.block_pattern = re.compile(filter_text[6:], flags | re.MULTILINE)
+            except re.error as e:
+                print(f"⚠️ 정규식 오류: {e}")
+                # 일반 텍스트 검색으로 폴백
+                self.pattern = None
+
+    def block_may_match(self, block: str) -> bool:
+        """블록(여러 라인) 안에 매칭 라인이 있을 수 있는지"""
+        if self.pattern is not None:
+            return self.block_pattern is None or self.block_pattern.search(block) is not None
+        return self.needle in (block if self.case_sensitive else block.lower())
+
+    def match(self, line: str) -> bool:
+        """라인 매칭 여부"""
+        if self.pattern is not None:
+            return self.pattern.search(line) is not None
+        return self.needle in (line if self.case_sensitive else line.lower())
+
+
+class LogLineIndex:
+    """mmap 기반 라인 오프셋 인덱스"""
+
+    def __init__(self, path: str, encoding: str = 'utf-8'):
+        """
+        Args:
+            path: 로그 파일 경로
+            encoding: 디코딩 인코딩 (잘못된 바이트는 대체 문자로 표시)
+        """
+        self.path = path
+        self.encoding = encoding
+        # 라인 시작 오프셋 (항상 0으로 시작, 줄바꿈마다 다음 위치 추가)
+        self.offsets = array('Q', [0])
+        self.size = 0  # 매핑된 파일 크기
+        self.indexed = 0  # 인덱싱을 마친 위치 (읽기는 여기까지만)
+        self._identity = None  # (st_dev, st_ino) - 로테이션 감지
+        self._file = None
+        self._mmap = None
+        self._lock = threading.RLock()  # 읽기와 mmap 교체 사이
+        self._refresh_lock = threading.Lock()  # refresh 동시 실행 방지
+
+    def refresh(self) -> Tuple[bool, bool]:
+        """
+        파일 변경 반영 (늘어난 부분만 인덱싱)
+
+        Returns:
+            Tuple[bool, bool]: (변경 여부, 처음부터 다시 만들었는지 - 잘림/로테이션)
+        """
+        with self._refresh_lock:
+            with self._lock:
+                stat = os.stat(self.path)
+                identity = (stat.st_dev, stat.st_ino)
+                rebuilt = False
+
+                if self._identity is not None and (identity != self._identity or stat.st_size < self.size):
+                    self._reset()
+                    rebuilt = True
+
+                self._identity = identity
+                if stat.st_size == self.size:
+                    return rebuilt, rebuilt
+
+                self._remap(stat.st_size)
+
+            # 스캔 중에도 이미 인덱싱된 범위는 읽을 수 있도록 청크마다 잠금
+            self._scan()
+            return True, rebuilt
+
+    def _reset(self):
+        self._close_map()
+        self.offsets = array('Q', [0])
+        self.size = 0
+        self.indexed = 0
+
+    def _remap(self, size: int):
+        self._close_map()
+        self.size = size
+        if size == 0:
+            return
+        self._file = open(self.path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = len(self._mmap)
+
+    def _scan(self):
+        # 마지막 줄바꿈 다음부터 (끝나지 않은 마지막 라인은 다시 스캔)
+        position = self.offsets[-1]
+        while position < self.size:
+            with self._lock:
+                if self._mmap is None:
+                    return
+                end = min(position + SCAN_CHUNK_BYTES, self.size)
+                chunk = self._mmap[position:end]
+
+            parts = chunk.split(b'\n')
+            # 각 조각 길이 + 줄바꿈 1바이트 누적 = 다음 라인 시작 오프셋
+            starts = array('Q', accumulate((len(part) + 1 for part in parts[:-1]), initial=position))
+
+            with self._lock:
+                self.offsets.extend(starts[1:])
+                self.indexed = end
+            position = end
+
+    def __len__(self) -> int:
+        if self.offsets[-1] < self.indexed:
+            return len(self.offsets)
+        return len(self.offsets) - 1
+
+    @property
+    def complete_lines(self) -> int:
+        """줄바꿈으로 끝난 라인 수 (기록 중인 마지막 라인 제외)"""
+        return len(self.offsets) - 1
+
+    def _span(self, start: int, stop: int) -> Tuple[int, int]:
+        begin = self.offsets[start]
+        end = self.offsets[stop] if stop < len(self.offsets) else self.indexed
+        return begin, end
+
+    def lines(self, start: int, stop: int) -> List[str]:
+        """start 이상 stop 미만 라인 (줄바꿈 제외)"""
+        with self._lock:
+            stop = min(stop, len(self))
+            if start >= stop or self._mmap is None:
+                return []
+            return self._decode(start, stop).split('\n')[:stop - start]
+
+    def _decode(self, start: int, stop: int) -> str:
+        begin, end = self._span(start, stop)
+        text = self._mmap[begin:end].decode(self.encoding, errors='replace')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n')
+        if text.endswith('\n'):
+            text = text[:-1]
+        return text
+
+    def line(self, number: int) -> str:
+        """단일 라인"""
+        lines = self.lines(number, number + 1)
+        return lines[0] if lines else ''
+
+    def search(self, matcher: LogLineMatcher, start: int = 0, stop: Optional[int] = None,
+               block_lines: int = 20000,
+               should_stop: Optional[Callable[[], bool]] = None) -> Iterator[Tuple[int, List[int]]]:
+        """
+        블록 단위 검색
+
+        Args:
+            matcher: 필터 조건
+            start: 시작 라인
+            stop: 끝 라인 (None이면 줄바꿈으로 끝난 라인까지)
+            block_lines: 블록당 라인 수
+            should_stop: True를 반환하면 검색 중단 (새 필터 입력 등)
+
+        Yields:
+            Tuple[int, List[int]]: (검색을 마친 라인 번호, 블록 안의 매칭 라인 번호)
+        """
+        if stop is None:
+            stop = self.complete_lines
+        position = start
+        while position < stop:
+            if should_stop and should_stop():
+                return
+            block_stop = min(position + block_lines, stop)
+            with self._lock:
+                if self._mmap is None:
+                    return
+                block = self._decode(position, block_stop)
+            matches = []
+            if matcher.block_may_match(block):
+                matches = [
+                    position + index
+                    for index, line in enumerate(block.split('\n'))
+                    if matcher.match(line)
+                ]
+            position = block_stop
+            yield position, matches
+
+    def _close_map(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        """mmap 및 파일 닫기"""
+        with self._lock:
+            self._close_map()
+
+
+class ListLineSource:
+    """메모리 라인 목록을 LogLineIndex와 같은 방식으로 사용 (JSON 보기 등)"""
+
+    def __init__(self, lines: List[str]):
+        self._lines = lines
+
+    def refresh(self) -> Tuple[bool, bool]:
+        return False, False
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    @property
+    def complete_lines(self) -> int:
+        return len(self._lines)
+
+    def lines(self, start: int, stop: int) -> List[str]:
+        return self._lines[start:stop]
+
+    def line(self, number: int) -> str:
+        return self._lines[number] if 0 <= number < len(self._lines) else ''
+
+    def search(self, matcher: LogLineMatcher, start: int = 0, stop: Optional[int] = None,
+               block_lines: int = 20000,
+               should_stop: Optional[Callable[[], bool]] = None) -> Iterator[Tuple[int, List[int]]]:
+        if stop is None:
+            stop = len(self._lines)
+        for position in range(start, stop, block_lines):
+            if should_stop and should_stop():
+                return
+            block_stop = min(position + block_lines, stop)
+            matches = [
+                number for number in range(position, block_stop)
+                if matcher.match(self._lines[number])
+            ]
+            yield block_stop, matches
+
+    def close(self):
+        pass
@@ -5,18 +5,21 @@ Optimized Log Viewer Component - 성능 최적화된 로그 뷰어
 대용량 로그 파일 처리 및 실시간 모니터링 최적화
 
 주요 기능:
-- 📊 대용량 로그 표시 성능 최적화
-- ⚡ 청크 단위 로그 로딩
-- 🔄 실시간 모니터링 데이터 업데이트 최적화
-- 💾 메모리 효율적 로그 캐싱
+- 📊 대용량 로그 표시 성능 최적화 (보이는 범위만 렌더링하는 가상 스크롤)
+- ⚡ mmap 라인 오프셋 인덱스 (파일 전체를 읽지 않고 임의 위치 접근)
+- 🔄 파일 증가분만 인덱싱하는 실시간 갱신
+- 🔍 워커 스레드 증분 필터링 (수 GB 로그도 처음부터 끝까지 검색)
 
 Requirements: 6.4, 5.1, 5.2 구현
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import os
 import json
+import queue
+from array import array
 from datetime import datetime
 import threading
 import time
@@ -33,6 +36,11 @@ try:
 except ImportError:
     print("⚠️ 성능 최적화 시스템을 사용할 수 없습니다")
 
+try:
+    from gui_components.log_line_index import ListLineSource, LogLineIndex, LogLineMatcher
+except ImportError:
+    from log_line_index import ListLineSource, LogLineIndex, LogLineMatcher
+
 
 class OptimizedLogViewer:
     """성능 최적화된 로그 뷰어 - 대용량 로그 처리 특화"""
@@ -52,16 +60,20 @@ class OptimizedLogViewer:
             print("⚠️ 최적화된 로그 뷰어: 성능 최적화 없이 실행")
         
         # 로그 표시 최적화 설정
-        self.max_display_lines = 2000  # 한 번에 표시할 최대 라인 수
-        self.chunk_size = 500  # 청크 단위 로딩 크기
-        self.virtual_scroll_threshold = 5000  # 가상 스크롤 임계값
+        self.filter_block_lines = 20000  # 필터 워커가 한 번에 검사할 라인 수
+        self.json_pretty_max_bytes = 10 * 1024 * 1024  # 이보다 작은 JSON만 정렬해 표시
         
         # 현재 상태
         self.current_file = None
-        self.current_lines = []
-        self.displayed_lines = []
-        self.scroll_position = 0
+        self.line_source = None  # LogLineIndex (로그) 또는 ListLineSource (정렬된 JSON)
+        self.view_top = 0  # 화면 첫 행 (필터 중이면 매칭 목록 위치)
+        self.visible_rows = 40
+        self.follow_tail = True  # 맨 아래를 보고 있으면 새 라인을 따라감
         self.total_lines = 0
+        self._line_height = 0
+        
+        # 작업 스레드 → UI 스레드 전달 큐 (Tk 호출은 UI 스레드에서만)
+        self._ui_queue = queue.Queue()
         
         # 자동 새로고침
         self.auto_refresh = True
@@ -69,10 +81,15 @@ class OptimizedLogViewer:
         self.refresh_thread = None
         self.running = False
         
-        # 필터링
-        self.filter_text = ""
-        self.filter_case_sensitive = False
-        self.filtered_lines = []
+        # 필터링 (매칭 라인 번호만 보관, 새 필터가 들어오면 세대 번호로 이전 작업 중단)
+        self.filter_matcher = None
+        self.filtered_rows = array('Q')
+        self.filtered_upto = 0  # 필터 검사를 마친 라인 수
+        self._filter_generation = 0
+        self._filter_running = False
+        self._filter_lock = threading.Lock()
+        self._filter_after_id = None
+        self._filter_started_at = 0.0
         
         # 성능 메트릭
         self.load_time = 0
@@ -124,6 +141,9 @@ class OptimizedLogViewer:
             self._setup_keyboard_shortcuts()
             print("✅ 키보드 단축키 설정 완료")
             
+            # 작업 스레드 결과를 UI 스레드에서 반영
+            self._drain_ui_queue()
+            
             # 초기 로그 파일 로드
             print("📂 초기 로그 파일 로드 중...")
             self.load_log_files()
@@ -216,14 +236,6 @@ class OptimizedLogViewer:
                        variable=self.case_sensitive_var,
                        command=self.apply_filter).pack(side=tk.LEFT, padx=(0, 10))
         
-        # 표시 옵션
-        ttk.Label(row2, text="표시 라인:").pack(side=tk.LEFT, padx=(0, 5))
-        self.max_lines_var = tk.StringVar(value=str(self.max_display_lines))
-        max_lines_spinbox = ttk.Spinbox(row2, from_=100, to=10000, width=8, 
-                                       textvariable=self.max_lines_var,
-                                       command=self.update_display_settings)
-        max_lines_spinbox.pack(side=tk.LEFT, padx=(0, 5))
-        
         # 세 번째 행: 성능 정보
         row3 = ttk.Frame(control_frame)
         row3.pack(fill=tk.X)
@@ -242,26 +254,41 @@ class OptimizedLogViewer:
         display_frame = ttk.Frame(parent)
         display_frame.pack(fill=tk.BOTH, expand=True)
         
-        # 로그 텍스트 영역 (최적화된 설정)
-        self.log_text = scrolledtext.ScrolledText(
+        # 로그 텍스트 영역 (보이는 행만 담는 가상 스크롤 - 세로 스크롤바는 전체 라인 기준으로 직접 계산)
+        self.log_text = tk.Text(
             display_frame, 
             wrap=tk.NONE,  # 가로 스크롤 허용
             font=('Consolas', 9),
             state=tk.DISABLED,  # 편집 방지
             cursor="arrow"
         )
-        self.log_text.pack(fill=tk.BOTH, expand=True)
+        self.v_scrollbar = ttk.Scrollbar(display_frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        h_scrollbar = ttk.Scrollbar(display_frame, orient=tk.HORIZONTAL, command=self.log_text.xview)
+        self.log_text.config(xscrollcommand=h_scrollbar.set)
+        
+        self.log_text.grid(row=0, column=0, sticky="nsew")
+        self.v_scrollbar.grid(row=0, column=1, sticky="ns")
+        h_scrollbar.grid(row=1, column=0, sticky="ew")
+        display_frame.rowconfigure(0, weight=1)
+        display_frame.columnconfigure(0, weight=1)
+        
+        self._line_height = max(1, tkfont.Font(font=self.log_text['font']).metrics('linespace'))
         
         # 스크롤 이벤트 바인딩
         self.log_text.bind('<MouseWheel>', self.on_mouse_wheel)
         self.log_text.bind('<Button-4>', self.on_mouse_wheel)
         self.log_text.bind('<Button-5>', self.on_mouse_wheel)
+        self.log_text.bind('<Configure>', lambda e: self._render_view())
         
         # 키보드 단축키
         self.log_text.bind('<Control-f>', lambda e: self.filter_entry.focus())
         self.log_text.bind('<Control-r>', lambda e: self.refresh_logs())
         self.log_text.bind('<End>', lambda e: self.scroll_to_bottom())
         self.log_text.bind('<Home>', lambda e: self.scroll_to_top())
+        self.log_text.bind('<Up>', lambda e: self.scroll_rows(-1))
+        self.log_text.bind('<Down>', lambda e: self.scroll_rows(1))
+        self.log_text.bind('<Prior>', lambda e: self.scroll_rows(-self.visible_rows))
+        self.log_text.bind('<Next>', lambda e: self.scroll_rows(self.visible_rows))
     
     def create_status_bar(self, parent):
         """상태 바 생성"""
@@ -313,145 +340,64 @@ class OptimizedLogViewer:
             self.load_current_log()
     
     def load_current_log(self):
-        """현재 선택된 로그 파일 로드 (완전 최적화 구현)"""
+        """현재 선택된 로그 파일 로드 (라인 인덱스 생성은 백그라운드, 표시는 UI 스레드)"""
         if not self.current_file:
             print("⚠️ 선택된 로그 파일이 없습니다")
             return
         
-        def _load_optimized():
+        file_name = self.current_file
+        
+        def _load_indexed():
             start_time = time.time()
             
             try:
-                log_path = os.path.join(self.logs_dir, self.current_file)
-                print(f"📂 로그 파일 로드 시작: {self.current_file}")
+                log_path = os.path.join(self.logs_dir, file_name)
+                print(f"📂 로그 파일 로드 시작: {file_name}")
                 
                 # 파일 존재 확인
                 if not os.path.exists(log_path):
-                    error_msg = f"로그 파일을 찾을 수 없습니다: {self.current_file}"
+                    error_msg = f"로그 파일을 찾을 수 없습니다: {file_name}"
                     print(f"❌ {error_msg}")
-                    self._update_display([error_msg])
-                    self.status_var.set(error_msg)
+                    self._post_ui(self._set_source, file_name, ListLineSource([error_msg]), 0, error_msg)
                     return
                 
-                # 파일 크기 및 정보 확인
-                file_size = os.path.getsize(log_path)
-                file_modified = os.path.getmtime(log_path)
-                print(f"📊 파일 정보: 크기 {file_size:,}bytes, 수정시간 {time.ctime(file_modified)}")
-                
                 # 파일 접근 권한 확인
                 if not os.access(log_path, os.R_OK):
-                    error_msg = f"로그 파일 읽기 권한이 없습니다: {self.current_file}"
+                    error_msg = f"로그 파일 읽기 권한이 없습니다: {file_name}"
                     print(f"❌ {error_msg}")
-                    self._update_display([error_msg])
-                    self.status_var.set(error_msg)
+                    self._post_ui(self._set_source, file_name, ListLineSource([error_msg]), 0, error_msg)
                     return
                 
-                # 성능 최적화된 로딩
-                if self.use_optimization:
-                    print("⚡ 성능 최적화 로딩 사용")
-                    lines = self._load_with_optimization(log_path)
-                else:
-                    print("📊 기본 로딩 방식 사용")
-                    lines = self._load_without_optimization(log_path)
-                
-                # 로드 결과 검증
-                if not lines:
-                    print("⚠️ 빈 파일이거나 로드 실패")
-                    lines = ["파일이 비어있거나 읽을 수 없습니다."]
-                
-                self.current_lines = lines
-                self.total_lines = len(lines)
-                
-                print(f"✅ 로그 로드 완료: {self.total_lines:,}라인")
-                
-                # 필터 적용
-                print("🔍 필터 적용 시작")
-                self.apply_filter()
-                print("✅ 필터 적용 완료")
-                
-                # 로드 시간 기록 및 성능 메트릭 업데이트
-                self.load_time = (time.time() - start_time) * 1000
-                print(f"⏱️ 로드 시간: {self.load_time:.1f}ms")
-                
-                if hasattr(self, '_update_performance_display'):
-                    self._update_performance_display()
-                
-                # 상태 업데이트
-                status_msg = f"로그 로드 완료: {self.current_file} ({self.total_lines:,}라인, {self.load_time:.1f}ms)"
-                self.status_var.set(status_msg)
+                source = self._open_line_source(log_path)
+                load_time = (time.time() - start_time) * 1000
+                status_msg = f"로그 로드 완료: {file_name} ({len(source):,}라인, {load_time:.1f}ms)"
                 print(f"✅ {status_msg}")
-                
-                # 메모리 사용량 확인
-                try:
-                    import psutil
-                    memory_usage = psutil.virtual_memory().percent
-                    print(f"📊 메모리 사용률: {memory_usage:.1f}%")
-                except:
-                    pass
+                self._post_ui(self._set_source, file_name, source, load_time, status_msg)
                 
             except Exception as e:
                 error_msg = f"로그 로드 오류: {str(e)}"
                 print(f"❌ {error_msg}")
-                self._update_display([error_msg])
-                self.status_var.set(f"로그 로드 실패: {self.current_file}")
-                
-                # 상세 오류 로깅
-                import traceback
-                print(f"📋 상세 오류 정보:\n{traceback.format_exc()}")
+                self._post_ui(self._set_source, file_name, ListLineSource([error_msg]), 0,
+                              f"로그 로드 실패: {file_name}")
         
-        # 백그라운드에서 로드
-        try:
-            if self.use_optimization and hasattr(self, 'performance_optimizer'):
-                print("🚀 백그라운드 작업으로 스케줄링")
-                self.performance_optimizer.schedule_background_task(_load_optimized)
-            else:
-                print("🔄 별도 스레드에서 실행")
-                threading.Thread(target=_load_optimized, daemon=True).start()
-        except Exception as e:
-            print(f"❌ 백그라운드 로드 스케줄링 실패: {e}")
-            # 폴백: 직접 실행
-            _load_optimized()
+        threading.Thread(target=_load_indexed, daemon=True, name="LogIndexLoader").start()
     
-    def _load_with_optimization(self, log_path: str) -> List[str]:
-        """성능 최적화를 사용한 로그 로드 (완전 구현)"""
-        try:
-            file_size = os.path.getsize(log_path)
-            print(f"📁 파일 크기: {file_size / 1024 / 1024:.1f}MB")
-            
-            if file_size > 10 * 1024 * 1024:  # 10MB 이상
-                print(f"🚀 대용량 파일 tail 방식 로드")
-                # 대용량 파일: tail 방식 사용
-                lines = self.performance_optimizer.get_log_file_tail(log_path, self.max_display_lines * 2)
-                print(f"✅ Tail 로드 완료: {len(lines):,} 라인")
-                return lines
-            elif file_size > 1024 * 1024:  # 1MB 이상
-                print(f"📊 중간 크기 파일 청크 로드")
-                # 중간 크기: 청크 단위 로드
-                lines = self.performance_optimizer.process_large_log_file(
-                    log_path, lambda x: x, max_lines=self.max_display_lines * 2
-                )
-                print(f"✅ 청크 로드 완료: {len(lines):,} 라인")
-                return lines
-            else:
-                print(f"⚡ 소용량 파일 전체 로드")
-                # 작은 파일: 전체 로드
-                lines = self._load_without_optimization(log_path)
-                print(f"✅ 전체 로드 완료: {len(lines):,} 라인")
-                return lines
-                
-        except Exception as e:
-            print(f"❌ 최적화 로드 실패: {e}")
-            # 폴백: 기본 방식으로 로드
-            try:
-                return self._load_without_optimization(log_path)
-            except Exception as fallback_error:
-                print(f"❌ 폴백 로드도 실패: {fallback_error}")
-                return [f"로그 로드 실패: {str(e)}"]
+    def _open_line_source(self, log_path: str):
+        """로그는 mmap 라인 인덱스, 작은 JSON은 정렬된 라인 목록"""
+        file_size = os.path.getsize(log_path)
+        print(f"📁 파일 크기: {file_size / 1024 / 1024:.1f}MB")
+        
+        if log_path.endswith('.json') and file_size <= self.json_pretty_max_bytes:
+            return ListLineSource(self._load_without_optimization(log_path))
+        
+        index = LogLineIndex(log_path)
+        index.refresh()
+        return index
     
     def _load_without_optimization(self, log_path: str) -> List[str]:
-        """기본 방식으로 로그 로드"""
+        """기본 방식으로 로그 로드 (JSON 정렬 표시용)"""
         with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            if self.current_file.endswith('.json'):
+            if log_path.endswith('.json'):
                 try:
                     data = json.load(f)
                     content = json.dumps(data, indent=2, ensure_ascii=False)
@@ -462,130 +408,214 @@ class OptimizedLogViewer:
             else:
                 return f.read().split('\n')
     
+    def _set_source(self, file_name: str, source, load_time: float, status_msg: str):
+        """새 라인 소스 적용 (UI 스레드)"""
+        if file_name != self.current_file:
+            # 로드 중 다른 파일이 선택됨
+            source.close()
+            return
+        
+        if self.line_source is not None and self.line_source is not source:
+            self.line_source.close()
+        self.line_source = source
+        self.total_lines = len(source)
+        self.load_time = load_time
+        self.follow_tail = True
+        self.apply_filter()
+        self.status_var.set(status_msg)
+    
+    def _refresh_source(self):
+        """파일 증가분 인덱싱 후 필터/화면 갱신 (작업 스레드)"""
+        source = self.line_source
+        if source is None:
+            return
+        try:
+            changed, rebuilt = source.refresh()
+        except OSError as e:
+            # 로테이션 중 잠시 파일이 없을 수 있음
+            print(f"⚠️ 로그 파일 확인 실패: {e}")
+            return
+        if changed:
+            self._post_ui(self._on_source_changed, source, rebuilt)
+    
+    def _on_source_changed(self, source, rebuilt: bool):
+        """라인 소스 변경 반영 (UI 스레드)"""
+        if source is not self.line_source:
+            return
+        self.total_lines = len(source)
+        if rebuilt:
+            # 잘림/로테이션: 필터를 처음부터 다시
+            self.apply_filter()
+            return
+        if self.filter_matcher is not None:
+            self._start_filter_worker(self._filter_generation)
+        self._render_view()
+    
     def apply_filter(self):
-        """필터 적용 (완전 구현)"""
+        """필터 적용 (매칭 라인 번호를 워커 스레드에서 증분 수집)"""
+        filter_text = self.filter_entry.get().strip()
+        case_sensitive = self.case_sensitive_var.get()
+        print(f"🔍 필터 적용: '{filter_text}' (대소문자 구분: {case_sensitive})")
+        
+        with self._filter_lock:
+            # 세대 번호가 바뀌면 이전 필터 워커는 다음 블록에서 중단
+            self._filter_generation += 1
+            self.filter_matcher = LogLineMatcher(filter_text, case_sensitive) if filter_text else None
+            self.filtered_rows = array('Q')
+            self.filtered_upto = 0
+        
+        self.filter_time = 0
+        self.view_top = 0
+        self.follow_tail = True
+        
+        if self.filter_matcher is not None and self.line_source is not None:
+            self._start_filter_worker(self._filter_generation)
+        
+        self._render_view()
+    
+    def _start_filter_worker(self, generation: int):
+        """필터 워커 시작 (이미 실행 중이면 워커가 늘어난 라인까지 이어서 검사)"""
+        with self._filter_lock:
+            if self._filter_running or generation != self._filter_generation:
+                return
+            self._filter_running = True
+        
+        self._filter_started_at = time.time()
+        threading.Thread(
+            target=self._filter_worker, args=(generation,), daemon=True, name="LogFilterWorker"
+        ).start()
+    
+    def _filter_worker(self, generation: int):
+        """필터 워커: 인덱스를 블록 단위로 검사해 매칭 라인 번호 추가"""
+        source = self.line_source
+        matcher = self.filter_matcher
+        rows = self.filtered_rows
+        is_current = lambda: generation == self._filter_generation and source is self.line_source
+        last_post = 0.0
+        failed = False
+        
+        try:
+            while is_current() and self.filtered_upto < source.complete_lines:
+                for position, matches in source.search(matcher, self.filtered_upto,
+                                                       block_lines=self.filter_block_lines,
+                                                       should_stop=lambda: not is_current()):
+                    with self._filter_lock:
+                        if not is_current():
+                            return
+                        rows.extend(matches)
+                        self.filtered_upto = position
+                    
+                    # 진행 상황은 0.2초마다 화면에 반영
+                    now = time.time()
+                    if now - last_post >= 0.2:
+                        last_post = now
+                        self._post_ui(self._on_filter_progress, generation, False)
+        except Exception as e:
+            failed = True
+            print(f"❌ 필터 적용 오류: {e}")
+        finally:
+            with self._filter_lock:
+                self._filter_running = False
+                # 실행 중에 새 필터가 들어왔거나 (시작 요청이 무시됨) 라인이 늘었으면 최신 세대로 다시 시작
+                latest = self._filter_generation
+                restart = (not failed and self.filter_matcher is not None and self.line_source is not None and
+                           (latest != generation or self.filtered_upto < self.line_source.complete_lines))
+            self._post_ui(self._on_filter_progress, generation, True)
+            if restart:
+                self._start_filter_worker(latest)
+    
+    def _on_filter_progress(self, generation: int, done: bool):
+        """필터 진행 반영 (UI 스레드)"""
+        if generation != self._filter_generation or self.filter_matcher is None:
+            return
+        total = self.line_source.complete_lines if self.line_source is not None else 0
+        if done and self.filtered_upto >= total:
+            self.filter_time = (time.time() - self._filter_started_at) * 1000
+            self.status_var.set(f"필터 완료: {len(self.filtered_rows):,}/{total:,} 라인")
+        else:
+            progress = self.filtered_upto / total * 100 if total else 100
+            self.status_var.set(f"필터링 중... {progress:.0f}% ({len(self.filtered_rows):,} 라인 일치)")
+        self._render_view()
+    
+    def _row_count(self) -> int:
+        if self.line_source is None:
+            return 0
+        if self.filter_matcher is not None:
+            return len(self.filtered_rows)
+        return len(self.line_source)
+    
+    def _rows_text(self, top: int, count: int) -> List[str]:
+        """화면 행 top부터 count개의 라인 텍스트"""
+        if self.filter_matcher is None:
+            return self.line_source.lines(top, top + count)
+        rows = self.filtered_rows[top:top + count]
+        if rows and rows[-1] - rows[0] < count * 4:
+            # 매칭이 몰려 있으면 한 번에 읽어서 골라냄
+            block = self.line_source.lines(rows[0], rows[-1] + 1)
+            return [block[row - rows[0]] for row in rows if row - rows[0] < len(block)]
+        return [self.line_source.line(row) for row in rows]
+    
+    def _render_view(self):
+        """보이는 행만 텍스트 위젯에 표시 (UI 스레드)"""
+        if not hasattr(self, 'log_text') or self.line_source is None:
+            return
         try:
             start_time = time.time()
             
-            filter_text = self.filter_entry.get().strip()
-            case_sensitive = self.case_sensitive_var.get()
-            
-            print(f"🔍 필터 적용: '{filter_text}' (대소문자 구분: {case_sensitive})")
-            
-            if not filter_text:
-                self.filtered_lines = self.current_lines[:]
-                print(f"📄 필터 없음: {len(self.filtered_lines):,} 라인")
+            height = self.log_text.winfo_height()
+            if height > 1:
+                self.visible_rows = max(1, height // self._line_height)
+            
+            total = self._row_count()
+            max_top = max(0, total - self.visible_rows)
+            if self.follow_tail:
+                self.view_top = max_top
+            self.view_top = min(max(0, self.view_top), max_top)
+            self.follow_tail = self.view_top >= max_top
+            
+            lines = self._rows_text(self.view_top, self.visible_rows)
+            xview = self.log_text.xview()[0]
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.delete(1.0, tk.END)
+            self.log_text.insert(tk.END, '\n'.join(lines))
+            self.log_text.config(state=tk.DISABLED)
+            self.log_text.xview_moveto(xview)
+            
+            if total:
+                self.v_scrollbar.set(self.view_top / total, min(1.0, (self.view_top + len(lines)) / total))
             else:
-                self.filtered_lines = []
-                search_text = filter_text if case_sensitive else filter_text.lower()
-                
-                # 정규식 지원
-                import re
-                try:
-                    if filter_text.startswith('regex:'):
-                        pattern = re.compile(filter_text[6:], 0 if case_sensitive else re.IGNORECASE)
-                        for line in self.current_lines:
-                            if pattern.search(line):
-                                self.filtered_lines.append(line)
-                    else:
-                        # 일반 텍스트 검색
-                        for line in self.current_lines:
-                            line_to_search = line if case_sensitive else line.lower()
-                            if search_text in line_to_search:
-                                self.filtered_lines.append(line)
-                except re.error as e:
-                    print(f"⚠️ 정규식 오류: {e}")
-                    # 일반 텍스트 검색으로 폴백
-                    for line in self.current_lines:
-                        line_to_search = line if case_sensitive else line.lower()
-                        if search_text in line_to_search:
-                            self.filtered_lines.append(line)
-                
-                print(f"🎯 필터 결과: {len(self.filtered_lines):,}/{len(self.current_lines):,} 라인")
-            
-            # 표시할 라인 수 제한
-            max_lines = int(self.max_lines_var.get())
-            if len(self.filtered_lines) > max_lines:
-                self.displayed_lines = self.filtered_lines[-max_lines:]  # 최근 라인들
-                print(f"📊 표시 제한: {len(self.displayed_lines):,}/{len(self.filtered_lines):,} 라인")
-            else:
-                self.displayed_lines = self.filtered_lines[:]
+                self.v_scrollbar.set(0.0, 1.0)
             
-            # 필터 시간 기록
-            self.filter_time = (time.time() - start_time) * 1000
+            end_row = self.view_top + len(lines)
+            self.line_info_var.set(f"라인: {self.view_top + 1 if lines else 0:,}-{end_row:,}/{total:,}")
             
-            # 화면 업데이트
-            self._update_display(self.displayed_lines)
+            self.display_time = (time.time() - start_time) * 1000
             self._update_performance_display()
             
-            # 라인 정보 업데이트
-            self.line_info_var.set(f"라인: {len(self.displayed_lines):,}/{len(self.filtered_lines):,}")
-            
         except Exception as e:
-            print(f"❌ 필터 적용 오류: {e}")
-            # 오류 시 전체 라인 표시
-            self.filtered_lines = self.current_lines[:]
-            self.displayed_lines = self.filtered_lines[:int(self.max_lines_var.get())]
-            self._update_display(self.displayed_lines)
-        
-        # 라인 정보 업데이트
-        self.line_info_var.set(f"라인: {len(self.displayed_lines):,}/{len(self.filtered_lines):,}")
+            print(f"❌ 화면 업데이트 오류: {e}")
     
-    def _update_display(self, lines: List[str]):
-        """화면 표시 업데이트 (완전 구현)"""
-        def _update():
-            try:
-                start_time = time.time()
-                
-                print(f"🖥️ 화면 업데이트 시작: {len(lines):,} 라인")
-                
-                self.log_text.config(state=tk.NORMAL)
-                self.log_text.delete(1.0, tk.END)
-                
-                # 대용량 텍스트 효율적 삽입
-                if len(lines) > 1000:
-                    print(f"📊 대용량 텍스트 청크 처리 모드")
-                    # 청크 단위로 삽입
-                    chunk_size = 100
-                    total_chunks = (len(lines) + chunk_size - 1) // chunk_size
-                    
-                    for i in range(0, len(lines), chunk_size):
-                        chunk = lines[i:i+chunk_size]
-                        text_chunk = '\n'.join(chunk) + '\n'
-                        self.log_text.insert(tk.END, text_chunk)
-                        
-                        # UI 응답성 유지
-                        if i % 500 == 0:
-                            progress = (i // chunk_size + 1) / total_chunks * 100
-                            print(f"📈 처리 진행률: {progress:.1f}%")
-                            self.log_text.update_idletasks()
-                else:
-                    print(f"⚡ 일괄 텍스트 삽입 모드")
-                    # 한 번에 삽입
-                    text_content = '\n'.join(lines)
-                    self.log_text.insert(tk.END, text_content)
-                
-                self.log_text.config(state=tk.DISABLED)
-                self.log_text.see(tk.END)
-                
-                # 표시 시간 기록
-                self.display_time = (time.time() - start_time) * 1000
-                print(f"✅ 화면 업데이트 완료: {self.display_time:.1f}ms")
-                self._update_performance_display()
-                
-            except Exception as e:
-                print(f"❌ 화면 업데이트 오류: {e}")
-                # 오류 시 기본 메시지 표시
-                self.log_text.config(state=tk.NORMAL)
-                self.log_text.delete(1.0, tk.END)
-                self.log_text.insert(tk.END, f"화면 업데이트 오류: {str(e)}")
-                self.log_text.config(state=tk.DISABLED)
-        
-        # UI 업데이트 스케줄링
-        if self.use_optimization:
-            self.performance_optimizer.schedule_ui_update(_update)
-        else:
-            self.window.after(0, _update)
+    def _post_ui(self, callback: Callable, *args):
+        """작업 스레드에서 UI 갱신 요청"""
+        self._ui_queue.put((callback, args))
+    
+    def _drain_ui_queue(self):
+        """대기 중인 UI 갱신 실행 (UI 스레드에서 주기 실행)"""
+        if not self.window:
+            return
+        try:
+            while True:
+                callback, args = self._ui_queue.get_nowait()
+                try:
+                    callback(*args)
+                except Exception as e:
+                    print(f"❌ UI 갱신 오류: {e}")
+        except queue.Empty:
+            pass
+        try:
+            self.window.after(50, self._drain_ui_queue)
+        except tk.TclError:
+            pass  # 창이 닫힘
     
     def _update_performance_display(self):
         """성능 정보 표시 업데이트"""
@@ -599,22 +629,14 @@ class OptimizedLogViewer:
             self.memory_label.config(text=f"메모리: {memory_mb:.1f}MB")
     
     def on_filter_changed(self, event=None):
-        """필터 텍스트 변경 시 처리 (디바운싱 적용, 완전 구현)"""
+        """필터 텍스트 변경 시 처리 (디바운싱 적용 - 입력이 멈추면 적용)"""
         try:
             filter_text = self.filter_entry.get().strip()
-            print(f"🔍 필터 변경 감지: '{filter_text}'")
-            
-            if self.use_optimization:
-                # 디바운싱 적용 (연속 입력 시 마지막 입력만 처리)
-                print(f"⏱️ 디바운싱 적용 (0.5초 지연)")
-                debounced_filter = self.performance_optimizer.debounce_function(
-                    self.apply_filter, delay=0.5
-                )
-                debounced_filter()
-            else:
-                print(f"⚡ 즉시 필터 적용")
-                # 즉시 적용
-                self.apply_filter()
+            
+            # 연속 입력 시 마지막 입력만 처리
+            if self._filter_after_id is not None:
+                self.window.after_cancel(self._filter_after_id)
+            self._filter_after_id = self.window.after(300, self._apply_debounced_filter)
                 
             # 필터 히스토리 관리 (최근 10개)
             if not hasattr(self, 'filter_history'):
@@ -624,36 +646,58 @@ class OptimizedLogViewer:
                 self.filter_history.insert(0, filter_text)
                 if len(self.filter_history) > 10:
                     self.filter_history = self.filter_history[:10]
-                print(f"📝 필터 히스토리 업데이트: {len(self.filter_history)}개")
                 
         except Exception as e:
             print(f"❌ 필터 변경 처리 오류: {e}")
     
+    def _apply_debounced_filter(self):
+        self._filter_after_id = None
+        self.apply_filter()
+    
     def clear_filter(self):
         """필터 지우기"""
         self.filter_entry.delete(0, tk.END)
         self.apply_filter()
     
     def scroll_to_bottom(self):
-        """맨 아래로 스크롤"""
-        self.log_text.see(tk.END)
+        """맨 아래로 스크롤 (이후 새 라인을 따라감)"""
+        self.follow_tail = True
+        self._render_view()
+        return "break"
     
     def scroll_to_top(self):
         """맨 위로 스크롤"""
-        self.log_text.see(1.0)
+        self.follow_tail = False
+        self.view_top = 0
+        self._render_view()
+        return "break"
     
-    def on_mouse_wheel(self, event):
-        """마우스 휠 이벤트 처리"""
-        # 기본 스크롤 동작 유지
+    def scroll_rows(self, delta: int):
+        """화면 행 단위 스크롤"""
+        self.follow_tail = False
+        self.view_top += delta
+        self._render_view()
         return "break"
     
-    def update_display_settings(self):
-        """표시 설정 업데이트"""
-        try:
-            self.max_display_lines = int(self.max_lines_var.get())
-            self.apply_filter()  # 설정 변경 후 다시 적용
-        except ValueError:
-            pass
+    def on_scrollbar(self, action, value, unit=None):
+        """세로 스크롤바 조작 (전체 라인 기준 위치)"""
+        if action == tk.MOVETO:
+            self.follow_tail = False
+            self.view_top = int(float(value) * self._row_count())
+            self._render_view()
+        elif action == tk.SCROLL:
+            step = self.visible_rows if unit == tk.PAGES else 1
+            self.scroll_rows(int(value) * step)
+    
+    def on_mouse_wheel(self, event):
+        """마우스 휠 이벤트 처리"""
+        if event.num == 4:
+            delta = -3
+        elif event.num == 5:
+            delta = 3
+        else:
+            delta = -3 if event.delta > 0 else 3
+        return self.scroll_rows(delta)
     
     def toggle_auto_refresh(self):
         """자동 새로고침 토글"""
@@ -675,18 +719,11 @@ class OptimizedLogViewer:
         self.running = False
     
     def _auto_refresh_worker(self):
-        """자동 새로고침 워커 스레드"""
+        """자동 새로고침 워커 스레드 (파일 증가분만 인덱싱)"""
         while self.running:
             try:
                 if self.auto_refresh and self.current_file:
-                    # 성능 최적화: 스로틀링 적용
-                    if self.use_optimization:
-                        throttled_refresh = self.performance_optimizer.throttle_function(
-                            self.load_current_log, interval=self.refresh_interval
-                        )
-                        throttled_refresh()
-                    else:
-                        self.load_current_log()
+                    self._refresh_source()
                 
                 time.sleep(self.refresh_interval)
             except Exception as e:
@@ -698,17 +735,23 @@ class OptimizedLogViewer:
         current_selection = self.current_file
         self.load_log_files()
         
-        # 이전 선택 유지
+        # 이전 선택 유지 (같은 파일은 증가분만 반영)
         if current_selection and current_selection in self.file_combo['values']:
             self.file_combo.set(current_selection)
             self.current_file = current_selection
-            self.load_current_log()
+            threading.Thread(target=self._refresh_source, daemon=True).start()
     
     def on_closing(self):
         """창 닫기 시 처리"""
         self.stop_auto_refresh()
+        with self._filter_lock:
+            self._filter_generation += 1  # 실행 중인 필터 워커 중단
+        if self.line_source is not None:
+            self.line_source.close()
+            self.line_source = None
         if self.window:
             self.window.destroy()
+            self.window = None
     
     def show(self):
         """로그 뷰어 창 표시"""
@@ -223,6 +223,13 @@ class StatusDashboard:
         self.success_rate_progress = ttk.Progressbar(progress_frame, length=200, mode='determinate')
         self.success_rate_progress.pack(side=tk.LEFT, padx=10)
         
+        # 데이터 캐시 통계 (성능 최적화 시스템)
+        cache_stats_frame = ttk.LabelFrame(self.stats_frame, text="데이터 캐시")
+        cache_stats_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        self.cache_stats_label = ttk.Label(cache_stats_frame, text="-", font=("TkDefaultFont", 9))
+        self.cache_stats_label.pack(anchor="w", padx=10, pady=5)
+        
         # 최근 배포 목록
         recent_frame = ttk.LabelFrame(self.stats_frame, text="최근 배포 (최근 10개)")
         recent_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -587,9 +594,30 @@ class StatusDashboard:
             # 최근 배포 목록 업데이트
             self.update_recent_deployments()
             
+            self.update_cache_stats_display()
+            
         except Exception as e:
             print(f"❌ 통계 표시 업데이트 오류: {e}")
     
+    def update_cache_stats_display(self):
+        """데이터 캐시 통계 표시 업데이트"""
+        try:
+            cache_stats = self.get_performance_metrics().get('cache')
+            if not cache_stats:
+                self.cache_stats_label.config(text="캐시 통계 없음")
+                return
+            
+            self.cache_stats_label.config(text=(
+                f"히트율 {cache_stats['hit_rate']:.1f}% "
+                f"(히트 {cache_stats['hits']:,} / 미스 {cache_stats['misses']:,}) | "
+                f"항목 {cache_stats['entries']:,}개, "
+                f"{cache_stats['bytes'] / 1024 / 1024:.1f}/{cache_stats['max_bytes'] / 1024 / 1024:.0f}MB | "
+                f"만료 {cache_stats['expirations']:,}, 제거 {cache_stats['evictions']:,}, "
+                f"크기 초과 {cache_stats['rejected']:,}"
+            ))
+        except Exception as e:
+            print(f"❌ 캐시 통계 표시 오류: {e}")
+    
     def update_recent_deployments(self):
         """최근 배포 목록 업데이트"""
         try:
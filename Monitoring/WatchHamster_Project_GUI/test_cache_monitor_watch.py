@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+캐시 모니터 변경 감지 테스트
+(mtime, size)가 바뀔 때만 파싱, 나이/상태는 파일 I/O 없이 재평가 검증
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# 현재 디렉토리를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from core.cache_monitor import CacheMonitor, CacheStatus, DataType
+
+
+class CacheMonitorWatchTest(unittest.TestCase):
+    """CacheMonitor 변경 감지 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="cache_monitor_test_")
+        self.monitor = CacheMonitor(data_dir=self.temp_dir)
+        self.cache_path = self.monitor.cache_files[DataType.KOSPI]
+
+    def tearDown(self):
+        self.monitor.stop_monitoring()
+        shutil.rmtree(self.temp_dir)
+
+    def write_cache(self, minutes_ago: float, quality: float = 0.9, mtime_ns: int = None):
+        timestamp = (datetime.now() - timedelta(minutes=minutes_ago)).isoformat()
+        entry = {'timestamp': timestamp, 'quality_score': quality, 'confidence': 0.9}
+        market_data = {'kospi': entry, 'exchange_rate': entry, 'posco_stock': entry, 'news_sentiment': entry}
+        data = {'market_data': market_data}
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        if mtime_ns is not None:
+            os.utime(self.cache_path, ns=(mtime_ns, mtime_ns))
+
+    def test_unchanged_file_parsed_once(self):
+        """파일이 그대로면 여러 번 확인해도 한 번만 파싱 (데이터 타입끼리 공유)"""
+        self.write_cache(1)
+        for _ in range(3):
+            status = self.monitor.check_cache_status()
+        self.assertEqual(self.monitor.parse_count, 1)
+        self.assertEqual(status[DataType.KOSPI].status, CacheStatus.FRESH)
+
+    def test_change_triggers_reparse(self):
+        """(mtime, size)가 바뀌면 다시 파싱"""
+        self.write_cache(1, mtime_ns=1_000_000_000)
+        self.monitor.check_cache_status()
+        self.write_cache(1, quality=0.5, mtime_ns=2_000_000_000)
+        status = self.monitor.check_cache_status()
+        self.assertEqual(self.monitor.parse_count, 2)
+        self.assertEqual(status[DataType.KOSPI].quality_score, 0.5)
+
+        os.remove(self.cache_path)
+        status = self.monitor.check_cache_status()
+        self.assertEqual(status[DataType.KOSPI].status, CacheStatus.MISSING)
+
+    def test_age_reevaluated_without_io(self):
+        """파일 변경 없이도 시간이 지나면 상태가 바뀜"""
+        self.write_cache(1)
+        self.monitor.check_cache_status()
+        record = self.monitor._records[DataType.KOSPI]
+        record.last_updated -= timedelta(minutes=10)
+
+        status = self.monitor._evaluate_status()
+        self.assertEqual(self.monitor.parse_count, 1)
+        self.assertEqual(status[DataType.KOSPI].status, CacheStatus.STALE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로그 라인 인덱스 테스트
+mmap 오프셋 인덱스의 증분 인덱싱, 로테이션 감지, 블록 검색 검증
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+# 현재 디렉토리를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from gui_components import log_line_index
+from gui_components.log_line_index import ListLineSource, LogLineIndex, LogLineMatcher
+from gui_components.optimized_log_viewer import OptimizedLogViewer
+
+
+class LogLineIndexTest(unittest.TestCase):
+    """LogLineIndex 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="log_index_test_")
+        self.log_path = os.path.join(self.temp_dir, "test.log")
+        self.index = LogLineIndex(self.log_path)
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, text: str, mode: str = 'a'):
+        with open(self.log_path, mode, encoding='utf-8', newline='') as f:
+            f.write(text)
+
+    def test_incremental_growth(self):
+        """증가분만 인덱싱, 기록 중인 마지막 라인은 완료 후 반영"""
+        self.write("INFO 시작\r\nERROR 실패\npart", 'w')
+        self.assertEqual(self.index.refresh(), (True, False))
+        self.assertEqual(self.index.lines(0, 10), ["INFO 시작", "ERROR 실패", "part"])
+        self.assertEqual(self.index.complete_lines, 2)
+
+        self.write("ial\nWARN 경고\n")
+        self.assertEqual(self.index.refresh(), (True, False))
+        self.assertEqual(self.index.lines(2, 4), ["partial", "WARN 경고"])
+        self.assertEqual(self.index.refresh(), (False, False))
+
+    def test_chunk_boundaries(self):
+        """스캔 청크 경계에 걸친 라인도 정확히 인덱싱"""
+        original = log_line_index.SCAN_CHUNK_BYTES
+        log_line_index.SCAN_CHUNK_BYTES = 5
+        try:
+            self.write("".join(f"line {i}\n" for i in range(50)), 'w')
+            self.index.refresh()
+            self.assertEqual(len(self.index), 50)
+            self.assertEqual(self.index.line(37), "line 37")
+        finally:
+            log_line_index.SCAN_CHUNK_BYTES = original
+
+    def test_truncation_rebuilds(self):
+        """파일이 줄면(로테이션/잘림) 처음부터 다시 인덱싱"""
+        self.write("a\nb\nc\n", 'w')
+        self.index.refresh()
+        self.write("new\n", 'w')
+        self.assertEqual(self.index.refresh(), (True, True))
+        self.assertEqual(self.index.lines(0, 10), ["new"])
+
+    def test_block_search(self):
+        """블록 검색은 매칭 라인 번호만 반환 (정규식 ^는 라인 시작 기준)"""
+        self.write("".join(f"{'ERROR' if i % 7 == 0 else 'INFO'} {i}\n" for i in range(100)), 'w')
+        self.index.refresh()
+
+        matches = [n for _, found in self.index.search(LogLineMatcher("error"), block_lines=10) for n in found]
+        self.assertEqual(matches, list(range(0, 100, 7)))
+
+        regex = LogLineMatcher("regex:^INFO 9\\d$", case_sensitive=True)
+        matches = [n for _, found in self.index.search(regex, start=50) for n in found]
+        self.assertEqual(matches, [n for n in range(90, 100) if n % 7])
+
+
+class _BlockingSource(ListLineSource):
+    """첫 검색 블록에서 해제될 때까지 멈추는 라인 소스"""
+
+    def __init__(self, lines):
+        super().__init__(lines)
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def search(self, matcher, start=0, stop=None, block_lines=20000, should_stop=None):
+        if not self.release.is_set():
+            self.entered.set()
+            self.release.wait(5)
+        return super().search(matcher, start, stop, block_lines, should_stop)
+
+
+class _Value:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class FilterWorkerTest(unittest.TestCase):
+    """OptimizedLogViewer 필터 워커 테스트 (화면 없이 실행)"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="log_viewer_test_")
+        self.viewer = OptimizedLogViewer(logs_dir=self.temp_dir)
+        self.viewer._render_view = lambda: None
+        self.viewer.filter_entry = _Value("")
+        self.viewer.case_sensitive_var = _Value(False)
+
+    def tearDown(self):
+        self.viewer.on_closing()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def wait_filter(self):
+        deadline = time.time() + 5
+        while self.viewer._filter_running and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_filter_changed_while_running_is_applied(self):
+        """워커 실행 중 필터가 바뀌면 끝난 워커가 최신 필터로 다시 시작"""
+        source = _BlockingSource([f"{'ERROR' if i % 2 else 'INFO'} {i}" for i in range(10)])
+        self.viewer.line_source = source
+
+        self.viewer.filter_entry.value = "info"
+        self.viewer.apply_filter()
+        self.assertTrue(source.entered.wait(5))
+
+        # 첫 워커가 검색 중일 때 새 필터 (시작 요청은 실행 중이라 무시됨)
+        self.viewer.filter_entry.value = "error"
+        self.viewer.apply_filter()
+        source.release.set()
+
+        self.wait_filter()
+        time.sleep(0.05)
+        self.wait_filter()
+        self.assertEqual(list(self.viewer.filtered_rows), [1, 3, 5, 7, 9])
+        self.assertEqual(self.viewer.filtered_upto, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
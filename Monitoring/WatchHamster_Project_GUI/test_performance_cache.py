@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+성능 최적화 캐시 테스트
+LRU 순서, 직렬화 크기 기반 용량 제한, 네임스페이스별 TTL, 버전 무효화 검증
+"""
+
+import os
+import sys
+import time
+import unittest
+
+# 현재 디렉토리를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from core.performance_optimizer import LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+    """LRUCache 테스트"""
+
+    def test_lru_eviction_by_count(self):
+        """최근 사용한 항목은 남고 가장 오래 사용하지 않은 항목부터 제거"""
+        cache = LRUCache(max_entries=3)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        cache.get("a")
+        cache.set("d", "d")
+
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("a"), "a")
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_byte_budget_counts_nested_payload(self):
+        """용량은 중첩 데이터까지 포함한 직렬화 크기로 계산"""
+        payload = {"rows": [{"line": f"{index:03d}" + "x" * 100} for index in range(50)]}
+        size = LRUCache.measure_size(payload)
+        self.assertGreater(size, 5000)
+
+        cache = LRUCache(max_bytes=size * 4 + 100)
+        for index in range(5):
+            cache.set(f"k{index}", payload)
+
+        self.assertEqual(len(cache), 4)
+        self.assertLessEqual(cache.total_bytes, cache.max_bytes)
+        self.assertFalse(cache.set("huge", "x" * cache.max_bytes))
+        self.assertEqual(cache.get_stats()["rejected"], 1)
+
+    def test_namespace_ttl_and_version(self):
+        """네임스페이스별 TTL 만료, 버전이 바뀌면 미스"""
+        cache = LRUCache(namespace_ttls={"api": 0.01, "json": 60})
+        cache.set("api_data", {"ok": True}, namespace="api")
+        cache.set("json_file", [1, 2], namespace="json", version=(1, 10))
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("api_data"))
+        self.assertEqual(cache.get("json_file", version=(1, 10)), [1, 2])
+        self.assertIsNone(cache.get("json_file", version=(2, 12)))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["namespaces"]["json"], {"hits": 1, "misses": 1})
+        self.assertEqual(stats["expirations"], 2)
+
+    def test_plain_miss_counted_per_namespace(self):
+        """항목이 없을 때의 미스도 조회 시 전달한 네임스페이스로 집계"""
+        cache = LRUCache()
+        self.assertIsNone(cache.get("log_tail_a", namespace="log_tail"))
+        cache.set("log_tail_a", ["line"], namespace="log_tail")
+        self.assertEqual(cache.get("log_tail_a", namespace="log_tail"), ["line"])
+        self.assertIsNone(cache.get("unknown"))
+
+        namespaces = cache.get_stats()["namespaces"]
+        self.assertEqual(namespaces["log_tail"], {"hits": 1, "misses": 1})
+        self.assertEqual(namespaces["default"], {"hits": 0, "misses": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,8 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-import psutil
-import time
+
+from core.metrics_sampler import get_metrics_sampler
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -71,43 +71,22 @@ async def get_system_overview():
             datetime.fromisoformat(log.get('timestamp', '')).date() == today
         )
         
-        # 시스템 상태
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
-        
-        # 디스크 (Mac APFS 합산)
-        import platform
-        if platform.system() == 'Darwin':
-            total_used = 0
-            total_size = 0
-            for partition in psutil.disk_partitions():
-                if 'disk' in partition.device and 's' in partition.device:
-                    try:
-                        usage = psutil.disk_usage(partition.mountpoint)
-                        total_used += usage.used
-                        if total_size == 0:
-                            total_size = usage.total
-                    except:
-                        pass
-            disk_usage = (total_used / total_size) * 100 if total_size > 0 else 0
-        else:
-            disk = psutil.disk_usage('/')
-            disk_usage = disk.percent
+        # 시스템 상태 (백그라운드 샘플러의 최신 샘플, Mac APFS 디스크 합산 포함)
+        sample = get_metrics_sampler().snapshot()
+        cpu_percent = sample['cpu_percent']
+        memory_percent = sample['memory_percent']
+        disk_usage = sample['disk_percent']
         
         # 시스템 헬스
-        if cpu_percent > 90 or memory.percent > 95 or disk_usage > 95:
+        if cpu_percent > 90 or memory_percent > 95 or disk_usage > 95:
             system_health = "critical"
-        elif cpu_percent > 70 or memory.percent > 80 or disk_usage > 80:
+        elif cpu_percent > 70 or memory_percent > 80 or disk_usage > 80:
             system_health = "warning"
         else:
             system_health = "healthy"
         
         # 업타임
-        try:
-            boot_time = psutil.boot_time()
-            uptime_seconds = int(time.time() - boot_time)
-        except:
-            uptime_seconds = 0
+        uptime_seconds = sample['uptime']
         
         return SystemOverview(
             total_companies=total_companies,
@@ -119,7 +98,7 @@ async def get_system_overview():
             api_response_time_ms=2.0,  # 평균값
             uptime_seconds=uptime_seconds,
             cpu_usage=round(cpu_percent, 1),
-            memory_usage=round(memory.percent, 1),
+            memory_usage=round(memory_percent, 1),
             disk_usage=round(disk_usage, 1),
             timestamp=datetime.now().isoformat()
         )
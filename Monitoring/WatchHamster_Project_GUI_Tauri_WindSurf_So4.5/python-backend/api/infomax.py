@@ -7,19 +7,21 @@ InfoMax API 프록시 서버
 import asyncio
 import json
 import logging
+import os
+import tempfile
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 import httpx
 from fastapi import APIRouter, HTTPException, Query, Header
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel
+from starlette.background import BackgroundTask
 
-logger = logging.getLogger(__name__)
+from core.bond_export import DEFAULT_PAGE_DAYS, EXPORT_FORMATS, BondExportPipeline, ExportFilter
+from core.infomax_proxy_client import INFOMAX_BASE_URL, REQUEST_TIMEOUT, get_infomax_proxy_client
 
-# InfoMax API 설정
-INFOMAX_BASE_URL = "https://infomaxy.einfomax.co.kr/api"
-REQUEST_TIMEOUT = 30.0
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/infomax", tags=["InfoMax API Proxy"])
 
@@ -40,6 +42,34 @@ class InfoMaxError(BaseModel):
     timestamp: str
 
 
+class BondExportFilter(BaseModel):
+    field: str
+    op: str = "contains"  # contains, eq, range, isna
+    value: Optional[str] = None
+    start: Optional[str] = None
+    end: Optional[str] = None
+    logic: str = "and"  # and, or
+
+
+class BondExportRequest(BaseModel):
+    startDate: str
+    endDate: str
+    stdcd: str = ""
+    market: str = ""
+    format: str = "csv"  # csv, parquet, xlsx
+    columns: Optional[List[str]] = None
+    filters: List[BondExportFilter] = []
+    korean_headers: bool = False
+    page_days: int = DEFAULT_PAGE_DAYS
+
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+}
+
+
 @router.get("/test")
 async def test_proxy():
     """프록시 서버 테스트 엔드포인트"""
@@ -51,6 +81,31 @@ async def test_proxy():
     }
 
 
+@router.get("/cache/stats")
+async def get_proxy_cache_stats():
+    """프록시 연결 풀/응답 캐시 통계"""
+    return {
+        "success": True,
+        "stats": get_infomax_proxy_client().get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@router.delete("/cache")
+async def invalidate_proxy_cache(
+    endpoint: Optional[str] = Query(None, description="무효화할 엔드포인트 (예: stock/code, 생략 시 전체)")
+):
+    """프록시 응답 캐시 무효화"""
+    removed = get_infomax_proxy_client().cache.invalidate(endpoint)
+    logger.info(f"🧹 InfoMax 프록시 캐시 무효화: {endpoint or '전체'} ({removed}건)")
+    return {
+        "success": True,
+        "removed": removed,
+        "endpoint": endpoint,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 @router.get("/bond/market/mn_hist")
 async def get_bond_market_hist(
     authorization: str = Header(..., description="Bearer 토큰"),
@@ -89,6 +144,101 @@ async def get_bond_market_hist(
     )
 
 
+@router.post("/bond/export")
+async def export_bond_market_hist(
+    export_request: BondExportRequest,
+    authorization: str = Header(..., description="Bearer 토큰")
+):
+    """
+    채권 체결정보 내보내기 (mn_hist 페이지 조회 + basic_info stdcd 조인 + 필터)
+    
+    기간을 page_days 단위로 나누어 조회하고 페이지마다 바로 기록하므로
+    여러 해 구간도 고정 메모리로 처리합니다. CSV는 스트리밍 응답, Parquet/XLSX는 파일 응답입니다.
+    """
+    if not authorization.startswith("Bearer "):
+        raise HTTPException(
+            status_code=401,
+            detail="Authorization 헤더는 'Bearer TOKEN' 형식이어야 합니다."
+        )
+    if export_request.format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {export_request.format}")
+    
+    token = authorization.split(" ", 1)[1]
+    proxy = get_infomax_proxy_client()
+    
+    async def fetch(endpoint: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        response = await proxy.get(endpoint, params, token)
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=502,
+                detail=f"InfoMax API 호출 실패 ({endpoint}): HTTP {response.status_code}"
+            )
+        return response.json().get("results") or []
+    
+    try:
+        pipeline = BondExportPipeline(
+            fetch,
+            start_date=export_request.startDate,
+            end_date=export_request.endDate,
+            params={"stdcd": export_request.stdcd, "market": export_request.market},
+            filters=[ExportFilter(**condition.model_dump()) for condition in export_request.filters],
+            columns=export_request.columns,
+            korean_headers=export_request.korean_headers,
+            page_days=export_request.page_days
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    file_name = f"INFOMAX_BOND_API_{export_request.startDate}_{export_request.endDate}.{export_request.format}"
+    logger.info(f"📦 채권 내보내기 시작: {file_name} ({len(pipeline.pages)}페이지)")
+    
+    if export_request.format == "csv":
+        # 첫 청크까지 미리 조회해 초기 업스트림 오류는 200 헤더 전에 상태 코드로 응답
+        chunks = pipeline.stream_csv()
+        try:
+            first_chunk = await chunks.__anext__()
+        except StopAsyncIteration:
+            first_chunk = b""
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"🔥 채권 내보내기 실패: {e}")
+            raise HTTPException(status_code=500, detail=f"내보내기 실패: {str(e)}")
+        
+        async def body():
+            yield first_chunk
+            async for chunk in chunks:
+                yield chunk
+        
+        return StreamingResponse(
+            body(),
+            media_type=EXPORT_MEDIA_TYPES["csv"],
+            headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
+        )
+    
+    fd, path = tempfile.mkstemp(suffix=f".{export_request.format}")
+    os.close(fd)
+    try:
+        await pipeline.write_file(path, export_request.format)
+    except HTTPException:
+        os.unlink(path)
+        raise
+    except ValueError as e:
+        os.unlink(path)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        os.unlink(path)
+        logger.error(f"🔥 채권 내보내기 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"내보내기 실패: {str(e)}")
+    
+    return FileResponse(
+        path,
+        media_type=EXPORT_MEDIA_TYPES[export_request.format],
+        filename=file_name,
+        background=BackgroundTask(os.unlink, path)
+    )
+
+
 @router.get("/bond/marketvaluation")
 async def get_bond_marketvaluation(
     authorization: str = Header(..., description="Bearer 토큰"),
@@ -211,62 +361,70 @@ async def _make_infomax_request(
     logger.info(f"🚀 InfoMax API 호출: {url}")
     logger.info(f"📤 파라미터: {json.dumps(params, ensure_ascii=False)}")
     
+    proxy = get_infomax_proxy_client()
+    
+    # 참조성/지난 날짜 조회는 캐시에서 바로 응답
+    cache_key = proxy.cache.make_key(endpoint, params, token)
+    cached = proxy.cache.get(cache_key)
+    if cached is not None:
+        execution_time = (datetime.now() - start_time).total_seconds()
+        logger.info(f"💾 캐시 응답 ({execution_time:.3f}초)")
+        return JSONResponse(content={**cached, "timestamp": datetime.now().isoformat(),
+                                     "execution_time": execution_time, "cached": True})
+    
     try:
-        async with httpx.AsyncClient(verify=False, timeout=REQUEST_TIMEOUT) as client:
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "User-Agent": "WatchHamster-InfoMax-Proxy/1.0"
-            }
-            
-            response = await client.get(url, params=params, headers=headers)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            logger.info(f"📊 응답 상태: {response.status_code} {response.reason_phrase}")
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    logger.info(f"✅ API 호출 성공 ({execution_time:.3f}초)")
-                    
-                    return JSONResponse(
-                        content={
-                            "success": True,
-                            "data": data,
-                            "status": response.status_code,
-                            "url": str(response.url),
-                            "timestamp": datetime.now().isoformat(),
-                            "execution_time": execution_time
-                        }
-                    )
-                except json.JSONDecodeError as e:
-                    logger.error(f"📄 JSON 파싱 오류: {e}")
-                    raise HTTPException(
-                        status_code=502,
-                        detail="InfoMax API 응답을 JSON으로 파싱할 수 없습니다."
-                    )
-            else:
-                # 오류 응답 처리
-                try:
-                    error_data = response.json()
-                    error_message = error_data.get('message', f'HTTP {response.status_code}')
-                except:
-                    error_message = f"HTTP {response.status_code}: {response.reason_phrase}"
+        response = await proxy.get(endpoint, params, token)
+        execution_time = (datetime.now() - start_time).total_seconds()
+        
+        logger.info(f"📊 응답 상태: {response.status_code} {response.reason_phrase}")
+        
+        if response.status_code == 200:
+            try:
+                data = response.json()
+                logger.info(f"✅ API 호출 성공 ({execution_time:.3f}초)")
                 
-                logger.error(f"❌ API 호출 실패: {error_message}")
+                content = {
+                    "success": True,
+                    "data": data,
+                    "status": response.status_code,
+                    "url": str(response.url)
+                }
+                proxy.cache.store(cache_key, content)
                 
                 return JSONResponse(
-                    status_code=response.status_code,
                     content={
-                        "success": False,
-                        "error": error_message,
-                        "status": response.status_code,
+                        **content,
                         "timestamp": datetime.now().isoformat(),
                         "execution_time": execution_time
                     }
                 )
-                
+            except json.JSONDecodeError as e:
+                logger.error(f"📄 JSON 파싱 오류: {e}")
+                raise HTTPException(
+                    status_code=502,
+                    detail="InfoMax API 응답을 JSON으로 파싱할 수 없습니다."
+                )
+        else:
+            # 오류 응답 처리
+            try:
+                error_data = response.json()
+                error_message = error_data.get('message', f'HTTP {response.status_code}')
+            except:
+                error_message = f"HTTP {response.status_code}: {response.reason_phrase}"
+            
+            logger.error(f"❌ API 호출 실패: {error_message}")
+            
+            return JSONResponse(
+                status_code=response.status_code,
+                content={
+                    "success": False,
+                    "error": error_message,
+                    "status": response.status_code,
+                    "timestamp": datetime.now().isoformat(),
+                    "execution_time": execution_time
+                }
+            )
+            
     except httpx.TimeoutException:
         logger.error("⏰ 요청 시간 초과")
         raise HTTPException(
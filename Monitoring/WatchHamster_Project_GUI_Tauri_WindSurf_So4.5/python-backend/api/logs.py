@@ -17,6 +17,10 @@ from fastapi.responses import StreamingResponse, FileResponse, Response
 from pydantic import BaseModel
 import aiofiles
 import re
+from contextlib import closing
+
+from utils.log_index import LogFileIndex, get_log_index
+from utils.log_tailer import get_log_tailer, parse_log_record
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -238,23 +242,11 @@ async def get_logs(
         if not log_file_path.exists():
             raise HTTPException(status_code=404, detail=f"로그 파일을 찾을 수 없습니다: {file_name}")
         
-        logs = []
-        
-        # 로그 파일 읽기
-        async with aiofiles.open(log_file_path, 'r', encoding='utf-8') as f:
-            lines = await f.readlines()
-        
-        # 로그 파싱 및 필터링
-        for line in lines:
-            log_entry = _parse_log_line(line.strip())
-            if log_entry and _matches_filter(log_entry, level, search, start_time, end_time):
-                logs.append(log_entry)
-        
-        # 최신 로그부터 정렬
-        logs.sort(key=lambda x: x.timestamp, reverse=True)
-        
-        # 페이지네이션 적용
-        paginated_logs = logs[offset:offset + limit]
+        # 사이드카 인덱스로 범위를 좁혀 파일 끝에서부터 필요한 만큼만 읽음
+        index = get_log_index(log_file_path)
+        paginated_logs = await asyncio.to_thread(
+            _query_logs, index, limit, offset, level, search, start_time, end_time
+        )
         
         return paginated_logs
         
@@ -279,25 +271,19 @@ async def stream_logs(
             yield f"data: {json.dumps({'error': f'로그 파일을 찾을 수 없습니다: {file_name}'})}\n\n"
             return
         
-        # 파일 끝에서 시작
+        # 파일별 공유 테일러 구독 (파일 끝부터, 파싱/직렬화된 항목을 모든 클라이언트가 공유)
+        subscription = get_log_tailer(log_file_path).subscribe()
         try:
-            async with aiofiles.open(log_file_path, 'r', encoding='utf-8') as f:
-                # 파일 끝으로 이동
-                await f.seek(0, 2)
-                
-                while True:
-                    line = await f.readline()
-                    if line:
-                        log_entry = _parse_log_line(line.strip())
-                        if log_entry and (not level or log_entry.level.upper() == level.upper()):
-                            yield f"data: {json.dumps(log_entry.dict(), default=str)}\n\n"
-                    else:
-                        # 새 로그가 없으면 잠시 대기
-                        await asyncio.sleep(1)
+            while True:
+                event = await subscription.get()
+                if not level or event.entry['level'].upper() == level.upper():
+                    yield f"data: {event.to_json()}\n\n"
                         
         except Exception as e:
             logger.error(f"로그 스트리밍 오류: {e}")
             yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        finally:
+            subscription.close()
     
     return StreamingResponse(
         log_generator(),
@@ -395,24 +381,11 @@ async def search_logs(
         if not log_file_path.exists():
             raise HTTPException(status_code=404, detail=f"로그 파일을 찾을 수 없습니다: {file_name}")
         
-        matching_logs = []
         search_pattern = re.compile(query if case_sensitive else query, re.IGNORECASE if not case_sensitive else 0)
         
-        # 로그 파일 읽기 및 검색
-        async with aiofiles.open(log_file_path, 'r', encoding='utf-8') as f:
-            lines = await f.readlines()
-        
-        for line in lines:
-            if search_pattern.search(line):
-                log_entry = _parse_log_line(line.strip())
-                if log_entry:
-                    matching_logs.append(log_entry)
-                    
-                    if len(matching_logs) >= limit:
-                        break
-        
-        # 최신 로그부터 정렬
-        matching_logs.sort(key=lambda x: x.timestamp, reverse=True)
+        # 최신 로그부터 역방향 검색
+        index = get_log_index(log_file_path)
+        matching_logs = await asyncio.to_thread(_search_logs, index, search_pattern, limit)
         
         return {
             "query": query,
@@ -441,51 +414,15 @@ async def get_log_statistics(
         if not log_file_path.exists():
             raise HTTPException(status_code=404, detail=f"로그 파일을 찾을 수 없습니다: {file_name}")
         
-        # 통계 데이터 초기화
-        stats = {
-            "total_logs": 0,
-            "level_counts": {"DEBUG": 0, "INFO": 0, "WARNING": 0, "ERROR": 0, "CRITICAL": 0},
-            "hourly_counts": {},
-            "top_loggers": {},
-            "error_messages": []
-        }
-        
         cutoff_time = datetime.now() - timedelta(hours=hours)
         
-        # 로그 파일 읽기 및 분석
-        async with aiofiles.open(log_file_path, 'r', encoding='utf-8') as f:
-            lines = await f.readlines()
-        
-        for line in lines:
-            log_entry = _parse_log_line(line.strip())
-            if log_entry and log_entry.timestamp >= cutoff_time:
-                stats["total_logs"] += 1
-                
-                # 레벨별 카운트
-                if log_entry.level in stats["level_counts"]:
-                    stats["level_counts"][log_entry.level] += 1
-                
-                # 시간별 카운트
-                hour_key = log_entry.timestamp.strftime("%Y-%m-%d %H:00")
-                stats["hourly_counts"][hour_key] = stats["hourly_counts"].get(hour_key, 0) + 1
-                
-                # 로거별 카운트
-                stats["top_loggers"][log_entry.logger_name] = stats["top_loggers"].get(log_entry.logger_name, 0) + 1
-                
-                # 에러 메시지 수집
-                if log_entry.level in ["ERROR", "CRITICAL"]:
-                    stats["error_messages"].append({
-                        "timestamp": log_entry.timestamp,
-                        "level": log_entry.level,
-                        "message": log_entry.message[:200]  # 처음 200자만
-                    })
+        # 시간 버킷 집계로 통계 계산 (기간 경계 버킷만 줄 단위 확인)
+        index = get_log_index(log_file_path)
+        stats = await asyncio.to_thread(_collect_log_statistics, index, cutoff_time)
         
         # 상위 로거 정렬
         stats["top_loggers"] = dict(sorted(stats["top_loggers"].items(), key=lambda x: x[1], reverse=True)[:10])
         
-        # 최근 에러 메시지만 유지
-        stats["error_messages"] = sorted(stats["error_messages"], key=lambda x: x["timestamp"], reverse=True)[:20]
-        
         return stats
         
     except HTTPException:
@@ -689,33 +626,11 @@ async def get_export_formats():
 # 헬퍼 함수들
 def _parse_log_line(line: str) -> Optional[LogEntry]:
     """로그 라인을 파싱하여 LogEntry 객체로 변환"""
-    if not line.strip():
-        return None
-    
     try:
         # 기본 로그 포맷: 2024-01-01 12:00:00,123 - logger_name - LEVEL - message
-        # 정규식을 사용한 파싱
-        pattern = r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),(\d{3}) - ([^-]+) - (\w+) - (.+)'
-        match = re.match(pattern, line)
-        
-        if match:
-            timestamp_str = f"{match.group(1)}.{match.group(2)}"
-            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S.%f")
-            
-            return LogEntry(
-                timestamp=timestamp,
-                level=match.group(4).strip(),
-                logger_name=match.group(3).strip(),
-                message=match.group(5).strip()
-            )
-        else:
-            # 파싱 실패 시 기본 엔트리 생성
-            return LogEntry(
-                timestamp=datetime.now(),
-                level="INFO",
-                logger_name="unknown",
-                message=line
-            )
+        # 파싱 실패 시 기본 엔트리(현재 시각, INFO, unknown) 생성
+        fields = parse_log_record(line)
+        return LogEntry(**fields) if fields else None
             
     except Exception as e:
         logger.warning(f"로그 라인 파싱 실패: {e}")
@@ -742,6 +657,124 @@ def _matches_filter(log_entry: LogEntry, level: Optional[str], search: Optional[
     
     return True
 
+# 인덱스 기반 조회 헬퍼 함수들 (스레드에서 실행)
+ERROR_MESSAGE_LIMIT = 20
+
+def _query_logs(index: LogFileIndex, limit: int, offset: int, level: Optional[str], search: Optional[str],
+                start_time: Optional[datetime], end_time: Optional[datetime]) -> List[LogEntry]:
+    """최신 로그부터 역방향으로 읽으며 조건에 맞는 로그를 offset부터 limit개 반환"""
+    logs = []
+    skipped = 0
+    search_lower = search.lower() if search else None
+    
+    with closing(index.iter_lines_reverse(level, start_time, end_time)) as lines:
+        for line in lines:
+            # 검색어가 원문에 없으면 파싱 생략
+            if search_lower and search_lower not in line.lower():
+                continue
+            
+            log_entry = _parse_log_line(line.strip())
+            if not log_entry or not _matches_filter(log_entry, level, search, start_time, end_time):
+                continue
+            
+            if skipped < offset:
+                skipped += 1
+                continue
+            
+            logs.append(log_entry)
+            if len(logs) >= limit:
+                break
+    
+    return logs
+
+def _search_logs(index: LogFileIndex, search_pattern: "re.Pattern", limit: int) -> List[LogEntry]:
+    """최신 로그부터 역방향으로 정규식 검색"""
+    matching_logs = []
+    
+    with closing(index.iter_lines_reverse()) as lines:
+        for line in lines:
+            if not search_pattern.search(line):
+                continue
+            
+            log_entry = _parse_log_line(line.strip())
+            if log_entry:
+                matching_logs.append(log_entry)
+                if len(matching_logs) >= limit:
+                    break
+    
+    return matching_logs
+
+def _collect_log_statistics(index: LogFileIndex, cutoff_time: datetime) -> Dict[str, Any]:
+    """인덱스 버킷 집계로 로그 통계 계산"""
+    stats = {
+        "total_logs": 0,
+        "level_counts": {"DEBUG": 0, "INFO": 0, "WARNING": 0, "ERROR": 0, "CRITICAL": 0},
+        "hourly_counts": {},
+        "top_loggers": {},
+        "error_messages": []
+    }
+    
+    full_buckets, partial_buckets = index.buckets_since(cutoff_time)
+    
+    for bucket in full_buckets:
+        stats["total_logs"] += bucket.lines
+        
+        # 레벨별 카운트
+        for level_name, count in bucket.levels.items():
+            if level_name in stats["level_counts"]:
+                stats["level_counts"][level_name] += count
+        
+        # 시간별 카운트
+        hour_key = f"{bucket.hour}:00"
+        stats["hourly_counts"][hour_key] = stats["hourly_counts"].get(hour_key, 0) + bucket.lines
+        
+        # 로거별 카운트
+        for logger_name, count in bucket.loggers.items():
+            stats["top_loggers"][logger_name] = stats["top_loggers"].get(logger_name, 0) + count
+    
+    # 에러 메시지 수집: 최신 버킷부터 기록된 오프셋만 읽음
+    for bucket in reversed(full_buckets):
+        if len(stats["error_messages"]) >= ERROR_MESSAGE_LIMIT:
+            break
+        positions = sorted(bucket.marks.get("ERROR", []) + bucket.marks.get("CRITICAL", []), reverse=True)
+        for position in positions[:ERROR_MESSAGE_LIMIT - len(stats["error_messages"])]:
+            log_entry = _parse_log_line(index.read_line_at(position))
+            if log_entry:
+                stats["error_messages"].append({
+                    "timestamp": log_entry.timestamp,
+                    "level": log_entry.level,
+                    "message": log_entry.message[:200]  # 처음 200자만
+                })
+    
+    # 기간 경계에 걸친 버킷은 줄 단위로 확인
+    for bucket in partial_buckets:
+        for line in index.read_bucket_lines(bucket):
+            log_entry = _parse_log_line(line.strip())
+            if not log_entry or log_entry.timestamp < cutoff_time:
+                continue
+            
+            stats["total_logs"] += 1
+            if log_entry.level in stats["level_counts"]:
+                stats["level_counts"][log_entry.level] += 1
+            
+            hour_key = log_entry.timestamp.strftime("%Y-%m-%d %H:00")
+            stats["hourly_counts"][hour_key] = stats["hourly_counts"].get(hour_key, 0) + 1
+            stats["top_loggers"][log_entry.logger_name] = stats["top_loggers"].get(log_entry.logger_name, 0) + 1
+            
+            if log_entry.level in ["ERROR", "CRITICAL"]:
+                stats["error_messages"].append({
+                    "timestamp": log_entry.timestamp,
+                    "level": log_entry.level,
+                    "message": log_entry.message[:200]
+                })
+    
+    stats["hourly_counts"] = dict(sorted(stats["hourly_counts"].items()))
+    # 최근 에러 메시지만 유지 (최신순)
+    stats["error_messages"] = sorted(
+        stats["error_messages"], key=lambda x: x["timestamp"], reverse=True
+    )[:ERROR_MESSAGE_LIMIT]
+    return stats
+
 # 로그 포맷팅 헬퍼 함수들
 def _format_logs_as_txt(logs: List[LogEntry]) -> str:
     """로그를 텍스트 형식으로 포맷팅"""
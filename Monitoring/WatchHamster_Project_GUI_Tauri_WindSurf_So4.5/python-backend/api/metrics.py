@@ -5,14 +5,14 @@
 
 import logging
 import psutil
-import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-# 시스템 모니터링을 위한 기본 모듈들 (안정성 우선)
-# from core.system_monitor import get_system_monitor, RealSystemMonitor  # 필요시 활성화
+# 시스템 메트릭은 백그라운드 샘플러의 링 버퍼에서 읽음 (요청 처리 중 psutil 측정 없음)
+from core.metrics_sampler import get_metrics_sampler
+from utils.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -46,20 +46,37 @@ class StabilityMetrics(BaseModel):
     system_health: str  # healthy, warning, critical
     service_failures: List[Dict[str, Any]]
 
-# 메트릭 히스토리 저장 (실제로는 데이터베이스 사용)
-metrics_history = []
+def _to_system_metrics(sample: Dict[str, Any], sampler) -> SystemMetrics:
+    """샘플러 샘플을 SystemMetrics로 변환"""
+    network_status = "active" if sample['net_bytes_sent'] > 0 or sample['net_bytes_recv'] > 0 else "connected"
+    # 간단한 네트워크 사용률 계산 (0-100%)
+    network_usage = min(50.0, (sample['net_bytes_sent'] + sample['net_bytes_recv']) / (1024 * 1024) % 100)
+    
+    return SystemMetrics(
+        cpu_percent=round(sample['cpu_percent'], 1),
+        memory_percent=round(sample['memory_percent'], 1),
+        disk_usage=round(sample['disk_percent'], 1),
+        disk_used_gb=round(sample['disk_used_gb'], 1),
+        disk_total_gb=round(sampler.disk_total_gb, 1),
+        disk_free_gb=round(sample['disk_free_gb'], 1),
+        network_status=network_status,
+        network_usage=round(network_usage, 1),
+        network_speed_mbps=round(network_usage / 10.0, 1),  # 간단한 변환
+        uptime=int(sample['timestamp'] - sampler.boot_time),
+        active_services=min(int(sample['process_count']), 999),  # UI 표시 제한
+        timestamp=datetime.fromtimestamp(sample['timestamp']).isoformat()
+    )
 
 @router.get("/summary")
 async def get_metrics_summary():
     """메트릭 요약 (간단 버전)"""
     try:
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
+        sample = get_metrics_sampler().snapshot()
         
         return {
-            "cpu": round(cpu_percent, 1),
-            "memory": round(memory.percent, 1),
-            "timestamp": datetime.now().isoformat()
+            "cpu": round(sample['cpu_percent'], 1),
+            "memory": round(sample['memory_percent'], 1),
+            "timestamp": sample['sampled_at'].isoformat()
         }
     except Exception as e:
         logger.error(f"메트릭 요약 실패: {e}")
@@ -68,103 +85,22 @@ async def get_metrics_summary():
 
 @router.get("/", response_model=SystemMetrics)
 async def get_system_metrics():
-    """현재 시스템 메트릭 조회 - 직접 psutil 사용으로 안정성 확보"""
+    """현재 시스템 메트릭 조회 (샘플러의 최신 샘플)"""
     logger.info("시스템 메트릭 조회 요청")
     
     try:
-        # 직접 psutil로 시스템 메트릭 수집 (안정성 우선)
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
-        
-        # 디스크 사용량 (크로스 플랫폼 호환)
-        try:
-            # Mac APFS는 여러 볼륨으로 나뉘어 있어서 합산 필요
-            import platform
-            if platform.system() == 'Darwin':  # Mac
-                total_used = 0
-                total_size = 0
-                for partition in psutil.disk_partitions():
-                    # APFS 볼륨들만 합산
-                    if 'disk' in partition.device and 's' in partition.device:
-                        try:
-                            usage = psutil.disk_usage(partition.mountpoint)
-                            total_used += usage.used
-                            if total_size == 0:  # 전체 크기는 한 번만
-                                total_size = usage.total
-                        except:
-                            pass
-                
-                disk_used_gb = total_used / (1024**3)
-                disk_total_gb = total_size / (1024**3)
-                disk_free_gb = (total_size - total_used) / (1024**3)
-                disk_usage = (total_used / total_size) * 100 if total_size > 0 else 0
-            else:
-                # Windows/Linux는 기존 방식
-                disk = psutil.disk_usage('/' if platform.system() != 'Windows' else 'C:\\')
-                disk_usage = disk.percent
-                disk_used_gb = disk.used / (1024**3)
-                disk_total_gb = disk.total / (1024**3)
-                disk_free_gb = disk.free / (1024**3)
-        except Exception as e:
-            logger.warning(f"디스크 정보 수집 실패: {e}")
-            disk_usage = 0.0
-            disk_used_gb = 0.0
-            disk_total_gb = 0.0
-            disk_free_gb = 0.0
-        
-        # 네트워크 상태
-        network_status = "connected"
-        network_usage = 0.0
-        try:
-            net_io = psutil.net_io_counters()
-            if net_io and (net_io.bytes_sent > 0 or net_io.bytes_recv > 0):
-                network_status = "active"
-                # 간단한 네트워크 사용률 계산 (0-100%)
-                network_usage = min(50.0, (net_io.bytes_sent + net_io.bytes_recv) / (1024 * 1024) % 100)
-        except:
-            network_status = "unknown"
-        
-        # 시스템 업타임
-        try:
-            boot_time = psutil.boot_time()
-            uptime = int(time.time() - boot_time)
-        except:
-            uptime = 0
-        
-        # 활성 서비스 수 (프로세스 수로 대체)
-        try:
-            active_services = len(psutil.pids())
-        except:
-            active_services = 0
-        
-        metrics = SystemMetrics(
-            cpu_percent=round(cpu_percent, 1),
-            memory_percent=round(memory.percent, 1),
-            disk_usage=round(disk_usage, 1),
-            disk_used_gb=round(disk_used_gb, 1),
-            disk_total_gb=round(disk_total_gb, 1),
-            disk_free_gb=round(disk_free_gb, 1),
-            network_status=network_status,
-            network_usage=round(network_usage, 1),
-            network_speed_mbps=round(network_usage / 10.0, 1),  # 간단한 변환
-            uptime=uptime,
-            active_services=min(active_services, 999),  # UI 표시 제한
-            timestamp=datetime.now().isoformat()
-        )
-        
-        # 히스토리에 추가 (최대 100개 유지)
-        metrics_history.append(metrics)
-        if len(metrics_history) > 100:
-            metrics_history.pop(0)
+        sampler = get_metrics_sampler()
+        sample = sampler.snapshot()
+        metrics = _to_system_metrics(sample, sampler)
         
         # 경고 상황 체크
         warnings = []
-        if cpu_percent > 80:
-            warnings.append(f"높은 CPU 사용률: {cpu_percent:.1f}%")
-        if memory.percent > 85:
-            warnings.append(f"높은 메모리 사용률: {memory.percent:.1f}%")
-        if disk_usage > 90:
-            warnings.append(f"높은 디스크 사용률: {disk_usage:.1f}%")
+        if metrics.cpu_percent > 80:
+            warnings.append(f"높은 CPU 사용률: {metrics.cpu_percent:.1f}%")
+        if metrics.memory_percent > 85:
+            warnings.append(f"높은 메모리 사용률: {metrics.memory_percent:.1f}%")
+        if metrics.disk_usage > 90:
+            warnings.append(f"높은 디스크 사용률: {metrics.disk_usage:.1f}%")
         
         if warnings:
             logger.warning(f"시스템 경고: {', '.join(warnings)}")
@@ -191,22 +127,12 @@ async def get_performance_metrics():
     """성능 메트릭 조회 (히스토리 포함)"""
     logger.info("성능 메트릭 조회 요청")
     
-    if not metrics_history:
-        # 빈 데이터 반환
-        return PerformanceMetrics(
-            cpu_usage=[],
-            memory_usage=[],
-            disk_io={},
-            network_io={},
-            timestamps=[]
-        )
-    
     # 최근 20개 데이터 포인트
-    recent_metrics = metrics_history[-20:]
+    recent_samples = get_metrics_sampler().history(20)
     
-    cpu_usage = [m.cpu_percent for m in recent_metrics]
-    memory_usage = [m.memory_percent for m in recent_metrics]
-    timestamps = [m.timestamp for m in recent_metrics]
+    cpu_usage = [round(sample['cpu_percent'], 1) for sample in recent_samples]
+    memory_usage = [round(sample['memory_percent'], 1) for sample in recent_samples]
+    timestamps = [sample['sampled_at'].isoformat() for sample in recent_samples]
     
     # 디스크 I/O 정보
     try:
@@ -234,9 +160,10 @@ async def get_stability_metrics():
     logger.info("안정성 메트릭 조회 요청")
     
     try:
-        # 시스템 상태 체크
-        cpu_percent = psutil.cpu_percent()
-        memory_percent = psutil.virtual_memory().percent
+        # 시스템 상태 체크 (최근 1분 평균으로 순간 급등에 흔들리지 않도록)
+        buffer = get_metrics_sampler().buffer
+        cpu_percent = buffer.aggregate('cpu_percent', 60)['avg']
+        memory_percent = buffer.aggregate('memory_percent', 60)['avg']
         
         # 시스템 상태 판단
         if cpu_percent > 90 or memory_percent > 95:
@@ -284,11 +211,12 @@ async def get_metrics_history(limit: int = 50):
     logger.info(f"메트릭 히스토리 조회 요청 (limit: {limit})")
     
     # 최근 N개 메트릭 반환
-    recent_metrics = metrics_history[-limit:] if metrics_history else []
+    sampler = get_metrics_sampler()
+    recent_metrics = [_to_system_metrics(sample, sampler) for sample in sampler.history(limit)]
     
     return {
         "metrics": recent_metrics,
-        "total_count": len(metrics_history),
+        "total_count": len(sampler.buffer),
         "returned_count": len(recent_metrics)
     }
 
@@ -297,11 +225,14 @@ async def clear_metrics_history():
     """메트릭 히스토리 초기화"""
     logger.info("메트릭 히스토리 초기화 요청")
     
-    global metrics_history
-    cleared_count = len(metrics_history)
-    metrics_history.clear()
+    cleared_count = get_metrics_sampler().buffer.clear()
     
     return {
         "message": f"{cleared_count}개의 메트릭 히스토리가 초기화되었습니다",
         "cleared_count": cleared_count
-    }
\ No newline at end of file
+    }
+
+@router.get("/rate-limit")
+async def get_rate_limit_stats():
+    """레이트 리미터 허용/차단 카운터 조회"""
+    return get_rate_limiter().get_stats()
@@ -9,6 +9,8 @@ from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
+from core.state_backend import StateLog
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -59,14 +61,14 @@ class MonitorStats(BaseModel):
     last_failure: Optional[str] = None
 
 
-# 임시 로그 저장소 (실제로는 DB 사용)
-execution_logs: List[Dict[str, Any]] = []
+# 실행 로그 저장소 (상태 백엔드 - 여러 워커가 공유 가능, 최근 1000개 유지)
+execution_logs = StateLog("monitor_execution_logs", max_items=1000)
 
 
 @router.get("/recent")
 async def get_recent_logs(limit: int = Query(10, ge=1, le=100)):
     """최근 모니터 실행 로그 조회 (간단 버전)"""
-    logs = execution_logs.copy()
+    logs = execution_logs.entries()
     logs.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
     return logs[:limit]
 
@@ -78,13 +80,13 @@ async def get_monitor_executions(
     limit: int = Query(50, ge=1, le=500)
 ):
     """모니터 실행 로그 조회"""
-    logs = execution_logs.copy()
-    
     # 필터링
+    match = {}
     if monitor_name:
-        logs = [log for log in logs if log.get("monitor_name") == monitor_name]
+        match["monitor_name"] = monitor_name
     if status:
-        logs = [log for log in logs if log.get("status") == status]
+        match["status"] = status
+    logs = execution_logs.entries(match=match)
     
     # 최신순 정렬
     logs.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
@@ -100,7 +102,7 @@ async def get_monitor_stats():
     monitors = ["newyork-market-watch", "kospi-close", "exchange-rate"]
     
     for monitor in monitors:
-        monitor_logs = [log for log in execution_logs if log.get("monitor_name") == monitor]
+        monitor_logs = execution_logs.entries(match={"monitor_name": monitor})
         
         if not monitor_logs:
             stats.append(MonitorStats(
@@ -144,10 +146,6 @@ async def add_monitor_log(log: MonitorExecutionLog):
     """모니터 실행 로그 추가 (내부용)"""
     execution_logs.append(log.dict())
     
-    # 최대 1000개까지만 저장
-    if len(execution_logs) > 1000:
-        execution_logs.pop(0)
-    
     logger.info(f"Monitor log added: {log.monitor_name} - {log.status}")
     return {"status": "ok", "log_id": log.id}
 
@@ -155,7 +153,7 @@ async def add_monitor_log(log: MonitorExecutionLog):
 @router.get("/latest/{monitor_name}", response_model=Optional[MonitorExecutionLog])
 async def get_latest_execution(monitor_name: str):
     """특정 모니터의 최신 실행 로그"""
-    monitor_logs = [log for log in execution_logs if log.get("monitor_name") == monitor_name]
+    monitor_logs = execution_logs.entries(match={"monitor_name": monitor_name})
     
     if not monitor_logs:
         return None
@@ -273,6 +271,10 @@ def init_demo_data():
         )
     ]
     
+    # 다른 워커가 이미 채웠으면 중복 추가하지 않음
+    if execution_logs.count() > 0:
+        return
+    
     for log in demo_logs:
         execution_logs.append(log.dict())
 
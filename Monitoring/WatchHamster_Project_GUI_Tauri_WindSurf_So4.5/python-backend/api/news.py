@@ -13,6 +13,8 @@ from pydantic import BaseModel
 # 핵심 모듈 임포트 (모던 버전)
 from core.modern_infomax_client import ModernInfomaxClient, ApiConfig
 from core.news_data_parser import NewsDataParser
+from core.news_snapshot import NewsSnapshot, NewsSnapshotService
+from core.state_backend import StateLog, StateNamespace
 from enum import Enum
 
 # 뉴스 상태 열거형 정의
@@ -46,9 +48,11 @@ class NewsHistory(BaseModel):
 class NewsRefreshRequest(BaseModel):
     news_types: Optional[List[str]] = None  # 특정 뉴스 타입만 갱신
     force: bool = False  # 강제 갱신 여부
+    wait: bool = False  # 갱신 완료까지 기다려 타입별 결과 반환
+    timeout: Optional[float] = None  # 뉴스 타입별 제한 시간 (초)
 
-# 전역 뉴스 상태 저장소
-news_status_store = {
+# 전역 뉴스 상태 저장소 (상태 백엔드 - 여러 워커가 공유 가능, 필드 변경은 merge()로 반영)
+news_status_store = StateNamespace("news_status", defaults={
     "exchange-rate": {
         "status": "unknown",
         "last_update": datetime.now() - timedelta(hours=1),
@@ -73,14 +77,24 @@ news_status_store = {
         "data": None,
         "error_message": None
     }
-}
+})
 
 # 뉴스 이력 저장소 (최근 100개 항목)
-news_history_store = []
+news_history_store = StateLog("news_history", max_items=100)
+
+# 뉴스 타입별 최근 갱신 결과 (지연 시간 포함)
+last_refresh_results: Dict[str, Dict] = {}
+
+# 뉴스 타입별 마지막으로 상태/이력에 반영한 스냅샷 (같은 스냅샷을 다시 반영하지 않도록)
+applied_snapshots: Dict[str, NewsSnapshot] = {}
+
+# 뉴스 타입별 갱신 제한 시간 (초)
+NEWS_REFRESH_TIMEOUT = 20.0
 
 # API 클라이언트 및 파서 인스턴스
 api_client = None
 news_parser = None
+news_snapshot_service = None
 
 def get_api_client():
     """Modern API 클라이언트 인스턴스 반환"""
@@ -113,6 +127,41 @@ def get_news_parser():
             news_parser = NewsDataParser()
     return news_parser
 
+def get_news_snapshot_service() -> NewsSnapshotService:
+    """뉴스 스냅샷 서비스 인스턴스 반환 (REST/WebSocket/알림 폴러 공용)"""
+    global news_snapshot_service
+    if not news_snapshot_service:
+        news_snapshot_service = NewsSnapshotService(_fetch_news_for_snapshot)
+        news_snapshot_service.subscribe(_apply_snapshot_to_store)
+    return news_snapshot_service
+
+async def _fetch_news_for_snapshot(news_type: str, date: Optional[str] = None) -> Optional[Dict]:
+    """스냅샷 서비스의 업스트림 조회 (뉴스 타입별 조회 함수 선택)"""
+    fetchers = {
+        "exchange-rate": _fetch_exchange_rate_news,
+        "newyork-market-watch": _fetch_newyork_market_news,
+        "kospi-close": _fetch_kospi_close_news,
+    }
+    if news_type not in fetchers:
+        raise ValueError(f"유효하지 않은 뉴스 타입: {news_type}")
+    return await fetchers[news_type](get_api_client(), get_news_parser())
+
+def _apply_snapshot_to_store(snapshot: NewsSnapshot):
+    """새 스냅샷을 상태 저장소에 반영 (어느 소비자가 조회했든 REST 상태가 최신 유지)"""
+    if snapshot.date is not None or snapshot.news_type not in news_status_store:
+        return
+    if snapshot.data:
+        news_status_store.merge(
+            snapshot.news_type,
+            status="latest",
+            last_update=snapshot.fetched_at,
+            data=snapshot.data,
+            delay_minutes=0,
+            error_message=None
+        )
+    else:
+        news_status_store.merge(snapshot.news_type, status="error", error_message=snapshot.error)
+
 @router.get("/status")
 async def get_news_status(news_type: Optional[str] = Query(None, description="특정 뉴스 타입 조회")):
     """뉴스 상태 조회"""
@@ -175,13 +224,26 @@ async def refresh_news_data(
                 detail=f"유효하지 않은 뉴스 타입: {invalid_types}"
             )
         
+        timeout = request.timeout or NEWS_REFRESH_TIMEOUT
+        
+        if request.wait:
+            # 타입별로 동시에 갱신하고 결과(지연 시간 포함) 반환
+            results = await _refresh_news_task(news_types_to_refresh, request.force, timeout)
+            return {
+                "message": "뉴스 데이터 갱신 완료",
+                "news_types": news_types_to_refresh,
+                "force": request.force,
+                "results": results
+            }
+        
         # 백그라운드에서 뉴스 데이터 갱신 작업 수행
-        background_tasks.add_task(_refresh_news_task, news_types_to_refresh, request.force)
+        background_tasks.add_task(_refresh_news_task, news_types_to_refresh, request.force, timeout)
         
         return {
             "message": f"뉴스 데이터 갱신 중...",
             "news_types": news_types_to_refresh,
-            "force": request.force
+            "force": request.force,
+            "last_refresh": {nt: last_refresh_results.get(nt) for nt in news_types_to_refresh}
         }
         
     except HTTPException:
@@ -201,10 +263,7 @@ async def get_news_history(
     
     try:
         # 필터링된 이력 데이터
-        filtered_history = news_history_store
-        
-        if news_type:
-            filtered_history = [h for h in news_history_store if h.get("type") == news_type]
+        filtered_history = news_history_store.entries(match={"type": news_type} if news_type else None)
         
         # 최신 순으로 정렬
         filtered_history.sort(key=lambda x: x.get("timestamp", datetime.min), reverse=True)
@@ -243,13 +302,9 @@ async def clear_news_history(news_type: Optional[str] = Query(None, description=
     logger.info(f"뉴스 이력 정리 요청: {news_type}")
     
     try:
-        global news_history_store
-        
         if news_type:
             # 특정 뉴스 타입만 삭제
-            original_count = len(news_history_store)
-            news_history_store = [h for h in news_history_store if h.get("type") != news_type]
-            deleted_count = original_count - len(news_history_store)
+            deleted_count = news_history_store.clear(match={"type": news_type})
             
             return {
                 "message": f"'{news_type}' 뉴스 이력이 정리되었습니다",
@@ -257,8 +312,7 @@ async def clear_news_history(news_type: Optional[str] = Query(None, description=
             }
         else:
             # 모든 이력 삭제
-            deleted_count = len(news_history_store)
-            news_history_store.clear()
+            deleted_count = news_history_store.clear()
             
             return {
                 "message": "모든 뉴스 이력이 정리되었습니다",
@@ -269,113 +323,6 @@ async def clear_news_history(news_type: Optional[str] = Query(None, description=
         logger.error(f"뉴스 이력 정리 실패: {e}")
         raise HTTPException(status_code=500, detail="뉴스 이력 정리 중 오류가 발생했습니다")
 
-# 백그라운드 작업 함수
-async def _refresh_news_task(news_types: List[str], force: bool = False):
-    """뉴스 데이터 갱신 백그라운드 작업"""
-    logger.info(f"뉴스 데이터 갱신 작업 시작: {news_types}")
-    
-    client = get_api_client()
-    parser = get_news_parser()
-    
-    for news_type in news_types:
-        try:
-            start_time = datetime.now()
-            
-            # API에서 뉴스 데이터 조회
-            logger.info(f"뉴스 데이터 조회 중: {news_type}")
-            raw_data = await client.fetch_news_data(news_type)
-            
-            if not raw_data:
-                # 데이터가 없는 경우
-                news_status_store[news_type].update({
-                    "status": "error",
-                    "last_update": datetime.now(),
-                    "error_message": "API에서 데이터를 가져올 수 없습니다",
-                    "data": None
-                })
-                continue
-            
-            # 뉴스 데이터 파싱 및 상태 판단
-            logger.info(f"뉴스 데이터 파싱 중: {news_type}")
-            parsed_news = await parser.parse_news_data(raw_data, news_type)
-            
-            # 상태 저장소 업데이트
-            news_status_store[news_type].update({
-                "status": parsed_news.status.value if hasattr(parsed_news, 'status') else "unknown",
-                "last_update": datetime.now(),
-                "expected_time": getattr(parsed_news, 'expected_time', None),
-                "delay_minutes": getattr(parsed_news, 'delay_minutes', 0),
-                "data": parsed_news.dict() if hasattr(parsed_news, 'dict') else raw_data,
-                "error_message": None
-            })
-            
-            # 처리 시간 계산
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            # 이력에 추가
-            import uuid
-            history_entry = {
-                "id": str(uuid.uuid4()),
-                "type": news_type,
-                "timestamp": datetime.now(),
-                "status": parsed_news.status.value if hasattr(parsed_news, 'status') else "processed",
-                "data": parsed_news.dict() if hasattr(parsed_news, 'dict') else raw_data,
-                "processing_time": processing_time
-            }
-            
-            news_history_store.append(history_entry)
-            
-            # 이력 크기 제한 (최근 100개만 유지)
-            if len(news_history_store) > 100:
-                news_history_store.pop(0)
-            
-            logger.info(f"뉴스 데이터 갱신 완료: {news_type} (처리시간: {processing_time:.2f}초)")
-            
-            # WebSocket으로 실시간 업데이트 전송
-            try:
-                from api.websocket import manager
-                await manager.broadcast_json({
-                    "type": "news_update",
-                    "data": {
-                        "news_type": news_type,
-                        "status": news_status_store[news_type]["status"],
-                        "last_update": news_status_store[news_type]["last_update"].isoformat(),
-                        "processing_time": processing_time
-                    },
-                    "timestamp": datetime.now().isoformat()
-                })
-            except Exception as e:
-                logger.warning(f"WebSocket 뉴스 업데이트 전송 실패: {e}")
-            
-        except Exception as e:
-            logger.error(f"뉴스 데이터 갱신 실패 ({news_type}): {e}")
-            
-            # 오류 상태로 업데이트
-            news_status_store[news_type].update({
-                "status": "error",
-                "last_update": datetime.now(),
-                "error_message": str(e),
-                "data": None
-            })
-            
-            # 오류 이력 추가
-            import uuid
-            error_entry = {
-                "id": str(uuid.uuid4()),
-                "type": news_type,
-                "timestamp": datetime.now(),
-                "status": "error",
-                "data": {"error": str(e)},
-                "processing_time": 0.0
-            }
-            
-            news_history_store.append(error_entry)
-        
-        # 각 뉴스 타입 간 잠시 대기
-        await asyncio.sleep(1)
-    
-    logger.info("뉴스 데이터 갱신 작업 완료")
-
 # 주기적 뉴스 갱신 함수 (백그라운드 태스크에서 사용)
 async def periodic_news_refresh():
     """주기적 뉴스 데이터 갱신"""
@@ -487,81 +434,106 @@ async def get_news_summary():
         raise HTTPException(status_code=500, detail="뉴스 상태 요약 조회 중 오류가 발생했습니다")
 
 # 백그라운드 태스크 함수
-async def _refresh_news_task(news_types: List[str], force: bool = False):
-    """뉴스 데이터 갱신 백그라운드 태스크"""
+async def _refresh_news_task(news_types: List[str], force: bool = False,
+                             timeout: float = NEWS_REFRESH_TIMEOUT) -> Dict[str, Dict]:
+    """
+    뉴스 데이터 갱신 백그라운드 태스크
+    
+    뉴스 타입별 조회+파싱을 동시에 실행하고, 각 타입은 끝나는 즉시 상태에 반영합니다.
+    
+    Returns:
+        Dict[str, Dict]: 뉴스 타입별 갱신 결과 (status, cached, latency_ms, error)
+    """
+    logger.info(f"뉴스 데이터 갱신 태스크 시작: {news_types}, force={force}")
+    
     try:
-        logger.info(f"뉴스 데이터 갱신 태스크 시작: {news_types}, force={force}")
-        
-        # API 클라이언트와 파서 가져오기
-        client = get_api_client()
-        parser = get_news_parser()
-        
-        for news_type in news_types:
-            try:
-                logger.info(f"뉴스 데이터 갱신 시작: {news_type}")
-                start_time = datetime.now()
-                
-                # 상태를 갱신 중으로 변경
-                news_status_store[news_type]["status"] = "refreshing"
-                news_status_store[news_type]["error_message"] = None
-                
-                # 실제 뉴스 데이터 조회 (뉴스 타입별로 다른 로직 적용)
-                news_data = None
-                if news_type == "exchange-rate":
-                    # 환율 뉴스 조회 로직
-                    news_data = await _fetch_exchange_rate_news(client, parser)
-                elif news_type == "newyork-market-watch":
-                    # 뉴욕 시장 뉴스 조회 로직
-                    news_data = await _fetch_newyork_market_news(client, parser)
-                elif news_type == "kospi-close":
-                    # 코스피 종가 뉴스 조회 로직
-                    news_data = await _fetch_kospi_close_news(client, parser)
-                
-                # 갱신 완료 처리
-                processing_time = (datetime.now() - start_time).total_seconds()
-                
-                if news_data:
-                    news_status_store[news_type].update({
-                        "status": "latest",
-                        "last_update": datetime.now(),
-                        "data": news_data,
-                        "delay_minutes": 0,
-                        "error_message": None
-                    })
-                    
-                    # 이력에 추가
-                    news_history_store.append({
-                        "id": f"{news_type}_{int(datetime.now().timestamp())}",
-                        "type": news_type,
-                        "timestamp": datetime.now(),
-                        "status": "success",
-                        "data": news_data,
-                        "processing_time": processing_time
-                    })
-                    
-                    logger.info(f"뉴스 데이터 갱신 완료: {news_type} ({processing_time:.2f}초)")
-                else:
-                    # 데이터 없음
-                    news_status_store[news_type].update({
-                        "status": "error",
-                        "error_message": "뉴스 데이터를 가져올 수 없습니다"
-                    })
-                    
-            except Exception as e:
-                logger.error(f"뉴스 데이터 갱신 실패 ({news_type}): {e}")
-                news_status_store[news_type].update({
-                    "status": "error",
-                    "error_message": str(e)
-                })
-        
-        # 이력 개수 제한 (최대 100개)
-        if len(news_history_store) > 100:
-            news_history_store[:] = news_history_store[-100:]
-        
-        logger.info(f"뉴스 데이터 갱신 태스크 완료: {news_types}")
-        
+        results = await asyncio.gather(*(
+            _refresh_single_news_type(news_type, force, timeout) for news_type in news_types
+        ))
     except Exception as e:
         logger.error(f"뉴스 데이터 갱신 태스크 실패: {e}")
+        return {}
+    
+    refresh_results = dict(zip(news_types, results))
+    last_refresh_results.update(refresh_results)
+    
+    logger.info("뉴스 데이터 갱신 태스크 완료: " + ", ".join(
+        f"{news_type}={result['status']}({result['latency_ms']:.0f}ms)"
+        for news_type, result in refresh_results.items()
+    ))
+    return refresh_results
+
+async def _refresh_single_news_type(news_type: str, force: bool, timeout: float) -> Dict:
+    """뉴스 타입 하나 갱신 (제한 시간 초과 시 해당 타입만 오류 처리)"""
+    logger.info(f"뉴스 데이터 갱신 시작: {news_type}")
+    start_time = datetime.now()
+    
+    # 상태를 갱신 중으로 변경
+    news_status_store.merge(news_type, status="refreshing", error_message=None)
+    
+    error_message = None
+    fetch_latency = None
+    snapshot = None
+    try:
+        # 스냅샷 서비스로 조회 (다른 소비자의 진행 중인 조회와 합류, 기다리는 쪽이 없으면 시간 초과 시 취소)
+        snapshot = await get_news_snapshot_service().get(news_type, force=force, timeout=timeout)
+        news_data = snapshot.data
+        fetch_latency = snapshot.latency
+        if not news_data:
+            error_message = snapshot.error or "뉴스 데이터를 가져올 수 없습니다"
+    except asyncio.TimeoutError:
+        news_data = None
+        error_message = f"뉴스 데이터 조회 시간 초과 ({timeout:.0f}초)"
+    except Exception as e:
+        news_data = None
+        error_message = str(e)
+    
+    # 갱신 완료 처리
+    processing_time = (datetime.now() - start_time).total_seconds()
+    # 이 호출이 시작되기 전에 조회된 스냅샷이면 업스트림 호출 없이 보관된 스냅샷을 받은 것
+    cached = snapshot is not None and snapshot.fetched_at < start_time
+    # 지연 시간은 스냅샷이 기록한 업스트림 조회 시간 기준 (대기열/락 대기 제외),
+    # 보관된 스냅샷이거나 스냅샷이 없으면 경과 시간
+    if fetch_latency is None or cached:
+        fetch_latency = processing_time
+    
+    if news_data and applied_snapshots.get(news_type) is snapshot:
+        # 이미 반영한 스냅샷: 갱신 중 표시만 되돌리고 데이터/이력은 다시 기록하지 않음
+        news_status_store.merge(news_type, status="latest", last_update=snapshot.fetched_at, error_message=None)
+        logger.info(f"뉴스 데이터 캐시 적중: {news_type} (변경 없음)")
+    elif news_data:
+        news_status_store.merge(
+            news_type,
+            status="latest",
+            last_update=snapshot.fetched_at,
+            data=news_data,
+            delay_minutes=0,
+            error_message=None
+        )
+        
+        # 이력에 추가 (최근 100개만 유지)
+        news_history_store.append({
+            "id": f"{news_type}_{int(snapshot.fetched_at.timestamp())}",
+            "type": news_type,
+            "timestamp": snapshot.fetched_at,
+            "status": "success",
+            "data": news_data,
+            "processing_time": processing_time
+        })
+        applied_snapshots[news_type] = snapshot
+        
+        logger.info(f"뉴스 데이터 갱신 완료: {news_type} ({processing_time:.2f}초)")
+    else:
+        logger.error(f"뉴스 데이터 갱신 실패 ({news_type}): {error_message}")
+        news_status_store.merge(news_type, status="error", error_message=error_message)
+    
+    return {
+        "status": "success" if news_data else "error",
+        "cached": cached,
+        "latency_ms": round(fetch_latency * 1000, 1),
+        "error": error_message,
+        "completed_at": datetime.now()
+    }
 
 async def _fetch_exchange_rate_news(client, parser):
     """환율 뉴스 데이터 조회 (모던 클라이언트 사용)"""
@@ -4,12 +4,13 @@ publish 브랜치의 배포 상태 조회 (main 브랜치는 비공개)
 """
 
 import logging
-import subprocess
 from datetime import datetime
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from core.git_status_collector import get_git_status_collector
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -26,19 +27,14 @@ class PublishStatus(BaseModel):
     is_public: bool
 
 
-def run_git_command(command: list) -> str:
-    """Git 명령 실행"""
+async def get_publish_commit() -> Dict[str, str]:
+    """publish 브랜치 최신 커밋 (git log 한 번, ref가 바뀌지 않았으면 캐시)"""
     try:
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.stdout.strip()
+        commit = await get_git_status_collector().get_commit('origin/publish')
     except Exception as e:
         logger.error(f"Git 명령 실패: {e}")
-        return ""
+        commit = None
+    return commit or {'hash': "", 'message': "", 'date': ""}
 
 
 @router.get("/status", response_model=PublishStatus)
@@ -46,9 +42,10 @@ async def get_publish_status():
     """publish 브랜치 배포 상태 조회"""
     try:
         # publish 브랜치 최신 커밋 정보
-        commit_hash = run_git_command(['git', 'rev-parse', 'origin/publish'])
-        commit_message = run_git_command(['git', 'log', 'origin/publish', '-1', '--pretty=%s'])
-        commit_date = run_git_command(['git', 'log', 'origin/publish', '-1', '--pretty=%ci'])
+        commit = await get_publish_commit()
+        commit_hash = commit['hash']
+        commit_message = commit['message']
+        commit_date = commit['date']
         
         # 배포 상태 (최근 커밋 시간으로 판단)
         try:
@@ -87,8 +84,9 @@ async def get_publish_status():
 async def get_publish_info():
     """배포 정보 간단 조회"""
     try:
-        commit_hash = run_git_command(['git', 'rev-parse', 'origin/publish'])
-        commit_message = run_git_command(['git', 'log', 'origin/publish', '-1', '--pretty=%s'])
+        commit = await get_publish_commit()
+        commit_hash = commit['hash']
+        commit_message = commit['message']
         
         return {
             "branch": "publish",
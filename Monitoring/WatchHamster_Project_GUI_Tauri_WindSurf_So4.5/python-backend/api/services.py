@@ -397,8 +397,8 @@ async def _start_service_task(service_id: str):
         elif service_id == "webhook_sender":
             # 웹훅 발송자 시작
             try:
-                from core.webhook_sender import DoorayWebhookSender
-                sender = DoorayWebhookSender()
+                from core.webhook_sender import get_webhook_sender
+                sender = get_webhook_sender()
                 set_service_instance(service_id, sender)
                 SERVICE_START_TIMES[service_id] = time.time()
                 set_service_status(service_id, "running")
@@ -498,23 +498,18 @@ async def _restart_service_task(service_id: str):
 def get_service_metrics(service_id: str) -> dict:
     """서비스별 실제 메트릭 반환"""
     import psutil
-    import os
+    from core.metrics_sampler import get_metrics_sampler
     
     metrics = {}
     
     try:
-        # 기본 시스템 메트릭
-        metrics["cpu_percent"] = psutil.cpu_percent(interval=0.1)
-        metrics["memory_info"] = psutil.virtual_memory()
-        metrics["memory_used_mb"] = round(metrics["memory_info"].used / 1024 / 1024, 1)
-        metrics["memory_percent"] = metrics["memory_info"].percent
-        
-        # 프로세스별 메트릭 (현재 프로세스)
-        process = psutil.Process(os.getpid())
-        process_info = process.memory_info()
-        
-        metrics["process_memory_mb"] = round(process_info.rss / 1024 / 1024, 1)
-        metrics["process_cpu_percent"] = process.cpu_percent(interval=0.1)
+        # 기본 시스템 메트릭 및 현재 프로세스 메트릭 (백그라운드 샘플러의 최신 샘플)
+        sample = get_metrics_sampler().snapshot()
+        metrics["cpu_percent"] = sample["cpu_percent"]
+        metrics["memory_used_mb"] = round(sample["memory_used_gb"] * 1024, 1)
+        metrics["memory_percent"] = sample["memory_percent"]
+        metrics["process_memory_mb"] = round(sample["process_memory_mb"], 1)
+        metrics["process_cpu_percent"] = sample["process_cpu_percent"]
         
         # 서비스별 특화 메트릭
         if service_id == "api_server":
@@ -18,7 +18,7 @@ try:
     from core.watchhamster_monitor import WatchHamsterMonitor
     from core.infomax_client import InfomaxAPIClient
     from core.news_parser import NewsDataParser
-    from core.webhook_sender import DoorayWebhookSender
+    from core.webhook_sender import get_webhook_sender
 except ImportError as e:
     logger.warning(f"일부 core 모듈 임포트 실패: {e}")
     # 임포트 실패 시 더미 클래스 사용
@@ -38,6 +38,9 @@ except ImportError as e:
     
     class DoorayWebhookSender:
         async def send_system_status_report(self, data): pass
+    
+    def get_webhook_sender():
+        return DoorayWebhookSender()
 
 # 데이터 모델
 class SystemStatus(BaseModel):
@@ -260,7 +263,7 @@ async def _start_system_task(action: SystemAction = None):
         
         # 웹훅 발송자 초기화
         if not webhook_sender_instance:
-            webhook_sender_instance = DoorayWebhookSender()
+            webhook_sender_instance = get_webhook_sender()
             system_state["components"]["webhook_sender"] = "running"
             
             # services.py에 인스턴스 등록
@@ -31,8 +31,21 @@ def get_webhook_sender():
     global webhook_sender
     if webhook_sender is None:
         webhook_sender = WebhookSender(test_mode=False)
+        webhook_sender.result_callbacks.append(_record_send_result)
     return webhook_sender
 
+
+def _record_send_result(result):
+    """실제 전송 결과(성공/최종 실패)를 웹훅 로그 상태에 반영 (큐 투입 시에는 pending으로 기록)"""
+    try:
+        get_db().update_webhook_log_status(
+            result.message_id,
+            "success" if result.success else "failed",
+            error_message=result.error_message
+        )
+    except Exception as e:
+        logger.error(f"로그 상태 갱신 실패: {e}")
+
 def get_message_generator():
     """메시지 생성기 싱글톤"""
     global message_generator
@@ -58,7 +71,7 @@ def save_webhook_log(
     metadata: Optional[Dict[str, Any]] = None,
     error_message: Optional[str] = None
 ) -> str:
-    """웹훅 로그를 데이터베이스에 저장"""
+    """웹훅 로그를 데이터베이스에 저장 (쓰기 버퍼를 거쳐 일괄 기록)"""
     try:
         db = get_db()
         log_data = {
@@ -74,7 +87,7 @@ def save_webhook_log(
             'metadata': metadata,
             'error_message': error_message
         }
-        return db.create_webhook_log(log_data)
+        return db.queue_webhook_log(log_data)
     except Exception as e:
         logger.error(f"로그 저장 실패: {e}")
         return message_id
@@ -212,7 +225,7 @@ async def send_test_message(
             bot_type="TEST",
             priority="LOW",
             endpoint="NEWS_MAIN",
-            status="success" if message_id else "failed",
+            status="pending" if message_id else "failed",
             message_id=message_id,
             full_message=full_message,
             metadata={"test_content": test_content}
@@ -228,7 +241,7 @@ async def send_test_message(
                 "bot_type": "TEST",
                 "priority": "LOW",
                 "endpoint": "NEWS_MAIN",
-                "status": "success",
+                "status": "pending" if message_id else "failed",
                 "message_id": message_id
             }
         }
@@ -260,7 +273,7 @@ async def send_business_day_comparison(data: Dict[str, Any], company_id: str = "
             bot_type="NEWS_COMPARISON",
             priority=data.get('priority', 'NORMAL'),
             endpoint="NEWS_MAIN",
-            status="success" if success else "failed",
+            status="pending" if success else "failed",
             message_id=message_id,
             full_message=full_message,
             metadata={"raw_data": data}
@@ -276,7 +289,7 @@ async def send_business_day_comparison(data: Dict[str, Any], company_id: str = "
                 "bot_type": "NEWS_COMPARISON",
                 "priority": data.get('priority', 'NORMAL'),
                 "endpoint": "NEWS_MAIN",
-                "status": "success" if message_id else "failed",
+                "status": "pending" if message_id else "failed",
                 "message_id": message_id
             }
         }
@@ -307,7 +320,7 @@ async def send_delay_notification(news_type: str, delay_minutes: int, data: Dict
             bot_type="NEWS_DELAY",
             priority="HIGH",
             endpoint="NEWS_MAIN",
-            status="success" if message_id else "failed",
+            status="pending" if message_id else "failed",
             message_id=message_id,
             full_message=full_message if message_id else None,
             metadata={"news_type": news_type, "delay_minutes": delay_minutes, "current_data": data.get('current_data', {})}
@@ -323,7 +336,7 @@ async def send_delay_notification(news_type: str, delay_minutes: int, data: Dict
                 "bot_type": "NEWS_DELAY",
                 "priority": "HIGH",
                 "endpoint": "NEWS_MAIN",
-                "status": "success" if message_id else "failed",
+                "status": "pending" if message_id else "failed",
                 "message_id": message_id
             }
         }
@@ -353,7 +366,7 @@ async def send_daily_integrated_report(data: Dict[str, Any], company_id: str = "
             bot_type="NEWS_REPORT",
             priority="NORMAL",
             endpoint="NEWS_MAIN",
-            status="success" if message_id else "failed",
+            status="pending" if message_id else "failed",
             message_id=message_id,
             full_message=full_message if message_id else None,
             metadata={"report_url": data.get('report_url'), "raw_data": data.get('raw_data', {})}
@@ -369,7 +382,7 @@ async def send_daily_integrated_report(data: Dict[str, Any], company_id: str = "
                 "bot_type": "NEWS_REPORT",
                 "priority": "NORMAL",
                 "endpoint": "NEWS_MAIN",
-                "status": "success" if message_id else "failed",
+                "status": "pending" if message_id else "failed",
                 "message_id": message_id
             }
         }
@@ -398,7 +411,7 @@ async def send_status_notification(data: Dict[str, Any], company_id: str = "posc
             bot_type="NEWS_STATUS",
             priority="NORMAL",
             endpoint="NEWS_MAIN",
-            status="success" if message_id else "failed",
+            status="pending" if message_id else "failed",
             message_id=message_id,
             full_message=full_message if message_id else None,
             metadata={"raw_data": data.get('raw_data', {})}
@@ -414,7 +427,7 @@ async def send_status_notification(data: Dict[str, Any], company_id: str = "posc
                 "bot_type": "NEWS_STATUS",
                 "priority": "NORMAL",
                 "endpoint": "NEWS_MAIN",
-                "status": "success" if message_id else "failed",
+                "status": "pending" if message_id else "failed",
                 "message_id": message_id
             }
         }
@@ -443,7 +456,7 @@ async def send_no_data_notification(data: Dict[str, Any], company_id: str = "pos
             bot_type="NEWS_NO_DATA",
             priority="LOW",
             endpoint="NEWS_MAIN",
-            status="success" if message_id else "failed",
+            status="pending" if message_id else "failed",
             message_id=message_id,
             full_message=full_message if message_id else None,
             metadata={"raw_data": data.get('raw_data', {})}
@@ -459,7 +472,7 @@ async def send_no_data_notification(data: Dict[str, Any], company_id: str = "pos
                 "bot_type": "NEWS_NO_DATA",
                 "priority": "LOW",
                 "endpoint": "NEWS_MAIN",
-                "status": "success" if message_id else "failed",
+                "status": "pending" if message_id else "failed",
                 "message_id": message_id
             }
         }
@@ -489,7 +502,7 @@ async def send_watchhamster_error(error_message: str, error_details: Optional[Di
             bot_type="WATCHHAMSTER_ERROR",
             priority="CRITICAL",
             endpoint="WATCHHAMSTER",
-            status="success" if message_id else "failed",
+            status="pending" if message_id else "failed",
             message_id=message_id,
             full_message=full_message if message_id else None,
             error_message=error_message,
@@ -506,7 +519,7 @@ async def send_watchhamster_error(error_message: str, error_details: Optional[Di
                 "bot_type": "WATCHHAMSTER_ERROR",
                 "priority": "CRITICAL",
                 "endpoint": "WATCHHAMSTER",
-                "status": "success" if message_id else "failed",
+                "status": "pending" if message_id else "failed",
                 "message_id": message_id
             }
         }
@@ -536,7 +549,7 @@ async def send_watchhamster_status(status_message: str, status_details: Optional
             bot_type="WATCHHAMSTER_STATUS",
             priority="NORMAL",
             endpoint="WATCHHAMSTER",
-            status="success" if message_id else "failed",
+            status="pending" if message_id else "failed",
             message_id=message_id,
             full_message=full_message if message_id else None,
             metadata=status_details
@@ -552,7 +565,7 @@ async def send_watchhamster_status(status_message: str, status_details: Optional
                 "bot_type": "WATCHHAMSTER_STATUS",
                 "priority": "NORMAL",
                 "endpoint": "WATCHHAMSTER",
-                "status": "success" if message_id else "failed",
+                "status": "pending" if message_id else "failed",
                 "message_id": message_id
             }
         }
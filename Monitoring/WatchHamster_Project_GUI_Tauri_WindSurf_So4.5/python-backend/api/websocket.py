@@ -6,13 +6,27 @@ WebSocket 실시간 통신 API
 import asyncio
 import json
 import logging
-import psutil
-import time
+from dataclasses import asdict
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Set, Optional, List
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
+from core.git_status_collector import get_git_status_collector
+from core.leader_election import WORKER_ID
+from core.metrics_sampler import get_metrics_sampler
+from core.state_backend import get_state_backend
+from utils.log_tailer import TailEvent, subscribe_log_files
+from utils.state_channel import StateChannel
+from utils.ws_send_queue import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    PRIORITY_URGENT,
+    ClientSendQueue,
+)
+
 logger = logging.getLogger(__name__)
 
 # Core 모듈 임포트 (현대화된 버전)
@@ -22,15 +36,18 @@ try:
     from core.news_data_parser import NewsDataParser
     WatchHamsterMonitor = ModernWatchHamsterMonitor
     InfomaxAPIClient = ModernInfomaxClient
-    DoorayWebhookSender = None  # 임시로 비활성화
+    get_webhook_sender = None  # 임시로 비활성화 (사용 시 core.webhook_sender.get_webhook_sender 공유 인스턴스)
 except ImportError as e:
     logger.warning(f"일부 core 모듈 임포트 실패: {e}")
     WatchHamsterMonitor = None
     NewsDataParser = None
     InfomaxAPIClient = None
-    DoorayWebhookSender = None
+    get_webhook_sender = None
 router = APIRouter()
 
+# 모니터링 대상 뉴스 타입
+NEWS_TYPES = ["exchange-rate", "newyork-market-watch", "kospi-close"]
+
 # 전역 core 인스턴스들
 watchhamster_monitor = None
 news_parser = None
@@ -71,12 +88,41 @@ class ServiceStatus(BaseModel):
     restart_count: int
     description: str
 
+# 이벤트 타입별 전송 우선순위
+TOPIC_PRIORITIES = {
+    "system_alerts": PRIORITY_URGENT,
+    "service_events": PRIORITY_HIGH,
+    "news_updates": PRIORITY_HIGH,
+    "git_updates": PRIORITY_NORMAL,
+    "webhook_events": PRIORITY_NORMAL,
+    "system_metrics": PRIORITY_LOW,
+}
+
+# 상태 채널 → 이벤트 토픽
+STATE_CHANNEL_TOPICS = {
+    "system_metrics": "system_metrics",
+    "news_status": "news_updates",
+    "service_status": "service_events",
+    "git_status": "git_updates",
+}
+
+# 워커 간 중계 (공유 상태 백엔드 사용 시 다른 워커의 브로드캐스트/상태 채널을 이 워커 클라이언트에 전달)
+BROADCAST_RELAY_LOG = "ws_broadcasts"
+STATE_RELAY_NAMESPACE = "ws_state"
+RELAY_MAX_ITEMS = 500
+RELAY_POLL_INTERVAL = 1.0  # 초
+
 # 연결된 WebSocket 클라이언트 관리
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
         self.client_info: Dict[WebSocket, dict] = {}
         self.subscriptions: Dict[WebSocket, Set[str]] = {}  # 클라이언트별 구독 정보
+        self.topic_subscribers: Dict[str, Set[WebSocket]] = {}  # 토픽 → 구독 클라이언트
+        self.send_queues: Dict[WebSocket, ClientSendQueue] = {}  # 클라이언트별 송신 큐
+        self.state_versions: Dict[WebSocket, Dict[str, List[int]]] = {}  # 델타 사용 클라이언트: 채널 → [보낸 버전, 확인 버전]
+        self.slow_disconnects = 0
+        self.relay_enabled = False  # 다른 워커로 브로드캐스트 중계 여부
     
     async def connect(self, websocket: WebSocket, client_id: str = None):
         """클라이언트 연결"""
@@ -87,7 +133,15 @@ class ConnectionManager:
             "connected_at": datetime.now(),
             "last_ping": datetime.now()
         }
-        self.subscriptions[websocket] = {"all"}  # 기본적으로 모든 이벤트 구독
+        self._set_subscriptions(websocket, {"all"})  # 기본적으로 모든 이벤트 구독
+        
+        send_queue = ClientSendQueue(
+            websocket.send_text,
+            lambda: self._on_send_failure(websocket),
+            name=self.client_info[websocket]["client_id"]
+        )
+        send_queue.start()
+        self.send_queues[websocket] = send_queue
         logger.info(f"WebSocket 클라이언트 연결: {self.client_info[websocket]['client_id']}")
     
     def disconnect(self, websocket: WebSocket):
@@ -99,49 +153,171 @@ class ConnectionManager:
             self.active_connections.remove(websocket)
             if websocket in self.client_info:
                 del self.client_info[websocket]
-            if websocket in self.subscriptions:
-                del self.subscriptions[websocket]
+            self._set_subscriptions(websocket, set())
+            self.subscriptions.pop(websocket, None)
+            self.state_versions.pop(websocket, None)
+            
+            send_queue = self.send_queues.pop(websocket, None)
+            if send_queue:
+                send_queue.close()
             
             logger.info(f"WebSocket 클라이언트 연결 해제: {client_id}")
     
+    def _on_send_failure(self, websocket: WebSocket):
+        """송신 실패/시간 초과 클라이언트 정리 (다른 클라이언트 전송에는 영향 없음)"""
+        self.slow_disconnects += 1
+        self.disconnect(websocket)
+    
+    def _set_subscriptions(self, websocket: WebSocket, topics: Set[str]):
+        """구독 변경 및 토픽 인덱스 갱신"""
+        for topic in self.subscriptions.get(websocket, set()) - topics:
+            subscribers = self.topic_subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(websocket)
+                if not subscribers:
+                    del self.topic_subscribers[topic]
+        for topic in topics:
+            self.topic_subscribers.setdefault(topic, set()).add(websocket)
+        self.subscriptions[websocket] = topics
+    
     async def send_personal_message(self, message: str, websocket: WebSocket):
-        """특정 클라이언트에게 메시지 전송"""
+        """특정 클라이언트에게 메시지 전송 (송신 큐가 있으면 최우선으로 대기열에 추가)"""
+        send_queue = self.send_queues.get(websocket)
+        if send_queue is not None:
+            send_queue.put(message, PRIORITY_URGENT)
+            return
+        
         try:
             await websocket.send_text(message)
         except Exception as e:
             logger.error(f"개인 메시지 전송 실패: {e}")
             self.disconnect(websocket)
     
-    async def broadcast(self, message: str, event_type: str = "all"):
-        """모든 연결된 클라이언트에게 브로드캐스트 (구독 필터링 적용)"""
+    def _targets(self, event_type: str) -> Set[WebSocket]:
+        targets = self.topic_subscribers.get("all", set())
+        if event_type != "all" and event_type in self.topic_subscribers:
+            targets = targets | self.topic_subscribers[event_type]
+        return targets
+    
+    async def broadcast(self, message: str, event_type: str = "all",
+                        coalesce_key: Optional[str] = None, priority: Optional[int] = None,
+                        relay: bool = True):
+        """
+        구독한 클라이언트에게 브로드캐스트 (클라이언트별 송신 큐에 추가만 하고 대기하지 않음)
+        
+        Args:
+            message: 직렬화된 메시지
+            event_type: 이벤트 토픽
+            coalesce_key: 상태 메시지 키 (아직 보내지 않은 같은 키 메시지는 최신 값으로 대체)
+            priority: 전송 우선순위 (기본: 토픽별 우선순위)
+            relay: 다른 워커에도 전달 (중계된 메시지를 다시 보낼 때는 False)
+        """
+        if relay and self.relay_enabled:
+            await self._relay_broadcast(message, event_type, coalesce_key, priority)
+        
         if not self.active_connections:
             return
         
-        disconnected = set()
+        if priority is None:
+            priority = TOPIC_PRIORITIES.get(event_type, PRIORITY_NORMAL)
         
-        for connection in self.active_connections.copy():
-            try:
-                # 구독 확인
-                client_subscriptions = self.subscriptions.get(connection, {"all"})
-                if "all" in client_subscriptions or event_type in client_subscriptions:
-                    await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"브로드캐스트 전송 실패: {e}")
-                disconnected.add(connection)
+        for connection in self._targets(event_type):
+            send_queue = self.send_queues.get(connection)
+            if send_queue is not None:
+                send_queue.put(message, priority, coalesce_key)
         
-        # 연결이 끊어진 클라이언트 정리
-        for connection in disconnected:
-            self.disconnect(connection)
+        # 송신 태스크가 바로 전송을 시작하도록 양보
+        await asyncio.sleep(0)
+    
+    async def _relay_broadcast(self, message: str, event_type: str,
+                               coalesce_key: Optional[str], priority: Optional[int]):
+        entry = {
+            "origin": WORKER_ID,
+            "message": message,
+            "event_type": event_type,
+            "coalesce_key": coalesce_key,
+            "priority": priority,
+        }
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, get_state_backend().append, BROADCAST_RELAY_LOG, entry, RELAY_MAX_ITEMS
+            )
+        except Exception as e:
+            logger.warning(f"브로드캐스트 중계 실패: {e}")
     
-    async def broadcast_json(self, data: dict, event_type: str = "all"):
-        """JSON 데이터 브로드캐스트"""
+    async def broadcast_json(self, data: dict, event_type: str = "all",
+                             coalesce_key: Optional[str] = None, priority: Optional[int] = None):
+        """JSON 데이터 브로드캐스트 (직렬화는 한 번)"""
         message = json.dumps(data, default=str, ensure_ascii=False)
-        await self.broadcast(message, event_type)
+        await self.broadcast(message, event_type, coalesce_key=coalesce_key, priority=priority)
+    
+    def enable_state_channels(self, websocket: WebSocket, channels: List[StateChannel]):
+        """클라이언트의 델타 전송 사용 설정 (채널별 스냅샷 1회 전송 후 델타만 전송)"""
+        if websocket not in self.active_connections:
+            return
+        
+        versions = self.state_versions.setdefault(websocket, {})
+        for channel in channels:
+            versions[channel.name] = [0, 0]
+            if channel.version:
+                self.send_state_snapshot(websocket, channel)
+    
+    def send_state_snapshot(self, websocket: WebSocket, channel: StateChannel):
+        """채널 스냅샷 전송 (구독 시작/재동기화 요청 시)"""
+        send_queue = self.send_queues.get(websocket)
+        if send_queue is None or not channel.version:
+            return
+        
+        send_queue.put(channel.snapshot_message(), PRIORITY_URGENT, channel.message_type)
+        versions = self.state_versions.get(websocket, {}).get(channel.name)
+        if versions is not None:
+            versions[0] = channel.version
+    
+    def ack_state(self, websocket: WebSocket, channel_name: str, version: int):
+        """클라이언트가 적용한 채널 버전 기록"""
+        versions = self.state_versions.get(websocket, {}).get(channel_name)
+        if versions is not None and versions[1] < version <= versions[0]:
+            versions[1] = version
+    
+    async def publish_state(self, channel: StateChannel, event_type: str, priority: Optional[int] = None):
+        """
+        상태 채널의 최신 버전 전송 (메시지는 채널에서 한 번만 직렬화된 것을 공유)
+        
+        델타 사용 클라이언트는 직전 버전을 받았고 확인 버전이 보관 범위 안이면 델타를,
+        아니면 스냅샷을 받음. 그 외 클라이언트는 기존처럼 전체 문서(스냅샷)를 받음
+        """
+        if not self.active_connections or not channel.version:
+            return
+        
+        if priority is None:
+            priority = TOPIC_PRIORITIES.get(event_type, PRIORITY_NORMAL)
+        
+        version = channel.version
+        delta = channel.delta_message(version)
+        for connection in self._targets(event_type):
+            send_queue = self.send_queues.get(connection)
+            if send_queue is None:
+                continue
+            
+            versions = self.state_versions.get(connection, {}).get(channel.name)
+            if versions is None:
+                send_queue.put(channel.snapshot_message(), priority, channel.message_type)
+                continue
+            
+            sent_version, acked_version = versions
+            if delta is not None and sent_version == version - 1 and version - acked_version <= channel.history:
+                send_queue.put(delta, priority)
+            else:
+                # 뒤처진 클라이언트는 대기 중인 스냅샷을 최신 값으로 대체
+                send_queue.put(channel.snapshot_message(), priority, channel.message_type)
+            versions[0] = version
+        
+        await asyncio.sleep(0)
     
     def subscribe(self, websocket: WebSocket, event_types: List[str]):
         """클라이언트 구독 설정"""
         if websocket in self.subscriptions:
-            self.subscriptions[websocket] = set(event_types)
+            self._set_subscriptions(websocket, set(event_types))
     
     def get_connection_count(self) -> int:
         """연결된 클라이언트 수 반환"""
@@ -154,10 +330,35 @@ class ConnectionManager:
                 "client_id": info["client_id"],
                 "connected_at": info["connected_at"],
                 "last_ping": info["last_ping"],
-                "subscriptions": list(self.subscriptions.get(ws, {"all"}))
+                "subscriptions": list(self.subscriptions.get(ws, {"all"})),
+                "send_queue": self.send_queues[ws].get_stats() if ws in self.send_queues else None
             }
             for ws, info in self.client_info.items()
         ]
+    
+    def get_send_stats(self) -> dict:
+        """송신 큐 통계"""
+        stats = [send_queue.get_stats() for send_queue in self.send_queues.values()]
+        return {
+            "clients": len(stats),
+            "pending": sum(item["pending"] for item in stats),
+            "sent": sum(item["sent"] for item in stats),
+            "coalesced": sum(item["coalesced"] for item in stats),
+            "dropped": sum(item["dropped"] for item in stats),
+            "slow_disconnects": self.slow_disconnects,
+            "topics": {topic: len(subscribers) for topic, subscribers in self.topic_subscribers.items()}
+        }
+    
+    def shutdown(self):
+        """모든 송신 태스크 종료 및 상태 초기화"""
+        for send_queue in self.send_queues.values():
+            send_queue.close()
+        self.send_queues.clear()
+        self.active_connections.clear()
+        self.client_info.clear()
+        self.subscriptions.clear()
+        self.topic_subscribers.clear()
+        self.state_versions.clear()
 
 # 전역 연결 매니저
 manager = ConnectionManager()
@@ -182,8 +383,8 @@ async def initialize_core_modules():
             )
             logger.info("INFOMAX API 클라이언트 초기화 완료")
         
-        if not webhook_sender:
-            webhook_sender = DoorayWebhookSender()
+        if not webhook_sender and get_webhook_sender is not None:
+            webhook_sender = get_webhook_sender()
             logger.info("Dooray 웹훅 발송자 초기화 완료")
             
     except Exception as e:
@@ -275,81 +476,73 @@ async def websocket_logs_endpoint(websocket: WebSocket):
 
 async def stream_real_logs(websocket: WebSocket):
     """실제 로그 파일을 모니터링하여 실시간 스트리밍"""
-    import os
-    import uuid
-    from pathlib import Path
-    
-    # 로그 파일 경로들
+    # 로그 파일 경로들 (파일별 공유 테일러를 하나의 구독 버퍼로 구독)
     log_paths = [
         "logs/watchhamster.log",
         "logs/news_monitor.log", 
         "logs/webhook.log",
         "logs/system.log"
     ]
-    
-    # 로그 파일 상태 추적
-    log_file_positions = {}
-    
-    # 기존 로그 파일들의 마지막 위치 저장
-    for log_path in log_paths:
-        if os.path.exists(log_path):
-            with open(log_path, 'r', encoding='utf-8') as f:
-                f.seek(0, 2)  # 파일 끝으로 이동
-                log_file_positions[log_path] = f.tell()
-        else:
-            log_file_positions[log_path] = 0
+    subscription = subscribe_log_files(log_paths)
     
     # Core 모듈에서 실시간 로그 생성
     log_counter = 0
     
-    while True:
-        try:
-            # 실제 로그 파일 변화 확인
-            new_logs = []
-            
-            for log_path in log_paths:
-                if os.path.exists(log_path):
-                    current_size = os.path.getsize(log_path)
-                    last_position = log_file_positions.get(log_path, 0)
-                    
-                    if current_size > last_position:
-                        # 새로운 로그 내용 읽기
-                        with open(log_path, 'r', encoding='utf-8') as f:
-                            f.seek(last_position)
-                            new_content = f.read()
-                            log_file_positions[log_path] = f.tell()
-                            
-                            # 새 로그 라인들 처리
-                            for line in new_content.strip().split('\n'):
-                                if line.strip():
-                                    new_logs.append(parse_log_line(line, log_path))
-            
-            # Core 모듈에서 실시간 로그 생성 (실제 시스템 활동 기반)
-            if watchhamster_monitor or news_parser or infomax_client or webhook_sender:
-                system_logs = await generate_system_activity_logs()
-                new_logs.extend(system_logs)
-            
-            # 새 로그가 없으면 시뮬레이션 로그 생성 (개발용)
-            if not new_logs:
-                new_logs = await generate_simulation_logs(log_counter)
-                log_counter += len(new_logs)
-            
-            # 로그 전송
-            for log_entry in new_logs:
-                await websocket.send_json({
-                    "type": "log_entry",
-                    "data": log_entry,
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            # 2초마다 체크
-            await asyncio.sleep(2)
-            
-        except WebSocketDisconnect:
-            break
-        except Exception as e:
-            logger.error(f"로그 스트리밍 중 오류: {e}")
-            await asyncio.sleep(2)
+    try:
+        while True:
+            try:
+                # 테일러가 읽어 둔 새 로그 라인들 (파일 폴링 없음)
+                new_logs = [tail_event_to_log_entry(event) for event in subscription.drain()]
+                
+                # Core 모듈에서 실시간 로그 생성 (실제 시스템 활동 기반)
+                if watchhamster_monitor or news_parser or infomax_client or webhook_sender:
+                    system_logs = await generate_system_activity_logs()
+                    new_logs.extend(system_logs)
+                
+                # 새 로그가 없으면 시뮬레이션 로그 생성 (개발용)
+                if not new_logs:
+                    new_logs = await generate_simulation_logs(log_counter)
+                    log_counter += len(new_logs)
+                
+                # 로그 전송
+                for log_entry in new_logs:
+                    await websocket.send_json({
+                        "type": "log_entry",
+                        "data": log_entry,
+                        "timestamp": datetime.now().isoformat()
+                    })
+                
+                # 2초마다 체크
+                await asyncio.sleep(2)
+                
+            except WebSocketDisconnect:
+                break
+            except Exception as e:
+                logger.error(f"로그 스트리밍 중 오류: {e}")
+                await asyncio.sleep(2)
+    finally:
+        subscription.close()
+
+def tail_event_to_log_entry(event: TailEvent) -> dict:
+    """테일러가 파싱한 로그를 스트리밍 형식으로 변환"""
+    import uuid
+    
+    entry = event.entry
+    if entry['logger_name'] == "unknown":
+        # 형식을 알 수 없는 줄은 원문에서 레벨/시간 추출
+        return parse_log_line(event.line, str(event.path))
+    
+    return {
+        "id": str(uuid.uuid4()),
+        "timestamp": entry['timestamp'].strftime("%Y-%m-%d %H:%M:%S"),
+        "level": entry['level'].upper(),
+        "source": event.path.stem,
+        "message": event.line.strip(),
+        "metadata": {
+            "log_file": str(event.path),
+            "parsed_at": datetime.now().isoformat()
+        }
+    }
 
 def parse_log_line(line: str, log_path: str) -> dict:
     """로그 라인을 파싱하여 구조화된 데이터로 변환"""
@@ -590,6 +783,20 @@ async def handle_client_message(websocket: WebSocket, message: str):
                 websocket
             )
         
+        elif message_type == "subscribe_state":
+            # 델타 상태 채널 구독 (스냅샷 1회 후 JSON Patch 델타)
+            await subscribe_state_channels(websocket, data.get("channels") or list(STATE_CHANNEL_TOPICS))
+        
+        elif message_type == "state_ack":
+            # 클라이언트가 적용한 상태 버전 확인
+            manager.ack_state(websocket, data.get("channel", ""), int(data.get("version", 0)))
+        
+        elif message_type == "state_resync":
+            # 델타 누락 시 스냅샷 재전송
+            channel = realtime_system.state_channels.get(data.get("channel", ""))
+            if channel is not None:
+                manager.send_state_snapshot(websocket, channel)
+        
         elif message_type == "request_status":
             # 상태 요청 처리
             await send_current_status(websocket)
@@ -615,6 +822,27 @@ async def handle_client_message(websocket: WebSocket, message: str):
     except Exception as e:
         logger.error(f"클라이언트 메시지 처리 오류: {e}")
 
+async def subscribe_state_channels(websocket: WebSocket, channel_names: List[str]):
+    """델타 상태 채널 구독 (아직 수집된 적 없는 채널은 먼저 수집)"""
+    channels = []
+    for name in channel_names:
+        channel = realtime_system.state_channels.get(name)
+        if channel is None:
+            logger.warning(f"알 수 없는 상태 채널: {name}")
+            continue
+        if not channel.version:
+            await realtime_system.refresh_state_channel(name)
+        channels.append(channel)
+    
+    manager.enable_state_channels(websocket, channels)
+    
+    response = WSMessage(
+        type="state_subscription_confirmed",
+        data={"channels": {channel.name: channel.version for channel in channels}},
+        timestamp=datetime.now()
+    )
+    await manager.send_personal_message(response.model_dump_json(), websocket)
+
 async def send_initial_status(websocket: WebSocket):
     """연결 시 초기 상태 전송"""
     try:
@@ -656,47 +884,20 @@ async def send_current_status(websocket: WebSocket):
 async def send_news_status(websocket: WebSocket):
     """뉴스 상태 전송"""
     try:
-        if not news_parser or not infomax_client:
-            await initialize_core_modules()
+        from api.news import get_news_snapshot_service
         
-        news_types = ["exchange-rate", "newyork-market-watch", "kospi-close"]
+        snapshots = await get_news_snapshot_service().get_many(NEWS_TYPES)
         news_statuses = []
         
-        for news_type in news_types:
-            try:
-                # 실제 뉴스 데이터 조회
-                raw_data = await infomax_client.fetch_news_data(news_type)
-                
-                if raw_data:
-                    # 뉴스 데이터 파싱
-                    parsed_data = await news_parser.parse_news_data(raw_data, news_type)
-                    status = news_parser.determine_news_status(parsed_data)
-                    
-                    news_status = NewsStatusUpdate(
-                        news_type=news_type,
-                        status=status,
-                        last_update=datetime.now(),
-                        data=parsed_data
-                    )
-                else:
-                    news_status = NewsStatusUpdate(
-                        news_type=news_type,
-                        status="error",
-                        last_update=datetime.now(),
-                        error_message="데이터 조회 실패"
-                    )
-                
-                news_statuses.append(news_status.model_dump())
-                
-            except Exception as e:
-                logger.error(f"{news_type} 뉴스 상태 조회 오류: {e}")
-                news_status = NewsStatusUpdate(
-                    news_type=news_type,
-                    status="error",
-                    last_update=datetime.now(),
-                    error_message=str(e)
-                )
-                news_statuses.append(news_status.model_dump())
+        for news_type, snapshot in snapshots.items():
+            news_status = NewsStatusUpdate(
+                news_type=news_type,
+                status=snapshot.status,
+                last_update=snapshot.fetched_at,
+                data=snapshot.data,
+                error_message=snapshot.error
+            )
+            news_statuses.append(news_status.model_dump())
         
         # 뉴스 상태 전송
         news_message = WSMessage(
@@ -716,40 +917,17 @@ async def send_news_status(websocket: WebSocket):
 async def send_system_metrics(websocket: WebSocket):
     """시스템 메트릭 전송"""
     try:
-        # 실제 시스템 메트릭 수집
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
-        
-        # 디스크 사용량 (크로스 플랫폼 호환)
-        try:
-            disk_usage = psutil.disk_usage('/').percent
-        except:
-            try:
-                disk_usage = psutil.disk_usage('C:\\').percent
-            except:
-                disk_usage = 0
-        
-        # 네트워크 상태
-        network_status = "connected"
-        try:
-            net_io = psutil.net_io_counters()
-            if net_io and (net_io.bytes_sent > 0 or net_io.bytes_recv > 0):
-                network_status = "active"
-        except:
-            network_status = "unknown"
-        
-        # 시스템 업타임
-        boot_time = psutil.boot_time()
-        uptime = int(time.time() - boot_time)
+        # 백그라운드 샘플러의 최신 샘플 사용
+        sample = get_metrics_sampler().snapshot()
         
         metrics = SystemMetrics(
-            cpu_percent=round(cpu_percent, 1),
-            memory_percent=round(memory.percent, 1),
-            memory_used_gb=round(memory.used / (1024**3), 2),
-            memory_total_gb=round(memory.total / (1024**3), 2),
-            disk_usage=round(disk_usage, 1),
-            network_status=network_status,
-            uptime=uptime,
+            cpu_percent=round(sample['cpu_percent'], 1),
+            memory_percent=round(sample['memory_percent'], 1),
+            memory_used_gb=round(sample['memory_used_gb'], 2),
+            memory_total_gb=round(sample['memory_total_gb'], 2),
+            disk_usage=round(sample['disk_percent'], 1),
+            network_status=sample['network_status'],
+            uptime=sample['uptime'],
             timestamp=datetime.now()
         )
         
@@ -804,14 +982,21 @@ async def send_service_status(websocket: WebSocket):
     except Exception as e:
         logger.error(f"서비스 상태 전송 오류: {e}")
 
+async def get_current_git_status() -> dict:
+    """현재 Git 상태 수집 (비동기 수집기, 변경 시에만 git 실행)"""
+    try:
+        git_status = await get_git_status_collector().collect()
+        return asdict(git_status)
+        
+    except Exception as e:
+        logger.error(f"Git 상태 수집 오류: {e}")
+        return {}
+
 async def send_git_status(websocket: WebSocket):
     """Git 상태 전송"""
     try:
-        if not watchhamster_monitor:
-            await initialize_core_modules()
-        
-        # Git 상태 조회
-        git_status = await watchhamster_monitor.get_git_status()
+        # Git 상태 조회 (HEAD/index가 바뀌지 않았으면 캐시 반환)
+        git_status = await get_current_git_status()
         
         git_message = WSMessage(
             type="git_status_update",
@@ -828,68 +1013,46 @@ async def send_git_status(websocket: WebSocket):
         logger.error(f"Git 상태 전송 오류: {e}")
 
 async def force_news_refresh(websocket: WebSocket, news_type: str):
-    """강제 뉴스 갱신"""
+    """강제 뉴스 갱신 (진행 중인 조회가 있으면 합류)"""
     try:
-        if not news_parser or not infomax_client:
-            await initialize_core_modules()
+        from api.news import get_news_snapshot_service
         
         if news_type == "all":
-            news_types = ["exchange-rate", "newyork-market-watch", "kospi-close"]
+            news_types = NEWS_TYPES
         else:
             news_types = [news_type]
         
-        for nt in news_types:
-            try:
-                # 강제 데이터 갱신
-                raw_data = await infomax_client.fetch_news_data(nt)
-                
-                if raw_data:
-                    parsed_data = await news_parser.parse_news_data(raw_data, nt)
-                    
-                    # 갱신 완료 알림
-                    refresh_message = WSMessage(
-                        type="news_refresh_completed",
-                        data={
-                            "news_type": nt,
-                            "status": "success",
-                            "data": parsed_data,
-                            "timestamp": datetime.now()
-                        },
-                        timestamp=datetime.now()
-                    )
-                else:
-                    refresh_message = WSMessage(
-                        type="news_refresh_completed",
-                        data={
-                            "news_type": nt,
-                            "status": "failed",
-                            "error": "데이터 조회 실패"
-                        },
-                        timestamp=datetime.now()
-                    )
-                
-                await manager.send_personal_message(
-                    refresh_message.model_dump_json(default=str),
-                    websocket
-                )
-                
-            except Exception as e:
-                logger.error(f"{nt} 뉴스 갱신 오류: {e}")
-                
-                error_message = WSMessage(
+        snapshots = await get_news_snapshot_service().get_many(news_types, force=True)
+        
+        for nt, snapshot in snapshots.items():
+            if snapshot.data:
+                # 갱신 완료 알림
+                refresh_message = WSMessage(
                     type="news_refresh_completed",
                     data={
                         "news_type": nt,
-                        "status": "error",
-                        "error": str(e)
+                        "status": "success",
+                        "data": snapshot.data,
+                        "version": snapshot.version,
+                        "timestamp": snapshot.fetched_at
                     },
                     timestamp=datetime.now()
                 )
-                
-                await manager.send_personal_message(
-                    error_message.model_dump_json(default=str),
-                    websocket
+            else:
+                refresh_message = WSMessage(
+                    type="news_refresh_completed",
+                    data={
+                        "news_type": nt,
+                        "status": "failed",
+                        "error": snapshot.error or "데이터 조회 실패"
+                    },
+                    timestamp=datetime.now()
                 )
+            
+            await manager.send_personal_message(
+                refresh_message.model_dump_json(default=str),
+                websocket
+            )
         
     except Exception as e:
         logger.error(f"뉴스 강제 갱신 오류: {e}")
@@ -903,18 +1066,17 @@ async def get_comprehensive_system_status():
         # 시스템 전체 상태 조회
         system_status = await watchhamster_monitor.get_system_status()
         
-        # 추가 메트릭 수집
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
+        # 추가 메트릭 (백그라운드 샘플러의 최신 샘플)
+        sample = get_metrics_sampler().snapshot()
         
         return {
             "overall_status": system_status.overall if system_status else "unknown",
             "services": system_status.services if system_status else {},
             "system_metrics": {
-                "cpu_percent": round(cpu_percent, 1),
-                "memory_percent": round(memory.percent, 1),
-                "memory_used_gb": round(memory.used / (1024**3), 2),
-                "memory_total_gb": round(memory.total / (1024**3), 2)
+                "cpu_percent": round(sample['cpu_percent'], 1),
+                "memory_percent": round(sample['memory_percent'], 1),
+                "memory_used_gb": round(sample['memory_used_gb'], 2),
+                "memory_total_gb": round(sample['memory_total_gb'], 2)
             },
             "connection_count": manager.get_connection_count(),
             "last_check": datetime.now()
@@ -984,6 +1146,13 @@ class RealTimeUpdateSystem:
             "git_status": 60        # 60초마다 Git 상태
         }
         self.last_update_times = {}
+        # 버전 관리되는 상태 채널 (변경 시 한 번만 직렬화해 모든 클라이언트가 공유)
+        self.state_channels = {
+            "system_metrics": StateChannel("system_metrics", "system_metrics_update"),
+            "news_status": StateChannel("news_status", "news_status_update"),
+            "service_status": StateChannel("service_status", "service_status_update"),
+            "git_status": StateChannel("git_status", "git_status_update"),
+        }
     
     async def start_monitoring(self):
         """실시간 모니터링 시작"""
@@ -1009,11 +1178,15 @@ class RealTimeUpdateSystem:
                 if not task.done():
                     task.cancel()
     
+    def has_listeners(self) -> bool:
+        """수집 결과를 받을 곳이 있는지 (이 워커의 클라이언트 또는 다른 워커로 중계)"""
+        return manager.get_connection_count() > 0 or manager.relay_enabled
+    
     async def monitor_system_metrics(self):
         """시스템 메트릭 실시간 모니터링"""
         while True:
             try:
-                if manager.get_connection_count() > 0:
+                if self.has_listeners():
                     # 현재 시스템 메트릭 수집
                     current_metrics = await self.get_current_system_metrics()
                     
@@ -1034,7 +1207,7 @@ class RealTimeUpdateSystem:
         """뉴스 상태 실시간 모니터링"""
         while True:
             try:
-                if manager.get_connection_count() > 0:
+                if self.has_listeners():
                     # 뉴스 상태 확인
                     current_news_status = await self.get_current_news_status()
                     
@@ -1058,7 +1231,7 @@ class RealTimeUpdateSystem:
         """서비스 상태 실시간 모니터링"""
         while True:
             try:
-                if manager.get_connection_count() > 0:
+                if self.has_listeners():
                     # 서비스 상태 확인
                     current_service_status = await self.get_current_service_status()
                     
@@ -1082,7 +1255,7 @@ class RealTimeUpdateSystem:
         """Git 상태 실시간 모니터링"""
         while True:
             try:
-                if manager.get_connection_count() > 0:
+                if self.has_listeners():
                     # Git 상태 확인
                     current_git_status = await self.get_current_git_status()
                     
@@ -1103,7 +1276,7 @@ class RealTimeUpdateSystem:
         """웹훅 이벤트 모니터링"""
         while True:
             try:
-                if manager.get_connection_count() > 0 and webhook_sender:
+                if self.has_listeners() and webhook_sender:
                     # 웹훅 전송 상태 확인
                     webhook_status = await self.get_webhook_status()
                     
@@ -1120,78 +1293,43 @@ class RealTimeUpdateSystem:
     
     # 데이터 수집 메서드들
     async def get_current_system_metrics(self):
-        """현재 시스템 메트릭 수집"""
+        """현재 시스템 메트릭 수집 (백그라운드 샘플러의 최신 샘플)"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            
-            # 디스크 사용량
-            try:
-                disk_usage = psutil.disk_usage('/').percent
-            except:
-                try:
-                    disk_usage = psutil.disk_usage('C:\\').percent
-                except:
-                    disk_usage = 0
-            
-            # 네트워크 상태
-            network_status = "connected"
-            try:
-                net_io = psutil.net_io_counters()
-                if net_io and (net_io.bytes_sent > 0 or net_io.bytes_recv > 0):
-                    network_status = "active"
-            except:
-                network_status = "unknown"
+            sample = get_metrics_sampler().snapshot()
             
             return {
-                "cpu_percent": round(cpu_percent, 1),
-                "memory_percent": round(memory.percent, 1),
-                "memory_used_gb": round(memory.used / (1024**3), 2),
-                "memory_total_gb": round(memory.total / (1024**3), 2),
-                "disk_usage": round(disk_usage, 1),
-                "network_status": network_status,
-                "uptime": int(time.time() - psutil.boot_time()),
-                "timestamp": datetime.now()
+                "cpu_percent": round(sample['cpu_percent'], 1),
+                "memory_percent": round(sample['memory_percent'], 1),
+                "memory_used_gb": round(sample['memory_used_gb'], 2),
+                "memory_total_gb": round(sample['memory_total_gb'], 2),
+                "disk_usage": round(sample['disk_percent'], 1),
+                "network_status": sample['network_status'],
+                "uptime": sample['uptime'],
+                "timestamp": sample['sampled_at']
             }
         except Exception as e:
             logger.error(f"시스템 메트릭 수집 오류: {e}")
             return {}
     
     async def get_current_news_status(self):
-        """현재 뉴스 상태 수집"""
+        """현재 뉴스 상태 수집 (공유 스냅샷 서비스, 주기 안의 조회는 업스트림 호출 없음)"""
         try:
-            if not news_parser or not infomax_client:
-                return {}
+            from api.news import get_news_snapshot_service
             
-            news_types = ["exchange-rate", "newyork-market-watch", "kospi-close"]
-            news_statuses = {}
+            snapshots = await get_news_snapshot_service().get_many(
+                NEWS_TYPES, max_age=self.update_intervals["news_status"]
+            )
             
-            for news_type in news_types:
-                try:
-                    raw_data = await infomax_client.fetch_news_data(news_type)
-                    
-                    if raw_data:
-                        parsed_data = await news_parser.parse_news_data(raw_data, news_type)
-                        status = news_parser.determine_news_status(parsed_data)
-                        
-                        news_statuses[news_type] = {
-                            "status": status,
-                            "last_update": datetime.now(),
-                            "data": parsed_data
-                        }
-                    else:
-                        news_statuses[news_type] = {
-                            "status": "error",
-                            "last_update": datetime.now(),
-                            "error": "데이터 조회 실패"
-                        }
-                        
-                except Exception as e:
-                    news_statuses[news_type] = {
-                        "status": "error",
-                        "last_update": datetime.now(),
-                        "error": str(e)
-                    }
+            news_statuses = {}
+            for news_type, snapshot in snapshots.items():
+                news_statuses[news_type] = {
+                    "status": snapshot.status,
+                    "last_update": snapshot.fetched_at,
+                    "version": snapshot.version,
+                    "data": snapshot.data
+                }
+                if snapshot.error:
+                    news_statuses[news_type]["error"] = snapshot.error
             
             return news_statuses
             
@@ -1218,16 +1356,7 @@ class RealTimeUpdateSystem:
     
     async def get_current_git_status(self):
         """현재 Git 상태 수집"""
-        try:
-            if not watchhamster_monitor:
-                return {}
-            
-            git_status = await watchhamster_monitor.get_git_status()
-            return git_status or {}
-            
-        except Exception as e:
-            logger.error(f"Git 상태 수집 오류: {e}")
-            return {}
+        return await get_current_git_status()
     
     async def get_webhook_status(self):
         """웹훅 상태 수집"""
@@ -1285,11 +1414,8 @@ class RealTimeUpdateSystem:
             if status_data.get("status") != last_status.get("status"):
                 return True
             
-            # 데이터 변화 확인 (해시 비교)
-            current_data_hash = hash(str(status_data.get("data", {})))
-            last_data_hash = hash(str(last_status.get("data", {})))
-            
-            if current_data_hash != last_data_hash:
+            # 데이터 변화 확인 (스냅샷 버전 비교)
+            if status_data.get("version") != last_status.get("version"):
                 return True
         
         return False
@@ -1318,7 +1444,8 @@ class RealTimeUpdateSystem:
             return True
         
         # 주요 Git 상태 변화 확인
-        important_keys = ["branch", "last_commit", "has_conflicts", "remote_status"]
+        important_keys = ["branch", "last_commit", "status", "ahead_commits", "behind_commits",
+                          "modified_files", "untracked_files", "conflicted_files"]
         
         for key in important_keys:
             if current_git_status.get(key) != self.last_git_status.get(key):
@@ -1329,55 +1456,19 @@ class RealTimeUpdateSystem:
     # 브로드캐스트 메서드들
     async def broadcast_system_metrics_update(self, metrics_data):
         """시스템 메트릭 업데이트 브로드캐스트"""
-        message = WSMessage(
-            type="system_metrics_update",
-            data=metrics_data,
-            timestamp=datetime.now()
-        )
-        
-        await manager.broadcast_json(
-            message.model_dump(default=str),
-            event_type="system_metrics"
-        )
+        await self.publish_state("system_metrics", metrics_data)
     
     async def broadcast_news_status_update(self, news_status_data):
         """뉴스 상태 업데이트 브로드캐스트"""
-        message = WSMessage(
-            type="news_status_update",
-            data={"news_statuses": news_status_data},
-            timestamp=datetime.now()
-        )
-        
-        await manager.broadcast_json(
-            message.model_dump(default=str),
-            event_type="news_updates"
-        )
+        await self.publish_state("news_status", {"news_statuses": news_status_data})
     
     async def broadcast_service_status_update(self, service_status_data):
         """서비스 상태 업데이트 브로드캐스트"""
-        message = WSMessage(
-            type="service_status_update",
-            data={"services": service_status_data},
-            timestamp=datetime.now()
-        )
-        
-        await manager.broadcast_json(
-            message.model_dump(default=str),
-            event_type="service_events"
-        )
+        await self.publish_state("service_status", {"services": service_status_data})
     
     async def broadcast_git_status_update(self, git_status_data):
         """Git 상태 업데이트 브로드캐스트"""
-        message = WSMessage(
-            type="git_status_update",
-            data=git_status_data,
-            timestamp=datetime.now()
-        )
-        
-        await manager.broadcast_json(
-            message.model_dump(default=str),
-            event_type="git_updates"
-        )
+        await self.publish_state("git_status", git_status_data)
     
     async def broadcast_webhook_events(self, webhook_events):
         """웹훅 이벤트 브로드캐스트"""
@@ -1392,6 +1483,51 @@ class RealTimeUpdateSystem:
             event_type="webhook_events"
         )
     
+    async def publish_state(self, channel_name: str, data, relay: bool = True) -> bool:
+        """
+        상태 채널 갱신 후 변경된 경우에만 전송
+        
+        Args:
+            channel_name: 상태 채널 이름
+            data: 새 상태
+            relay: 다른 워커에도 전달 (중계된 상태를 반영할 때는 False)
+        
+        Returns:
+            bool: 상태가 바뀌어 전송했는지
+        """
+        channel = self.state_channels[channel_name]
+        if not channel.update(data):
+            return False
+        
+        if relay and manager.relay_enabled:
+            # 채널 단위 최신 상태만 공유 (다른 워커는 자신의 채널 버전으로 델타 계산)
+            document = {"origin": WORKER_ID, "data": channel.state}
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, get_state_backend().set, STATE_RELAY_NAMESPACE, channel_name, document
+                )
+            except Exception as e:
+                logger.warning(f"상태 채널 중계 실패 ({channel_name}): {e}")
+        
+        await manager.publish_state(channel, event_type=STATE_CHANNEL_TOPICS[channel_name])
+        return True
+    
+    async def refresh_state_channel(self, channel_name: str):
+        """채널 상태를 즉시 수집해 반영 (전송하지 않음)"""
+        sources = {
+            "system_metrics": (self.get_current_system_metrics, None),
+            "news_status": (self.get_current_news_status, "news_statuses"),
+            "service_status": (self.get_current_service_status, "services"),
+            "git_status": (self.get_current_git_status, None),
+        }
+        collect, key = sources[channel_name]
+        data = await collect()
+        self.state_channels[channel_name].update({key: data} if key else data)
+    
+    def get_state_stats(self) -> dict:
+        """상태 채널 통계"""
+        return {name: channel.get_stats() for name, channel in self.state_channels.items()}
+    
     # 알림 처리 메서드들
     async def handle_news_status_webhook(self, news_status_data):
         """뉴스 상태 변화 시 웹훅 전송"""
@@ -1541,7 +1677,8 @@ async def broadcast_news_update(news_type: str, status: str, data: dict = None):
         
         await manager.broadcast_json(
             update_message.model_dump(default=str),
-            event_type="news_updates"
+            event_type="news_updates",
+            coalesce_key=f"news_update:{news_type}"
         )
         
         logger.info(f"뉴스 업데이트 브로드캐스트: {news_type} - {status}")
@@ -1650,6 +1787,57 @@ async def trigger_git_status_update():
     except Exception as e:
         logger.error(f"Git 상태 업데이트 트리거 오류: {e}")
 
+# 워커 간 중계 수신 (공유 상태 백엔드 사용 시)
+async def relay_shared_updates(poll_interval: float = RELAY_POLL_INTERVAL):
+    """다른 워커가 보낸 브로드캐스트와 상태 채널 변경을 이 워커의 클라이언트에 전달"""
+    backend = get_state_backend()
+    if not backend.shared:
+        return
+    
+    loop = asyncio.get_running_loop()
+    manager.relay_enabled = True
+    # 시작 이전 브로드캐스트는 다시 보내지 않고 (로그는 RELAY_MAX_ITEMS로 제한), 상태 채널은 현재 값부터 반영
+    last_seq, _ = await loop.run_in_executor(None, backend.tail, BROADCAST_RELAY_LOG, 0)
+    last_revision = -1
+    logger.info(f"워커 간 중계 시작: {WORKER_ID}")
+    
+    try:
+        while True:
+            try:
+                last_seq, broadcasts = await loop.run_in_executor(
+                    None, backend.tail, BROADCAST_RELAY_LOG, last_seq
+                )
+                for entry in broadcasts:
+                    if entry.get("origin") == WORKER_ID:
+                        continue
+                    await manager.broadcast(
+                        entry["message"],
+                        entry.get("event_type", "all"),
+                        coalesce_key=entry.get("coalesce_key"),
+                        priority=entry.get("priority"),
+                        relay=False
+                    )
+                
+                last_revision, changed = await loop.run_in_executor(
+                    None, backend.changes_since, STATE_RELAY_NAMESPACE, last_revision
+                )
+                for channel_name, document in changed.items():
+                    if document.get("origin") == WORKER_ID or channel_name not in realtime_system.state_channels:
+                        continue
+                    await realtime_system.publish_state(channel_name, document.get("data"), relay=False)
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"워커 간 중계 오류: {e}")
+            
+            await asyncio.sleep(poll_interval)
+    
+    except asyncio.CancelledError:
+        logger.info("워커 간 중계가 취소되었습니다")
+    finally:
+        manager.relay_enabled = False
+
 # 연결 상태 모니터링 함수 (개선된 버전)
 async def monitor_connection_health():
     """WebSocket 연결 상태 모니터링 및 자동 정리"""
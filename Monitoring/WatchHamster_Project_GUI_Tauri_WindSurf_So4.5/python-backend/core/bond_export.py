@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+채권 체결정보 스트리밍 내보내기
+
+내부용 INFOMAX API TOOL 노트북의 내보내기 흐름(mn_hist + basic_info 전체 조회 → 위치 기준
+concat → 조건별 행 필터 → openpyxl 저장)을 서버에서 고정 메모리로 처리합니다.
+
+- mn_hist는 날짜 구간 단위로 페이지를 나누어 순서대로 조회
+- basic_info는 stdcd 키 조회표로 관리하며 페이지에 새로 나온 종목만 조회 (키 기준 left join)
+- 필터는 요청당 한 번 컴파일하여 페이지의 열 단위로 마스크를 계산
+- 결과는 페이지마다 CSV / Parquet(행 그룹) / XLSX(write-only)로 바로 기록
+"""
+
+import asyncio
+import csv
+import io
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# (endpoint, params) → 결과 행 목록
+BondFetcher = Callable[[str, Dict[str, Any]], Awaitable[List[Dict[str, Any]]]]
+
+MN_HIST_ENDPOINT = "bond/market/mn_hist"
+BASIC_INFO_ENDPOINT = "bond/basic_info"
+
+MN_HIST_COLUMNS = ('bonddate', 'market', 'stdcd', 'serial', 'time', 'serial_otc',
+                   'yld', 'price', 'volume', 'amount')
+BASIC_INFO_COLUMNS = ('bondnm', 'engnm', 'compnm')
+
+# 노트북과 동일한 한글 필드명
+COLUMN_LABELS = {
+    'bonddate': '일자',
+    'market': '시장구분',
+    'stdcd': '표준코드',
+    'serial': '일련번호',
+    'time': '거래시각',
+    'serial_otc': '장외 일련번호',
+    'yld': '거래수익률',
+    'price': '거래가격',
+    'volume': '거래수량',
+    'amount': '거래금액',
+    'bondnm': '한글종목명',
+    'engnm': '영문종목명',
+    'compnm': '회사명'
+}
+
+DEFAULT_PAGE_DAYS = 31
+BASIC_INFO_CONCURRENCY = 5
+EXPORT_FORMATS = ('csv', 'parquet', 'xlsx')
+# CSV 스트리밍 도중 중단되었을 때 마지막에 기록하는 오류 표시 행의 첫 칸
+CSV_ERROR_MARKER = "#EXPORT_ERROR"
+
+Columns = Dict[str, List[Any]]
+
+
+# ----------------------------------------------------------------------
+# 페이지 조회
+# ----------------------------------------------------------------------
+def iter_date_pages(start_date: str, end_date: str, page_days: int = DEFAULT_PAGE_DAYS) -> Iterator[Tuple[str, str]]:
+    """
+    YYYYMMDD 날짜 구간을 page_days 단위 (시작일, 종료일) 구간으로 분할
+
+    Raises:
+        ValueError: 날짜 형식 오류 또는 시작일이 종료일보다 늦은 경우
+    """
+    if page_days <= 0:
+        raise ValueError("page_days는 0보다 커야 합니다")
+    start = datetime.strptime(start_date, "%Y%m%d")
+    end = datetime.strptime(end_date, "%Y%m%d")
+    if start > end:
+        raise ValueError("시작일이 종료일보다 늦습니다")
+
+    while start <= end:
+        page_end = min(start + timedelta(days=page_days - 1), end)
+        yield start.strftime("%Y%m%d"), page_end.strftime("%Y%m%d")
+        start = page_end + timedelta(days=1)
+
+
+class BasicInfoIndex:
+    """stdcd → basic_info 필드 조회표 (새 종목만 조회)"""
+
+    def __init__(self, fetcher: BondFetcher, fields: Sequence[str] = BASIC_INFO_COLUMNS,
+                 concurrency: int = BASIC_INFO_CONCURRENCY):
+        self.fetcher = fetcher
+        self.fields = tuple(fields)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self.lookups = 0
+
+    async def ensure(self, stdcds: Sequence[str]):
+        """조회표에 없는 종목만 basic_info 조회"""
+        missing = {stdcd for stdcd in stdcds if stdcd and stdcd not in self._index}
+        if missing:
+            await asyncio.gather(*(self._load(stdcd) for stdcd in missing))
+
+    async def _load(self, stdcd: str):
+        async with self._semaphore:
+            self.lookups += 1
+            try:
+                rows = await self.fetcher(BASIC_INFO_ENDPOINT, {'stdcd': stdcd})
+            except Exception as e:
+                logger.warning(f"basic_info 조회 실패 ({stdcd}): {e}")
+                rows = []
+        # 같은 stdcd 행이 여러 개면 첫 행 사용
+        row = next((row for row in rows if row.get('stdcd', stdcd) == stdcd), {})
+        self._index[stdcd] = {name: row.get(name) for name in self.fields}
+
+    def join(self, columns: Columns):
+        """stdcd 기준 left join (없는 종목은 None)"""
+        empty = dict.fromkeys(self.fields)
+        matches = [self._index.get(stdcd, empty) for stdcd in columns.get('stdcd', [])]
+        for name in self.fields:
+            columns[name] = [match[name] for match in matches]
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def rows_to_columns(rows: List[Dict[str, Any]], names: Sequence[str]) -> Columns:
+    """행 목록 → 열 딕셔너리"""
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+# ----------------------------------------------------------------------
+# 필터
+# ----------------------------------------------------------------------
+@dataclass
+class ExportFilter:
+    """
+    내보내기 필터 조건
+
+    op:
+        contains: 문자열 포함 (대소문자 무시)
+        eq: 일치 (숫자로 해석되면 숫자 비교)
+        range: start 이상 end 이하 (숫자 또는 YYYYMMDD 문자열, 한쪽 생략 가능)
+        isna: 값 없음
+    logic: 앞 조건과의 결합 방식 (and / or)
+    """
+    field: str
+    op: str = "contains"
+    value: Optional[str] = None
+    start: Optional[str] = None
+    end: Optional[str] = None
+    logic: str = "and"
+
+
+def _to_number(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _compile_filter(condition: ExportFilter) -> Callable[[List[Any]], List[bool]]:
+    """조건 하나를 열 → 마스크 함수로 컴파일"""
+    op = condition.op
+
+    if op == "isna":
+        return lambda values: [value is None or value == "" for value in values]
+
+    if op == "contains":
+        needle = (condition.value or "").strip().lower()
+        if not needle:
+            return lambda values: [True] * len(values)
+        return lambda values: [value is not None and needle in str(value).lower() for value in values]
+
+    if op == "eq":
+        target = (condition.value or "").strip()
+        number = _to_number(target)
+        if number is not None:
+            return lambda values: [_to_number(value) == number for value in values]
+        return lambda values: [value is not None and str(value) == target for value in values]
+
+    if op == "range":
+        start = (condition.start or "").strip() or None
+        end = (condition.end or "").strip() or None
+        low, high = _to_number(start), _to_number(end)
+        numeric = (start is None or low is not None) and (end is None or high is not None)
+
+        if numeric:
+            def mask(values: List[Any]) -> List[bool]:
+                numbers = [_to_number(value) for value in values]
+                return [number is not None and (low is None or number >= low) and (high is None or number <= high)
+                        for number in numbers]
+        else:
+            start = start.replace("-", "") if start else None
+            end = end.replace("-", "") if end else None
+
+            def mask(values: List[Any]) -> List[bool]:
+                texts = ["" if value is None else str(value).replace("-", "") for value in values]
+                return [bool(text) and (start is None or text >= start) and (end is None or text <= end)
+                        for text in texts]
+        return mask
+
+    raise ValueError(f"지원하지 않는 필터 연산입니다: {op}")
+
+
+class CompiledFilters:
+    """요청 단위로 한 번 컴파일된 필터 (페이지별 열 단위 마스크 계산)"""
+
+    def __init__(self, filters: Sequence[ExportFilter]):
+        self._predicates = [
+            (condition.field, condition.logic.lower(), _compile_filter(condition)) for condition in filters
+        ]
+
+    def mask(self, columns: Columns, size: int) -> List[bool]:
+        """페이지 마스크 (조건은 왼쪽부터 and/or로 결합)"""
+        result: Optional[List[bool]] = None
+        for name, logic, predicate in self._predicates:
+            current = predicate(columns.get(name) or [None] * size)
+            if result is None:
+                result = current
+            elif logic == "or":
+                result = [a or b for a, b in zip(result, current)]
+            else:
+                result = [a and b for a, b in zip(result, current)]
+        return [True] * size if result is None else result
+
+
+def apply_mask(columns: Columns, mask: List[bool], names: Sequence[str], dedup: bool = True) -> Columns:
+    """마스크 적용 + 페이지 안 중복 행 제거"""
+    selected = [i for i, keep in enumerate(mask) if keep]
+    if dedup:
+        seen = set()
+        unique = []
+        for i in selected:
+            key = tuple(columns[name][i] for name in names)
+            if key not in seen:
+                seen.add(key)
+                unique.append(i)
+        selected = unique
+    return {name: [columns[name][i] for i in selected] for name in names}
+
+
+# ----------------------------------------------------------------------
+# 기록기
+# ----------------------------------------------------------------------
+class CsvExportWriter:
+    """CSV 기록기 (페이지마다 인코딩된 청크 반환, UTF-8 BOM 포함)"""
+
+    def __init__(self, headers: Sequence[str]):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self._writer.writerow(headers)
+        self._first = True
+
+    def write(self, columns: Columns, names: Sequence[str]) -> bytes:
+        self._writer.writerows(zip(*(columns[name] for name in names)))
+        return self._drain()
+
+    def close(self) -> bytes:
+        return self._drain()
+
+    def error(self, message: str) -> bytes:
+        """중단 표시 행 (부분 파일을 완성본으로 오인하지 않도록)"""
+        self._writer.writerow([CSV_ERROR_MARKER, message])
+        return self._drain()
+
+    def _drain(self) -> bytes:
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        data = text.encode('utf-8')
+        if self._first:
+            self._first = False
+            data = b'\xef\xbb\xbf' + data  # 엑셀에서 한글이 깨지지 않도록
+        return data
+
+
+class XlsxExportWriter:
+    """XLSX 기록기 (openpyxl write-only 모드)"""
+
+    def __init__(self, path: str, headers: Sequence[str]):
+        if not OPENPYXL_AVAILABLE:
+            raise ValueError("xlsx 내보내기에는 openpyxl이 필요합니다")
+        self.path = path
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("INFOMAX_BOND_API")
+        self._sheet.append(list(headers))
+
+    @staticmethod
+    def _clean(value: Any) -> Any:
+        # 엑셀에서 허용하지 않는 제어 문자 제거
+        return ILLEGAL_CHARACTERS_RE.sub("", value) if isinstance(value, str) else value
+
+    def write(self, columns: Columns, names: Sequence[str]):
+        for row in zip(*(columns[name] for name in names)):
+            self._sheet.append([self._clean(value) for value in row])
+
+    def close(self):
+        self._workbook.save(self.path)
+
+
+class ParquetExportWriter:
+    """Parquet 기록기 (페이지마다 행 그룹 하나)"""
+
+    def __init__(self, path: str, headers: Sequence[str]):
+        if not PYARROW_AVAILABLE:
+            raise ValueError("parquet 내보내기에는 pyarrow가 필요합니다")
+        self.path = path
+        self.headers = list(headers)
+        # 업스트림 값 타입이 페이지마다 다를 수 있으므로 문자열 열로 고정
+        self.schema = pa.schema([(header, pa.string()) for header in self.headers])
+        self._writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, columns: Columns, names: Sequence[str]):
+        arrays = [
+            pa.array([None if value is None else str(value) for value in columns[name]], type=pa.string())
+            for name in names
+        ]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self._writer.close()
+
+
+# ----------------------------------------------------------------------
+# 파이프라인
+# ----------------------------------------------------------------------
+@dataclass
+class BondExportStats:
+    """내보내기 진행 통계"""
+    pages: int = 0
+    fetched_rows: int = 0
+    written_rows: int = 0
+    basic_info_lookups: int = 0
+    started_at: datetime = field(default_factory=datetime.now)
+
+
+class BondExportPipeline:
+    """mn_hist 페이지 조회 → basic_info 조인 → 필터 → 기록"""
+
+    def __init__(self, fetcher: BondFetcher, start_date: str, end_date: str,
+                 params: Optional[Dict[str, Any]] = None, filters: Sequence[ExportFilter] = (),
+                 columns: Optional[Sequence[str]] = None, korean_headers: bool = False,
+                 page_days: int = DEFAULT_PAGE_DAYS):
+        """
+        Args:
+            fetcher: (endpoint, params) → 결과 행 목록
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+            params: mn_hist 추가 파라미터 (stdcd, market 등)
+            filters: 필터 조건
+            columns: 내보낼 열 (기본: mn_hist + basic_info 전체)
+            korean_headers: 머리글을 한글 필드명으로 기록
+            page_days: 페이지당 조회 일수
+        """
+        self.fetcher = fetcher
+        self.pages = list(iter_date_pages(start_date, end_date, page_days))
+        self.params = {k: v for k, v in (params or {}).items() if k not in ('startDate', 'endDate')}
+        self.filters = CompiledFilters(filters)
+        self.columns = list(columns or MN_HIST_COLUMNS + BASIC_INFO_COLUMNS)
+        unknown = [name for name in self.columns if name not in MN_HIST_COLUMNS + BASIC_INFO_COLUMNS]
+        if unknown:
+            raise ValueError(f"알 수 없는 열입니다: {', '.join(unknown)}")
+        self.headers = [COLUMN_LABELS.get(name, name) if korean_headers else name for name in self.columns]
+
+        self.basic_info = BasicInfoIndex(fetcher)
+        self._needs_join = any(
+            name in BASIC_INFO_COLUMNS for name in self.columns + [f.field for f in filters]
+        )
+        self.stats = BondExportStats()
+
+    async def iter_batches(self) -> AsyncIterator[Columns]:
+        """필터가 적용된 페이지 단위 열 묶음"""
+        names = MN_HIST_COLUMNS + (BASIC_INFO_COLUMNS if self._needs_join else ())
+
+        for start, end in self.pages:
+            rows = await self.fetcher(MN_HIST_ENDPOINT, {**self.params, 'startDate': start, 'endDate': end})
+            self.stats.pages += 1
+            self.stats.fetched_rows += len(rows)
+            if not rows:
+                continue
+
+            columns = rows_to_columns(rows, MN_HIST_COLUMNS)
+            if self._needs_join:
+                await self.basic_info.ensure(columns['stdcd'])
+                self.basic_info.join(columns)
+                self.stats.basic_info_lookups = self.basic_info.lookups
+
+            batch = apply_mask(columns, self.filters.mask(columns, len(rows)), names)
+            self.stats.written_rows += len(batch['stdcd'])
+            if batch['stdcd']:
+                yield batch
+
+    async def stream_csv(self) -> AsyncIterator[bytes]:
+        """
+        CSV 바이트 청크 스트림
+
+        첫 청크를 내기 전 오류는 그대로 전파하고 (응답 전에 상태 코드로 변환),
+        이후 오류는 오류 표시 행을 기록하고 스트림을 끝냅니다.
+        """
+        writer = CsvExportWriter(self.headers)
+        started = False
+        try:
+            async for batch in self.iter_batches():
+                chunk = writer.write(batch, self.columns)
+                started = True
+                yield chunk
+        except Exception as e:
+            if not started:
+                raise
+            message = str(getattr(e, 'detail', None) or e)
+            logger.error(f"채권 내보내기 중단 (csv, {self.stats.pages}페이지 이후): {message}")
+            yield writer.error(message)
+            return
+        tail = writer.close()
+        if tail:
+            yield tail
+        logger.info(f"채권 내보내기 완료 (csv): {self.stats.written_rows}/{self.stats.fetched_rows}행, "
+                    f"{self.stats.pages}페이지")
+
+    async def write_file(self, path: str, export_format: str) -> BondExportStats:
+        """Parquet/XLSX 파일로 기록"""
+        if export_format == "xlsx":
+            writer = XlsxExportWriter(path, self.headers)
+        elif export_format == "parquet":
+            writer = ParquetExportWriter(path, self.headers)
+        else:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {export_format}")
+
+        try:
+            async for batch in self.iter_batches():
+                writer.write(batch, self.columns)
+        finally:
+            writer.close()
+
+        logger.info(f"채권 내보내기 완료 ({export_format}): {self.stats.written_rows}/{self.stats.fetched_rows}행, "
+                    f"{self.stats.pages}페이지")
+        return self.stats
@@ -10,6 +10,7 @@ POSCO 뉴스 시스템용 완전 독립 배포 모니터링 시스템
 - 📁 logs/ 폴더에 상세 로그 저장
 - 🖥️ GUI에서 배포 진행 상황 실시간 표시
 - 📈 배포 성능 분석 및 통계
+- 🧮 단계별 소요 시간 롤링 저장소 (고정 크기 배열 + 증분 집계, 통계 조회 시 파일을 다시 읽지 않음)
 
 Requirements: 5.1, 5.2 구현
 """
@@ -18,11 +19,28 @@ import os
 import json
 import time
 import threading
+from collections import deque
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import Dict, List, Optional, Callable, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    from core.metrics_sampler import MetricRingBuffer
+    from core.rolling_metrics import RunningStats
+except ImportError:
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.metrics_sampler import MetricRingBuffer
+    from core.rolling_metrics import RunningStats
+
+# 보관 개수
+METRICS_HISTORY_LIMIT = 100  # 세션 메트릭 (deployment_metrics.json)
+PERFORMANCE_TREND_LIMIT = 50  # 성능 트렌드
+PHASE_DURATION_CAPACITY = 200  # 단계별 최근 소요 시간 (고정 크기 배열)
+SUMMARY_RECENT_SESSIONS = 10  # 요약 통계 대상 최근 세션 수
+
 
 class DeploymentPhase(Enum):
     """배포 단계 열거형"""
@@ -41,6 +59,10 @@ class DeploymentPhase(Enum):
     FAILED = "failed"
 
 
+# 작업이 아닌 상태 표시용 단계 (소요 시간 집계 제외)
+MARKER_PHASES = (DeploymentPhase.INITIALIZING, DeploymentPhase.COMPLETED, DeploymentPhase.FAILED)
+
+
 class MonitoringStatus(Enum):
     """모니터링 상태 열거형"""
     IDLE = "idle"
@@ -97,13 +119,13 @@ class DeploymentSession:
 class DeploymentMonitor:
     """배포 모니터링 시스템 클래스 (스탠드얼론)"""
     
-    def __init__(self, base_dir: Optional[str] = None):
+    def __init__(self, base_dir: Optional[str] = None, logs_dir: Optional[str] = None):
         """배포 모니터링 시스템 초기화"""
         self.base_dir = base_dir or os.getcwd()
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         
         # logs 폴더 설정 (Requirements 5.1, 5.2)
-        self.logs_dir = os.path.join(os.path.dirname(self.script_dir), "logs")
+        self.logs_dir = logs_dir or os.path.join(os.path.dirname(self.script_dir), "logs")
         os.makedirs(self.logs_dir, exist_ok=True)
         
         # 로그 파일들
@@ -141,6 +163,16 @@ class DeploymentMonitor:
             DeploymentPhase.CLEANUP: 30.0         # 30초
         }
         
+        # 롤링 메트릭 저장소 (조회는 메모리에서만, 파일은 저장용)
+        self.metrics_lock = threading.Lock()
+        self.metrics_history: deque = deque(maxlen=METRICS_HISTORY_LIMIT)
+        self.performance_trends: deque = deque(maxlen=PERFORMANCE_TREND_LIMIT)
+        self.phase_durations: Dict[str, MetricRingBuffer] = {}  # 단계 → 최근 (소요 시간, 성공) 배열
+        self.phase_stats: Dict[str, RunningStats] = {}  # 단계 → 누적 집계
+        self.session_stats = RunningStats()  # 전체 배포 소요 시간 누적 집계
+        self.session_counts = {'total': 0, 'success': 0, 'failed': 0}
+        self._load_metrics_store()
+        
         self.log_message("🔧 배포 모니터링 시스템 초기화 완료 (스탠드얼론)")
     
     def log_message(self, message: str, level: str = "INFO"):
@@ -259,6 +291,13 @@ class DeploymentMonitor:
                     )
                     self.current_session.overall_success = success
                     
+                    # 진행 중이던 마지막 단계 완료 처리
+                    last_phase = self.current_session.current_phase
+                    last_metrics = self.current_session.phases.get(last_phase.value)
+                    if last_metrics and last_metrics.end_time is None and last_phase not in MARKER_PHASES:
+                        last_metrics.complete(success, error_message)
+                        self._record_phase_duration(last_metrics)
+                    
                     if not success and error_message:
                         self.current_session.error_count += 1
                     
@@ -309,6 +348,7 @@ class DeploymentMonitor:
                     prev_metrics = self.current_session.phases[prev_phase_key]
                     if prev_metrics.end_time is None:
                         prev_metrics.complete(success, error_message)
+                        self._record_phase_duration(prev_metrics)
                         
                         # 성능 임계값 확인
                         if prev_metrics.duration and prev_metrics.duration > self.performance_thresholds.get(self.current_session.current_phase, 300):
@@ -391,6 +431,79 @@ class DeploymentMonitor:
         except Exception as e:
             self.log_message(f"❌ 모니터링 루프 오류: {str(e)}", "ERROR")
     
+    def _load_metrics_store(self):
+        """
+        시작 시 한 번 저장된 파일에서 롤링 메트릭 저장소 복원
+        
+        누적 집계 상태가 성능 파일에 있으면 그대로 복원하고, 없으면 메트릭 이력을 재생
+        """
+        try:
+            if os.path.exists(self.metrics_log):
+                with open(self.metrics_log, 'r', encoding='utf-8') as f:
+                    self.metrics_history.extend(json.load(f))
+            
+            performance_data = {}
+            if os.path.exists(self.performance_log):
+                with open(self.performance_log, 'r', encoding='utf-8') as f:
+                    performance_data = json.load(f)
+            self.performance_trends.extend(performance_data.get("trends", []))
+            
+            state = performance_data.get("rolling_state")
+            if state:
+                self.phase_stats = {
+                    phase: RunningStats.from_state(phase_state)
+                    for phase, phase_state in state.get("phases", {}).items()
+                }
+                self.session_stats = RunningStats.from_state(state["sessions"])
+                self.session_counts.update(state.get("counts", {}))
+            
+            # 단계별 최근 소요 시간 배열은 메트릭 이력에서 채움 (집계 상태가 없으면 집계도 재생)
+            for metrics_data in self.metrics_history:
+                for phase_key, phase_data in metrics_data.get("phases", {}).items():
+                    if phase_data.get("duration") is None:
+                        continue
+                    self._phase_buffer(phase_key).append(
+                        phase_data.get("end_time") or 0.0,
+                        {'duration': phase_data["duration"], 'success': float(bool(phase_data.get("success")))}
+                    )
+                    if not state:
+                        self._phase_running_stats(phase_key).add(phase_data["duration"])
+                if not state:
+                    self._record_session_totals(metrics_data.get("total_duration"), metrics_data.get("overall_success", False))
+                    
+        except Exception as e:
+            self.log_message(f"❌ 메트릭 저장소 복원 실패: {str(e)}", "ERROR")
+    
+    def _phase_buffer(self, phase_key: str) -> MetricRingBuffer:
+        buffer = self.phase_durations.get(phase_key)
+        if buffer is None:
+            buffer = self.phase_durations[phase_key] = MetricRingBuffer(PHASE_DURATION_CAPACITY, ('duration', 'success'))
+        return buffer
+    
+    def _phase_running_stats(self, phase_key: str) -> RunningStats:
+        stats = self.phase_stats.get(phase_key)
+        if stats is None:
+            stats = self.phase_stats[phase_key] = RunningStats()
+        return stats
+    
+    def _record_phase_duration(self, metrics: DeploymentMetrics):
+        """단계 완료 시 소요 시간을 배열과 누적 집계에 반영"""
+        if metrics.duration is None or metrics.phase in MARKER_PHASES:
+            return
+        
+        phase_key = metrics.phase.value
+        with self.metrics_lock:
+            self._phase_buffer(phase_key).append(
+                metrics.end_time, {'duration': metrics.duration, 'success': float(metrics.success)}
+            )
+            self._phase_running_stats(phase_key).add(metrics.duration)
+    
+    def _record_session_totals(self, total_duration: Optional[float], success: bool):
+        self.session_counts['total'] += 1
+        self.session_counts['success' if success else 'failed'] += 1
+        if total_duration:
+            self.session_stats.add(total_duration)
+    
     def _save_deployment_metrics(self, session: DeploymentSession):
         """배포 메트릭 저장 (logs 폴더에 기록)"""
         try:
@@ -422,22 +535,10 @@ class DeploymentMonitor:
                     "details": metrics.details
                 }
             
-            # 기존 메트릭 로드
-            existing_metrics = []
-            if os.path.exists(self.metrics_log):
-                with open(self.metrics_log, 'r', encoding='utf-8') as f:
-                    existing_metrics = json.load(f)
-            
-            # 새 메트릭 추가
-            existing_metrics.append(metrics_data)
-            
-            # 최근 100개 세션만 유지
-            if len(existing_metrics) > 100:
-                existing_metrics = existing_metrics[-100:]
-            
-            # 파일에 저장
-            with open(self.metrics_log, 'w', encoding='utf-8') as f:
-                json.dump(existing_metrics, f, ensure_ascii=False, indent=2)
+            # 메모리 이력에 추가 (최근 100개 세션만 유지) 후 파일에 저장
+            with self.metrics_lock:
+                self.metrics_history.append(metrics_data)
+                self._write_json(self.metrics_log, list(self.metrics_history))
             
             # 성능 분석 데이터 업데이트
             self._update_performance_analysis(session)
@@ -448,14 +549,8 @@ class DeploymentMonitor:
             self.log_message(f"❌ 배포 메트릭 저장 실패: {str(e)}", "ERROR")
     
     def _update_performance_analysis(self, session: DeploymentSession):
-        """성능 분석 데이터 업데이트"""
+        """성능 분석 데이터 업데이트 (누적 집계 갱신 후 파일에 저장)"""
         try:
-            # 기존 성능 데이터 로드
-            performance_data = {"summary": {}, "phase_averages": {}, "trends": []}
-            if os.path.exists(self.performance_log):
-                with open(self.performance_log, 'r', encoding='utf-8') as f:
-                    performance_data = json.load(f)
-            
             # 현재 세션 데이터 추가
             session_summary = {
                 "session_id": session.session_id,
@@ -472,50 +567,52 @@ class DeploymentMonitor:
                 if metrics.duration:
                     session_summary["phase_durations"][phase_key] = metrics.duration
             
-            # 트렌드 데이터에 추가
-            performance_data["trends"].append(session_summary)
-            
-            # 최근 50개 세션만 유지
-            if len(performance_data["trends"]) > 50:
-                performance_data["trends"] = performance_data["trends"][-50:]
-            
-            # 단계별 평균 시간 계산
-            phase_totals = {}
-            phase_counts = {}
-            
-            for trend in performance_data["trends"]:
-                for phase, duration in trend.get("phase_durations", {}).items():
-                    if phase not in phase_totals:
-                        phase_totals[phase] = 0
-                        phase_counts[phase] = 0
-                    phase_totals[phase] += duration
-                    phase_counts[phase] += 1
-            
-            # 평균 계산
-            for phase in phase_totals:
-                if phase_counts[phase] > 0:
-                    performance_data["phase_averages"][phase] = phase_totals[phase] / phase_counts[phase]
-            
-            # 전체 요약 통계
-            recent_sessions = performance_data["trends"][-10:]  # 최근 10개 세션
-            if recent_sessions:
-                total_durations = [s["total_duration"] for s in recent_sessions if s["total_duration"]]
-                success_count = sum(1 for s in recent_sessions if s["success"])
+            with self.metrics_lock:
+                # 트렌드 데이터에 추가 (최근 50개 세션만 유지)
+                self.performance_trends.append(session_summary)
+                self._record_session_totals(session.total_duration, session.overall_success)
                 
-                performance_data["summary"] = {
-                    "recent_sessions_count": len(recent_sessions),
-                    "average_duration": sum(total_durations) / len(total_durations) if total_durations else 0,
-                    "success_rate": success_count / len(recent_sessions) * 100,
-                    "last_updated": datetime.now().isoformat()
+                performance_data = self._build_performance_statistics()
+                performance_data["rolling_state"] = {
+                    "phases": {phase: stats.state() for phase, stats in self.phase_stats.items()},
+                    "sessions": self.session_stats.state(),
+                    "counts": dict(self.session_counts)
                 }
-            
-            # 파일에 저장
-            with open(self.performance_log, 'w', encoding='utf-8') as f:
-                json.dump(performance_data, f, ensure_ascii=False, indent=2)
+                self._write_json(self.performance_log, performance_data)
             
         except Exception as e:
             self.log_message(f"❌ 성능 분석 데이터 업데이트 실패: {str(e)}", "ERROR")
     
+    def _build_performance_statistics(self) -> Dict[str, Any]:
+        """메모리의 누적 집계로 성능 통계 구성 (metrics_lock 안에서 호출)"""
+        # 전체 요약 통계 (최근 10개 세션)
+        recent_sessions = list(islice(reversed(self.performance_trends), SUMMARY_RECENT_SESSIONS))
+        summary = {}
+        if recent_sessions:
+            total_durations = [s["total_duration"] for s in recent_sessions if s["total_duration"]]
+            success_count = sum(1 for s in recent_sessions if s["success"])
+            summary = {
+                "recent_sessions_count": len(recent_sessions),
+                "average_duration": sum(total_durations) / len(total_durations) if total_durations else 0,
+                "success_rate": success_count / len(recent_sessions) * 100,
+                "last_updated": datetime.now().isoformat()
+            }
+        
+        return {
+            "summary": summary,
+            "phase_averages": {phase: stats.mean for phase, stats in self.phase_stats.items()},
+            "phase_statistics": {phase: stats.to_dict() for phase, stats in self.phase_stats.items()},
+            "session_statistics": dict(self.session_stats.to_dict(), **self.session_counts),
+            "trends": list(self.performance_trends)
+        }
+    
+    def _write_json(self, path: str, data: Any):
+        """임시 파일에 쓴 뒤 교체 (쓰는 도중 중단되어도 이전 파일 유지)"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+    
     def get_current_deployment_status(self) -> Optional[Dict[str, Any]]:
         """현재 배포 상태 조회 (GUI용)"""
         if not self.current_session:
@@ -549,81 +646,59 @@ class DeploymentMonitor:
             return None
     
     def get_deployment_history(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """배포 히스토리 조회"""
-        try:
-            if not os.path.exists(self.metrics_log):
-                return []
-            
-            with open(self.metrics_log, 'r', encoding='utf-8') as f:
-                all_metrics = json.load(f)
-            
-            # 최신순으로 정렬하여 반환
-            return sorted(all_metrics, key=lambda x: x.get('start_time', 0), reverse=True)[:limit]
-            
-        except Exception as e:
-            self.log_message(f"❌ 배포 히스토리 조회 실패: {str(e)}", "ERROR")
-            return []
+        """배포 히스토리 조회 (최신순)"""
+        with self.metrics_lock:
+            return list(islice(reversed(self.metrics_history), max(limit, 0)))
     
     def get_performance_statistics(self) -> Dict[str, Any]:
-        """성능 통계 조회"""
+        """성능 통계 조회 (파일을 읽지 않고 누적 집계 반환)"""
         try:
-            if not os.path.exists(self.performance_log):
-                return {"summary": {}, "phase_averages": {}, "trends": []}
-            
-            with open(self.performance_log, 'r', encoding='utf-8') as f:
-                return json.load(f)
-                
+            with self.metrics_lock:
+                return self._build_performance_statistics()
         except Exception as e:
             self.log_message(f"❌ 성능 통계 조회 실패: {str(e)}", "ERROR")
             return {"summary": {}, "phase_averages": {}, "trends": []}
     
+    def get_phase_durations(self, phase: DeploymentPhase, limit: Optional[int] = None) -> List[float]:
+        """단계별 최근 소요 시간 (시간순, 최대 PHASE_DURATION_CAPACITY개)"""
+        with self.metrics_lock:
+            buffer = self.phase_durations.get(phase.value)
+            return buffer.values('duration', limit=limit) if buffer else []
+    
     def cleanup_old_logs(self, days_to_keep: int = 30):
-        """오래된 로그 파일 정리"""
+        """오래된 로그 정리 (메모리 이력을 정리한 뒤 파일에 저장, 누적 집계는 유지)"""
         try:
             cutoff_time = time.time() - (days_to_keep * 24 * 60 * 60)
             
-            # 메트릭 로그 정리
-            if os.path.exists(self.metrics_log):
-                with open(self.metrics_log, 'r', encoding='utf-8') as f:
-                    all_metrics = json.load(f)
+            with self.metrics_lock:
+                # 메트릭 이력 정리
+                original_count = len(self.metrics_history)
+                recent_metrics = [m for m in self.metrics_history if m.get('start_time', 0) > cutoff_time]
                 
-                # 최근 데이터만 유지
-                recent_metrics = [
-                    m for m in all_metrics 
-                    if m.get('start_time', 0) > cutoff_time
-                ]
-                
-                if len(recent_metrics) != len(all_metrics):
-                    with open(self.metrics_log, 'w', encoding='utf-8') as f:
-                        json.dump(recent_metrics, f, ensure_ascii=False, indent=2)
-                    
-                    removed_count = len(all_metrics) - len(recent_metrics)
-                    self.log_message(f"🧹 오래된 메트릭 {removed_count}개 정리 완료")
-            
-            # 성능 로그 정리
-            if os.path.exists(self.performance_log):
-                with open(self.performance_log, 'r', encoding='utf-8') as f:
-                    performance_data = json.load(f)
+                if len(recent_metrics) != original_count:
+                    self.metrics_history = deque(recent_metrics, maxlen=METRICS_HISTORY_LIMIT)
+                    self._write_json(self.metrics_log, recent_metrics)
+                    self.log_message(f"🧹 오래된 메트릭 {original_count - len(recent_metrics)}개 정리 완료")
                 
                 # 트렌드 데이터 정리
-                if "trends" in performance_data:
-                    original_count = len(performance_data["trends"])
-                    performance_data["trends"] = [
-                        t for t in performance_data["trends"]
-                        if datetime.fromisoformat(t["timestamp"]).timestamp() > cutoff_time
-                    ]
-                    
-                    if len(performance_data["trends"]) != original_count:
-                        with open(self.performance_log, 'w', encoding='utf-8') as f:
-                            json.dump(performance_data, f, ensure_ascii=False, indent=2)
-                        
-                        removed_count = original_count - len(performance_data["trends"])
-                        self.log_message(f"🧹 오래된 성능 데이터 {removed_count}개 정리 완료")
+                original_count = len(self.performance_trends)
+                recent_trends = [
+                    t for t in self.performance_trends
+                    if datetime.fromisoformat(t["timestamp"]).timestamp() > cutoff_time
+                ]
+                
+                if len(recent_trends) != original_count:
+                    self.performance_trends = deque(recent_trends, maxlen=PERFORMANCE_TREND_LIMIT)
+                    if os.path.exists(self.performance_log):
+                        with open(self.performance_log, 'r', encoding='utf-8') as f:
+                            performance_data = json.load(f)
+                        performance_data["trends"] = recent_trends
+                        self._write_json(self.performance_log, performance_data)
+                    self.log_message(f"🧹 오래된 성능 데이터 {original_count - len(recent_trends)}개 정리 완료")
             
         except Exception as e:
             self.log_message(f"❌ 로그 정리 중 오류: {str(e)}", "ERROR")
 
-
 # 편의 함수들
 def create_deployment_monitor(base_dir: Optional[str] = None) -> DeploymentMonitor:
     """배포 모니터 인스턴스 생성"""
@@ -25,12 +25,18 @@ class GitStatus:
     modified_files: List[str] = None
     ahead_commits: int = 0
     behind_commits: int = 0
+    conflicted_files: List[str] = None
+    upstream: Optional[str] = None
+    last_commit_message: str = ""
+    last_commit_date: str = ""
     
     def __post_init__(self):
         if self.untracked_files is None:
             self.untracked_files = []
         if self.modified_files is None:
             self.modified_files = []
+        if self.conflicted_files is None:
+            self.conflicted_files = []
 
 class GitMonitor:
     """Git 저장소 모니터링 및 관리 클래스"""
@@ -38,6 +44,7 @@ class GitMonitor:
     def __init__(self, repo_path: str = "."):
         self.repo_path = repo_path
         self.logger = self._setup_logger()
+        self._status_collector = None
         
     def _setup_logger(self) -> logging.Logger:
         """로거 설정"""
@@ -218,6 +225,21 @@ class GitMonitor:
                 error_message=str(e)
             )
     
+    async def get_git_status_async(self, force: bool = False) -> GitStatus:
+        """
+        전체 Git 상태 확인 (비동기, 이벤트 루프를 막지 않음)
+        
+        git status/log 두 번만 실행하고 HEAD/index가 바뀌지 않았으면 캐시를 반환합니다.
+        원격 저장소 fetch는 하지 않으므로 ahead/behind는 로컬 추적 브랜치 기준입니다.
+        """
+        if self._status_collector is None:
+            try:
+                from .git_status_collector import AsyncGitStatusCollector
+            except ImportError:
+                from git_status_collector import AsyncGitStatusCollector
+            self._status_collector = AsyncGitStatusCollector(self.repo_path)
+        return await self._status_collector.collect(force=force)
+    
     def attempt_git_update(self) -> Tuple[bool, str]:
         """
         Git 업데이트 시도
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 Git 상태 수집기
+이벤트 루프를 막지 않고 Git 저장소 상태를 수집하는 서버용 수집기
+
+- asyncio 서브프로세스로 `git status --porcelain=v2 --branch` 한 번 + `git log -1` 한 번만 실행
+- .git/HEAD, index, 현재 브랜치 ref 파일의 mtime이 바뀔 때만 다시 수집 (변경 없으면 캐시 반환)
+- 동시에 들어온 수집 요청은 진행 중인 한 번의 실행을 함께 기다림
+"""
+
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .git_monitor import GitStatus
+except ImportError:
+    from git_monitor import GitStatus
+
+logger = logging.getLogger(__name__)
+
+GIT_COMMAND_TIMEOUT = 10.0  # 초
+DEFAULT_MAX_AGE = 300.0  # 작업 트리만 바뀐 경우(인덱스 변화 없음)를 위한 최대 캐시 유지 시간 (초)
+LOG_FORMAT = "%H%x1f%s%x1f%ci"
+
+
+def parse_porcelain_v2(output: str) -> Dict[str, Any]:
+    """
+    `git status --porcelain=v2 --branch` 출력 파싱
+
+    Args:
+        output: git status 출력
+
+    Returns:
+        branch, oid, upstream, ahead, behind, modified_files, untracked_files, conflicted_files
+    """
+    result = {
+        'branch': "",
+        'oid': "",
+        'upstream': None,
+        'ahead': 0,
+        'behind': 0,
+        'modified_files': [],
+        'untracked_files': [],
+        'conflicted_files': []
+    }
+
+    for line in output.splitlines():
+        if line.startswith('# '):
+            key, _, value = line[2:].partition(' ')
+            if key == 'branch.oid':
+                result['oid'] = "" if value == "(initial)" else value
+            elif key == 'branch.head':
+                result['branch'] = "HEAD" if value == "(detached)" else value
+            elif key == 'branch.upstream':
+                result['upstream'] = value
+            elif key == 'branch.ab':
+                ahead, _, behind = value.partition(' ')
+                result['ahead'] = abs(int(ahead))
+                result['behind'] = abs(int(behind))
+        elif line.startswith('1 '):
+            # 1 XY sub mH mI mW hH hI path
+            result['modified_files'].append(line.split(' ', 8)[8])
+        elif line.startswith('2 '):
+            # 2 XY sub mH mI mW hH hI Xscore path<TAB>origPath
+            result['modified_files'].append(line.split(' ', 9)[9].split('\t', 1)[0])
+        elif line.startswith('u '):
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path
+            result['conflicted_files'].append(line.split(' ', 10)[10])
+        elif line.startswith('? '):
+            result['untracked_files'].append(line[2:])
+
+    return result
+
+
+class AsyncGitStatusCollector:
+    """변경 감지 기반 비동기 Git 상태 수집기"""
+
+    def __init__(self, repo_path: str = ".", max_age: Optional[float] = DEFAULT_MAX_AGE,
+                 timeout: float = GIT_COMMAND_TIMEOUT):
+        """
+        Args:
+            repo_path: 저장소 경로 (하위 디렉토리도 가능)
+            max_age: mtime 변화가 없어도 이 시간이 지나면 다시 수집 (초, None이면 변화 시에만)
+            timeout: git 명령어별 제한 시간 (초)
+        """
+        self.repo_path = str(repo_path)
+        self.max_age = max_age
+        self.timeout = timeout
+        self._git_dir: Optional[Path] = None
+        self._cache: Optional[GitStatus] = None
+        self._cache_key: Optional[Tuple] = None
+        self._cached_at = 0.0
+        self._lock = asyncio.Lock()
+        self._commit_cache: Dict[str, Tuple[Tuple, Optional[Dict[str, str]]]] = {}
+
+        self.runs = 0
+        self.cache_hits = 0
+
+    async def _run_git(self, args: List[str]) -> Tuple[bool, str, str]:
+        """
+        Git 명령어 비동기 실행
+
+        Returns:
+            (성공여부, stdout, stderr)
+        """
+        env = os.environ.copy()
+        env['GIT_PAGER'] = ''
+        env['GIT_OPTIONAL_LOCKS'] = '0'  # status가 인덱스를 다시 쓰지 않도록 (mtime 캐시 키 유지)
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'git', *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.repo_path,
+                env=env
+            )
+        except Exception as e:
+            logger.error(f"Git 명령어 실행 오류: {e}")
+            return False, "", str(e)
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), self.timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            logger.error(f"Git 명령어 타임아웃: git {' '.join(args)}")
+            return False, "", "명령어 실행 타임아웃"
+        except asyncio.CancelledError:
+            process.kill()
+            raise
+
+        return (
+            process.returncode == 0,
+            stdout.decode('utf-8', errors='ignore').strip(),
+            stderr.decode('utf-8', errors='ignore').strip()
+        )
+
+    async def _resolve_git_dir(self) -> Optional[Path]:
+        if self._git_dir is None:
+            success, output, _ = await self._run_git(['rev-parse', '--absolute-git-dir'])
+            if success and output:
+                self._git_dir = Path(output)
+        return self._git_dir
+
+    def _ref_paths(self, ref: str = "HEAD") -> List[Path]:
+        """ref 변화 감지용 파일 목록 (HEAD가 가리키는 브랜치 ref 포함)"""
+        git_dir = self._git_dir
+        paths = [git_dir / 'HEAD', git_dir / 'packed-refs']
+        if ref == "HEAD":
+            try:
+                head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+            except OSError:
+                head = ""
+            if head.startswith('ref: '):
+                paths.append(git_dir / head[5:])
+        else:
+            paths.append(git_dir / ref)
+        return paths
+
+    @staticmethod
+    def _stat_key(paths: List[Path]) -> Tuple:
+        key = []
+        for path in paths:
+            try:
+                stat = path.stat()
+                key.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                key.append(None)
+        return tuple(key)
+
+    def _status_key(self) -> Tuple:
+        return self._stat_key(self._ref_paths() + [self._git_dir / 'index'])
+
+    async def collect(self, force: bool = False) -> GitStatus:
+        """
+        Git 상태 수집 (HEAD/index/ref mtime이 그대로면 캐시 반환)
+
+        Args:
+            force: 캐시를 무시하고 다시 수집
+        """
+        async with self._lock:
+            git_dir = await self._resolve_git_dir()
+            if git_dir is None:
+                return GitStatus(
+                    branch="",
+                    last_commit="",
+                    status="오류",
+                    error_message="Git 저장소가 아닙니다"
+                )
+
+            key = self._status_key()
+            fresh = self.max_age is None or time.monotonic() - self._cached_at < self.max_age
+            if not force and self._cache is not None and key == self._cache_key and fresh:
+                self.cache_hits += 1
+                return self._cache
+
+            status = await self._collect()
+            if status.status != "오류":
+                self._cache = status
+                # 수집 직후 키로 저장 (수집 중 바뀌었다면 다음 호출에서 다시 수집)
+                self._cache_key = key
+                self._cached_at = time.monotonic()
+            return status
+
+    async def _collect(self) -> GitStatus:
+        self.runs += 1
+        (status_ok, status_output, status_error), (log_ok, log_output, _) = await asyncio.gather(
+            self._run_git(['status', '--porcelain=v2', '--branch']),
+            self._run_git(['log', '-1', f'--format={LOG_FORMAT}'])
+        )
+
+        if not status_ok:
+            logger.error(f"Git 상태 확인 중 오류: {status_error}")
+            return GitStatus(
+                branch="",
+                last_commit="",
+                status="오류",
+                error_message=status_error or "git status 실패"
+            )
+
+        parsed = parse_porcelain_v2(status_output)
+        commit = self._parse_log(log_output) if log_ok else None
+
+        if parsed['conflicted_files']:
+            status = "충돌"
+        elif parsed['behind'] > 0:
+            status = "업데이트 필요"
+        elif parsed['modified_files'] or parsed['untracked_files']:
+            status = "변경사항 있음"
+        else:
+            status = "최신"
+
+        return GitStatus(
+            branch=parsed['branch'] or "unknown",
+            last_commit=parsed['oid'] or "unknown",
+            status=status,
+            uncommitted_changes=bool(parsed['modified_files'] or parsed['untracked_files'] or parsed['conflicted_files']),
+            untracked_files=parsed['untracked_files'],
+            modified_files=parsed['modified_files'] + parsed['conflicted_files'],
+            ahead_commits=parsed['ahead'],
+            behind_commits=parsed['behind'],
+            conflicted_files=parsed['conflicted_files'],
+            upstream=parsed['upstream'],
+            last_commit_message=commit['message'] if commit else "",
+            last_commit_date=commit['date'] if commit else ""
+        )
+
+    @staticmethod
+    def _parse_log(output: str) -> Optional[Dict[str, str]]:
+        parts = output.split('\x1f')
+        if len(parts) != 3:
+            return None
+        return {'hash': parts[0], 'message': parts[1], 'date': parts[2]}
+
+    async def get_commit(self, ref: str) -> Optional[Dict[str, str]]:
+        """
+        ref의 최신 커밋 정보 (git log 한 번, ref 파일 mtime이 그대로면 캐시 반환)
+
+        Args:
+            ref: 브랜치/원격 ref (예: "origin/publish")
+
+        Returns:
+            {'hash', 'message', 'date'} 또는 None
+        """
+        git_dir = await self._resolve_git_dir()
+        if git_dir is None:
+            return None
+
+        ref_path = ref if ref.startswith('refs/') or ref == "HEAD" else (
+            f"refs/remotes/{ref}" if '/' in ref else f"refs/heads/{ref}"
+        )
+        key = self._stat_key(self._ref_paths(ref_path))
+        cached = self._commit_cache.get(ref)
+        if cached is not None and cached[0] == key:
+            self.cache_hits += 1
+            return cached[1]
+
+        self.runs += 1
+        success, output, _ = await self._run_git(['log', ref, '-1', f'--format={LOG_FORMAT}'])
+        commit = self._parse_log(output) if success else None
+        self._commit_cache[ref] = (key, commit)
+        return commit
+
+    def invalidate(self):
+        """캐시 무효화"""
+        self._cache = None
+        self._cache_key = None
+        self._commit_cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """수집 통계"""
+        return {
+            'repo_path': self.repo_path,
+            'git_dir': str(self._git_dir) if self._git_dir else None,
+            'runs': self.runs,
+            'cache_hits': self.cache_hits,
+            'cached': self._cache is not None
+        }
+
+
+# 싱글톤 인스턴스
+_git_status_collector: Optional[AsyncGitStatusCollector] = None
+
+
+def get_git_status_collector() -> AsyncGitStatusCollector:
+    """Git 상태 수집기 인스턴스 가져오기 (백엔드 디렉토리 기준 저장소)"""
+    global _git_status_collector
+    if _git_status_collector is None:
+        _git_status_collector = AsyncGitStatusCollector(str(Path(__file__).resolve().parent.parent))
+    return _git_status_collector
@@ -22,13 +22,15 @@ import aiohttp
 import json
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, Callable, List
+from typing import Dict, Optional, Any, Callable, List, AsyncIterator, Tuple
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
 import ssl
 from urllib.parse import urljoin
 
+from .news_response_cache import NewsResponseCache, get_news_response_cache
+
 
 class ConnectionStatus(Enum):
     """연결 상태 열거형"""
@@ -66,6 +68,45 @@ class APIMetrics:
         return self.total_response_time / self.successful_requests
 
 
+class TokenBucketRateLimiter:
+    """
+    토큰 버킷 기반 비동기 요청 속도 제한기
+    
+    초당 rate 개의 토큰이 채워지며 최대 burst 개까지 누적됩니다.
+    토큰이 없으면 다음 토큰이 채워질 때까지 대기합니다.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate (float): 초당 허용 요청 수
+            burst (int): 순간적으로 허용할 최대 요청 수
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        """경과 시간만큼 토큰 보충"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+    
+    async def acquire(self):
+        """토큰 1개 획득 (부족하면 대기)"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
 class InfomaxAPIClient:
     """
     INFOMAX API 클라이언트 클래스
@@ -90,6 +131,11 @@ class InfomaxAPIClient:
                 - max_delay (float): 최대 지연 시간
                 - backoff_factor (float): 백오프 배수
                 - pool_size (int): 연결 풀 크기
+                - max_concurrency (int): 과거 데이터 동시 조회 수 (기본: pool_size)
+                - rate_limit (float): 초당 최대 요청 수 (API 쿼터)
+                - rate_burst (int): 순간 허용 요청 수
+                - cache (NewsResponseCache): 응답 캐시 (기본: 공유 디스크 캐시)
+                - cache_enabled (bool): 응답 캐시 사용 여부
         """
         # 기본 설정
         self.api_url = base_url
@@ -101,6 +147,17 @@ class InfomaxAPIClient:
         self.max_delay = kwargs.get("max_delay", 60.0)
         self.backoff_factor = kwargs.get("backoff_factor", 2.0)
         self.pool_size = kwargs.get("pool_size", 10)
+        self.max_concurrency = kwargs.get("max_concurrency", self.pool_size)
+        self.rate_limit = kwargs.get("rate_limit", 2.0)
+        self.rate_burst = kwargs.get("rate_burst", 2)
+        self.rate_limiter = TokenBucketRateLimiter(self.rate_limit, self.rate_burst)
+        
+        # 응답 캐시 (지난 날짜는 영구 보관, 오늘 날짜는 TTL + 조건부 재검증)
+        self.cache: Optional[NewsResponseCache] = None
+        if kwargs.get("cache_enabled", True):
+            self.cache = kwargs.get("cache") or get_news_response_cache()
+        # 캐시 키 구분 (같은 캐시를 쓰는 다른 클라이언트/엔드포인트와 겹치지 않도록)
+        self.cache_scope = NewsResponseCache.make_scope(self.api_url)
         
         # 상태 관리
         self.status = ConnectionStatus.UNKNOWN
@@ -189,6 +246,11 @@ class InfomaxAPIClient:
         if not self.session:
             await self._create_session()
         
+        if self.cache:
+            cached = self.cache.get_fresh(news_type, date, self.cache_scope)
+            if cached is not None:
+                return cached
+        
         return await self._execute_with_retry(self._fetch_news_data_internal, news_type, date)
     
     async def _fetch_news_data_internal(self, news_type: Optional[str] = None, date: Optional[str] = None) -> Dict[str, Any]:
@@ -199,9 +261,19 @@ class InfomaxAPIClient:
         if news_type:
             params['type'] = news_type
         
+        # 캐시된 응답이 있으면 조건부 요청으로 재검증
+        headers = self.cache.conditional_headers(news_type, date, self.cache_scope) if self.cache else {}
+        
         start_time = time.time()
         
-        async with self.session.get(self.api_url, params=params) as response:
+        async with self.session.get(self.api_url, params=params, headers=headers) as response:
+            if response.status == 304 and self.cache:
+                cached = self.cache.get_stale(news_type, date, self.cache_scope)
+                if cached is not None:
+                    self.cache.mark_revalidated(news_type, date, self.cache_scope)
+                    await self._update_success_metrics(time.time() - start_time)
+                    return cached
+            
             response.raise_for_status()
             
             data = await response.json()
@@ -213,6 +285,14 @@ class InfomaxAPIClient:
             response_time = time.time() - start_time
             await self._update_success_metrics(response_time)
             
+            if self.cache:
+                self.cache.store(
+                    news_type, date, data,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    scope=self.cache_scope
+                )
+            
             return data
     
     async def health_check(self) -> bool:
@@ -247,7 +327,22 @@ class InfomaxAPIClient:
             self.logger.error(f"API 헬스 체크 오류: {e}")
             return False
     
-    async def get_historical_data(self, start_date: str, end_date: str, news_type: Optional[str] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _iter_business_days(start_date: str, end_date: str) -> List[str]:
+        """시작~종료 날짜 사이의 영업일(주말 제외) 목록 반환"""
+        start_dt = datetime.strptime(start_date, '%Y%m%d')
+        end_dt = datetime.strptime(end_date, '%Y%m%d')
+        
+        dates = []
+        current_dt = start_dt
+        while current_dt <= end_dt:
+            if current_dt.weekday() < 5:  # 0=월요일, 4=금요일
+                dates.append(current_dt.strftime('%Y%m%d'))
+            current_dt += timedelta(days=1)
+        return dates
+    
+    async def get_historical_data(self, start_date: str, end_date: str, news_type: Optional[str] = None,
+                                  concurrent: bool = False) -> Dict[str, Any]:
         """
         기간별 과거 데이터 조회
         
@@ -255,39 +350,96 @@ class InfomaxAPIClient:
             start_date (str): 시작 날짜 (YYYYMMDD)
             end_date (str): 종료 날짜 (YYYYMMDD)
             news_type (str, optional): 뉴스 타입
+            concurrent (bool): True면 iter_historical_data로 동시 조회
         
         Returns:
             dict: 날짜별 뉴스 데이터
         """
         historical_data = {}
         
-        start_dt = datetime.strptime(start_date, '%Y%m%d')
-        end_dt = datetime.strptime(end_date, '%Y%m%d')
+        if concurrent:
+            async for date_str, data in self.iter_historical_data(start_date, end_date, news_type):
+                if data:
+                    historical_data[date_str] = data
+            
+            self.logger.info(f"과거 데이터 조회 완료: {len(historical_data)}일치 데이터")
+            return dict(sorted(historical_data.items()))
         
-        current_dt = start_dt
-        while current_dt <= end_dt:
-            date_str = current_dt.strftime('%Y%m%d')
+        for date_str in self._iter_business_days(start_date, end_date):
+            try:
+                data = await self.fetch_news_data(news_type, date_str)
+                if data:
+                    historical_data[date_str] = data
+                    self.logger.info(f"과거 데이터 조회 성공: {date_str}")
+                else:
+                    self.logger.warning(f"과거 데이터 조회 실패: {date_str}")
+                
+                # API 부하 방지를 위한 지연
+                await asyncio.sleep(0.5)
+                
+            except Exception as e:
+                self.logger.error(f"과거 데이터 조회 오류 ({date_str}): {e}")
+        
+        self.logger.info(f"과거 데이터 조회 완료: {len(historical_data)}일치 데이터")
+        return historical_data
+    
+    async def iter_historical_data(self, start_date: str, end_date: str, news_type: Optional[str] = None,
+                                   max_concurrency: Optional[int] = None) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        기간별 과거 데이터 동시 조회 (스트리밍)
+        
+        영업일을 연결 풀 전체에 분산하여 동시에 조회하고, 완료되는 순서대로
+        (날짜, 데이터) 튜플을 반환합니다. 동시 요청 수는 세마포어로,
+        초당 요청 수는 토큰 버킷으로 제한됩니다. 실패한 날짜는 데이터가 None입니다.
+        
+        Args:
+            start_date (str): 시작 날짜 (YYYYMMDD)
+            end_date (str): 종료 날짜 (YYYYMMDD)
+            news_type (str, optional): 뉴스 타입
+            max_concurrency (int, optional): 동시 요청 수 (기본: self.max_concurrency)
+        
+        Yields:
+            tuple: (날짜 문자열, 뉴스 데이터 또는 None)
+        """
+        if not self.session:
+            await self._create_session()
+        
+        # 연결 풀 크기보다 많은 동시 요청은 커넥터 대기열에만 쌓이므로 제한
+        concurrency = max(1, min(max_concurrency or self.max_concurrency, self.pool_size))
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(date_str: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+            # 확정된 과거 데이터는 캐시에서 바로 반환 (토큰 소비 없음)
+            if self.cache:
+                cached = self.cache.get_fresh(news_type, date_str, self.cache_scope)
+                if cached is not None:
+                    return date_str, cached
             
-            # 주말 제외 (영업일만)
-            if current_dt.weekday() < 5:  # 0=월요일, 4=금요일
+            async with semaphore:
                 try:
-                    data = await self.fetch_news_data(news_type, date_str)
-                    if data:
-                        historical_data[date_str] = data
-                        self.logger.info(f"과거 데이터 조회 성공: {date_str}")
-                    else:
-                        self.logger.warning(f"과거 데이터 조회 실패: {date_str}")
-                    
-                    # API 부하 방지를 위한 지연
-                    await asyncio.sleep(0.5)
-                    
+                    data = await self._execute_with_retry(self._rate_limited_fetch, news_type, date_str)
+                    return date_str, data
                 except Exception as e:
                     self.logger.error(f"과거 데이터 조회 오류 ({date_str}): {e}")
-            
-            current_dt += timedelta(days=1)
+                    return date_str, None
         
-        self.logger.info(f"과거 데이터 조회 완료: {len(historical_data)}일치 데이터")
-        return historical_data
+        tasks = [asyncio.create_task(fetch_one(date_str))
+                 for date_str in self._iter_business_days(start_date, end_date)]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 소비자가 중간에 중단한 경우 남은 요청 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _rate_limited_fetch(self, news_type: Optional[str], date: Optional[str]) -> Dict[str, Any]:
+        """속도 제한기를 거친 뉴스 데이터 조회 (재시도마다 토큰 소비)"""
+        await self.rate_limiter.acquire()
+        return await self._fetch_news_data_internal(news_type, date)
     
     async def _execute_with_retry(self, operation: Callable, *args, **kwargs) -> Any:
         """
@@ -452,8 +604,11 @@ class InfomaxAPIClient:
                 'retry_delay': self.retry_delay,
                 'max_delay': self.max_delay,
                 'backoff_factor': self.backoff_factor,
-                'pool_size': self.pool_size
-            }
+                'pool_size': self.pool_size,
+                'max_concurrency': self.max_concurrency,
+                'rate_limit': self.rate_limit
+            },
+            'cache': self.cache.get_stats() if self.cache else None
         }
     
     def get_connection_info(self) -> Dict[str, Any]:
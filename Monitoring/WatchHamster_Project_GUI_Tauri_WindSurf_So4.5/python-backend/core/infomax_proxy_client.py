@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfoMax 채권/주식 API 프록시 클라이언트
+
+- 앱 수명 동안 유지되는 httpx.AsyncClient 하나를 공유 (keep-alive 연결 풀, h2 설치 시 HTTP/2)
+- 참조성 엔드포인트(stock/code)와 지난 날짜 조회(mn_hist, stock/hist)는
+  정규화된 파라미터 키로 TTL 캐시, 명시적 무효화 지원
+- 캐시 키에는 토큰 해시가 포함되어 사용자(토큰) 간 응답을 공유하지 않음
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+INFOMAX_BASE_URL = "https://infomaxy.einfomax.co.kr/api"
+REQUEST_TIMEOUT = 30.0
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# 엔드포인트별 캐시 정책: (TTL 초, 지난 날짜일 때만 캐시할 날짜 파라미터)
+CACHE_POLICIES: Dict[str, Tuple[float, Optional[str]]] = {
+    "stock/code": (6 * 3600, None),
+    "bond/market/mn_hist": (24 * 3600, "endDate"),
+    "stock/hist": (24 * 3600, "endDate"),
+}
+MAX_CACHE_ENTRIES = 512
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def normalize_params(params: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    """빈 값 제거 + 공백 정리 + 키 정렬 (캐시 키용)"""
+    normalized = []
+    for key, value in params.items():
+        value = "" if value is None else str(value).strip()
+        if value:
+            normalized.append((key, value))
+    return tuple(sorted(normalized))
+
+
+def _is_past_date(value: str) -> bool:
+    """YYYYMMDD / YYYY-MM-DD 형식의 날짜가 오늘 이전인지 (해석 불가 시 False)"""
+    digits = value.replace("-", "").strip()
+    if len(digits) != 8 or not digits.isdigit():
+        return False
+    return digits < datetime.now().strftime("%Y%m%d")
+
+
+class ProxyResponseCache:
+    """정규화된 파라미터 키 기반 TTL + LRU 응답 캐시"""
+
+    def __init__(self, max_entries: int = MAX_CACHE_ENTRIES,
+                 policies: Optional[Dict[str, Tuple[float, Optional[str]]]] = None):
+        """
+        Args:
+            max_entries: 최대 보관 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            policies: 엔드포인트별 캐시 정책 (기본: CACHE_POLICIES)
+        """
+        self.max_entries = max_entries
+        self.policies = CACHE_POLICIES if policies is None else policies
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def make_key(self, endpoint: str, params: Dict[str, Any], token: str) -> Optional[CacheKey]:
+        """캐시 대상이면 키 반환, 아니면 None"""
+        policy = self.policies.get(endpoint.strip("/"))
+        if policy is None:
+            return None
+
+        _, date_param = policy
+        if date_param is not None and not _is_past_date(str(params.get(date_param) or "")):
+            return None
+
+        token_digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+        return endpoint.strip("/"), token_digest, normalize_params(params)
+
+    def get(self, key: Optional[CacheKey]) -> Optional[Any]:
+        """유효한 캐시 데이터 (없거나 만료되면 None)"""
+        if key is None:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[1]
+
+    def store(self, key: Optional[CacheKey], data: Any):
+        """응답 저장"""
+        if key is None:
+            return
+
+        ttl, _ = self.policies[key[0]]
+        self._entries[key] = (time.monotonic() + ttl, data)
+        self._entries.move_to_end(key)
+        self.stats["stores"] += 1
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, endpoint: Optional[str] = None) -> int:
+        """
+        캐시 무효화
+
+        Args:
+            endpoint: 이 엔드포인트 항목만 제거 (None이면 전체)
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        if endpoint is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+        endpoint = endpoint.strip("/")
+        keys = [key for key in self._entries if key[0] == endpoint]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class InfoMaxProxyClient:
+    """연결 풀을 공유하는 InfoMax API 프록시 클라이언트"""
+
+    def __init__(self, base_url: str = INFOMAX_BASE_URL, timeout: float = REQUEST_TIMEOUT,
+                 max_connections: int = 20, max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 30.0, cache: Optional[ProxyResponseCache] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Args:
+            base_url: InfoMax API 기본 URL
+            timeout: 요청 제한 시간 (초)
+            max_connections: 최대 동시 연결 수
+            max_keepalive_connections: 유지할 유휴 연결 수
+            keepalive_expiry: 유휴 연결 유지 시간 (초)
+            cache: 응답 캐시 (기본: 새 ProxyResponseCache)
+            transport: httpx 전송 계층 (테스트용 주입)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.cache = cache or ProxyResponseCache()
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: set = set()  # 교체된 클라이언트 종료 태스크 (GC 방지)
+
+    async def start(self):
+        """공유 클라이언트 생성 (앱 시작 시)"""
+        self._get_client()
+        logger.info(f"InfoMax 프록시 클라이언트 시작 (HTTP/2: {HTTP2_AVAILABLE})")
+
+    async def close(self):
+        """공유 클라이언트 종료 (앱 종료 시)"""
+        client, self._client, self._loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # 연결 풀은 이벤트 루프에 묶이므로 다른 루프에서 호출되면 새로 생성
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._discard_client(self._client, self._loop)
+            self._client = httpx.AsyncClient(
+                verify=False,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=HTTP2_AVAILABLE,
+                transport=self.transport,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                    "User-Agent": "WatchHamster-InfoMax-Proxy/1.0"
+                }
+            )
+            self._loop = loop
+        return self._client
+
+    def _discard_client(self, client: Optional[httpx.AsyncClient],
+                        loop: Optional[asyncio.AbstractEventLoop]):
+        """교체되는 클라이언트 종료 (소켓 누수 방지)
+
+        이전 루프가 아직 돌고 있으면 그 루프에서, 아니면 현재 루프에서 백그라운드로 닫음
+        """
+        if client is None or client.is_closed:
+            return
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._aclose_quietly(client), loop)
+            return
+        task = asyncio.get_running_loop().create_task(self._aclose_quietly(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _aclose_quietly(client: httpx.AsyncClient):
+        try:
+            await client.aclose()
+        except Exception as e:
+            # 이전 루프가 이미 닫혀 있으면 전송 계층 정리가 실패할 수 있음
+            logger.debug(f"이전 InfoMax 클라이언트 종료 실패: {e}")
+
+    async def get(self, endpoint: str, params: Dict[str, Any], token: str) -> httpx.Response:
+        """InfoMax API GET 요청 (공유 연결 풀 사용)"""
+        return await self._get_client().get(
+            f"{self.base_url}/{endpoint.lstrip('/')}",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """클라이언트/캐시 통계"""
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "client_open": self._client is not None and not self._client.is_closed,
+            "cache_entries": len(self.cache),
+            **self.cache.stats
+        }
+
+
+# 싱글톤 인스턴스
+_infomax_proxy_client: Optional[InfoMaxProxyClient] = None
+
+
+def get_infomax_proxy_client() -> InfoMaxProxyClient:
+    """InfoMax 프록시 클라이언트 인스턴스 가져오기"""
+    global _infomax_proxy_client
+    if _infomax_proxy_client is None:
+        _infomax_proxy_client = InfoMaxProxyClient()
+    return _infomax_proxy_client
+
+
+async def close_infomax_proxy_client():
+    """InfoMax 프록시 클라이언트 종료"""
+    if _infomax_proxy_client is not None:
+        await _infomax_proxy_client.close()
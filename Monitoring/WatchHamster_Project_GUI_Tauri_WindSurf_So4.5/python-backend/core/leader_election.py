@@ -0,0 +1,111 @@
+"""
+워커 간 리더 선출
+여러 uvicorn 워커 중 하나만 폴러(실시간 상태 수집)와 웹훅 백로그 복구를 실행하도록 잠금 파일로 리더를 정함
+
+리더는 프로세스가 살아 있는 동안 잠금을 유지하고, 리더 프로세스가 죽으면 OS가 잠금을 풀어
+대기 중인 다른 워커가 다음 시도에서 리더가 됨
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+try:
+    from utils.file_lock import InterProcessLock
+except ImportError:
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from utils.file_lock import InterProcessLock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETRY_INTERVAL = 5.0  # 초
+
+# 이 프로세스 식별자 (중계 메시지의 출처 표시 등)
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaderElection:
+    """잠금 파일 기반 리더 선출"""
+
+    def __init__(self, lock_path: str, retry_interval: float = DEFAULT_RETRY_INTERVAL):
+        """
+        Args:
+            lock_path: 리더 잠금 파일 경로 (같은 경로를 쓰는 워커끼리 경쟁)
+            retry_interval: 리더가 아닐 때 재시도 간격 (초)
+        """
+        self.lock_path = lock_path
+        self.retry_interval = retry_interval
+        self._lock = InterProcessLock(lock_path)
+        self._is_leader = False
+        self.elected_at: Optional[datetime] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    def try_acquire(self) -> bool:
+        """리더 잠금 시도 (대기하지 않음)"""
+        if not self._is_leader and self._lock.acquire(blocking=False):
+            self._is_leader = True
+            self.elected_at = datetime.now()
+            self._write_owner()
+            logger.info(f"리더로 선출됨: {WORKER_ID}")
+        return self._is_leader
+
+    def _write_owner(self):
+        # 잠금 파일에 리더 정보 기록 (진단용, 잠금 자체와는 무관)
+        try:
+            with open(f"{self.lock_path}.owner", "w", encoding="utf-8") as f:
+                f.write(f"{WORKER_ID} {self.elected_at.isoformat()}\n")
+        except OSError:
+            pass
+
+    async def wait_for_leadership(self):
+        """리더가 될 때까지 retry_interval 간격으로 재시도"""
+        while not self.try_acquire():
+            await asyncio.sleep(self.retry_interval)
+
+    def release(self):
+        """리더 잠금 해제"""
+        if self._is_leader:
+            self._is_leader = False
+            self._lock.release()
+            logger.info(f"리더 잠금 해제: {WORKER_ID}")
+        self._lock.close()
+
+    def get_status(self) -> Dict[str, Any]:
+        """리더 선출 상태"""
+        return {
+            'worker_id': WORKER_ID,
+            'is_leader': self._is_leader,
+            'elected_at': self.elected_at.isoformat() if self.elected_at else None,
+            'lock_path': self.lock_path
+        }
+
+
+# 전역 리더 선출 인스턴스
+_leader_election: Optional[LeaderElection] = None
+
+
+def get_leader_election() -> LeaderElection:
+    """설정 기반 리더 선출 인스턴스 반환 (싱글톤)"""
+    global _leader_election
+    if _leader_election is None:
+        from utils.config import get_settings
+
+        settings = get_settings()
+        lock_path = settings.leader_lock_path or os.path.join(
+            tempfile.gettempdir(), f"watchhamster-{settings.api_port}.leader.lock"
+        )
+        _leader_election = LeaderElection(lock_path)
+    return _leader_election
+
+
+def is_leader_process() -> bool:
+    """이 프로세스가 리더인지 (아직 시도하지 않았으면 한 번 시도)"""
+    return get_leader_election().try_acquire()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시간 창 기반 메시지 중복 방지 저장소
+
+OrderedDict에 (메시지 해시 → 만료 시각)을 사용 순서대로 보관하고,
+만료 시각 순서는 별도의 힙으로 관리합니다.
+
+- 항목마다 만료 시각을 두어 창(window)이 지난 메시지는 다시 전송 허용
+- 창 길이가 항목마다 달라 사용 순서와 만료 순서가 다를 수 있으므로,
+  만료된 항목을 모두 정리한 뒤에만 용량 초과분을 제거
+- 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+- 적중/미적중/제거/만료 카운터 제공
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class MessageDedupCache:
+    """만료 시간과 용량 제한을 가진 LRU 중복 방지 저장소"""
+
+    def __init__(self, max_entries: int = 1000, default_window: float = 3600,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries: 최대 보관 항목 수
+            default_window: 기본 중복 판정 창 (초)
+            clock: 시간 함수 (테스트용 주입)
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries는 0보다 커야 합니다")
+
+        self.max_entries = max_entries
+        self.default_window = default_window
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, float]" = OrderedDict()
+        # (만료 시각, 순번, 키) 최소 힙 - 제거/재등록된 키의 옛 항목은 꺼낼 때 건너뜀
+        self._expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def check_and_add(self, key: Hashable, window: Optional[float] = None) -> bool:
+        """
+        중복 여부 확인 후 새 항목이면 등록
+
+        Args:
+            key: 메시지 해시
+            window: 이 항목의 중복 판정 창 (초, None이면 기본값)
+
+        Returns:
+            bool: 창 안에 같은 항목이 있으면 True (중복)
+        """
+        now = self._clock()
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is not None:
+                if expires_at > now:
+                    # 중복 적중: 최근 사용으로 갱신하되 만료 시각은 연장하지 않음
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True
+                del self._entries[key]
+                self.expirations += 1
+
+            self.misses += 1
+            expires_at = now + (self.default_window if window is None else window)
+            self._entries[key] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, next(self._sequence), key))
+            self._purge_expired(now)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._compact_heap()
+            return False
+
+    def _purge_expired(self, now: float):
+        """만료 시각이 지난 항목을 사용 순서와 관계없이 모두 제거"""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            if self._entries.get(key) == expires_at:
+                del self._entries[key]
+                self.expirations += 1
+
+    def _compact_heap(self):
+        """제거된 항목이 힙에 많이 쌓이면 현재 항목으로 다시 구성"""
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [
+                (expires_at, next(self._sequence), key)
+                for key, expires_at in self._entries.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def discard(self, key: Hashable):
+        """항목 제거 (전송 투입 실패 시 재시도 허용)"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """전체 항목 제거"""
+        with self._lock:
+            self._entries.clear()
+            self._expiry_heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """중복 방지 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시스템 메트릭 백그라운드 샘플러
+
+요청 처리 경로에서 psutil을 직접 호출하지 않도록 하나의 백그라운드 스레드가
+주기적으로 메트릭을 수집해 고정 크기 링 버퍼에 기록합니다.
+
+- 링 버퍼는 타임스탬프와 float 열을 array('d')로 보관 (항목별 dict 생성 없음)
+- 최신 스냅샷 조회는 O(1), 시간 창 조회/집계는 창 안의 샘플 수만큼만 순회
+- CPU 사용률은 interval=None(직전 샘플 대비)으로 측정하여 스레드도 대기하지 않음
+"""
+
+import logging
+import os
+import platform
+import threading
+import time
+from array import array
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL = 2.0  # 초
+DEFAULT_CAPACITY = 1800  # 2초 간격 기준 1시간
+DISK_SAMPLE_INTERVAL = 30.0  # 디스크 사용량은 자주 변하지 않으므로 별도 주기
+
+SAMPLE_COLUMNS = (
+    'cpu_percent',
+    'memory_percent',
+    'memory_used_gb',
+    'memory_available_gb',
+    'disk_percent',
+    'disk_used_gb',
+    'disk_free_gb',
+    'net_bytes_sent',
+    'net_bytes_recv',
+    'net_sent_per_sec',
+    'net_recv_per_sec',
+    'process_count',
+    'process_cpu_percent',
+    'process_memory_mb',
+)
+
+
+class MetricRingBuffer:
+    """타임스탬프 + float 열로 구성된 고정 크기 링 버퍼"""
+
+    def __init__(self, capacity: int, columns: Sequence[str]):
+        """
+        Args:
+            capacity: 최대 샘플 수 (초과 시 가장 오래된 샘플부터 덮어씀)
+            columns: 값 열 이름
+        """
+        if capacity <= 0:
+            raise ValueError("capacity는 0보다 커야 합니다")
+
+        self.capacity = capacity
+        self.columns = tuple(columns)
+        self._column_index = {name: i for i, name in enumerate(self.columns)}
+        self._timestamps = array('d', [0.0]) * capacity
+        self._values = [array('d', [0.0]) * capacity for _ in self.columns]
+        self._head = 0  # 다음에 기록할 위치
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def append(self, timestamp: float, values: Dict[str, float]):
+        """샘플 기록 (없는 열은 0.0)"""
+        with self._lock:
+            head = self._head
+            self._timestamps[head] = timestamp
+            for name, column in zip(self.columns, self._values):
+                column[head] = values.get(name, 0.0)
+            self._head = (head + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+
+    def clear(self) -> int:
+        """전체 샘플 제거, 제거된 수 반환"""
+        with self._lock:
+            cleared = self._count
+            self._head = 0
+            self._count = 0
+            return cleared
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _positions(self, limit: Optional[int] = None, since: Optional[float] = None) -> List[int]:
+        """최신 샘플부터 거꾸로 조건에 맞는 위치 수집 후 시간순으로 반환 (잠금 안에서 호출)"""
+        positions = []
+        count = self._count if limit is None else min(limit, self._count)
+        position = self._head
+        for _ in range(count):
+            position = (position - 1) % self.capacity
+            if since is not None and self._timestamps[position] < since:
+                break
+            positions.append(position)
+        positions.reverse()
+        return positions
+
+    def _row(self, position: int) -> Dict[str, float]:
+        row = {'timestamp': self._timestamps[position]}
+        for name, column in zip(self.columns, self._values):
+            row[name] = column[position]
+        return row
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """가장 최근 샘플"""
+        with self._lock:
+            if not self._count:
+                return None
+            return self._row((self._head - 1) % self.capacity)
+
+    def last(self, n: int) -> List[Dict[str, float]]:
+        """최근 n개 샘플 (시간순)"""
+        with self._lock:
+            return [self._row(position) for position in self._positions(limit=n)]
+
+    def window(self, seconds: float, now: Optional[float] = None) -> List[Dict[str, float]]:
+        """최근 seconds초 안의 샘플 (시간순)"""
+        since = (time.time() if now is None else now) - seconds
+        with self._lock:
+            return [self._row(position) for position in self._positions(since=since)]
+
+    def values(self, column: str, seconds: Optional[float] = None, limit: Optional[int] = None,
+               now: Optional[float] = None) -> List[float]:
+        """한 열의 값만 시간순으로 반환"""
+        since = None if seconds is None else (time.time() if now is None else now) - seconds
+        data = self._values[self._column_index[column]]
+        with self._lock:
+            return [data[position] for position in self._positions(limit=limit, since=since)]
+
+    def aggregate(self, column: str, seconds: float, now: Optional[float] = None) -> Dict[str, float]:
+        """시간 창 안의 한 열 집계 (count, avg, min, max, last)"""
+        values = self.values(column, seconds=seconds, now=now)
+        if not values:
+            return {'count': 0, 'avg': 0.0, 'min': 0.0, 'max': 0.0, 'last': 0.0}
+        return {
+            'count': len(values),
+            'avg': sum(values) / len(values),
+            'min': min(values),
+            'max': max(values),
+            'last': values[-1]
+        }
+
+
+class MetricsSampler:
+    """시스템 메트릭 백그라운드 샘플러"""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL, capacity: int = DEFAULT_CAPACITY,
+                 disk_interval: float = DISK_SAMPLE_INTERVAL):
+        """
+        Args:
+            interval: 샘플링 간격 (초)
+            capacity: 링 버퍼 크기 (샘플 수)
+            disk_interval: 디스크 사용량 재측정 간격 (초)
+        """
+        self.interval = interval
+        self.disk_interval = disk_interval
+        self.buffer = MetricRingBuffer(capacity, SAMPLE_COLUMNS)
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._process = psutil.Process(os.getpid())
+        self._disk: Dict[str, float] = {}
+        self._disk_sampled_at = 0.0
+        self._last_net: Optional[tuple] = None
+
+        # 거의 변하지 않는 값
+        self.memory_total_gb = psutil.virtual_memory().total / (1024**3)
+        self.disk_total_gb = 0.0
+        try:
+            self.boot_time = psutil.boot_time()
+        except Exception:
+            self.boot_time = time.time()
+
+        self.samples_taken = 0
+        self.sample_errors = 0
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+    def start(self):
+        """샘플링 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread and self._thread.is_alive():
+            return
+        # CPU 사용률 기준점 설정 후 첫 샘플을 바로 기록
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
+        self.sample_once()
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-sampler", daemon=True)
+        self._thread.start()
+        logger.info(f"메트릭 샘플러 시작 (간격 {self.interval}초, 버퍼 {self.buffer.capacity}개)")
+
+    def stop(self):
+        """샘플링 스레드 종료"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample_once()
+
+    # ------------------------------------------------------------------
+    # 수집
+    # ------------------------------------------------------------------
+    def sample_once(self):
+        """메트릭 1회 수집 후 링 버퍼에 기록"""
+        now = time.time()
+        try:
+            memory = psutil.virtual_memory()
+            values = {
+                'cpu_percent': psutil.cpu_percent(interval=None),
+                'memory_percent': memory.percent,
+                'memory_used_gb': memory.used / (1024**3),
+                'memory_available_gb': memory.available / (1024**3),
+            }
+
+            if not self._disk or now - self._disk_sampled_at >= self.disk_interval:
+                self._disk = self._collect_disk_usage()
+                self._disk_sampled_at = now
+            values.update(self._disk)
+
+            try:
+                net_io = psutil.net_io_counters()
+                values['net_bytes_sent'] = net_io.bytes_sent
+                values['net_bytes_recv'] = net_io.bytes_recv
+                if self._last_net:
+                    last_time, last_sent, last_recv = self._last_net
+                    elapsed = now - last_time
+                    if elapsed > 0:
+                        values['net_sent_per_sec'] = max(0.0, (net_io.bytes_sent - last_sent) / elapsed)
+                        values['net_recv_per_sec'] = max(0.0, (net_io.bytes_recv - last_recv) / elapsed)
+                self._last_net = (now, net_io.bytes_sent, net_io.bytes_recv)
+            except Exception:
+                pass
+
+            try:
+                values['process_count'] = len(psutil.pids())
+                values['process_cpu_percent'] = self._process.cpu_percent(interval=None)
+                values['process_memory_mb'] = self._process.memory_info().rss / (1024 * 1024)
+            except Exception:
+                pass
+
+            self.buffer.append(now, values)
+            self.samples_taken += 1
+        except Exception as e:
+            self.sample_errors += 1
+            logger.warning(f"메트릭 샘플 수집 실패: {e}")
+
+    def _collect_disk_usage(self) -> Dict[str, float]:
+        """디스크 사용량 (Mac APFS는 볼륨 합산)"""
+        try:
+            if platform.system() == 'Darwin':
+                total_used = 0
+                total_size = 0
+                for partition in psutil.disk_partitions():
+                    # APFS 볼륨들만 합산
+                    if 'disk' in partition.device and 's' in partition.device:
+                        try:
+                            usage = psutil.disk_usage(partition.mountpoint)
+                            total_used += usage.used
+                            if total_size == 0:  # 전체 크기는 한 번만
+                                total_size = usage.total
+                        except Exception:
+                            pass
+                used, total, free = total_used, total_size, total_size - total_used
+                percent = (total_used / total_size) * 100 if total_size > 0 else 0.0
+            else:
+                disk = psutil.disk_usage('/' if platform.system() != 'Windows' else 'C:\\')
+                used, total, free, percent = disk.used, disk.total, disk.free, disk.percent
+
+            self.disk_total_gb = total / (1024**3)
+            return {
+                'disk_percent': percent,
+                'disk_used_gb': used / (1024**3),
+                'disk_free_gb': free / (1024**3),
+            }
+        except Exception as e:
+            logger.warning(f"디스크 정보 수집 실패: {e}")
+            return {'disk_percent': 0.0, 'disk_used_gb': 0.0, 'disk_free_gb': 0.0}
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        """최신 샘플 (아직 없으면 빈 값) + 고정 정보"""
+        sample = self.buffer.latest() or {'timestamp': time.time(), **{name: 0.0 for name in SAMPLE_COLUMNS}}
+        sample.update({
+            'memory_total_gb': self.memory_total_gb,
+            'disk_total_gb': self.disk_total_gb,
+            'uptime': int(sample['timestamp'] - self.boot_time),
+            'network_status': "active" if sample['net_bytes_sent'] > 0 or sample['net_bytes_recv'] > 0 else "connected",
+            'sampled_at': datetime.fromtimestamp(sample['timestamp'])
+        })
+        return sample
+
+    def history(self, limit: int) -> List[Dict[str, Any]]:
+        """최근 샘플 목록 (시간순, datetime 포함)"""
+        rows = self.buffer.last(limit)
+        for row in rows:
+            row['sampled_at'] = datetime.fromtimestamp(row['timestamp'])
+        return rows
+
+    def get_status(self) -> Dict[str, Any]:
+        """샘플러 상태"""
+        return {
+            'running': self.is_running,
+            'interval': self.interval,
+            'capacity': self.buffer.capacity,
+            'samples': len(self.buffer),
+            'samples_taken': self.samples_taken,
+            'sample_errors': self.sample_errors
+        }
+
+
+# 싱글톤 인스턴스
+_metrics_sampler: Optional[MetricsSampler] = None
+_metrics_sampler_lock = threading.Lock()
+
+
+def get_metrics_sampler() -> MetricsSampler:
+    """메트릭 샘플러 인스턴스 가져오기 (최초 호출 시 시작)"""
+    global _metrics_sampler
+    with _metrics_sampler_lock:
+        if _metrics_sampler is None:
+            _metrics_sampler = MetricsSampler()
+        if not _metrics_sampler.is_running:
+            _metrics_sampler.start()
+        return _metrics_sampler
+
+
+def stop_metrics_sampler():
+    """메트릭 샘플러 종료 (애플리케이션 종료 시)"""
+    with _metrics_sampler_lock:
+        if _metrics_sampler is not None:
+            _metrics_sampler.stop()
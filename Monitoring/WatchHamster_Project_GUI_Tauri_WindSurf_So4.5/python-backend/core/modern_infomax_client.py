@@ -13,12 +13,15 @@ from pydantic import BaseModel, Field, HttpUrl
 import httpx
 import json
 
+from .news_response_cache import NewsResponseCache, get_news_response_cache
+
 # Pydantic 모델들 (현재 시스템과 호환)
 class ApiConfig(BaseModel):
     base_url: HttpUrl = "https://global-api.einfomax.co.kr/apis/posco/news"
     timeout: int = 30
     max_retries: int = 3
     retry_delay: float = 1.0
+    cache_enabled: bool = True
     headers: Dict[str, str] = Field(default_factory=lambda: {
         "Content-Type": "application/json",
         "User-Agent": "WatchHamster/3.0"
@@ -49,11 +52,12 @@ class ModernInfomaxClient:
     - FastAPI와 완벽 호환
     """
     
-    def __init__(self, config: Optional[ApiConfig] = None):
+    def __init__(self, config: Optional[ApiConfig] = None, cache: Optional[NewsResponseCache] = None):
         self.config = config or ApiConfig()
         self.logger = logging.getLogger(__name__)
         self.client: Optional[httpx.AsyncClient] = None
         self.is_connected = False
+        self.cache = (cache or get_news_response_cache()) if self.config.cache_enabled else None
         
     async def __aenter__(self):
         """Async context manager 진입"""
@@ -179,6 +183,7 @@ class ModernInfomaxClient:
                 "max_retries": self.config.max_retries,
                 "retry_delay": self.config.retry_delay
             },
+            "cache": self.cache.get_stats() if self.cache else None,
             "timestamp": datetime.now().isoformat()
         }
     
@@ -194,35 +199,45 @@ class ModernInfomaxClient:
         
         start_time = datetime.now()
         last_error = None
+        cache_date = params.get("date")
+        # 엔드포인트 URL + 파라미터로 구분 (type 파라미터 방식 클라이언트와 캐시 키가 겹치지 않도록)
+        cache_scope = NewsResponseCache.make_scope(f"{str(self.config.base_url).rstrip('/')}/{endpoint}", params)
+        
+        # 캐시가 유효하면 API 호출 없이 반환
+        if self.cache:
+            cached = self.cache.get_fresh(endpoint, cache_date, cache_scope)
+            if cached is not None:
+                return self._build_news_response(endpoint, cached, start_time, cached=True)
         
         # 재시도 로직
         for attempt in range(self.config.max_retries):
             try:
+                headers = self.cache.conditional_headers(endpoint, cache_date, cache_scope) if self.cache else {}
                 response = await self.client.get(
                     f"/{endpoint}",
                     params=params,
+                    headers=headers,
                     timeout=self.config.timeout
                 )
                 
-                response_time = (datetime.now() - start_time).total_seconds() * 1000
+                if response.status_code == 304 and self.cache:
+                    cached = self.cache.get_stale(endpoint, cache_date, cache_scope)
+                    if cached is not None:
+                        self.cache.mark_revalidated(endpoint, cache_date, cache_scope)
+                        return self._build_news_response(endpoint, cached, start_time, cached=True)
                 
                 if response.status_code == 200:
                     data = response.json()
                     
-                    # 뉴스 데이터 파싱
-                    news_items = self._parse_news_data(data, endpoint)
+                    if self.cache:
+                        self.cache.store(
+                            endpoint, cache_date, data,
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                            scope=cache_scope
+                        )
                     
-                    return ApiResponse(
-                        success=True,
-                        data={
-                            "news": news_items,
-                            "count": len(news_items),
-                            "category": endpoint,
-                            "raw_data": data
-                        },
-                        message=f"{endpoint} 뉴스 조회 성공",
-                        response_time_ms=response_time
-                    )
+                    return self._build_news_response(endpoint, data, start_time)
                 else:
                     last_error = f"HTTP {response.status_code}: {response.text}"
                     
@@ -247,6 +262,26 @@ class ModernInfomaxClient:
             response_time_ms=response_time
         )
     
+    def _build_news_response(self, endpoint: str, data: Any, start_time: datetime, cached: bool = False) -> ApiResponse:
+        """원시 응답 데이터로 ApiResponse 생성"""
+        response_time = (datetime.now() - start_time).total_seconds() * 1000
+        
+        # 뉴스 데이터 파싱
+        news_items = self._parse_news_data(data, endpoint)
+        
+        return ApiResponse(
+            success=True,
+            data={
+                "news": news_items,
+                "count": len(news_items),
+                "category": endpoint,
+                "raw_data": data,
+                "cached": cached
+            },
+            message=f"{endpoint} 뉴스 조회 성공",
+            response_time_ms=response_time
+        )
+    
     def _parse_news_data(self, raw_data: Any, category: str) -> List[NewsItem]:
         """원시 뉴스 데이터를 구조화된 NewsItem으로 파싱"""
         news_items = []
@@ -20,9 +20,11 @@ newyork_market_parser.py, kospi_close_parser.py를 통합하여
 
 import re
 import json
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, time
-from typing import Dict, Any, Optional, List, Tuple, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, List, Tuple, Union, Iterable, Mapping
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import logging
 
@@ -105,6 +107,184 @@ class TradingFlow:
     individual_net: float
 
 
+@dataclass
+class PatternHit:
+    """추출 엔진이 찾은 통화/지수 매칭 결과"""
+    field: str              # 패턴 그룹 이름 (예: 'usd_krw', 'kospi')
+    pattern_index: int      # 그룹 내 패턴 우선순위 (0이 가장 높음)
+    value: float
+    start: int              # 매칭 시작 위치
+    end: int                # 매칭 종료 위치
+
+
+@dataclass
+class InstrumentSeries:
+    """통화/지수별 컬럼형 시계열 (날짜 오름차순)"""
+    name: str
+    dates: List[str] = field(default_factory=list)
+    values: array = field(default_factory=lambda: array('d'))
+    changes: array = field(default_factory=lambda: array('d'))
+    change_percents: array = field(default_factory=lambda: array('d'))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 변환"""
+        return {
+            'name': self.name,
+            'dates': list(self.dates),
+            'values': self.values.tolist(),
+            'changes': self.changes.tolist(),
+            'change_percents': self.change_percents.tolist()
+        }
+
+
+@dataclass
+class BulkParseResult:
+    """parse_many 결과 (NewsItem 없이 바로 비교/리포트에 사용)"""
+    dates: List[str] = field(default_factory=list)
+    instruments: Dict[str, InstrumentSeries] = field(default_factory=dict)
+    market_situations: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    errors: List[Tuple[str, str, str]] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 변환"""
+        return {
+            'dates': list(self.dates),
+            'instruments': {name: series.to_dict() for name, series in self.instruments.items()},
+            'market_situations': self.market_situations,
+            'errors': [list(error) for error in self.errors]
+        }
+
+
+# 뉴스 타입별 추출 대상 (패턴 그룹 이름, 변화량 추출 방식)
+NEWS_TYPE_INSTRUMENTS = {
+    'exchange-rate': (['usd_krw', 'jpy_krw', 'eur_krw'], 'rate'),
+    'newyork-market-watch': (['dow', 'nasdaq', 'sp500'], 'index'),
+    'kospi-close': (['kospi', 'kosdaq'], 'index')
+}
+
+
+# 변화량/변화율 패턴 (모듈 로드 시 한 번만 컴파일)
+_RATE_CHANGE_PATTERNS = [
+    re.compile(r'([+-]?\s*[0-9,]+\.?[0-9]*)\s*(?:원|won)'),
+    re.compile(r'전일\s*대비\s*([+-]?\s*[0-9,]+\.?[0-9]*)'),
+    re.compile(r'([+-]\s*[0-9,]+\.?[0-9]*)')
+]
+_INDEX_CHANGE_PATTERNS = [
+    re.compile(r'([+-]?\s*[0-9,]+\.?[0-9]*)\s*(?:포인트|pt|점)'),
+    re.compile(r'전일\s*대비\s*([+-]?\s*[0-9,]+\.?[0-9]*)'),
+    re.compile(r'([+-]\s*[0-9,]+\.?[0-9]*)')
+]
+_PERCENT_PATTERNS = [
+    re.compile(r'([+-]?\s*[0-9]+\.?[0-9]*)\s*%'),
+    re.compile(r'([+-]?\s*[0-9]+\.?[0-9]*)\s*퍼센트')
+]
+_FACTOR_PATTERNS = [
+    re.compile(r'(연준|Fed|금리|인플레이션).*?(?:[.。]|$)', re.IGNORECASE),
+    re.compile(r'(실적|어닝|earnings).*?(?:[.。]|$)', re.IGNORECASE),
+    re.compile(r'(중국|무역|관세).*?(?:[.。]|$)', re.IGNORECASE),
+    re.compile(r'(유가|원유|oil).*?(?:[.。]|$)', re.IGNORECASE)
+]
+_FOREIGN_FLOW_PATTERN = re.compile(r'외국인.*?([+-]?\s*[0-9,]+(?:\.[0-9]+)?)\s*억')
+_INSTITUTION_FLOW_PATTERN = re.compile(r'기관.*?([+-]?\s*[0-9,]+(?:\.[0-9]+)?)\s*억')
+
+
+class PatternExtractionEngine:
+    """
+    통화/지수 패턴 단일 패스 추출 엔진
+    
+    그룹별 패턴 목록을 하나의 정규식 alternation으로 컴파일하고
+    (각 패턴은 `<그룹>__<순번>` 이름의 named group), 본문을 한 번만 스캔하여
+    모든 매칭 결과를 위치와 함께 반환합니다.
+    
+    모든 패턴이 리터럴 문자로 시작하면 첫 글자 집합을 lookahead로 앞에 붙여
+    후보가 아닌 위치에서는 alternation 전체를 시도하지 않도록 합니다.
+    
+    각 패턴은 값에 해당하는 캡처 그룹을 정확히 하나 가져야 합니다.
+    """
+    
+    def __init__(self, pattern_groups: Dict[str, List[str]], flags: int = re.IGNORECASE):
+        """
+        Args:
+            pattern_groups: {그룹 이름: [우선순위 순 패턴 문자열]}
+            flags: 정규식 플래그
+        """
+        self.pattern_groups = {name: list(patterns) for name, patterns in pattern_groups.items()}
+        self._group_info: Dict[str, Tuple[str, int, str]] = {}
+        
+        alternatives = []
+        first_chars = set()
+        for field_name, patterns in self.pattern_groups.items():
+            for index, pattern in enumerate(patterns):
+                match_group = f"{field_name}__{index}"
+                value_group = f"{match_group}__v"
+                self._group_info[match_group] = (field_name, index, value_group)
+                alternatives.append(
+                    f"(?P<{match_group}>{self._name_value_group(pattern, value_group)})"
+                )
+                if first_chars is not None and self._starts_with_literal(pattern):
+                    first_chars.add(pattern[0])
+                else:
+                    first_chars = None
+        
+        combined = '|'.join(alternatives)
+        if first_chars:
+            guard = ''.join(re.escape(char) for char in sorted(first_chars))
+            combined = f"(?=[{guard}])(?:{combined})"
+        self.regex = re.compile(combined, flags)
+    
+    @staticmethod
+    def _starts_with_literal(pattern: str) -> bool:
+        """패턴이 수량자 없는 리터럴 문자로 시작하는지 확인"""
+        if not pattern or pattern[0] in '\\.^$*+?{}[]|()':
+            return False
+        return len(pattern) == 1 or pattern[1] not in '*?{'
+    
+    @staticmethod
+    def _name_value_group(pattern: str, group_name: str) -> str:
+        """패턴의 첫 번째 캡처 그룹을 named group으로 변환"""
+        i = 0
+        in_class = False
+        while i < len(pattern):
+            char = pattern[i]
+            if char == '\\':
+                i += 2
+                continue
+            if in_class:
+                in_class = char != ']'
+            elif char == '[':
+                in_class = True
+            elif char == '(' and not pattern.startswith('(?', i):
+                return f"{pattern[:i]}(?P<{group_name}>{pattern[i + 1:]}"
+            i += 1
+        raise ValueError(f"값 캡처 그룹이 없는 패턴: {pattern}")
+    
+    def scan(self, text: str) -> List[PatternHit]:
+        """본문을 한 번 스캔하여 숫자로 변환 가능한 모든 매칭 결과 반환 (위치 순)"""
+        hits = []
+        for match in self.regex.finditer(text):
+            field_name, index, value_group = self._group_info[match.lastgroup]
+            try:
+                value = float(match.group(value_group).replace(',', ''))
+            except (ValueError, AttributeError):
+                continue
+            hits.append(PatternHit(field_name, index, value, match.start(), match.end()))
+        return hits
+    
+    def best_hits(self, text: str) -> Dict[str, PatternHit]:
+        """
+        그룹별 대표 매칭 결과 반환
+        
+        패턴 우선순위가 높은 것을 먼저, 같은 패턴이면 앞쪽 위치를 선택합니다.
+        (패턴을 순서대로 re.search 하던 기존 동작과 동일한 선택 규칙)
+        """
+        best: Dict[str, PatternHit] = {}
+        for hit in self.scan(text):
+            current = best.get(hit.field)
+            if current is None or hit.pattern_index < current.pattern_index:
+                best[hit.field] = hit
+        return best
+
+
 class NewsDataParser:
     """
     통합 뉴스 데이터 파싱 및 상태 판단 클래스
@@ -206,6 +386,9 @@ class NewsDataParser:
             ]
         }
         
+        # 통화/지수 패턴 단일 패스 추출 엔진
+        self.extraction_engine = PatternExtractionEngine({**self.currency_patterns, **self.index_patterns})
+        
         # 시장 상황 키워드
         self.market_keywords = {
             'positive': ['상승', '오름', '급등', '강세', '반등', '회복', '증가', '플러스'],
@@ -240,6 +423,114 @@ class NewsDataParser:
         self.logger.info(f"뉴스 데이터 파싱 완료: {len(parsed_items)}개 타입")
         return parsed_items
     
+    def parse_many(self, raw_days: Union[Mapping[str, Dict[str, Any]], Iterable[Dict[str, Any]]],
+                   max_workers: int = 0, chunk_size: int = 64) -> BulkParseResult:
+        """
+        기간 단위 일괄 파싱 (동기)
+        
+        과거 데이터처럼 여러 날짜의 원시 응답을 한 번에 파싱하여 통화/지수별
+        컬럼형 결과를 반환합니다. 상태 판단이나 NewsItem 생성은 하지 않습니다.
+        
+        Args:
+            raw_days: {날짜: 원시 API 응답} (get_historical_data 결과) 또는
+                      뉴스별 'date' 필드를 가진 원시 응답 목록
+            max_workers: 2 이상이면 chunk_size보다 많은 기사를 ProcessPoolExecutor로 분산
+                         (작업자는 이 파서의 추출 패턴/시장 키워드로 초기화됨)
+            chunk_size: 프로세스 작업 단위 (기사 수)
+        
+        Returns:
+            BulkParseResult: 날짜/값/변화량 배열
+        """
+        articles = list(self._iter_articles(raw_days))
+        
+        if max_workers > 1 and len(articles) > chunk_size:
+            chunks = [articles[i:i + chunk_size] for i in range(0, len(articles), chunk_size)]
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker_parser,
+                                     initargs=(type(self), self._worker_config())) as executor:
+                rows = [row for chunk_rows in executor.map(_parse_article_chunk, chunks) for row in chunk_rows]
+        else:
+            rows = self._extract_article_rows(articles)
+        
+        result = self._build_bulk_result(rows)
+        self.logger.info(f"일괄 파싱 완료: {len(articles)}개 기사, {len(result.dates)}일")
+        return result
+    
+    def _worker_config(self) -> Dict[str, Any]:
+        """프로세스 풀 작업자에 전달할 추출 설정 (사용자 지정 패턴/키워드 반영)"""
+        return {
+            'pattern_groups': self.extraction_engine.pattern_groups,
+            'flags': self.extraction_engine.regex.flags,
+            'market_keywords': self.market_keywords,
+        }
+    
+    @staticmethod
+    def _iter_articles(raw_days) -> Iterable[Tuple[str, str, Dict[str, Any]]]:
+        """원시 응답에서 (날짜, 뉴스 타입, 뉴스 데이터) 추출"""
+        if isinstance(raw_days, Mapping):
+            day_items = ((date_key, day_data) for date_key, day_data in raw_days.items())
+        else:
+            day_items = ((None, day_data) for day_data in raw_days)
+        
+        for date_key, day_data in day_items:
+            if not isinstance(day_data, dict):
+                continue
+            for news_type, news_data in day_data.items():
+                if news_type in NEWS_TYPE_INSTRUMENTS and isinstance(news_data, dict) and news_data.get('title'):
+                    yield date_key or news_data.get('date', ''), news_type, news_data
+    
+    def _extract_article_rows(self, articles: List[Tuple[str, str, Dict[str, Any]]]) -> List[Tuple]:
+        """
+        기사별 추출 결과를 행 목록으로 변환
+        
+        Returns:
+            list: ('row', 날짜, 타입, 계기, 값, 변화량, 변화율) / ('situation', 날짜, 타입, 상황)
+                  / ('error', 날짜, 타입, 메시지)
+        """
+        rows = []
+        for date, news_type, news_data in articles:
+            try:
+                text = f"{news_data.get('title', '')} {news_data.get('content', '')}"
+                hits = self.extraction_engine.best_hits(text)
+                fields, change_kind = NEWS_TYPE_INSTRUMENTS[news_type]
+                extract_change = self._extract_rate_change if change_kind == 'rate' else self._extract_change_info
+                
+                for field_name in fields:
+                    hit = hits.get(field_name)
+                    if hit:
+                        change, change_percent = extract_change(text, hit.start)
+                        rows.append(('row', date, news_type, field_name, hit.value, change, change_percent))
+                
+                rows.append(('situation', date, news_type, self._determine_market_situation_from_text(text)))
+            except Exception as e:
+                rows.append(('error', date, news_type, str(e)))
+        return rows
+    
+    @staticmethod
+    def _build_bulk_result(rows: List[Tuple]) -> BulkParseResult:
+        """행 목록을 날짜순 컬럼형 결과로 변환"""
+        result = BulkParseResult()
+        dates = set()
+        
+        for row in sorted(rows, key=lambda r: r[1]):
+            kind, date, news_type = row[0], row[1], row[2]
+            dates.add(date)
+            if kind == 'row':
+                _, _, _, field_name, value, change, change_percent = row
+                series = result.instruments.get(field_name)
+                if series is None:
+                    series = result.instruments[field_name] = InstrumentSeries(field_name)
+                series.dates.append(date)
+                series.values.append(value)
+                series.changes.append(change)
+                series.change_percents.append(change_percent)
+            elif kind == 'situation':
+                result.market_situations.setdefault(news_type, {})[date] = row[3]
+            else:
+                result.errors.append((date, news_type, row[3]))
+        
+        result.dates = sorted(dates)
+        return result
+    
     async def _parse_single_news_item(self, news_type: str, news_data: Dict[str, Any]) -> Optional[NewsItem]:
         """개별 뉴스 아이템 파싱"""
         config = self.news_configs[news_type]
@@ -303,18 +594,20 @@ class NewsDataParser:
         text = f"{title} {content}"
         
         try:
+            hits = self.extraction_engine.best_hits(text)
             if news_type == 'exchange-rate':
-                return await self._parse_exchange_rate_data(text)
+                return await self._parse_exchange_rate_data(text, hits)
             elif news_type == 'newyork-market-watch':
-                return await self._parse_newyork_market_data(text)
+                return await self._parse_newyork_market_data(text, hits)
             elif news_type == 'kospi-close':
-                return await self._parse_kospi_close_data(text)
+                return await self._parse_kospi_close_data(text, hits)
         except Exception as e:
             self.logger.error(f"{news_type} 전문 데이터 파싱 오류: {e}")
         
         return None
     
-    async def _parse_exchange_rate_data(self, text: str) -> Dict[str, Any]:
+    async def _parse_exchange_rate_data(self, text: str,
+                                        hits: Optional[Dict[str, PatternHit]] = None) -> Dict[str, Any]:
         """서환마감 전문 데이터 파싱"""
         exchange_data = {
             'market_situation': '보합',
@@ -323,53 +616,38 @@ class NewsDataParser:
             'volatility_level': 'medium'
         }
         
+        if hits is None:
+            hits = self.extraction_engine.best_hits(text)
+        
         # 원달러 환율 추출
-        for pattern in self.currency_patterns['usd_krw']:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    rate_str = match.group(1).replace(',', '')
-                    rate = float(rate_str)
-                    
-                    # 변화량과 변화율 추출
-                    change, change_percent = self._extract_rate_change(text, match.start())
-                    
-                    exchange_data['usd_krw_rate'] = {
-                        'currency_pair': 'USD/KRW',
-                        'rate': rate,
-                        'change': change,
-                        'change_percent': change_percent,
-                        'direction': 'up' if change > 0 else 'down' if change < 0 else 'flat'
-                    }
-                    break
-                except (ValueError, IndexError):
-                    continue
+        usd_hit = hits.get('usd_krw')
+        if usd_hit:
+            change, change_percent = self._extract_rate_change(text, usd_hit.start)
+            
+            exchange_data['usd_krw_rate'] = {
+                'currency_pair': 'USD/KRW',
+                'rate': usd_hit.value,
+                'change': change,
+                'change_percent': change_percent,
+                'direction': 'up' if change > 0 else 'down' if change < 0 else 'flat'
+            }
         
         # 주요 통화 환율 추출
         major_currencies = []
-        for currency_name, patterns in self.currency_patterns.items():
-            if currency_name == 'usd_krw':
+        for currency_name in self.currency_patterns:
+            if currency_name == 'usd_krw' or currency_name not in hits:
                 continue
-                
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    try:
-                        rate_str = match.group(1).replace(',', '')
-                        rate = float(rate_str)
-                        
-                        change, change_percent = self._extract_rate_change(text, match.start())
-                        
-                        major_currencies.append({
-                            'currency_pair': currency_name.upper().replace('_', '/'),
-                            'rate': rate,
-                            'change': change,
-                            'change_percent': change_percent,
-                            'direction': 'up' if change > 0 else 'down' if change < 0 else 'flat'
-                        })
-                        break
-                    except (ValueError, IndexError):
-                        continue
+            
+            hit = hits[currency_name]
+            change, change_percent = self._extract_rate_change(text, hit.start)
+            
+            major_currencies.append({
+                'currency_pair': currency_name.upper().replace('_', '/'),
+                'rate': hit.value,
+                'change': change,
+                'change_percent': change_percent,
+                'direction': 'up' if change > 0 else 'down' if change < 0 else 'flat'
+            })
         
         exchange_data['major_currencies'] = major_currencies
         
@@ -378,7 +656,8 @@ class NewsDataParser:
         
         return exchange_data
     
-    async def _parse_newyork_market_data(self, text: str) -> Dict[str, Any]:
+    async def _parse_newyork_market_data(self, text: str,
+                                         hits: Optional[Dict[str, PatternHit]] = None) -> Dict[str, Any]:
         """뉴욕마켓워치 전문 데이터 파싱"""
         market_data = {
             'market_situation': '혼조',
@@ -386,43 +665,18 @@ class NewsDataParser:
             'key_factors': []
         }
         
+        if hits is None:
+            hits = self.extraction_engine.best_hits(text)
+        
         # 주요 지수 추출
-        major_indices = []
-        for index_name in ['dow', 'nasdaq', 'sp500']:
-            if index_name in self.index_patterns:
-                for pattern in self.index_patterns[index_name]:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        try:
-                            value_str = match.group(1).replace(',', '')
-                            value = float(value_str)
-                            
-                            change, change_percent = self._extract_change_info(text, match.start())
-                            
-                            major_indices.append({
-                                'name': self._get_index_display_name(index_name),
-                                'value': value,
-                                'change': change,
-                                'change_percent': change_percent,
-                                'direction': 'up' if change > 0 else 'down' if change < 0 else 'flat'
-                            })
-                            break
-                        except (ValueError, IndexError):
-                            continue
+        major_indices = self._build_index_entries(text, hits, ['dow', 'nasdaq', 'sp500'])
         
         market_data['major_indices'] = major_indices
         
         # 주요 요인 추출
-        factor_patterns = [
-            r'(연준|Fed|금리|인플레이션).*?(?:[.。]|$)',
-            r'(실적|어닝|earnings).*?(?:[.。]|$)',
-            r'(중국|무역|관세).*?(?:[.。]|$)',
-            r'(유가|원유|oil).*?(?:[.。]|$)'
-        ]
-        
         key_factors = []
-        for pattern in factor_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _FACTOR_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if len(match) > 10 and len(match) < 100:
                     key_factors.append(match.strip())
@@ -434,7 +688,8 @@ class NewsDataParser:
         
         return market_data
     
-    async def _parse_kospi_close_data(self, text: str) -> Dict[str, Any]:
+    async def _parse_kospi_close_data(self, text: str,
+                                      hits: Optional[Dict[str, PatternHit]] = None) -> Dict[str, Any]:
         """증시마감 전문 데이터 파싱"""
         kospi_data = {
             'market_situation': '혼조',
@@ -443,29 +698,11 @@ class NewsDataParser:
             'sector_analysis': {}
         }
         
+        if hits is None:
+            hits = self.extraction_engine.best_hits(text)
+        
         # 주요 지수 추출
-        main_indices = []
-        for index_name in ['kospi', 'kosdaq']:
-            if index_name in self.index_patterns:
-                for pattern in self.index_patterns[index_name]:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        try:
-                            value_str = match.group(1).replace(',', '')
-                            value = float(value_str)
-                            
-                            change, change_percent = self._extract_change_info(text, match.start())
-                            
-                            main_indices.append({
-                                'name': self._get_index_display_name(index_name),
-                                'value': value,
-                                'change': change,
-                                'change_percent': change_percent,
-                                'direction': 'up' if change > 0 else 'down' if change < 0 else 'flat'
-                            })
-                            break
-                        except (ValueError, IndexError):
-                            continue
+        main_indices = self._build_index_entries(text, hits, ['kospi', 'kosdaq'])
         
         kospi_data['main_indices'] = main_indices
         
@@ -473,8 +710,7 @@ class NewsDataParser:
         trading_flow = {}
         
         # 외국인 매매
-        foreign_pattern = r'외국인.*?([+-]?\s*[0-9,]+(?:\.[0-9]+)?)\s*억'
-        foreign_match = re.search(foreign_pattern, text)
+        foreign_match = _FOREIGN_FLOW_PATTERN.search(text)
         if foreign_match:
             try:
                 trading_flow['foreign_net'] = float(foreign_match.group(1).replace(' ', '').replace(',', ''))
@@ -482,8 +718,7 @@ class NewsDataParser:
                 pass
         
         # 기관 매매
-        institution_pattern = r'기관.*?([+-]?\s*[0-9,]+(?:\.[0-9]+)?)\s*억'
-        institution_match = re.search(institution_pattern, text)
+        institution_match = _INSTITUTION_FLOW_PATTERN.search(text)
         if institution_match:
             try:
                 trading_flow['institution_net'] = float(institution_match.group(1).replace(' ', '').replace(',', ''))
@@ -508,14 +743,8 @@ class NewsDataParser:
         change_percent = 0.0
         
         # 변화량 패턴
-        change_patterns = [
-            r'([+-]?\s*[0-9,]+\.?[0-9]*)\s*(?:원|won)',
-            r'전일\s*대비\s*([+-]?\s*[0-9,]+\.?[0-9]*)',
-            r'([+-]\s*[0-9,]+\.?[0-9]*)'
-        ]
-        
-        for pattern in change_patterns:
-            matches = re.findall(pattern, context)
+        for pattern in _RATE_CHANGE_PATTERNS:
+            matches = pattern.findall(context)
             if matches:
                 try:
                     change_str = matches[0].replace(' ', '').replace(',', '')
@@ -525,13 +754,8 @@ class NewsDataParser:
                     continue
         
         # 변화율 패턴
-        percent_patterns = [
-            r'([+-]?\s*[0-9]+\.?[0-9]*)\s*%',
-            r'([+-]?\s*[0-9]+\.?[0-9]*)\s*퍼센트'
-        ]
-        
-        for pattern in percent_patterns:
-            matches = re.findall(pattern, context)
+        for pattern in _PERCENT_PATTERNS:
+            matches = pattern.findall(context)
             if matches:
                 try:
                     percent_str = matches[0].replace(' ', '')
@@ -552,14 +776,8 @@ class NewsDataParser:
         change_percent = 0.0
         
         # 변화량 패턴
-        change_patterns = [
-            r'([+-]?\s*[0-9,]+\.?[0-9]*)\s*(?:포인트|pt|점)',
-            r'전일\s*대비\s*([+-]?\s*[0-9,]+\.?[0-9]*)',
-            r'([+-]\s*[0-9,]+\.?[0-9]*)'
-        ]
-        
-        for pattern in change_patterns:
-            matches = re.findall(pattern, context)
+        for pattern in _INDEX_CHANGE_PATTERNS:
+            matches = pattern.findall(context)
             if matches:
                 try:
                     change_str = matches[0].replace(' ', '').replace(',', '')
@@ -569,13 +787,8 @@ class NewsDataParser:
                     continue
         
         # 변화율 패턴
-        percent_patterns = [
-            r'([+-]?\s*[0-9]+\.?[0-9]*)\s*%',
-            r'([+-]?\s*[0-9]+\.?[0-9]*)\s*퍼센트'
-        ]
-        
-        for pattern in percent_patterns:
-            matches = re.findall(pattern, context)
+        for pattern in _PERCENT_PATTERNS:
+            matches = pattern.findall(context)
             if matches:
                 try:
                     percent_str = matches[0].replace(' ', '')
@@ -586,6 +799,26 @@ class NewsDataParser:
         
         return change, change_percent
     
+    def _build_index_entries(self, text: str, hits: Dict[str, PatternHit],
+                             index_names: List[str]) -> List[Dict[str, Any]]:
+        """추출 엔진 결과로 지수 데이터 목록 생성"""
+        entries = []
+        for index_name in index_names:
+            hit = hits.get(index_name)
+            if not hit:
+                continue
+            
+            change, change_percent = self._extract_change_info(text, hit.start)
+            
+            entries.append({
+                'name': self._get_index_display_name(index_name),
+                'value': hit.value,
+                'change': change,
+                'change_percent': change_percent,
+                'direction': 'up' if change > 0 else 'down' if change < 0 else 'flat'
+            })
+        return entries
+    
     def _get_index_display_name(self, index_name: str) -> str:
         """지수 표시명 반환"""
         display_names = {
@@ -940,6 +1173,24 @@ class NewsDataParser:
         return is_valid, errors
 
 
+# 프로세스 풀 작업자별 파서 (프로세스당 한 번만 생성)
+_worker_parser: Optional[NewsDataParser] = None
+
+
+def _init_worker_parser(parser_class: type, config: Dict[str, Any]):
+    """ProcessPoolExecutor 작업자 초기화 (호출한 파서와 같은 클래스/추출 설정 사용)"""
+    global _worker_parser
+    parser = parser_class()
+    parser.extraction_engine = PatternExtractionEngine(config['pattern_groups'], config['flags'])
+    parser.market_keywords = config['market_keywords']
+    _worker_parser = parser
+
+
+def _parse_article_chunk(articles: List[Tuple[str, str, Dict[str, Any]]]) -> List[Tuple]:
+    """ProcessPoolExecutor 작업 함수"""
+    return _worker_parser._extract_article_rows(articles)
+
+
 # 팩토리 함수
 def create_news_parser() -> NewsDataParser:
     """뉴스 파서 팩토리 함수"""
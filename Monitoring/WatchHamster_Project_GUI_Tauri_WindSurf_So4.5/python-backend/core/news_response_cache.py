@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""INFOMAX 뉴스 응답 디스크 캐시
+
+(news_type, date, scope) 키로 API 응답을 저장하는 영구 캐시입니다.
+
+- scope는 요청 URL + 정규화한 쿼리 파라미터로, 같은 캐시를 쓰는 클라이언트끼리
+  (type 파라미터 방식 / 엔드포인트 방식 등) 응답이 섞이지 않도록 구분합니다.
+
+- 응답 본문은 SHA-256 해시 이름의 파일로 저장되어 동일 본문은 한 번만 기록됩니다.
+- 지난 날짜의 응답 중 검증을 통과한 것(비어 있지 않고 뉴스 필드가 있는 본문)만
+  확정 데이터로 보고 만료 없이 보관합니다. 빈 응답이나 오류 본문은 일반 TTL을 따릅니다.
+- 오늘 날짜의 응답은 짧은 TTL 동안만 유효하며, 만료 후에는 ETag/Last-Modified로
+  조건부 재검증할 수 있도록 헤더를 함께 보관합니다.
+- 인덱스는 파일로 저장되므로 재시작 후에도 유지됩니다. 변경이 몰려도 한 번만 쓰도록
+  잠시 모았다가 백그라운드 타이머에서 기록합니다 (종료 시 flush()로 즉시 기록).
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+
+class NewsResponseCache:
+    """뉴스 API 응답 영구 캐시"""
+
+    INDEX_FILENAME = "index.json"
+    OBJECTS_DIRNAME = "objects"
+    ALL_TYPES_KEY = "all"
+    NEWS_TYPE_KEYS = ("newyork-market-watch", "kospi-close", "exchange-rate")
+
+    def __init__(self, cache_dir: Optional[Path | str] = None, today_ttl: float = 300.0,
+                 index_save_delay: float = 1.0) -> None:
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (기본: data/news_cache)
+            today_ttl: 오늘 날짜 응답 (및 검증을 통과하지 못한 응답)의 유효 시간 (초)
+            index_save_delay: 인덱스 변경을 모아서 기록할 때까지의 대기 시간 (초)
+        """
+        base_path = Path(cache_dir) if cache_dir else Path(__file__).resolve().parents[1] / "data" / "news_cache"
+        self.cache_dir = base_path
+        self.objects_dir = base_path / self.OBJECTS_DIRNAME
+        self.index_file = base_path / self.INDEX_FILENAME
+        self.today_ttl = today_ttl
+        self.index_save_delay = index_save_delay
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stores": 0}
+        self.logger = logger.getChild(self.__class__.__name__)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_fresh(self, news_type: Optional[str], date: Optional[str],
+                  scope: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """재검증 없이 바로 사용할 수 있는 캐시 데이터 반환 (없으면 None)"""
+        key = self._make_key(news_type, date, scope)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry and self._is_fresh(entry):
+                data = self._read_object(entry["hash"])
+                if data is not None:
+                    self.stats["hits"] += 1
+                    return data
+            self.stats["misses"] += 1
+            return None
+
+    def get_stale(self, news_type: Optional[str], date: Optional[str],
+                  scope: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """만료 여부와 관계없이 저장된 데이터 반환 (304 응답 처리용)"""
+        key = self._make_key(news_type, date, scope)
+        with self._lock:
+            entry = self._index.get(key)
+            return self._read_object(entry["hash"]) if entry else None
+
+    def conditional_headers(self, news_type: Optional[str], date: Optional[str],
+                            scope: Optional[str] = None) -> Dict[str, str]:
+        """조건부 요청에 사용할 If-None-Match / If-Modified-Since 헤더"""
+        key = self._make_key(news_type, date, scope)
+        with self._lock:
+            entry = self._index.get(key)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def store(self, news_type: Optional[str], date: Optional[str], data: Dict[str, Any],
+              etag: Optional[str] = None, last_modified: Optional[str] = None,
+              scope: Optional[str] = None) -> None:
+        """응답 저장 (교체된 본문 파일은 다른 키가 참조하지 않으면 삭제)"""
+        key = self._make_key(news_type, date, scope)
+        body = json.dumps(data, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+        content_hash = hashlib.sha256(body).hexdigest()
+
+        with self._lock:
+            object_path = self.objects_dir / f"{content_hash}.json"
+            if not object_path.exists():
+                self._atomic_write(object_path, body)
+
+            complete = self.is_complete_payload(data)
+            previous = self._index.get(key)
+            self._index[key] = {
+                "hash": content_hash,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time(),
+                "complete": complete,
+                "final": complete and self._is_past_date(self._key_date(key)),
+            }
+            if previous and previous["hash"] != content_hash:
+                self._remove_unreferenced({previous["hash"]})
+            self._schedule_index_save()
+            self.stats["stores"] += 1
+
+    def mark_revalidated(self, news_type: Optional[str], date: Optional[str],
+                         scope: Optional[str] = None) -> None:
+        """304 응답을 받은 항목의 TTL 갱신"""
+        key = self._make_key(news_type, date, scope)
+        with self._lock:
+            entry = self._index.get(key)
+            if not entry:
+                return
+            entry["fetched_at"] = time.time()
+            entry["final"] = entry.get("complete", False) and self._is_past_date(self._key_date(key))
+            self._schedule_index_save()
+            self.stats["revalidated"] += 1
+
+    def invalidate(self, news_type: Optional[str] = None, date: Optional[str] = None) -> int:
+        """
+        캐시 항목 무효화
+
+        news_type/date 중 지정한 조건에 맞는 항목만 (모든 scope에서) 제거하며,
+        둘 다 생략하면 전체를 제거합니다. 본문 파일은 다른 키가 참조할 수 있으므로
+        참조가 없어진 경우에만 삭제합니다.
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        with self._lock:
+            removed = [
+                key for key in self._index
+                if (news_type is None or key.split("|", 2)[0] == news_type)
+                and (date is None or self._key_date(key) == date)
+            ]
+            for key in removed:
+                del self._index[key]
+
+            referenced = {entry["hash"] for entry in self._index.values()}
+            for object_path in self.objects_dir.glob("*.json"):
+                if object_path.stem not in referenced:
+                    object_path.unlink(missing_ok=True)
+
+            self._schedule_index_save()
+            return len(removed)
+
+    def flush(self) -> None:
+        """대기 중인 인덱스 변경을 즉시 파일에 기록"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self._save_index()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            final_entries = sum(1 for entry in self._index.values() if entry.get("final"))
+            return {
+                **self.stats,
+                "entries": len(self._index),
+                "final_entries": final_entries,
+                "today_ttl": self.today_ttl,
+                "cache_dir": str(self.cache_dir),
+            }
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+    @staticmethod
+    def make_scope(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """요청 URL + 정규화한 쿼리 파라미터 (date는 키에 따로 들어가므로 제외)"""
+        items = sorted(
+            (str(name), str(value)) for name, value in (params or {}).items()
+            if value is not None and name != "date"
+        )
+        query = urlencode(items)
+        return f"{url.rstrip('/')}?{query}" if query else url.rstrip('/')
+
+    def _make_key(self, news_type: Optional[str], date: Optional[str], scope: Optional[str] = None) -> str:
+        key = f"{news_type or self.ALL_TYPES_KEY}|{date or datetime.now().strftime('%Y%m%d')}"
+        # urlencode가 '|'를 이스케이프하므로 scope에는 구분자가 나오지 않음
+        return f"{key}|{scope}" if scope else key
+
+    @classmethod
+    def is_complete_payload(cls, data: Any) -> bool:
+        """
+        확정 캐시로 보관해도 되는 응답인지 검증
+
+        비어 있지 않고 제목이 있는 뉴스 항목을 하나 이상 포함해야 합니다.
+        뉴스 타입별 응답({type: {...}})과 목록 응답({"items": [...]}, {"news": [...]}, [...])을
+        모두 지원합니다.
+        """
+        if isinstance(data, list):
+            return any(isinstance(item, dict) and item.get("title") for item in data)
+        if not isinstance(data, dict) or not data:
+            return False
+        for list_key in ("items", "news"):
+            if list_key in data:
+                return cls.is_complete_payload(data[list_key])
+        if data.get("title"):
+            return True
+        return any(
+            isinstance(data.get(news_type), dict) and data[news_type].get("title")
+            for news_type in cls.NEWS_TYPE_KEYS
+        )
+
+    @staticmethod
+    def _key_date(key: str) -> str:
+        return key.split("|", 2)[1]
+
+    def _remove_unreferenced(self, hashes) -> None:
+        """주어진 본문 중 어떤 키도 참조하지 않는 파일 삭제 (잠금 안에서 호출)"""
+        referenced = {entry["hash"] for entry in self._index.values()}
+        for content_hash in set(hashes) - referenced:
+            (self.objects_dir / f"{content_hash}.json").unlink(missing_ok=True)
+
+    @staticmethod
+    def _is_past_date(date: str) -> bool:
+        return date < datetime.now().strftime("%Y%m%d")
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        if entry.get("final"):
+            return True
+        return time.time() - entry.get("fetched_at", 0) < self.today_ttl
+
+    def _read_object(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        try:
+            with (self.objects_dir / f"{content_hash}.json").open("r", encoding="utf-8") as fp:
+                return json.load(fp)
+        except (OSError, ValueError) as exc:
+            self.logger.warning("캐시 본문 읽기 실패 (%s): %s", content_hash, exc)
+            return None
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self.index_file.exists():
+            return {}
+        try:
+            with self.index_file.open("r", encoding="utf-8") as fp:
+                index = json.load(fp)
+        except (OSError, ValueError) as exc:
+            logger.warning("캐시 인덱스 로드 실패, 새로 시작합니다: %s", exc)
+            return {}
+        if not isinstance(index, dict):
+            return {}
+        # 검증 여부가 기록되지 않은 예전 항목은 확정으로 보지 않음 (TTL 후 재검증)
+        for entry in index.values():
+            if "complete" not in entry:
+                entry["complete"] = False
+                entry["final"] = False
+        return index
+
+    def _schedule_index_save(self) -> None:
+        """인덱스 기록 예약 (잠금 안에서 호출, 이미 예약돼 있으면 함께 기록됨)"""
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.index_save_delay, self._flush_scheduled)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush_scheduled(self) -> None:
+        with self._lock:
+            self._save_timer = None
+        self._save_index()
+
+    def _save_index(self) -> None:
+        """인덱스 스냅샷을 잠금 밖에서 직렬화해 기록 (기록끼리는 _save_lock으로 순서 보장)"""
+        with self._save_lock:
+            with self._lock:
+                snapshot = {key: dict(entry) for key, entry in self._index.items()}
+            body = json.dumps(snapshot, ensure_ascii=False).encode("utf-8")
+            self._atomic_write(self.index_file, body)
+
+    @staticmethod
+    def _atomic_write(path: Path, body: bytes) -> None:
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("wb") as fp:
+            fp.write(body)
+        os.replace(tmp_path, path)
+
+
+# 싱글톤 인스턴스
+_news_response_cache_instance = None
+
+
+def get_news_response_cache(cache_dir: Optional[str] = None) -> NewsResponseCache:
+    """뉴스 응답 캐시 싱글톤 인스턴스 반환"""
+    global _news_response_cache_instance
+    if _news_response_cache_instance is None:
+        _news_response_cache_instance = NewsResponseCache(cache_dir)
+        atexit.register(_news_response_cache_instance.flush)
+    return _news_response_cache_instance
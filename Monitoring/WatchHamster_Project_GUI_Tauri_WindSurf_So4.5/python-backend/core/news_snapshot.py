@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+뉴스 스냅샷 서비스
+REST API, WebSocket 실시간 시스템, 알림 폴러가 공유하는 프로세스 내 뉴스 조회 계층
+
+- (뉴스 타입, 날짜)별 단일 실행(single-flight): 동시에 들어온 조회는 진행 중인 한 번의 호출을 함께 기다림
+- 호출자별 대기 제한 시간, 기다리는 호출자가 없어진 조회는 취소
+- 최신 스냅샷을 보관하고 max_age 안의 조회는 업스트림 호출 없이 반환
+- 데이터가 바뀔 때만 버전을 올리고 구독자에게 알림
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+NewsFetcher = Callable[[str, Optional[str]], Awaitable[Optional[Dict[str, Any]]]]
+SnapshotListener = Callable[["NewsSnapshot"], Any]
+
+DEFAULT_MAX_AGE = 30.0  # 초
+
+
+@dataclass
+class NewsSnapshot:
+    """뉴스 타입별 최신 조회 결과"""
+    news_type: str
+    date: Optional[str]
+    version: int
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    fetched_at: datetime = field(default_factory=datetime.now)
+    latency: float = 0.0  # 업스트림 조회 소요 시간 (초)
+    _monotonic: float = field(default=0.0, repr=False)
+
+    @property
+    def status(self) -> str:
+        return "latest" if self.data else "error"
+
+    def age(self, now: Optional[float] = None) -> float:
+        """조회 후 경과 시간 (초)"""
+        return (time.monotonic() if now is None else now) - self._monotonic
+
+
+class NewsSnapshotService:
+    """단일 실행 뉴스 조회 + 버전 관리 스냅샷"""
+
+    def __init__(self, fetcher: NewsFetcher, max_age: float = DEFAULT_MAX_AGE,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            fetcher: (news_type, date) → 뉴스 데이터 (없으면 None, 실패 시 예외)
+            max_age: 이 시간 안의 스냅샷은 다시 조회하지 않음 (초)
+            clock: 시간 함수 (테스트용 주입)
+        """
+        self.fetcher = fetcher
+        self.max_age = max_age
+        self._clock = clock
+        self._snapshots: Dict[Tuple[str, Optional[str]], NewsSnapshot] = {}
+        self._inflight: Dict[Tuple[str, Optional[str]], asyncio.Task] = {}
+        self._waiters: Dict[Tuple[str, Optional[str]], int] = {}
+        self._listeners: List[SnapshotListener] = []
+
+        self.upstream_calls = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+        self.cancelled = 0
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    async def get(self, news_type: str, date: Optional[str] = None,
+                  max_age: Optional[float] = None, force: bool = False,
+                  timeout: Optional[float] = None) -> NewsSnapshot:
+        """
+        스냅샷 조회 (필요할 때만 업스트림 호출)
+
+        Args:
+            news_type: 뉴스 타입
+            date: 조회 날짜 (None이면 최신)
+            max_age: 허용할 스냅샷 나이 (초, None이면 서비스 기본값)
+            force: 보관된 스냅샷을 무시하고 새로 조회 (진행 중인 조회가 있으면 합류)
+            timeout: 대기 제한 시간 (초, 초과 시 asyncio.TimeoutError)
+
+        기다리는 호출자가 모두 떠나면(취소/시간 초과) 진행 중인 업스트림 조회도 취소합니다.
+        """
+        key = (news_type, date)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await self._wait(key, task, timeout)
+
+        snapshot = self._snapshots.get(key)
+        limit = self.max_age if max_age is None else max_age
+        if not force and snapshot is not None and snapshot.age(self._clock()) < limit:
+            self.cache_hits += 1
+            return snapshot
+
+        task = asyncio.get_running_loop().create_task(self._fetch(key))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await self._wait(key, task, timeout)
+
+    def _forget(self, key: Tuple[str, Optional[str]], task: asyncio.Task):
+        """진행 중 목록에서 제거 (그 사이 새로 시작된 조회는 유지)"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _wait(self, key: Tuple[str, Optional[str]], task: asyncio.Task,
+                    timeout: Optional[float]) -> NewsSnapshot:
+        # 한 호출자가 취소되어도 같은 조회를 기다리는 다른 호출자에게는 영향 없음
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                if not task.done():
+                    task.cancel()
+                    self.cancelled += 1
+                    self._forget(key, task)
+
+    async def get_many(self, news_types: Iterable[str], date: Optional[str] = None,
+                       max_age: Optional[float] = None, force: bool = False) -> Dict[str, NewsSnapshot]:
+        """여러 뉴스 타입을 동시에 조회"""
+        news_types = list(news_types)
+        snapshots = await asyncio.gather(*(
+            self.get(news_type, date, max_age=max_age, force=force) for news_type in news_types
+        ))
+        return dict(zip(news_types, snapshots))
+
+    def latest(self, news_type: str, date: Optional[str] = None) -> Optional[NewsSnapshot]:
+        """보관된 스냅샷 (조회하지 않음)"""
+        return self._snapshots.get((news_type, date))
+
+    async def _fetch(self, key: Tuple[str, Optional[str]]) -> NewsSnapshot:
+        news_type, date = key
+        self.upstream_calls += 1
+        started = self._clock()
+        data, error = None, None
+        try:
+            data = await self.fetcher(news_type, date)
+            if not data:
+                error = "뉴스 데이터를 가져올 수 없습니다"
+        except Exception as e:
+            logger.error(f"뉴스 스냅샷 조회 실패 ({news_type}): {e}")
+            error = str(e)
+
+        finished = self._clock()
+        previous = self._snapshots.get(key)
+        changed = previous is None or previous.data != data or previous.error != error
+        snapshot = NewsSnapshot(
+            news_type=news_type,
+            date=date,
+            version=(previous.version if previous else 0) + (1 if changed else 0),
+            data=data,
+            error=error,
+            latency=finished - started,
+            _monotonic=finished
+        )
+        self._snapshots[key] = snapshot
+
+        if changed:
+            await self._notify(snapshot)
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------------
+    def subscribe(self, listener: SnapshotListener):
+        """새 버전 스냅샷 알림 구독 (동기/비동기 함수 모두 가능)"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: SnapshotListener):
+        """구독 해제"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    async def _notify(self, snapshot: NewsSnapshot):
+        for listener in list(self._listeners):
+            try:
+                result = listener(snapshot)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"뉴스 스냅샷 구독자 처리 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """조회 통계"""
+        return {
+            'upstream_calls': self.upstream_calls,
+            'coalesced': self.coalesced,
+            'cache_hits': self.cache_hits,
+            'cancelled': self.cancelled,
+            'inflight': len(self._inflight),
+            'listeners': len(self._listeners),
+            'versions': {
+                news_type if date is None else f"{news_type}@{date}": snapshot.version
+                for (news_type, date), snapshot in self._snapshots.items()
+            }
+        }
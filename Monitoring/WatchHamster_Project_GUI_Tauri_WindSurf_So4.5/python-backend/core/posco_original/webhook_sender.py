@@ -22,7 +22,7 @@ import time
 import requests
 import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Callable, Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
@@ -157,6 +157,9 @@ class WebhookSender:
         self.processing_queue = Queue()
         self.failed_messages = []
         
+        # 전송 결과 콜백 (성공 또는 최종 실패 시 호출, 웹훅 로그 상태 갱신 등)
+        self.result_callbacks: List[Callable[['WebhookSendResult'], None]] = []
+        
         # 전송 통계
         self.send_statistics = {
             'total_sent': 0,
@@ -226,6 +229,9 @@ class WebhookSender:
                         # 최대 재시도 횟수 초과
                         self.failed_messages.append((message, result))
                         self.logger.error(f"메시지 전송 최종 실패: {message.id}")
+                        self._notify_result(result)
+                    else:
+                        self._notify_result(result)
                     
                     self.message_queue.task_done()
                 else:
@@ -785,6 +791,14 @@ class WebhookSender:
             processing_time=time.time() - start_time
         )
     
+    def _notify_result(self, result: 'WebhookSendResult'):
+        """전송 결과 콜백 호출 (콜백 오류는 큐 처리에 영향 없음)"""
+        for callback in self.result_callbacks:
+            try:
+                callback(result)
+            except Exception as e:
+                self.logger.error(f"전송 결과 콜백 오류: {e}")
+    
     def get_queue_status(self) -> Dict[str, Any]:
         """큐 상태 조회"""
         return {
@@ -257,11 +257,15 @@ class PoscoMainNotifier:
             current_time = datetime.now()
             news_found = False
             
+            # 한 번 조회한 스냅샷을 모든 뉴스 타입이 공유 (타입마다 API를 다시 호출하지 않음)
+            try:
+                news_data = self.api_module.get_latest_news_data()
+            except Exception as e:
+                self.log_message(f"❌ 뉴스 데이터 조회 오류: {e}")
+                news_data = None
+            
             for news_type, info in self.news_types.items():
                 try:
-                    # API에서 최신 뉴스 데이터 가져오기
-                    news_data = self.api_module.get_latest_news_data()
-                    
                     if news_data:
                         # API 데이터 구조에 맞게 처리
                         news_item = None
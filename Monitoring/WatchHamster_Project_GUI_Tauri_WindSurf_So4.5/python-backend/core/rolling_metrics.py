@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+증분 집계 (롤링 메트릭)
+
+값이 들어올 때마다 집계를 갱신해 조회 시 이력을 다시 훑지 않도록 합니다.
+
+- 개수/평균/최소/최대/최근 값은 누적 합으로 O(1) 갱신
+- p50/p95는 P² 알고리즘(Jain & Chlamtac)으로 마커 5개만 유지하며 추정
+- 상태를 dict로 내보내고 복원할 수 있어 재시작 후에도 집계 유지
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class P2Quantile:
+    """P² 스트리밍 분위수 추정 (메모리 O(1), 갱신 O(1))"""
+
+    def __init__(self, quantile: float):
+        """
+        Args:
+            quantile: 추정할 분위수 (0 < quantile < 1)
+        """
+        if not 0 < quantile < 1:
+            raise ValueError("quantile은 0과 1 사이여야 합니다")
+
+        self.quantile = quantile
+        self.count = 0
+        self._heights: List[float] = []  # 마커 높이 (처음 5개는 정렬된 원본 값)
+        self._positions = [0, 1, 2, 3, 4]  # 마커 실제 위치
+        self._desired = [0.0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4.0]  # 마커 목표 위치
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def add(self, value: float):
+        """값 추가"""
+        self.count += 1
+        heights = self._heights
+
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        # 값이 들어갈 구간 찾기 (양 끝이면 극값 갱신)
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # 가운데 마커 3개를 목표 위치로 조정
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if ((offset >= 1 and positions[i + 1] - positions[i] > 1) or
+                    (offset <= -1 and positions[i - 1] - positions[i] < -1)):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+    def value(self) -> Optional[float]:
+        """현재 추정값 (값이 5개 이하면 정확한 선형 보간 분위수)"""
+        if not self.count:
+            return None
+        if self.count > 5:
+            return self._heights[2]
+
+        heights = self._heights
+        rank = self.quantile * (len(heights) - 1)
+        lower = int(rank)
+        upper = min(lower + 1, len(heights) - 1)
+        return heights[lower] + (heights[upper] - heights[lower]) * (rank - lower)
+
+    def state(self) -> Dict[str, Any]:
+        """저장용 상태"""
+        return {
+            'quantile': self.quantile,
+            'count': self.count,
+            'heights': list(self._heights),
+            'positions': list(self._positions),
+            'desired': list(self._desired)
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'P2Quantile':
+        """저장된 상태에서 복원"""
+        estimator = cls(state['quantile'])
+        estimator.count = state['count']
+        estimator._heights = list(state['heights'])
+        estimator._positions = list(state['positions'])
+        estimator._desired = list(state['desired'])
+        return estimator
+
+
+class RunningStats:
+    """누적 집계 (count, mean, min, max, last, p50, p95)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.last: Optional[float] = None
+        self.p50 = P2Quantile(0.5)
+        self.p95 = P2Quantile(0.95)
+
+    def add(self, value: float):
+        """값 추가"""
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.last = value
+        self.p50.add(value)
+        self.p95.add(value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """조회용 요약"""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min,
+            'max': self.max,
+            'last': self.last,
+            'p50': self.p50.value(),
+            'p95': self.p95.value()
+        }
+
+    def state(self) -> Dict[str, Any]:
+        """저장용 상태"""
+        return {
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+            'last': self.last,
+            'p50': self.p50.state(),
+            'p95': self.p95.state()
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'RunningStats':
+        """저장된 상태에서 복원"""
+        stats = cls()
+        stats.count = state['count']
+        stats.total = state['total']
+        stats.min = state.get('min')
+        stats.max = state.get('max')
+        stats.last = state.get('last')
+        stats.p50 = P2Quantile.from_state(state['p50'])
+        stats.p95 = P2Quantile.from_state(state['p95'])
+        return stats
@@ -0,0 +1,477 @@
+"""
+런타임 상태 저장소 추상화
+모듈 전역 dict/list에 두던 상태(뉴스 상태/이력, 모니터 실행 로그 등)를 백엔드 뒤로 옮겨
+여러 uvicorn 워커 프로세스가 같은 상태를 보도록 함
+
+- memory: 프로세스 메모리 (단일 워커, 기본값 - 기존 동작과 동일)
+- sqlite: WAL 모드 SQLite 파일 (같은 호스트의 여러 워커가 공유)
+- register_state_backend()로 다른 구현(예: Redis) 연결 가능
+
+저장 형태는 두 가지:
+- 키-값 네임스페이스: 문서 단위 저장, merge()로 일부 필드만 원자적으로 갱신, 리비전으로 변경 추적
+- 추가 전용 로그: 최근 max_items개만 유지하는 이력, seq로 이후 항목 조회
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Match = Optional[Dict[str, Any]]
+
+
+def _matches(value: Any, match: Match) -> bool:
+    if not match:
+        return True
+    if not isinstance(value, dict):
+        return False
+    return all(value.get(field) == expected for field, expected in match.items())
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=_json_default, ensure_ascii=False)
+
+
+class StateBackend(ABC):
+    """상태 저장소 인터페이스"""
+
+    # 다른 프로세스와 상태를 공유하는지 (True면 워커 간 브로드캐스트 중계에 사용)
+    shared = False
+
+    # 키-값
+    @abstractmethod
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        pass
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any) -> int:
+        """값 저장 후 새 리비전 반환"""
+        pass
+
+    @abstractmethod
+    def merge(self, namespace: str, key: str, changes: Dict[str, Any]) -> Dict[str, Any]:
+        """문서의 일부 필드만 원자적으로 갱신하고 갱신된 문서 반환"""
+        pass
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def items(self, namespace: str) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def changes_since(self, namespace: str, revision: int) -> Tuple[int, Dict[str, Any]]:
+        """revision 이후 바뀐 키와 마지막 리비전"""
+        pass
+
+    # 추가 전용 로그
+    @abstractmethod
+    def append(self, namespace: str, value: Any, max_items: Optional[int] = None) -> int:
+        """항목 추가 후 seq 반환 (max_items를 넘는 오래된 항목은 삭제)"""
+        pass
+
+    @abstractmethod
+    def entries(self, namespace: str, match: Match = None, limit: Optional[int] = None) -> List[Any]:
+        """항목 목록 (오래된 순, limit이면 최근 limit개)"""
+        pass
+
+    @abstractmethod
+    def tail(self, namespace: str, since: int) -> Tuple[int, List[Any]]:
+        """since 이후 추가된 항목과 마지막 seq"""
+        pass
+
+    @abstractmethod
+    def count(self, namespace: str, match: Match = None) -> int:
+        pass
+
+    @abstractmethod
+    def clear(self, namespace: str, match: Match = None) -> int:
+        """조건에 맞는 로그 항목 삭제 후 삭제 수 반환"""
+        pass
+
+    def close(self):
+        pass
+
+
+class MemoryStateBackend(StateBackend):
+    """프로세스 메모리 백엔드 (값을 복사하지 않고 그대로 보관)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._kv: Dict[str, Dict[str, Tuple[int, Any]]] = {}
+        self._logs: Dict[str, List[Tuple[int, Any]]] = {}
+        self._revision = 0
+        self._seq = 0
+
+    def get(self, namespace, key, default=None):
+        entry = self._kv.get(namespace, {}).get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, namespace, key, value):
+        with self._lock:
+            self._revision += 1
+            self._kv.setdefault(namespace, {})[key] = (self._revision, value)
+            return self._revision
+
+    def merge(self, namespace, key, changes):
+        with self._lock:
+            document = self.get(namespace, key)
+            if document is None:
+                document = {}
+            document.update(changes)
+            self.set(namespace, key, document)
+            return document
+
+    def delete(self, namespace, key):
+        with self._lock:
+            return self._kv.get(namespace, {}).pop(key, None) is not None
+
+    def items(self, namespace):
+        return {key: entry[1] for key, entry in self._kv.get(namespace, {}).items()}
+
+    def changes_since(self, namespace, revision):
+        with self._lock:
+            changed = {key: value for key, (rev, value) in self._kv.get(namespace, {}).items() if rev > revision}
+            return self._revision, changed
+
+    def append(self, namespace, value, max_items=None):
+        with self._lock:
+            self._seq += 1
+            log = self._logs.setdefault(namespace, [])
+            log.append((self._seq, value))
+            if max_items is not None and len(log) > max_items:
+                del log[:len(log) - max_items]
+            return self._seq
+
+    def entries(self, namespace, match=None, limit=None):
+        values = [value for _, value in self._logs.get(namespace, []) if _matches(value, match)]
+        return values[-limit:] if limit else values
+
+    def tail(self, namespace, since):
+        with self._lock:
+            log = self._logs.get(namespace, [])
+            return self._seq, [value for seq, value in log if seq > since]
+
+    def count(self, namespace, match=None):
+        if not match:
+            return len(self._logs.get(namespace, []))
+        return len(self.entries(namespace, match))
+
+    def clear(self, namespace, match=None):
+        with self._lock:
+            log = self._logs.get(namespace, [])
+            kept = [(seq, value) for seq, value in log if not _matches(value, match)]
+            self._logs[namespace] = kept
+            return len(log) - len(kept)
+
+
+class SQLiteStateBackend(StateBackend):
+    """
+    SQLite 백엔드 (같은 호스트의 여러 워커 프로세스가 공유)
+
+    값은 JSON으로 저장하므로 datetime은 ISO 문자열로 돌아옴.
+    스레드별 장기 연결을 재사용하고 WAL 모드로 읽기가 쓰기를 막지 않음
+    """
+
+    shared = True
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        conn = self.connect()
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS state_kv (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                revision INTEGER NOT NULL,
+                PRIMARY KEY (namespace, key)
+            );
+            CREATE INDEX IF NOT EXISTS idx_state_kv_revision ON state_kv(namespace, revision);
+            CREATE TABLE IF NOT EXISTS state_log (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                namespace TEXT NOT NULL,
+                value TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_state_log_namespace ON state_log(namespace, seq);
+        """)
+        conn.commit()
+
+    def connect(self) -> sqlite3.Connection:
+        """현재 스레드의 재사용 연결 반환"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _write(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """쓰기 잠금을 먼저 잡는 트랜잭션 안에서 실행"""
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = func(conn)
+            conn.execute("COMMIT")
+            return result
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _where(match: Match) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for field, expected in (match or {}).items():
+            clauses.append(f"json_extract(value, '$.{field}') = ?")
+            params.append(expected)
+        return "".join(f" AND {clause}" for clause in clauses), params
+
+    @staticmethod
+    def _next_revision(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COALESCE(MAX(revision), 0) + 1 FROM state_kv").fetchone()[0]
+
+    def get(self, namespace, key, default=None):
+        row = self.connect().execute(
+            "SELECT value FROM state_kv WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set(self, namespace, key, value):
+        def write(conn):
+            revision = self._next_revision(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO state_kv (namespace, key, value, revision) VALUES (?, ?, ?, ?)",
+                (namespace, key, _dumps(value), revision)
+            )
+            return revision
+        return self._write(write)
+
+    def merge(self, namespace, key, changes):
+        def write(conn):
+            row = conn.execute(
+                "SELECT value FROM state_kv WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            document = json.loads(row[0]) if row else {}
+            document.update(json.loads(_dumps(changes)))
+            conn.execute(
+                "INSERT OR REPLACE INTO state_kv (namespace, key, value, revision) VALUES (?, ?, ?, ?)",
+                (namespace, key, _dumps(document), self._next_revision(conn))
+            )
+            return document
+        return self._write(write)
+
+    def delete(self, namespace, key):
+        return self._write(lambda conn: conn.execute(
+            "DELETE FROM state_kv WHERE namespace = ? AND key = ?", (namespace, key)
+        ).rowcount > 0)
+
+    def items(self, namespace):
+        rows = self.connect().execute(
+            "SELECT key, value FROM state_kv WHERE namespace = ? ORDER BY rowid", (namespace,)
+        ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def changes_since(self, namespace, revision):
+        conn = self.connect()
+        rows = conn.execute(
+            "SELECT key, value, revision FROM state_kv WHERE namespace = ? AND revision > ? ORDER BY revision",
+            (namespace, revision)
+        ).fetchall()
+        latest = rows[-1][2] if rows else revision
+        return latest, {key: json.loads(value) for key, value, _ in rows}
+
+    def append(self, namespace, value, max_items=None):
+        def write(conn):
+            seq = conn.execute(
+                "INSERT INTO state_log (namespace, value) VALUES (?, ?)", (namespace, _dumps(value))
+            ).lastrowid
+            if max_items is not None:
+                conn.execute("""
+                    DELETE FROM state_log WHERE namespace = ? AND seq <= (
+                        SELECT seq FROM state_log WHERE namespace = ? ORDER BY seq DESC LIMIT 1 OFFSET ?
+                    )
+                """, (namespace, namespace, max_items))
+            return seq
+        return self._write(write)
+
+    def entries(self, namespace, match=None, limit=None):
+        where, params = self._where(match)
+        query = f"SELECT value FROM state_log WHERE namespace = ?{where} ORDER BY seq DESC"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        rows = self.connect().execute(query, [namespace, *params]).fetchall()
+        return [json.loads(value) for (value,) in reversed(rows)]
+
+    def tail(self, namespace, since):
+        rows = self.connect().execute(
+            "SELECT seq, value FROM state_log WHERE namespace = ? AND seq > ? ORDER BY seq", (namespace, since)
+        ).fetchall()
+        latest = rows[-1][0] if rows else since
+        return latest, [json.loads(value) for _, value in rows]
+
+    def count(self, namespace, match=None):
+        where, params = self._where(match)
+        return self.connect().execute(
+            f"SELECT COUNT(*) FROM state_log WHERE namespace = ?{where}", [namespace, *params]
+        ).fetchone()[0]
+
+    def clear(self, namespace, match=None):
+        where, params = self._where(match)
+        return self._write(lambda conn: conn.execute(
+            f"DELETE FROM state_log WHERE namespace = ?{where}", [namespace, *params]
+        ).rowcount)
+
+    def close(self):
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._local = threading.local()
+
+
+class StateNamespace(MutableMapping):
+    """
+    백엔드 키-값 네임스페이스를 dict처럼 사용
+
+    읽은 값은 사본일 수 있으므로(sqlite) 필드 변경은 merge()로 반영
+    """
+
+    def __init__(self, namespace: str, defaults: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            namespace: 네임스페이스 이름
+            defaults: 키가 없을 때 채울 초기 문서 (이미 있으면 유지)
+        """
+        self.namespace = namespace
+        self.defaults = defaults or {}
+        self._seeded_backend = None
+
+    @property
+    def backend(self) -> StateBackend:
+        backend = get_state_backend()
+        if backend is not self._seeded_backend:
+            # 다른 워커가 이미 만든 상태는 덮어쓰지 않음
+            existing = backend.items(self.namespace)
+            for key, value in self.defaults.items():
+                if key not in existing:
+                    backend.set(self.namespace, key, dict(value) if isinstance(value, dict) else value)
+            self._seeded_backend = backend
+        return backend
+
+    def merge(self, key: str, **changes) -> Dict[str, Any]:
+        return self.backend.merge(self.namespace, key, changes)
+
+    def __getitem__(self, key):
+        value = self.backend.get(self.namespace, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.backend.set(self.namespace, key, value)
+
+    def __delitem__(self, key):
+        if not self.backend.delete(self.namespace, key):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.backend.items(self.namespace))
+
+    def __len__(self) -> int:
+        return len(self.backend.items(self.namespace))
+
+    def items(self):
+        return self.backend.items(self.namespace).items()
+
+    def values(self):
+        return self.backend.items(self.namespace).values()
+
+
+class StateLog:
+    """백엔드 추가 전용 로그 (최근 max_items개 유지)"""
+
+    def __init__(self, namespace: str, max_items: Optional[int] = None):
+        self.namespace = namespace
+        self.max_items = max_items
+
+    def append(self, value: Any) -> int:
+        return get_state_backend().append(self.namespace, value, self.max_items)
+
+    def entries(self, match: Match = None, limit: Optional[int] = None) -> List[Any]:
+        return get_state_backend().entries(self.namespace, match, limit)
+
+    def count(self, match: Match = None) -> int:
+        return get_state_backend().count(self.namespace, match)
+
+    def clear(self, match: Match = None) -> int:
+        return get_state_backend().clear(self.namespace, match)
+
+    def __len__(self) -> int:
+        return self.count()
+
+
+# 백엔드 이름 → 생성 함수 (설정 객체를 받음)
+STATE_BACKENDS: Dict[str, Callable[[Any], StateBackend]] = {
+    "memory": lambda settings: MemoryStateBackend(),
+    "sqlite": lambda settings: SQLiteStateBackend(settings.state_db_path),
+}
+
+_state_backend: Optional[StateBackend] = None
+_state_backend_lock = threading.Lock()
+
+
+def register_state_backend(name: str, factory: Callable[[Any], StateBackend]):
+    """상태 백엔드 구현 등록 (설정 state_backend 값으로 선택)"""
+    STATE_BACKENDS[name] = factory
+
+
+def get_state_backend() -> StateBackend:
+    """설정에 따른 상태 백엔드 반환 (싱글톤)"""
+    global _state_backend
+    if _state_backend is None:
+        with _state_backend_lock:
+            if _state_backend is None:
+                from utils.config import get_settings
+
+                settings = get_settings()
+                name = settings.state_backend
+                if name not in STATE_BACKENDS:
+                    logger.warning(f"알 수 없는 상태 백엔드 '{name}', memory 사용")
+                    name = "memory"
+                _state_backend = STATE_BACKENDS[name](settings)
+                logger.info(f"상태 백엔드: {name}")
+    return _state_backend
+
+
+def set_state_backend(backend: Optional[StateBackend]):
+    """상태 백엔드 교체 (None이면 다음 호출 시 설정으로 다시 생성)"""
+    global _state_backend
+    with _state_backend_lock:
+        if _state_backend is not None and _state_backend is not backend:
+            _state_backend.close()
+        _state_backend = backend
@@ -12,11 +12,18 @@ Requirements: 3.1, 3.2
 import psutil
 import time
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    from .metrics_sampler import MetricRingBuffer
+except ImportError:
+    from metrics_sampler import MetricRingBuffer
+
+HISTORY_CAPACITY = 100  # 리소스별 보관할 최근 샘플 수
+
 class ResourceLevel(Enum):
     """리소스 사용량 레벨"""
     NORMAL = "normal"
@@ -126,10 +133,13 @@ class SystemMonitor:
         self.disk_critical_threshold = self.config.get('disk_critical_threshold', 90.0)
         self.disk_emergency_threshold = self.config.get('disk_emergency_threshold', 98.0)
         
-        # 모니터링 히스토리
-        self.cpu_history = []
-        self.memory_history = []
-        self.network_history = []
+        # 모니터링 히스토리 (고정 크기 링 버퍼)
+        self.cpu_history = MetricRingBuffer(HISTORY_CAPACITY, ('percent',))
+        self.memory_history = MetricRingBuffer(HISTORY_CAPACITY, ('percent', 'available_gb'))
+        self.network_history = MetricRingBuffer(HISTORY_CAPACITY, ('bytes_sent_per_sec', 'bytes_recv_per_sec'))
+        
+        # CPU 사용률 기준점 (이후 호출은 대기 없이 직전 호출 대비 사용률 반환)
+        psutil.cpu_percent(interval=None)
         
         # 마지막 네트워크 통계
         self.last_network_stats = None
@@ -179,8 +189,8 @@ class SystemMonitor:
     def get_cpu_info(self) -> CPUInfo:
         """CPU 정보 수집"""
         try:
-            # CPU 사용률 (1초 간격으로 측정)
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU 사용률 (직전 호출 대비, 대기 없음)
+            cpu_percent = psutil.cpu_percent(interval=None)
             cpu_count = psutil.cpu_count()
             
             # CPU 주파수 정보 (가능한 경우)
@@ -208,14 +218,7 @@ class SystemMonitor:
             )
             
             # 히스토리 업데이트
-            self.cpu_history.append({
-                'timestamp': datetime.now(),
-                'percent': cpu_percent
-            })
-            
-            # 히스토리 크기 제한 (최근 100개)
-            if len(self.cpu_history) > 100:
-                self.cpu_history = self.cpu_history[-100:]
+            self.cpu_history.append(time.time(), {'percent': cpu_percent})
             
             return cpu_info
             
@@ -255,16 +258,11 @@ class SystemMonitor:
             )
             
             # 히스토리 업데이트
-            self.memory_history.append({
-                'timestamp': datetime.now(),
+            self.memory_history.append(time.time(), {
                 'percent': virtual_memory.percent,
                 'available_gb': memory_info.available_gb
             })
             
-            # 히스토리 크기 제한
-            if len(self.memory_history) > 100:
-                self.memory_history = self.memory_history[-100:]
-            
             return memory_info
             
         except Exception as e:
@@ -320,15 +318,14 @@ class SystemMonitor:
             )
             
             # 네트워크 속도 계산을 위한 히스토리 업데이트
-            current_time = datetime.now()
+            current_time = time.time()
             if self.last_network_stats and self.last_network_time:
-                time_diff = (current_time - self.last_network_time).total_seconds()
+                time_diff = current_time - self.last_network_time
                 if time_diff > 0:
                     bytes_sent_per_sec = (network_stats.bytes_sent - self.last_network_stats.bytes_sent) / time_diff
                     bytes_recv_per_sec = (network_stats.bytes_recv - self.last_network_stats.bytes_recv) / time_diff
                     
-                    self.network_history.append({
-                        'timestamp': current_time,
+                    self.network_history.append(current_time, {
                         'bytes_sent_per_sec': bytes_sent_per_sec,
                         'bytes_recv_per_sec': bytes_recv_per_sec
                     })
@@ -336,10 +333,6 @@ class SystemMonitor:
             self.last_network_stats = network_stats
             self.last_network_time = current_time
             
-            # 히스토리 크기 제한
-            if len(self.network_history) > 100:
-                self.network_history = self.network_history[-100:]
-            
             return network_info
             
         except Exception as e:
@@ -520,25 +513,25 @@ class SystemMonitor:
                    f"⏰ 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
                    f"❌ 메시지 생성 오류: {str(e)}")
     
+    def _history_buffer(self, resource_type: str) -> Optional[MetricRingBuffer]:
+        """리소스 타입별 히스토리 버퍼"""
+        return {
+            'cpu': self.cpu_history,
+            'memory': self.memory_history,
+            'network': self.network_history
+        }.get(resource_type)
+    
     def get_resource_history(self, resource_type: str, minutes: int = 60) -> List[Dict]:
         """리소스 사용 히스토리 조회"""
         try:
-            cutoff_time = datetime.now() - timedelta(minutes=minutes)
-            
-            if resource_type == 'cpu':
-                history = self.cpu_history
-            elif resource_type == 'memory':
-                history = self.memory_history
-            elif resource_type == 'network':
-                history = self.network_history
-            else:
+            history = self._history_buffer(resource_type)
+            if history is None:
                 return []
             
-            # 지정된 시간 이후의 데이터만 반환
-            filtered_history = [
-                entry for entry in history 
-                if entry['timestamp'] >= cutoff_time
-            ]
+            # 지정된 시간 이후의 데이터만 반환 (창 안의 샘플만 순회)
+            filtered_history = history.window(minutes * 60)
+            for entry in filtered_history:
+                entry['timestamp'] = datetime.fromtimestamp(entry['timestamp'])
             
             return filtered_history
             
@@ -552,10 +545,10 @@ class SystemMonitor:
             trends = {}
             
             # CPU 트렌드
-            cpu_history = self.get_resource_history('cpu', minutes)
-            if len(cpu_history) >= 2:
-                recent_avg = sum(entry['percent'] for entry in cpu_history[-5:]) / min(5, len(cpu_history))
-                older_avg = sum(entry['percent'] for entry in cpu_history[:5]) / min(5, len(cpu_history))
+            cpu_values = self.cpu_history.values('percent', seconds=minutes * 60)
+            if len(cpu_values) >= 2:
+                recent_avg = sum(cpu_values[-5:]) / min(5, len(cpu_values))
+                older_avg = sum(cpu_values[:5]) / min(5, len(cpu_values))
                 
                 if recent_avg > older_avg + 10:
                     trends['cpu'] = 'increasing'
@@ -567,10 +560,10 @@ class SystemMonitor:
                 trends['cpu'] = 'insufficient_data'
             
             # 메모리 트렌드
-            memory_history = self.get_resource_history('memory', minutes)
-            if len(memory_history) >= 2:
-                recent_avg = sum(entry['percent'] for entry in memory_history[-5:]) / min(5, len(memory_history))
-                older_avg = sum(entry['percent'] for entry in memory_history[:5]) / min(5, len(memory_history))
+            memory_values = self.memory_history.values('percent', seconds=minutes * 60)
+            if len(memory_values) >= 2:
+                recent_avg = sum(memory_values[-5:]) / min(5, len(memory_values))
+                older_avg = sum(memory_values[:5]) / min(5, len(memory_values))
                 
                 if recent_avg > older_avg + 5:
                     trends['memory'] = 'increasing'
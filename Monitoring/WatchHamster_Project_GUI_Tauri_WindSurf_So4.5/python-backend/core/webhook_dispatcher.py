@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 웹훅 디스패처
+
+전용 이벤트 루프 스레드에서 엔드포인트별 우선순위 큐와 작업자 풀을 운영합니다.
+
+- 엔드포인트마다 독립된 우선순위 큐와 N개의 작업자 태스크
+- 모든 작업자가 공유하는 httpx.AsyncClient 연결 풀 (keep-alive)
+- 실패한 메시지는 작업자를 붙잡지 않고 지연 큐(loop.call_later)로 재예약
+- 어떤 스레드에서든 submit() 호출 가능
+- outbox 지정 시 투입 전 선기록, 완료 시 상태 갱신, 시작 시 미전송분을 우선순위 순으로 일괄 점유해 재개
+- recovery_interval 지정 시 주기적으로 (should_recover가 True일 때만) 복구를 다시 실행해
+  실행 중 종료된 다른 워커가 남긴 메시지도 이어서 전송
+
+메시지 객체는 id, endpoint, priority(.value), retry_count, max_retries 속성을 가져야 합니다.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+
+import httpx
+
+
+SendFunc = Callable[[Any, httpx.AsyncClient], Awaitable[Any]]
+
+
+class AsyncWebhookDispatcher:
+    """엔드포인트별 작업자 풀을 가진 비동기 웹훅 디스패처"""
+
+    def __init__(self, send_func: SendFunc, endpoints: Iterable[Any],
+                 workers_per_endpoint: Union[int, Dict[Any, int]] = 2,
+                 retry_delay_func: Optional[Callable[[Any], float]] = None,
+                 on_retry: Optional[Callable[[Any, Any], None]] = None,
+                 on_final_failure: Optional[Callable[[Any, Any], None]] = None,
+                 request_timeout: float = 10.0,
+                 outbox: Optional[Any] = None,
+                 claim_batch_size: int = 16,
+                 recover_on_start: bool = True,
+                 recovery_interval: Optional[float] = None,
+                 should_recover: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            send_func: async (message, client) -> 결과 객체 (success 속성 필요)
+            endpoints: 작업자를 띄울 엔드포인트 목록
+            workers_per_endpoint: 엔드포인트별 작업자 수 (int 또는 {엔드포인트: 수})
+            retry_delay_func: 재시도 지연 시간 계산 함수 (retry_count 증가 후 호출)
+            on_retry: 재시도 예약 시 콜백 (message, result)
+            on_final_failure: 최대 재시도 초과 시 콜백 (message, result)
+            request_timeout: HTTP 요청 타임아웃 (초)
+            outbox: 내구성 저장소 (WebhookOutbox 호환, None이면 메모리 전용)
+            claim_batch_size: 복구 시 한 번에 점유할 메시지 수
+            recover_on_start: 시작 시 이전 실행의 미전송분 재개 (여러 워커 중 리더 하나만 True)
+            recovery_interval: 주기적 복구 간격 (초, None이면 시작 시에만)
+            should_recover: 주기적 복구 실행 여부 판단 (예: 리더 워커인지, None이면 항상)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.send_func = send_func
+        self.endpoints = list(endpoints)
+        if isinstance(workers_per_endpoint, int):
+            self.workers_per_endpoint = {endpoint: workers_per_endpoint for endpoint in self.endpoints}
+        else:
+            self.workers_per_endpoint = {endpoint: workers_per_endpoint.get(endpoint, 1) for endpoint in self.endpoints}
+        self.retry_delay_func = retry_delay_func or (lambda message: min(2 ** message.retry_count, 60))
+        self.on_retry = on_retry
+        self.on_final_failure = on_final_failure
+        self.request_timeout = request_timeout
+        self.outbox = outbox
+        self.claim_batch_size = claim_batch_size
+        self.recover_on_start = recover_on_start
+        self.recovery_interval = recovery_interval
+        self.should_recover = should_recover
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._queues: Dict[Any, asyncio.PriorityQueue] = {}
+        self._workers = []
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sequence = itertools.count()
+        self._backlog_events: Dict[Any, asyncio.Event] = {}
+        self._recovered = 0
+        self._recovering = False  # 시작 시 복구가 디스패처 스레드에서 진행 중
+        self._recovery_requested: Optional[asyncio.Event] = None
+
+        # 완료되지 않은 메시지 수 (메모리 대기 + 전송 중 + 재시도 대기)
+        # 아웃박스에서 아직 점유하지 않은 복구 대상은 _backlog(엔드포인트별 추정치)로 따로 집계
+        self._state_lock = threading.Condition()
+        self._pending = 0
+        self._backlog: Dict[Any, int] = {}
+        self._draining = set()
+        self._in_flight = 0
+        self._retry_scheduled = 0
+        self.is_running = False
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+    def start(self):
+        """전용 이벤트 루프 스레드 시작"""
+        if self.is_running:
+            return
+
+        # 이전 실행에서 전송되지 못한 메시지 재개는 디스패처 스레드에서 (호출한 스레드/이벤트 루프를 막지 않음)
+        self._recovering = self.outbox is not None and self.recover_on_start
+
+        self._thread = threading.Thread(target=self._run_loop, name="webhook-dispatcher", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        self.is_running = True
+        self.logger.info(
+            "웹훅 디스패처 시작: " + ", ".join(f"{getattr(e, 'value', e)}×{n}" for e, n in self.workers_per_endpoint.items())
+        )
+
+    def _run_loop(self):
+        """디스패처 스레드 본체"""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._setup())
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.run_until_complete(self._teardown())
+            self._loop.close()
+
+    async def _setup(self):
+        """큐, HTTP 연결 풀, 작업자 태스크 생성"""
+        total_workers = sum(self.workers_per_endpoint.values())
+        self._client = httpx.AsyncClient(
+            timeout=self.request_timeout,
+            limits=httpx.Limits(max_connections=total_workers, max_keepalive_connections=total_workers)
+        )
+        for endpoint in self.endpoints:
+            self._queues[endpoint] = asyncio.PriorityQueue()
+            for index in range(self.workers_per_endpoint[endpoint]):
+                self._workers.append(asyncio.ensure_future(self._worker(endpoint, index)))
+        if self._recovering:
+            self._workers.append(asyncio.ensure_future(self._initial_recovery()))
+        if self.outbox is not None and self.recovery_interval:
+            self._recovery_requested = asyncio.Event()
+            self._workers.append(asyncio.ensure_future(self._recovery_loop()))
+
+    async def _teardown(self):
+        """작업자 취소 및 연결 풀 종료"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        if self._client:
+            await self._client.aclose()
+
+    def shutdown(self, timeout: float = 10) -> int:
+        """
+        남은 메시지를 timeout 동안 처리한 뒤 디스패처 종료
+
+        Returns:
+            int: 처리되지 못한 메시지 수
+        """
+        if not self.is_running:
+            return self._pending
+
+        remaining = self.wait_until_idle(timeout)
+        self.is_running = False
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=3)
+        if self._thread.is_alive():
+            self.logger.warning("웹훅 디스패처 스레드가 정상 종료되지 않았습니다")
+        return remaining
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> int:
+        """모든 메시지(복구 대상 포함)가 완료될 때까지 대기하고 남은 메시지 수 반환"""
+        with self._state_lock:
+            self._state_lock.wait_for(
+                lambda: self._pending == 0 and not self._draining and not self._recovering, timeout=timeout
+            )
+            return self._pending + sum(self._backlog.values())
+
+    # ------------------------------------------------------------------
+    # 메시지 투입
+    # ------------------------------------------------------------------
+    def submit(self, message: Any):
+        """메시지 투입 (스레드 안전)"""
+        if not self.is_running:
+            raise RuntimeError("웹훅 디스패처가 실행 중이 아닙니다")
+        if message.endpoint not in self._queues:
+            raise ValueError(f"알 수 없는 엔드포인트: {message.endpoint}")
+
+        if self.outbox is not None:
+            # 선기록 실패 시 예외를 그대로 전달 (메모리 큐에도 넣지 않음)
+            self.outbox.enqueue(message, claimed=True)
+
+        with self._state_lock:
+            self._pending += 1
+        self._loop.call_soon_threadsafe(self._put, message)
+
+    def _put(self, message: Any):
+        """루프 스레드에서 우선순위 큐에 추가 (동일 우선순위는 FIFO)"""
+        self._queues[message.endpoint].put_nowait((message.priority.value, next(self._sequence), message))
+
+    def _requeue(self, message: Any):
+        """재시도 지연이 끝난 메시지를 다시 큐에 추가"""
+        with self._state_lock:
+            self._retry_scheduled -= 1
+        self._put(message)
+
+    async def _drain_backlog(self, endpoint: Any):
+        """
+        복구된 대기 메시지를 우선순위 순으로 일괄 점유해 큐에 공급
+
+        메모리 큐에 작업자 수 이상이 쌓여 있으면 점유를 미뤄, 새로 들어온 긴급
+        메시지가 오래된 대량 백로그 뒤에 밀리지 않도록 합니다.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queues[endpoint]
+        wakeup = self._backlog_events[endpoint]
+        workers = self.workers_per_endpoint[endpoint]
+        while True:
+            wakeup.clear()
+            if queue.qsize() < workers:
+                try:
+                    messages, claimed = await loop.run_in_executor(
+                        None, self.outbox.claim, endpoint, self.claim_batch_size
+                    )
+                except Exception as e:
+                    self.logger.error(f"아웃박스 점유 오류 ({getattr(endpoint, 'value', endpoint)}): {e}")
+                else:
+                    # 복원하지 못해 실패 처리된 행은 메모리 대기 수에 넣지 않음
+                    with self._state_lock:
+                        self._pending += len(messages)
+                        self._backlog[endpoint] = max(0, self._backlog.get(endpoint, 0) - claimed)
+                    for message in messages:
+                        self._put(message)
+                    if claimed < self.claim_batch_size:
+                        break
+                    continue
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+        self._backlog_events.pop(endpoint, None)
+        with self._state_lock:
+            self._backlog[endpoint] = 0
+            self._draining.discard(endpoint)
+            self._state_lock.notify_all()
+
+    def _recover_backlog(self) -> Dict[Any, int]:
+        """아웃박스 복구 후 엔드포인트별 대기 수 반환 (어느 스레드에서든 호출 가능)"""
+        backlog = {endpoint: self.outbox.recover([endpoint]) for endpoint in self.endpoints}
+        total = sum(backlog.values())
+        with self._state_lock:
+            self._backlog.update(backlog)
+            self._recovered = total
+        if total:
+            self.logger.info(f"미전송 웹훅 메시지 {total}개 재개")
+        return backlog
+
+    async def _initial_recovery(self):
+        """시작 시 복구 (점유자가 종료되었거나 점유 기간이 만료된 메시지만)"""
+        try:
+            backlog = await asyncio.get_running_loop().run_in_executor(None, self._recover_backlog)
+            self._start_draining(backlog)
+        except Exception as e:
+            self.logger.error(f"아웃박스 시작 복구 오류: {e}")
+        finally:
+            with self._state_lock:
+                self._recovering = False
+                self._state_lock.notify_all()
+
+    def _start_draining(self, backlog: Dict[Any, int]):
+        """대기 메시지가 있는 엔드포인트의 백로그 공급 태스크 시작 (루프 스레드에서 호출)"""
+        for endpoint, count in backlog.items():
+            if not count or endpoint in self._backlog_events:
+                continue
+            with self._state_lock:
+                self._draining.add(endpoint)
+            self._backlog_events[endpoint] = asyncio.Event()
+            self._workers.append(asyncio.ensure_future(self._drain_backlog(endpoint)))
+
+    async def _recovery_loop(self):
+        """주기적 복구 (should_recover가 True일 때만, request_recovery()로 즉시 실행 가능)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await asyncio.wait_for(self._recovery_requested.wait(), timeout=self.recovery_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._recovery_requested.clear()
+            try:
+                if self.should_recover is not None and not await loop.run_in_executor(None, self.should_recover):
+                    continue
+                backlog = await loop.run_in_executor(None, self._recover_backlog)
+                self._start_draining(backlog)
+            except Exception as e:
+                self.logger.error(f"아웃박스 주기적 복구 오류: {e}")
+
+    def request_recovery(self):
+        """주기를 기다리지 않고 복구 실행 요청 (리더 승계 시 등, 스레드 안전)"""
+        if self.is_running and self._recovery_requested is not None:
+            self._loop.call_soon_threadsafe(self._recovery_requested.set)
+
+    async def _record(self, method: str, *args):
+        """아웃박스 상태 갱신 (이벤트 루프를 막지 않도록 실행기에서 수행)"""
+        if self.outbox is None:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, getattr(self.outbox, method), *args)
+        except Exception as e:
+            self.logger.error(f"아웃박스 갱신 오류 ({method}): {e}")
+
+    # ------------------------------------------------------------------
+    # 작업자
+    # ------------------------------------------------------------------
+    async def _worker(self, endpoint: Any, index: int):
+        """엔드포인트 작업자: 큐에서 꺼내 전송하고, 실패 시 재시도를 예약"""
+        queue = self._queues[endpoint]
+        while True:
+            _, _, message = await queue.get()
+            if endpoint in self._backlog_events:
+                self._backlog_events[endpoint].set()
+            with self._state_lock:
+                self._in_flight += 1
+
+            result = None
+            try:
+                result = await self.send_func(message, self._client)
+            except Exception as e:
+                self.logger.error(f"웹훅 작업자 오류 ({getattr(endpoint, 'value', endpoint)}#{index}): {e}")
+            finally:
+                with self._state_lock:
+                    self._in_flight -= 1
+
+            if result is not None and result.success:
+                await self._record('complete', message, result, True)
+                self._complete()
+            elif message.retry_count < message.max_retries:
+                message.retry_count += 1
+                delay = self.retry_delay_func(message)
+                await self._record('mark_retry', message, result)
+                with self._state_lock:
+                    self._retry_scheduled += 1
+                self._loop.call_later(delay, self._requeue, message)
+                self._invoke(self.on_retry, message, result)
+                self.logger.warning(
+                    f"메시지 재시도 예약: {message.id} ({delay:.1f}초 후, 시도 {message.retry_count}/{message.max_retries})"
+                )
+            else:
+                await self._record('complete', message, result, False)
+                self._invoke(self.on_final_failure, message, result)
+                self.logger.error(f"메시지 전송 최종 실패: {message.id}")
+                self._complete()
+
+            queue.task_done()
+
+    def _complete(self):
+        with self._state_lock:
+            self._pending -= 1
+            self._state_lock.notify_all()
+
+    def _invoke(self, callback: Optional[Callable], *args):
+        if not callback:
+            return
+        try:
+            callback(*args)
+        except Exception as e:
+            self.logger.error(f"웹훅 디스패처 콜백 오류: {e}")
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    def qsize(self) -> int:
+        """완료되지 않은 메시지 수 (아직 점유하지 않은 복구 대상 포함)"""
+        with self._state_lock:
+            return self._pending + sum(self._backlog.values())
+
+    def get_status(self) -> Dict[str, Any]:
+        """디스패처 상태"""
+        with self._state_lock:
+            return {
+                'is_running': self.is_running,
+                'pending': self._pending,
+                'in_flight': self._in_flight,
+                'durable': self.outbox is not None,
+                'recovered': self._recovered,
+                'retry_scheduled': self._retry_scheduled,
+                'queued': {
+                    getattr(endpoint, 'value', str(endpoint)): queue.qsize()
+                    for endpoint, queue in self._queues.items()
+                },
+                'workers': {
+                    getattr(endpoint, 'value', str(endpoint)): count
+                    for endpoint, count in self.workers_per_endpoint.items()
+                }
+            }
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹훅 아웃박스
+
+전송할 메시지를 SQLite webhook_outbox 테이블에 먼저 기록(write-ahead)하여
+백엔드가 재시작되어도 미전송 알림이 사라지지 않도록 합니다.
+
+- 투입: 단일 INSERT (즉시 전송되는 메시지는 claimed 상태로 기록)
+- 복구: 점유자가 종료되었거나 점유 기간이 만료된 claimed 행만 pending으로 되돌리고 우선순위 순으로 일괄 점유
+  (점유자는 호스트:PID:인스턴스 - 같은 프로세스의 다른 전송자나 살아 있는 다른 워커가 전송 중인 행은 유지)
+- 완료: 성공/최종 실패를 UPDATE로 기록하며, 전송 통계도 같은 테이블에서 집계
+"""
+
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import psutil
+
+# 점유 기간 (초) - 종료 여부를 확인할 수 없는 점유자(다른 호스트)의 행은 이 시간이 지나야 되돌림
+CLAIM_LEASE_SECONDS = 600.0
+
+
+class WebhookOutbox:
+    """Database 웹훅 아웃박스 테이블 어댑터"""
+
+    def __init__(self, db, decode: Callable[[Dict[str, Any]], Any], company_id: str = 'posco',
+                 lease_seconds: float = CLAIM_LEASE_SECONDS):
+        """
+        Args:
+            db: database.Database 인스턴스
+            decode: 저장된 payload(dict)를 메시지 객체로 복원하는 함수
+            company_id: 기록할 회사 ID
+            lease_seconds: 점유 기간 (초)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db = db
+        self.decode = decode
+        self.company_id = company_id
+        self.lease_seconds = lease_seconds
+        self.hostname = socket.gethostname()
+        self.owner = f"{self.hostname}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    @staticmethod
+    def _endpoint_key(endpoint: Any) -> str:
+        return getattr(endpoint, 'value', str(endpoint))
+
+    def enqueue(self, message: Any, claimed: bool = True) -> int:
+        """
+        메시지 선기록
+
+        Args:
+            message: to_dict()를 제공하는 메시지 객체
+            claimed: 바로 메모리 큐로 보낼 메시지면 True (작업자 점유 상태로 기록)
+        """
+        return self.db.enqueue_outbox_message({
+            'id': message.id,
+            'company_id': self.company_id,
+            'endpoint': self._endpoint_key(message.endpoint),
+            'bot_type': self._endpoint_key(message.bot_type),
+            'priority': message.priority.value,
+            'payload': message.to_dict(),
+            'status': 'claimed' if claimed else 'pending',
+            'claimed_by': self.owner if claimed else None
+        })
+
+    def recover(self, endpoints: Iterable[Any]) -> int:
+        """
+        종료된 점유자의 메시지와 점유 기간이 만료된 메시지를 대기 상태로 되돌리고 대기 수 반환
+        
+        같은 호스트의 점유자는 PID로 생존 여부를 확인하고, 다른 호스트의 점유자는 점유 기간으로만 판단합니다.
+        """
+        keys = [self._endpoint_key(endpoint) for endpoint in endpoints]
+        dead_owners, live_owners = [], []
+        for owner in self.db.get_outbox_claim_owners(keys):
+            alive = self._owner_alive(owner)
+            if alive is True:
+                live_owners.append(owner)
+            elif alive is False:
+                dead_owners.append(owner)
+        
+        expired_before = (datetime.now() - timedelta(seconds=self.lease_seconds)).isoformat()
+        return self.db.release_outbox_claims(
+            keys, dead_owners=dead_owners, expired_before=expired_before, live_owners=live_owners
+        )
+
+    def _owner_alive(self, owner: str) -> Optional[bool]:
+        """점유자 생존 여부 (같은 호스트만 확인 가능, 알 수 없으면 None)"""
+        parts = owner.split(':')
+        if len(parts) < 2 or parts[0] != self.hostname:
+            return None
+        try:
+            return psutil.pid_exists(int(parts[1]))
+        except ValueError:
+            return None
+
+    def claim(self, endpoint: Any, limit: int) -> Tuple[List[Any], int]:
+        """
+        대기 메시지를 우선순위 순으로 일괄 점유
+
+        Returns:
+            Tuple[List[Any], int]: (복원된 메시지 목록, 점유한 행 수)
+                복원에 실패한 행은 최종 실패로 기록되어 목록에서 빠집니다.
+        """
+        messages = []
+        entries = self.db.claim_outbox_messages(self._endpoint_key(endpoint), limit, self.owner)
+        for entry in entries:
+            try:
+                message = self.decode(entry['payload'])
+                message.retry_count = entry['attempts']
+                messages.append(message)
+            except Exception as e:
+                self.logger.error(f"아웃박스 메시지 복원 실패: {entry['id']} - {e}")
+                self.db.complete_outbox_message(entry['id'], False, entry['attempts'], error_message=f"복원 실패: {e}")
+        return messages, len(entries)
+
+    def mark_retry(self, message: Any, result: Optional[Any] = None) -> bool:
+        """재시도 예약 기록"""
+        return self.db.mark_outbox_retry(message.id, message.retry_count, getattr(result, 'error_message', None))
+
+    def complete(self, message: Any, result: Optional[Any], success: bool) -> bool:
+        """전송 성공 또는 최종 실패 기록"""
+        return self.db.complete_outbox_message(
+            message.id,
+            success,
+            message.retry_count + 1,
+            response_time=getattr(result, 'processing_time', None),
+            error_message=getattr(result, 'error_message', None)
+        )
+
+    def get_failed_messages(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """최종 실패 메시지 목록"""
+        return self.db.get_outbox_messages('failed', limit)
+
+    def dismiss_failed(self) -> int:
+        """최종 실패 메시지 확인 처리"""
+        return self.db.dismiss_failed_outbox_messages()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """아웃박스 기반 전송 통계"""
+        return self.db.get_outbox_stats(self.company_id)
@@ -9,8 +9,9 @@ WatchHamster Tauri 웹훅 전송 시스템
 - POSCO 뉴스 알림 웹훅 (기존 URL 유지)
 - WatchHamster 시스템 상태 웹훅
 - generate_dynamic_alert_message 로직 완전 이식
-- 웹훅 전송 실패 시 재시도 메커니즘
-- 메시지 우선순위 및 큐 관리
+- 웹훅 전송 실패 시 재시도 메커니즘 (지연 큐 재예약)
+- 메시지 우선순위 및 엔드포인트별 비동기 작업자 풀
+- SQLite 아웃박스 선기록으로 재시작 후 미전송 메시지 재개
 
 Requirements: 4.1, 4.2, 4.3, 4.4
 """
@@ -19,16 +20,22 @@ import os
 import sys
 import json
 import time
-import requests
-import threading
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
-from queue import Queue, PriorityQueue
 import hashlib
+import threading
+import weakref
+
+import httpx
+
+from .leader_election import is_leader_process
+from .webhook_dispatcher import AsyncWebhookDispatcher
+from .webhook_outbox import WebhookOutbox
+from .message_dedup import MessageDedupCache
 
 
 class MessagePriority(Enum):
@@ -51,6 +58,30 @@ class BotType(Enum):
     TEST = "test"                      # 테스트 메시지
 
 
+# 리더 워커의 아웃박스 주기적 복구 간격 (초) - 실행 중 종료된 다른 워커가 남긴 메시지 재개
+OUTBOX_RECOVERY_INTERVAL = 60.0
+
+# 이 프로세스에서 실행 중인 전송자 (리더 승계 시 즉시 복구 요청용)
+_active_senders = weakref.WeakSet()
+
+# 프로세스 공유 전송자 (get_webhook_sender)
+_shared_sender: Optional['DoorayWebhookSender'] = None
+_shared_sender_lock = threading.Lock()
+
+
+# BOT 타입별 중복 판정 창 (초) - 같은 내용의 알림은 이 시간 동안 다시 보내지 않음
+DEFAULT_DEDUP_WINDOWS: Dict[BotType, float] = {
+    BotType.NEWS_COMPARISON: 1800,
+    BotType.NEWS_DELAY: 3600,
+    BotType.NEWS_REPORT: 6 * 3600,
+    BotType.NEWS_STATUS: 1800,
+    BotType.NEWS_NO_DATA: 3600,
+    BotType.WATCHHAMSTER_ERROR: 600,      # 오류는 계속되면 10분 후 다시 알림
+    BotType.WATCHHAMSTER_STATUS: 1800,
+    BotType.TEST: 60
+}
+
+
 class WebhookEndpoint(Enum):
     """웹훅 엔드포인트"""
     NEWS_MAIN = "news_main"            # 뉴스 메인 채널
@@ -83,6 +114,25 @@ class WebhookMessage:
     def __lt__(self, other):
         """우선순위 큐를 위한 비교 연산자"""
         return self.priority.value < other.priority.value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """아웃박스 저장용 직렬화"""
+        data = asdict(self)
+        data['bot_type'] = self.bot_type.value
+        data['priority'] = self.priority.name
+        data['endpoint'] = self.endpoint.value
+        data['timestamp'] = self.timestamp.isoformat()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WebhookMessage':
+        """아웃박스 저장 데이터로부터 복원"""
+        data = dict(data)
+        data['bot_type'] = BotType(data['bot_type'])
+        data['priority'] = MessagePriority[data['priority']]
+        data['endpoint'] = WebhookEndpoint(data['endpoint'])
+        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+        return cls(**data)
 
 
 @dataclass
@@ -105,12 +155,25 @@ class DoorayWebhookSender:
     기존 WatchHamster_Project의 웹훅 전송 로직을 완전히 이식한 시스템입니다.
     """
     
-    def __init__(self, test_mode: bool = False):
+    def __init__(self, test_mode: bool = False,
+                 workers_per_endpoint: Union[int, Dict[WebhookEndpoint, int]] = 2,
+                 outbox: Optional[WebhookOutbox] = None,
+                 durable: bool = True,
+                 dedup_windows: Optional[Dict[BotType, float]] = None,
+                 dedup_max_entries: int = 1000,
+                 recover_backlog: Optional[bool] = None):
         """
         웹훅 전송자 초기화
         
         Args:
             test_mode (bool): 테스트 모드 활성화 여부
+            workers_per_endpoint: 엔드포인트별 동시 전송 작업자 수
+            outbox: 메시지 선기록 아웃박스 (None이면 기본 데이터베이스 사용)
+            durable (bool): False면 아웃박스 없이 메모리에서만 처리
+            dedup_windows: BOT 타입별 중복 판정 창 (초, 기본값 DEFAULT_DEDUP_WINDOWS 덮어쓰기)
+            dedup_max_entries: 중복 방지 저장소 최대 항목 수
+            recover_backlog: 시작 시 아웃박스 미전송분 재개 여부 (None이면 리더 워커만)
+                이후에도 리더인 동안 OUTBOX_RECOVERY_INTERVAL마다 다시 복구
         """
         self.logger = logging.getLogger(__name__)
         self.test_mode = test_mode
@@ -137,12 +200,15 @@ class DoorayWebhookSender:
             BotType.TEST: WebhookEndpoint.TEST
         }
         
-        # 메시지 큐 시스템
-        self.message_queue = PriorityQueue()
-        self.processing_queue = Queue()
+        # 실패 메시지 보관 (현재 실행분, 영구 기록은 아웃박스)
         self.failed_messages = []
         
-        # 전송 통계
+        # 미전송 메시지 선기록 아웃박스
+        self.outbox = outbox
+        if self.outbox is None and durable:
+            self.outbox = self._create_default_outbox()
+        
+        # 전송 통계 (아웃박스가 없을 때만 사용, 있으면 아웃박스 테이블에서 집계)
         self.send_statistics = {
             'total_sent': 0,
             'successful_sends': 0,
@@ -152,72 +218,94 @@ class DoorayWebhookSender:
             'average_response_time': 0.0
         }
         
-        # 중복 방지를 위한 메시지 해시 캐시
-        self.message_hash_cache = set()
-        self.cache_cleanup_interval = 3600  # 1시간마다 캐시 정리
-        self.last_cache_cleanup = datetime.now()
-        
-        # 전송 제어
+        # 중복 방지를 위한 시간 창 기반 메시지 해시 저장소
+        self.dedup_windows = {**DEFAULT_DEDUP_WINDOWS, **(dedup_windows or {})}
+        self.dedup_cache = MessageDedupCache(max_entries=dedup_max_entries)
+        
+        # 아웃박스 미전송분 복구는 리더 워커만 (점유자가 종료되었거나 점유 기간이 만료된 메시지만 되돌림)
+        if recover_backlog is None:
+            recover_backlog = self._is_leader_process()
+        
+        # 엔드포인트별 비동기 작업자 풀 (전용 이벤트 루프 스레드, 첫 메시지 투입 시 시작)
+        self._dispatcher_lock = threading.Lock()
+        self.dispatcher = AsyncWebhookDispatcher(
+            send_func=self._send_single_message,
+            endpoints=list(WebhookEndpoint),
+            workers_per_endpoint=workers_per_endpoint,
+            retry_delay_func=self._get_retry_delay,
+            on_retry=self._on_message_retry,
+            on_final_failure=self._on_message_failed,
+            outbox=self.outbox,
+            recover_on_start=recover_backlog,
+            recovery_interval=OUTBOX_RECOVERY_INTERVAL,
+            should_recover=self._is_leader_process
+        )
         self.is_running = True
-        self.send_lock = threading.Lock()
-        self.queue_processor_thread = None
-        
-        # 큐 처리 스레드 시작
-        self._start_queue_processor()
+        _active_senders.add(self)
         
         self.logger.info("Dooray 웹훅 전송 시스템 초기화 완료")
     
-    def _start_queue_processor(self):
-        """큐 처리 스레드 시작"""
-        self.queue_processor_thread = threading.Thread(
-            target=self._process_message_queue,
-            daemon=True
-        )
-        self.queue_processor_thread.start()
-        self.logger.info("메시지 큐 처리 스레드 시작됨")
+    def start(self):
+        """디스패처를 한 번만 시작 (첫 메시지 투입 시 자동 호출, 메시지를 보내지 않는 인스턴스는 스레드를 만들지 않음)"""
+        if self.dispatcher.is_running:
+            return
+        with self._dispatcher_lock:
+            if not self.dispatcher.is_running and self.is_running:
+                self.dispatcher.start()
     
-    def _process_message_queue(self):
-        """메시지 큐 처리 (백그라운드 스레드)"""
-        while self.is_running:
-            try:
-                # 우선순위 큐에서 메시지 가져오기 (타임아웃 1초)
-                if not self.message_queue.empty():
-                    message = self.message_queue.get(timeout=1)
-                    
-                    # 메시지 전송 시도
-                    result = self._send_single_message(message)
-                    
-                    # 전송 실패 시 재시도 처리
-                    if not result.success and message.retry_count < message.max_retries:
-                        message.retry_count += 1
-                        self.send_statistics['retry_attempts'] += 1
-                        
-                        # 테스트 모드에서는 재시도 지연 단축
-                        if self.test_mode:
-                            retry_delay = min(0.5 * (2 ** message.retry_count), 2)  # 최대 2초
-                        else:
-                            retry_delay = min(2 ** message.retry_count, 60)  # 최대 60초
-                        
-                        time.sleep(retry_delay)
-                        
-                        # 다시 큐에 추가
-                        self.message_queue.put(message)
-                        self.logger.warning(f"메시지 재시도 예약: {message.id} (시도 {message.retry_count}/{message.max_retries})")
-                    elif not result.success:
-                        # 최대 재시도 횟수 초과
-                        self.failed_messages.append((message, result))
-                        self.logger.error(f"메시지 전송 최종 실패: {message.id}")
-                    
-                    self.message_queue.task_done()
-                else:
-                    # 큐가 비어있으면 잠시 대기 (테스트 모드에서는 더 짧게)
-                    sleep_time = 0.05 if self.test_mode else 0.1
-                    time.sleep(sleep_time)
-                    
-            except Exception as e:
-                self.logger.error(f"큐 처리 중 오류: {e}")
-                sleep_time = 0.1 if self.test_mode else 1
-                time.sleep(sleep_time)
+    def _is_leader_process(self) -> bool:
+        """리더 워커 여부 (리더 선출을 사용할 수 없으면 단일 워커로 간주)"""
+        try:
+            return is_leader_process()
+        except Exception as e:
+            self.logger.warning(f"리더 선출 확인 실패, 단일 워커로 동작합니다: {e}")
+            return True
+    
+    def _create_default_outbox(self) -> Optional[WebhookOutbox]:
+        """기본 데이터베이스의 아웃박스 생성 (사용 불가 시 메모리 전용으로 동작)"""
+        try:
+            from database import get_db
+            return WebhookOutbox(get_db(), decode=WebhookMessage.from_dict)
+        except Exception as e:
+            self.logger.warning(f"웹훅 아웃박스 사용 불가, 메모리 큐로만 동작합니다: {e}")
+            return None
+    
+    def _record_send(self, success: bool, processing_time: Optional[float] = None):
+        """메모리 전송 통계 갱신 (아웃박스가 없을 때만)"""
+        if self.outbox is not None:
+            return
+        
+        self.send_statistics['total_sent'] += 1
+        if not success:
+            self.send_statistics['failed_sends'] += 1
+            return
+        
+        self.send_statistics['successful_sends'] += 1
+        self.send_statistics['last_send_time'] = datetime.now()
+        
+        # 평균 응답 시간 업데이트
+        if self.send_statistics['average_response_time'] == 0:
+            self.send_statistics['average_response_time'] = processing_time
+        else:
+            self.send_statistics['average_response_time'] = (
+                self.send_statistics['average_response_time'] * 0.9 + processing_time * 0.1
+            )
+    
+    def _get_retry_delay(self, message: WebhookMessage) -> float:
+        """재시도 지연 시간 계산 (지수 백오프)"""
+        # 테스트 모드에서는 재시도 지연 단축
+        if self.test_mode:
+            return min(0.5 * (2 ** message.retry_count), 2)  # 최대 2초
+        return min(2 ** message.retry_count, 60)  # 최대 60초
+    
+    def _on_message_retry(self, message: WebhookMessage, result: Optional[WebhookSendResult]):
+        """재시도 예약 시 통계 갱신"""
+        if self.outbox is None:
+            self.send_statistics['retry_attempts'] += 1
+    
+    def _on_message_failed(self, message: WebhookMessage, result: Optional[WebhookSendResult]):
+        """최대 재시도 초과 메시지 보관"""
+        self.failed_messages.append((message, result))
     
     def generate_dynamic_alert_message(self, data: Dict[str, Any], 
                                      message_type: str = "news_alert") -> str:
@@ -562,22 +650,22 @@ class DoorayWebhookSender:
     def _enqueue_message(self, message: WebhookMessage) -> str:
         """메시지를 큐에 추가"""
         try:
-            # 중복 메시지 확인
+            # 중복 메시지 확인 (BOT 타입별 시간 창)
             message_hash = self._generate_message_hash(message)
-            if message_hash in self.message_hash_cache:
+            if self.dedup_cache.check_and_add(message_hash, self.dedup_windows.get(message.bot_type)):
                 self.logger.warning(f"중복 메시지 감지, 전송 건너뜀: {message.id}")
                 return None
             
-            # 캐시에 추가
-            self.message_hash_cache.add(message_hash)
-            
             # 큐에 추가
-            self.message_queue.put(message)
+            try:
+                self.start()
+                self.dispatcher.submit(message)
+            except Exception:
+                # 투입되지 못한 메시지는 다시 보낼 수 있도록 해시 제거
+                self.dedup_cache.discard(message_hash)
+                raise
             self.logger.info(f"메시지 큐에 추가됨: {message.id} (우선순위: {message.priority.name})")
             
-            # 캐시 정리 (필요시)
-            self._cleanup_cache_if_needed()
-            
             return message.id
             
         except Exception as e:
@@ -589,21 +677,8 @@ class DoorayWebhookSender:
         hash_content = f"{message.bot_type.value}_{message.title}_{message.content[:100]}"
         return hashlib.md5(hash_content.encode()).hexdigest()
     
-    def _cleanup_cache_if_needed(self):
-        """필요시 캐시 정리"""
-        current_time = datetime.now()
-        if (current_time - self.last_cache_cleanup).total_seconds() >= self.cache_cleanup_interval:
-            # 캐시 크기 제한 (최대 1000개)
-            if len(self.message_hash_cache) > 1000:
-                # 오래된 해시들 제거 (간단히 절반 제거)
-                cache_list = list(self.message_hash_cache)
-                self.message_hash_cache = set(cache_list[len(cache_list)//2:])
-                self.logger.info(f"메시지 해시 캐시 정리 완료: {len(self.message_hash_cache)}개 유지")
-            
-            self.last_cache_cleanup = current_time
-    
-    def _send_single_message(self, message: WebhookMessage) -> WebhookSendResult:
-        """단일 메시지 전송"""
+    async def _send_single_message(self, message: WebhookMessage, client: httpx.AsyncClient) -> WebhookSendResult:
+        """단일 메시지 전송 (디스패처 작업자에서 호출)"""
         start_time = time.time()
         
         try:
@@ -632,31 +707,19 @@ class DoorayWebhookSender:
                 }]
             }
             
-            # HTTP 요청 전송
-            with self.send_lock:
-                response = requests.post(
-                    webhook_url,
-                    json=payload,
-                    headers={'Content-Type': 'application/json'},
-                    timeout=10
-                )
+            # HTTP 요청 전송 (공유 연결 풀 사용)
+            response = await client.post(
+                webhook_url,
+                json=payload,
+                headers={'Content-Type': 'application/json'}
+            )
             
             processing_time = time.time() - start_time
             
             # 응답 처리
             if response.status_code == 200:
                 # 전송 성공
-                self.send_statistics['successful_sends'] += 1
-                self.send_statistics['total_sent'] += 1
-                self.send_statistics['last_send_time'] = datetime.now()
-                
-                # 평균 응답 시간 업데이트
-                if self.send_statistics['average_response_time'] == 0:
-                    self.send_statistics['average_response_time'] = processing_time
-                else:
-                    self.send_statistics['average_response_time'] = (
-                        self.send_statistics['average_response_time'] * 0.9 + processing_time * 0.1
-                    )
+                self._record_send(True, processing_time)
                 
                 self.logger.info(f"메시지 전송 성공: {message.id} ({processing_time:.3f}초)")
                 
@@ -672,8 +735,7 @@ class DoorayWebhookSender:
                 )
             else:
                 # 전송 실패
-                self.send_statistics['failed_sends'] += 1
-                self.send_statistics['total_sent'] += 1
+                self._record_send(False)
                 
                 error_msg = f"HTTP {response.status_code}: {response.text}"
                 self.logger.warning(f"메시지 전송 실패: {message.id} - {error_msg}")
@@ -689,11 +751,11 @@ class DoorayWebhookSender:
                     processing_time=processing_time
                 )
                 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             error_msg = "요청 타임아웃"
             self.logger.warning(f"메시지 전송 타임아웃: {message.id}")
             
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             error_msg = "연결 오류"
             self.logger.warning(f"메시지 전송 연결 오류: {message.id}")
             
@@ -702,8 +764,7 @@ class DoorayWebhookSender:
             self.logger.error(f"메시지 전송 중 오류: {message.id} - {e}")
         
         # 오류 발생 시 실패 결과 반환
-        self.send_statistics['failed_sends'] += 1
-        self.send_statistics['total_sent'] += 1
+        self._record_send(False)
         
         return WebhookSendResult(
             success=False,
@@ -716,20 +777,37 @@ class DoorayWebhookSender:
             processing_time=time.time() - start_time
         )
     
+    def _collect_statistics(self) -> Dict[str, Any]:
+        """전송 통계 원본 (아웃박스 테이블 또는 메모리 카운터)"""
+        if self.outbox is None:
+            return self.send_statistics.copy()
+        
+        try:
+            stats = self.outbox.get_stats()
+        except Exception as e:
+            self.logger.error(f"아웃박스 통계 조회 오류: {e}")
+            return self.send_statistics.copy()
+        
+        if stats['last_send_time']:
+            stats['last_send_time'] = datetime.fromisoformat(stats['last_send_time'])
+        return stats
+    
     def get_queue_status(self) -> Dict[str, Any]:
         """큐 상태 조회"""
+        statistics = self._collect_statistics()
         return {
             'timestamp': datetime.now(),
-            'queue_size': self.message_queue.qsize(),
-            'failed_messages_count': len(self.failed_messages),
-            'cache_size': len(self.message_hash_cache),
+            'queue_size': self.dispatcher.qsize(),
+            'failed_messages_count': statistics.get('failed_messages', len(self.failed_messages)),
+            'cache_size': len(self.dedup_cache),
             'is_running': self.is_running,
-            'statistics': self.send_statistics.copy()
+            'dispatcher': self.dispatcher.get_status(),
+            'statistics': statistics
         }
     
     def get_send_statistics(self) -> Dict[str, Any]:
         """전송 통계 조회"""
-        stats = self.send_statistics.copy()
+        stats = self._collect_statistics()
         
         # 성공률 계산
         if stats['total_sent'] > 0:
@@ -743,43 +821,71 @@ class DoorayWebhookSender:
         else:
             stats['failure_rate'] = 0.0
         
+        # 중복 방지 저장소 적중/미적중/제거 통계
+        stats['dedup'] = self.dedup_cache.get_stats()
+        
         return stats
     
     def clear_failed_messages(self):
         """실패한 메시지 목록 정리"""
         cleared_count = len(self.failed_messages)
         self.failed_messages.clear()
+        if self.outbox is not None:
+            try:
+                cleared_count = self.outbox.dismiss_failed()
+            except Exception as e:
+                self.logger.error(f"아웃박스 실패 메시지 정리 오류: {e}")
         self.logger.info(f"실패한 메시지 {cleared_count}개 정리됨")
     
     def shutdown(self, timeout: int = 10):
         """웹훅 전송 시스템 종료"""
         self.logger.info("웹훅 전송 시스템 종료 시작")
         
-        self.is_running = False
+        with self._dispatcher_lock:
+            self.is_running = False
+        _active_senders.discard(self)
         
-        # 큐에 남은 메시지들 처리 대기 (타임아웃 적용)
-        if not self.message_queue.empty():
-            queue_size = self.message_queue.qsize()
+        # 큐에 남은 메시지들 처리 대기 (타임아웃 적용) 후 작업자 종료
+        queue_size = self.dispatcher.qsize()
+        if queue_size:
             self.logger.info(f"큐에 남은 메시지 {queue_size}개 처리 대기 중... (최대 {timeout}초)")
-            
-            # 타임아웃과 함께 큐 처리 대기
-            start_time = time.time()
-            while not self.message_queue.empty() and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
-            
-            if not self.message_queue.empty():
-                remaining = self.message_queue.qsize()
-                self.logger.warning(f"타임아웃으로 인해 {remaining}개 메시지가 처리되지 않고 종료됩니다")
         
-        # 스레드 종료 대기
-        if self.queue_processor_thread and self.queue_processor_thread.is_alive():
-            self.queue_processor_thread.join(timeout=3)
-            if self.queue_processor_thread.is_alive():
-                self.logger.warning("큐 처리 스레드가 정상 종료되지 않았습니다")
+        remaining = self.dispatcher.shutdown(timeout)
+        if remaining:
+            self.logger.warning(f"타임아웃으로 인해 {remaining}개 메시지가 처리되지 않고 종료됩니다")
         
         self.logger.info("웹훅 전송 시스템 종료 완료")
 
 
+def get_webhook_sender() -> DoorayWebhookSender:
+    """
+    프로세스 공유 웹훅 전송자 (아웃박스 사용)
+    
+    요청 처리 중에 전송자를 새로 만들면 인스턴스마다 디스패처 스레드가 생기므로 이 인스턴스를 사용합니다.
+    """
+    global _shared_sender
+    if _shared_sender is None:
+        with _shared_sender_lock:
+            if _shared_sender is None:
+                _shared_sender = DoorayWebhookSender()
+    return _shared_sender
+
+
+def shutdown_webhook_sender(timeout: int = 10):
+    """공유 웹훅 전송자 종료 (앱 종료 시)"""
+    global _shared_sender
+    with _shared_sender_lock:
+        sender, _shared_sender = _shared_sender, None
+    if sender is not None:
+        sender.shutdown(timeout)
+
+
+def request_outbox_recovery():
+    """이 프로세스의 모든 전송자에 아웃박스 복구 요청 (리더를 이어받았을 때 주기를 기다리지 않도록)"""
+    for sender in list(_active_senders):
+        sender.dispatcher.request_recovery()
+
+
 # 편의를 위한 별칭
 WebhookSender = DoorayWebhookSender
 
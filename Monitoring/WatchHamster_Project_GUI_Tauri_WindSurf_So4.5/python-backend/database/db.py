@@ -4,6 +4,8 @@ SQLite 데이터베이스 관리
 
 import sqlite3
 import json
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Any
@@ -13,24 +15,86 @@ logger = logging.getLogger(__name__)
 
 
 class Database:
-    """SQLite 데이터베이스 클래스"""
+    """
+    SQLite 데이터베이스 클래스
     
-    def __init__(self, db_path: str = "watchhamster.db"):
+    스레드별로 장기 연결을 하나씩 유지해 재사용합니다 (호출마다 연결을 열고 닫지 않음).
+    연결이 유지되므로 sqlite3 문장 캐시(prepared statement)도 호출 간에 재사용되며,
+    WAL 모드로 읽기와 쓰기가 서로를 막지 않습니다.
+    """
+    
+    # 웹훅 로그 일괄 기록 기본값
+    WEBHOOK_LOG_BATCH_SIZE = 50
+    WEBHOOK_LOG_FLUSH_INTERVAL = 0.5  # 초
+    
+    def __init__(
+        self,
+        db_path: str = "watchhamster.db",
+        synchronous: str = "NORMAL",
+        log_batch_size: int = WEBHOOK_LOG_BATCH_SIZE,
+        log_flush_interval: float = WEBHOOK_LOG_FLUSH_INTERVAL
+    ):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            synchronous: PRAGMA synchronous 값 (WAL에서는 NORMAL로도 커밋 일관성 유지)
+            log_batch_size: 버퍼링된 웹훅 로그를 즉시 기록하는 건수
+            log_flush_interval: 버퍼링된 웹훅 로그 최대 지연 시간 (초)
+        """
         self.db_path = Path(db_path)
-        self.conn: Optional[sqlite3.Connection] = None
+        self.synchronous = synchronous
+        self.log_batch_size = log_batch_size
+        self.log_flush_interval = log_flush_interval
+        
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        
+        # 웹훅 로그 쓰기 버퍼 (백그라운드 기록 스레드가 executemany로 일괄 기록)
+        self._log_buffer: List[Dict[str, Any]] = []
+        self._log_condition = threading.Condition()
+        self._log_write_lock = threading.Lock()
+        self._log_writer: Optional[threading.Thread] = None
+        
         self.init_database()
     
-    def connect(self):
-        """데이터베이스 연결"""
-        self.conn = sqlite3.connect(str(self.db_path))
-        self.conn.row_factory = sqlite3.Row
-        return self.conn
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """현재 스레드의 연결 (없으면 None)"""
+        return getattr(self._local, 'conn', None)
+    
+    def connect(self) -> sqlite3.Connection:
+        """현재 스레드의 재사용 연결 반환 (최초 호출 시 생성)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # 연결은 생성한 스레드에서만 사용하고, close_all()만 다른 스레드에서 닫음
+            conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -8000")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
     
     def close(self):
-        """데이터베이스 연결 종료"""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """호출 단위 정리 (연결은 재사용을 위해 유지하고 끝나지 않은 트랜잭션만 롤백)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and conn.in_transaction:
+            conn.rollback()
+    
+    def close_all(self):
+        """버퍼링된 로그를 기록하고 모든 스레드의 연결 종료 (애플리케이션 종료 시)"""
+        self.flush_webhook_logs()
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
     
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
@@ -38,6 +102,9 @@ class Database:
         cursor = conn.cursor()
         
         try:
+            # WAL 모드는 데이터베이스 파일에 유지되므로 초기화 시 한 번 설정
+            cursor.execute("PRAGMA journal_mode = WAL")
+            
             # 회사 테이블
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS companies (
@@ -102,10 +169,40 @@ class Database:
                 )
             """)
             
+            # 웹훅 아웃박스 테이블 (전송 전 선기록, 재시작 시 미전송분 재개)
+            # status: pending(대기) → claimed(작업자 점유) → sent / failed / dismissed
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS webhook_outbox (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id TEXT NOT NULL UNIQUE,
+                    company_id TEXT NOT NULL DEFAULT 'posco',
+                    endpoint TEXT NOT NULL,
+                    bot_type TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    claimed_by TEXT,
+                    claimed_at TIMESTAMP,
+                    completed_at TIMESTAMP,
+                    response_time REAL,
+                    error_message TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
             # 인덱스 생성
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_webhook_logs_company ON webhook_logs(company_id)")
+            # 회사/유형별 최신순 조회와 상태 집계를 테이블 접근 없이 처리하는 커버링 인덱스
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_webhook_logs_company_type_time
+                ON webhook_logs(company_id, message_type, timestamp DESC, status)
+            """)
+            # 회사별 최신순 조회 (유형 미지정), 기존 company 단일 인덱스를 대체
+            cursor.execute("DROP INDEX IF EXISTS idx_webhook_logs_company")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_webhook_logs_company_time ON webhook_logs(company_id, timestamp DESC)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_webhook_logs_timestamp ON webhook_logs(timestamp)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_webhook_logs_status ON webhook_logs(status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_webhook_outbox_claim ON webhook_outbox(status, endpoint, priority, seq)")
             
             conn.commit()
             logger.info("데이터베이스 초기화 완료")
@@ -356,30 +453,37 @@ class Database:
     
     # ========== 웹훅 로그 관리 ==========
     
+    _WEBHOOK_LOG_INSERT = """
+        INSERT INTO webhook_logs 
+        (id, company_id, message_type, bot_type, priority, endpoint, 
+         status, message_id, error_message, full_message, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _webhook_log_row(log_data: Dict[str, Any]) -> tuple:
+        """웹훅 로그 INSERT 파라미터"""
+        return (
+            log_data['id'],
+            log_data['company_id'],
+            log_data['message_type'],
+            log_data['bot_type'],
+            log_data['priority'],
+            log_data['endpoint'],
+            log_data['status'],
+            log_data.get('message_id'),
+            log_data.get('error_message'),
+            log_data.get('full_message'),
+            json.dumps(log_data.get('metadata', {}))
+        )
+    
     def create_webhook_log(self, log_data: Dict[str, Any]) -> str:
         """웹훅 로그 생성"""
         conn = self.connect()
         cursor = conn.cursor()
         
         try:
-            cursor.execute("""
-                INSERT INTO webhook_logs 
-                (id, company_id, message_type, bot_type, priority, endpoint, 
-                 status, message_id, error_message, full_message, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                log_data['id'],
-                log_data['company_id'],
-                log_data['message_type'],
-                log_data['bot_type'],
-                log_data['priority'],
-                log_data['endpoint'],
-                log_data['status'],
-                log_data.get('message_id'),
-                log_data.get('error_message'),
-                log_data.get('full_message'),
-                json.dumps(log_data.get('metadata', {}))
-            ))
+            cursor.execute(self._WEBHOOK_LOG_INSERT, self._webhook_log_row(log_data))
             
             conn.commit()
             return log_data['id']
@@ -391,6 +495,112 @@ class Database:
         finally:
             self.close()
     
+    def create_webhook_logs(self, logs: List[Dict[str, Any]]) -> int:
+        """
+        웹훅 로그 일괄 생성 (단일 트랜잭션 executemany)
+        
+        ID 중복 등으로 일괄 기록이 실패하면 건별로 다시 기록하여 나머지는 보존합니다.
+        
+        Returns:
+            int: 기록된 로그 수
+        """
+        if not logs:
+            return 0
+        
+        conn = self.connect()
+        
+        try:
+            conn.executemany(self._WEBHOOK_LOG_INSERT, [self._webhook_log_row(log) for log in logs])
+            conn.commit()
+            return len(logs)
+            
+        except sqlite3.IntegrityError:
+            conn.rollback()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"웹훅 로그 일괄 생성 실패: {e}")
+            raise
+        finally:
+            self.close()
+        
+        written = 0
+        for log in logs:
+            try:
+                self.create_webhook_log(log)
+                written += 1
+            except sqlite3.IntegrityError:
+                logger.warning(f"중복 웹훅 로그 건너뜀: {log['id']}")
+        return written
+    
+    def queue_webhook_log(self, log_data: Dict[str, Any]) -> str:
+        """
+        웹훅 로그를 쓰기 버퍼에 추가 (배치 크기 또는 지연 시간 도달 시 일괄 기록)
+        
+        로그 조회/통계는 먼저 버퍼를 기록하므로 방금 추가한 로그도 조회됩니다.
+        """
+        with self._log_condition:
+            self._log_buffer.append(log_data)
+            if self._log_writer is None or not self._log_writer.is_alive():
+                self._log_writer = threading.Thread(
+                    target=self._webhook_log_writer_loop, name="webhook-log-writer", daemon=True
+                )
+                self._log_writer.start()
+            self._log_condition.notify()
+        return log_data['id']
+    
+    def flush_webhook_logs(self) -> int:
+        """버퍼링된 웹훅 로그를 즉시 기록"""
+        with self._log_write_lock:
+            with self._log_condition:
+                pending, self._log_buffer = self._log_buffer, []
+            return self._write_buffered_logs(pending)
+    
+    def _write_buffered_logs(self, pending: List[Dict[str, Any]]) -> int:
+        try:
+            return self.create_webhook_logs(pending)
+        except Exception as e:
+            logger.error(f"버퍼링된 웹훅 로그 {len(pending)}건 기록 실패: {e}")
+            return 0
+    
+    def _webhook_log_writer_loop(self):
+        """버퍼가 배치 크기에 도달하거나 지연 시간이 지나면 일괄 기록"""
+        while True:
+            with self._log_condition:
+                while not self._log_buffer:
+                    self._log_condition.wait()
+                deadline = time.monotonic() + self.log_flush_interval
+                while len(self._log_buffer) < self.log_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._log_condition.wait(remaining)
+            self.flush_webhook_logs()
+    
+    def update_webhook_log_status(self, message_id: str, status: str,
+                                  error_message: Optional[str] = None) -> int:
+        """
+        메시지의 웹훅 로그 상태 갱신 (전송 완료 시 pending → success/failed)
+        
+        버퍼에 남은 로그를 먼저 기록하므로 방금 투입한 메시지도 갱신됩니다.
+        
+        Returns:
+            int: 갱신된 로그 수
+        """
+        self.flush_webhook_logs()
+        conn = self.connect()
+        
+        try:
+            cursor = conn.execute("""
+                UPDATE webhook_logs
+                SET status = ?, error_message = COALESCE(?, error_message)
+                WHERE message_id = ?
+            """, (status, error_message, message_id))
+            conn.commit()
+            return cursor.rowcount
+            
+        finally:
+            self.close()
+    
     def get_webhook_logs(
         self, 
         company_id: Optional[str] = None,
@@ -398,6 +608,7 @@ class Database:
         message_type: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """웹훅 로그 조회"""
+        self.flush_webhook_logs()
         conn = self.connect()
         cursor = conn.cursor()
         
@@ -431,18 +642,34 @@ class Database:
             self.close()
     
     def get_webhook_stats(self, company_id: Optional[str] = None) -> Dict[str, Any]:
-        """웹훅 통계 조회"""
+        """웹훅 통계 조회 (웹훅 로그 + 아웃박스 전송 완료분)"""
+        self.flush_webhook_logs()
         conn = self.connect()
         cursor = conn.cursor()
         
         try:
+            # 아웃박스를 거친 메시지는 아웃박스 행으로만 집계하고 (같은 message_id의 로그는 제외),
+            # 아웃박스를 거치지 않은 로그는 전송 결과가 확정된 것만 집계 (pending 제외)
             query = """
                 SELECT 
                     COUNT(*) as total_sent,
                     SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as successful_sends,
                     SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed_sends,
+                    SUM(retries) as retry_attempts,
+                    AVG(response_time) as average_response_time,
                     MAX(timestamp) as last_send_time
-                FROM webhook_logs
+                FROM (
+                    SELECT company_id, status, timestamp, 0 as retries, NULL as response_time
+                    FROM webhook_logs
+                    WHERE status IN ('success', 'failed')
+                      AND NOT EXISTS (SELECT 1 FROM webhook_outbox o WHERE o.id = webhook_logs.message_id)
+                    UNION ALL
+                    SELECT company_id,
+                           CASE WHEN status = 'sent' THEN 'success' ELSE 'failed' END,
+                           completed_at, MAX(attempts - 1, 0), response_time
+                    FROM webhook_outbox
+                    WHERE status IN ('sent', 'failed', 'dismissed')
+                )
             """
             
             params = []
@@ -457,8 +684,8 @@ class Database:
                 'total_sent': row['total_sent'] or 0,
                 'successful_sends': row['successful_sends'] or 0,
                 'failed_sends': row['failed_sends'] or 0,
-                'retry_attempts': 0,
-                'average_response_time': 0.0,
+                'retry_attempts': row['retry_attempts'] or 0,
+                'average_response_time': row['average_response_time'] or 0.0,
                 'last_send_time': row['last_send_time']
             }
             
@@ -467,6 +694,7 @@ class Database:
     
     def delete_all_logs(self, company_id: Optional[str] = None) -> int:
         """로그 삭제"""
+        self.flush_webhook_logs()
         conn = self.connect()
         cursor = conn.cursor()
         
@@ -486,6 +714,272 @@ class Database:
         finally:
             self.close()
 
+    
+    # ========== 웹훅 아웃박스 ==========
+    # 디스패처 스레드에서도 호출되며, 각 스레드는 자신의 연결을 사용
+    
+    def enqueue_outbox_message(self, entry: Dict[str, Any]) -> int:
+        """아웃박스에 메시지 선기록 (단일 INSERT)"""
+        conn = self.connect()
+        
+        try:
+            cursor = conn.execute("""
+                INSERT INTO webhook_outbox 
+                (id, company_id, endpoint, bot_type, priority, payload, status, claimed_by, claimed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                entry['id'],
+                entry.get('company_id', 'posco'),
+                entry['endpoint'],
+                entry['bot_type'],
+                entry['priority'],
+                json.dumps(entry['payload'], ensure_ascii=False),
+                entry.get('status', 'pending'),
+                entry.get('claimed_by'),
+                datetime.now().isoformat() if entry.get('claimed_by') else None
+            ))
+            conn.commit()
+            return cursor.lastrowid
+            
+        except sqlite3.IntegrityError:
+            raise ValueError(f"아웃박스 메시지 ID '{entry['id']}'가 이미 존재합니다")
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"아웃박스 기록 실패: {e}")
+            raise
+        finally:
+            self.close()
+    
+    def claim_outbox_messages(self, endpoint: str, limit: int, claimed_by: str) -> List[Dict[str, Any]]:
+        """대기 메시지를 우선순위 순으로 일괄 점유"""
+        conn = self.connect()
+        
+        try:
+            # 쓰기 잠금을 먼저 잡아 다른 작업자와 같은 행을 점유하지 않도록 함
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute("""
+                SELECT * FROM webhook_outbox
+                WHERE status = 'pending' AND endpoint = ?
+                ORDER BY priority, seq
+                LIMIT ?
+            """, (endpoint, limit)).fetchall()
+            
+            if rows:
+                conn.executemany("""
+                    UPDATE webhook_outbox SET status = 'claimed', claimed_by = ?, claimed_at = ?
+                    WHERE seq = ?
+                """, [(claimed_by, datetime.now().isoformat(), row['seq']) for row in rows])
+            conn.commit()
+            
+            claimed = []
+            for row in rows:
+                entry = dict(row)
+                entry['payload'] = json.loads(entry['payload'])
+                claimed.append(entry)
+            return claimed
+            
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"아웃박스 점유 실패: {e}")
+            raise
+        finally:
+            self.close()
+    
+    def mark_outbox_retry(self, message_id: str, attempts: int, error_message: Optional[str] = None) -> bool:
+        """재시도 예약 시 시도 횟수 갱신 (점유 상태 유지)"""
+        conn = self.connect()
+        
+        try:
+            # 점유 시각도 갱신 (재시도 중인 메시지의 점유 기간 연장)
+            cursor = conn.execute("""
+                UPDATE webhook_outbox SET attempts = ?, error_message = ?, claimed_at = ?
+                WHERE id = ?
+            """, (attempts, error_message, datetime.now().isoformat(), message_id))
+            conn.commit()
+            return cursor.rowcount > 0
+            
+        finally:
+            self.close()
+    
+    def complete_outbox_message(
+        self,
+        message_id: str,
+        success: bool,
+        attempts: int,
+        response_time: Optional[float] = None,
+        error_message: Optional[str] = None
+    ) -> bool:
+        """전송 완료 처리 (sent 또는 failed)"""
+        conn = self.connect()
+        
+        try:
+            cursor = conn.execute("""
+                UPDATE webhook_outbox 
+                SET status = ?, attempts = ?, response_time = ?, error_message = ?,
+                    completed_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, ('sent' if success else 'failed', attempts, response_time, error_message, message_id))
+            conn.commit()
+            completed = cursor.rowcount > 0
+            
+        finally:
+            self.close()
+        
+        # 같은 메시지의 웹훅 로그도 실제 전송 결과로 갱신
+        if completed:
+            self.update_webhook_log_status(message_id, 'success' if success else 'failed', error_message)
+        return completed
+    
+    def get_outbox_claim_owners(self, endpoints: Optional[List[str]] = None) -> List[str]:
+        """점유 중인 메시지의 점유자 목록"""
+        conn = self.connect()
+        
+        try:
+            condition = ""
+            params: List[Any] = []
+            if endpoints is not None:
+                condition = f" AND endpoint IN ({', '.join('?' * len(endpoints))})"
+                params = list(endpoints)
+            
+            rows = conn.execute(
+                "SELECT DISTINCT claimed_by FROM webhook_outbox "
+                "WHERE status = 'claimed' AND claimed_by IS NOT NULL" + condition, params
+            ).fetchall()
+            return [row['claimed_by'] for row in rows]
+            
+        finally:
+            self.close()
+    
+    def release_outbox_claims(self, endpoints: Optional[List[str]] = None,
+                              dead_owners: Optional[List[str]] = None,
+                              expired_before: Optional[str] = None,
+                              live_owners: Optional[List[str]] = None) -> int:
+        """
+        점유된 채 남은 메시지를 대기 상태로 되돌림 (복구용)
+        
+        점유자가 없거나 종료된 행, 또는 살아 있는 점유자가 아니면서 점유 기간이 만료된 행만 되돌립니다.
+        다른 작업자가 전송 중인 메시지를 되돌려 중복 전송하지 않도록 합니다.
+        
+        Args:
+            endpoints: 대상 엔드포인트 (None이면 전체)
+            dead_owners: 종료된 것으로 확인된 점유자
+            expired_before: 이 시각(ISO) 이전에 점유된 행은 점유 기간 만료로 간주
+            live_owners: 살아 있는 것으로 확인된 점유자 (점유 기간과 관계없이 유지)
+        
+        Returns:
+            int: 재개 대상 대기 메시지 수
+        """
+        conn = self.connect()
+        
+        try:
+            condition = ""
+            params: List[Any] = []
+            if endpoints is not None:
+                condition = f" AND endpoint IN ({', '.join('?' * len(endpoints))})"
+                params = list(endpoints)
+            
+            release_conditions = ["claimed_by IS NULL"]
+            release_params: List[Any] = []
+            if dead_owners:
+                release_conditions.append(f"claimed_by IN ({', '.join('?' * len(dead_owners))})")
+                release_params.extend(dead_owners)
+            if expired_before is not None:
+                expired = "claimed_at IS NULL OR claimed_at < ?"
+                release_params.append(expired_before)
+                if live_owners:
+                    expired = f"({expired}) AND claimed_by NOT IN ({', '.join('?' * len(live_owners))})"
+                    release_params.extend(live_owners)
+                release_conditions.append(f"({expired})")
+            
+            conn.execute(
+                "UPDATE webhook_outbox SET status = 'pending', claimed_by = NULL, claimed_at = NULL "
+                "WHERE status = 'claimed'" + condition + f" AND ({' OR '.join(release_conditions)})",
+                params + release_params
+            )
+            row = conn.execute(
+                "SELECT COUNT(*) as pending FROM webhook_outbox WHERE status = 'pending'" + condition, params
+            ).fetchone()
+            conn.commit()
+            return row['pending']
+            
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"아웃박스 복구 실패: {e}")
+            raise
+        finally:
+            self.close()
+    
+    def get_outbox_messages(self, status: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """상태별 아웃박스 메시지 조회 (최신순)"""
+        conn = self.connect()
+        
+        try:
+            rows = conn.execute("""
+                SELECT * FROM webhook_outbox WHERE status = ?
+                ORDER BY seq DESC LIMIT ?
+            """, (status, limit)).fetchall()
+            
+            messages = []
+            for row in rows:
+                entry = dict(row)
+                entry['payload'] = json.loads(entry['payload'])
+                messages.append(entry)
+            return messages
+            
+        finally:
+            self.close()
+    
+    def dismiss_failed_outbox_messages(self) -> int:
+        """최종 실패 메시지를 확인 처리 (통계에는 실패로 유지)"""
+        conn = self.connect()
+        
+        try:
+            cursor = conn.execute("UPDATE webhook_outbox SET status = 'dismissed' WHERE status = 'failed'")
+            conn.commit()
+            return cursor.rowcount
+            
+        finally:
+            self.close()
+    
+    def get_outbox_stats(self, company_id: Optional[str] = None) -> Dict[str, Any]:
+        """아웃박스 기반 전송 통계"""
+        conn = self.connect()
+        
+        try:
+            query = """
+                SELECT
+                    SUM(CASE WHEN status IN ('sent', 'failed', 'dismissed') THEN 1 ELSE 0 END) as total_sent,
+                    SUM(CASE WHEN status = 'sent' THEN 1 ELSE 0 END) as successful_sends,
+                    SUM(CASE WHEN status IN ('failed', 'dismissed') THEN 1 ELSE 0 END) as failed_sends,
+                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed_messages,
+                    SUM(CASE WHEN status IN ('pending', 'claimed') THEN 1 ELSE 0 END) as unsent,
+                    SUM(MAX(attempts - 1, 0)) as retry_attempts,
+                    AVG(CASE WHEN status = 'sent' THEN response_time END) as average_response_time,
+                    MAX(completed_at) as last_send_time
+                FROM webhook_outbox
+            """
+            
+            params = []
+            if company_id:
+                query += " WHERE company_id = ?"
+                params.append(company_id)
+            
+            row = conn.execute(query, params).fetchone()
+            
+            return {
+                'total_sent': row['total_sent'] or 0,
+                'successful_sends': row['successful_sends'] or 0,
+                'failed_sends': row['failed_sends'] or 0,
+                'failed_messages': row['failed_messages'] or 0,
+                'unsent': row['unsent'] or 0,
+                'retry_attempts': row['retry_attempts'] or 0,
+                'average_response_time': row['average_response_time'] or 0.0,
+                'last_send_time': row['last_send_time']
+            }
+            
+        finally:
+            self.close()
+
 
 # 싱글톤 인스턴스
 _db_instance: Optional[Database] = None
@@ -24,8 +24,10 @@ from utils.logger import get_logger
 from utils.middleware import (
     TimingMiddleware,
     SecurityHeadersMiddleware,
-    RequestLoggingMiddleware
+    RequestLoggingMiddleware,
+    RateLimitMiddleware
 )
+from utils.rate_limiter import get_rate_limiter
 
 # 설정 로드
 settings = get_settings()
@@ -188,6 +190,10 @@ app.add_middleware(
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(TimingMiddleware)
 
+# 레이트 리미트 (설정으로 활성화, rate_limit_backend=shared면 워커 간 한도 공유)
+if settings.rate_limit_enabled:
+    app.add_middleware(RateLimitMiddleware, limiter=get_rate_limiter())
+
 # 개발 모드에서만 요청 로깅 활성화
 if settings.debug:
     app.add_middleware(RequestLoggingMiddleware, log_body=True)
@@ -356,13 +362,32 @@ async def start_background_tasks():
         setup_log_streaming()
         logger.info("로그 스트리밍이 설정되었습니다")
         
-        from api.websocket import periodic_status_broadcast, monitor_connection_health
+        # InfoMax 프록시 공유 HTTP 클라이언트 (연결 풀) 생성
+        from core.infomax_proxy_client import get_infomax_proxy_client
+        await get_infomax_proxy_client().start()
+        
+        # 공유 웹훅 전송자 시작 (아웃박스 미전송분 재개는 디스패처 스레드에서 진행)
+        from core.webhook_sender import get_webhook_sender
+        await asyncio.to_thread(lambda: get_webhook_sender().start())
         
-        # WebSocket 주기적 상태 브로드캐스트 태스크 시작
-        status_task = asyncio.create_task(periodic_status_broadcast())
+        from api.websocket import periodic_status_broadcast, monitor_connection_health, relay_shared_updates
+        from core.leader_election import get_leader_election
+        
+        # WebSocket 주기적 상태 브로드캐스트 태스크 시작 (여러 워커 중 리더만 상태 수집)
+        election = get_leader_election()
+        if election.try_acquire():
+            status_task = asyncio.create_task(periodic_status_broadcast())
+        else:
+            logger.info(f"리더 워커가 아니므로 상태 수집은 리더 선출 후 시작합니다 ({election.lock_path})")
+            status_task = asyncio.create_task(run_when_leader(election, periodic_status_broadcast))
         background_tasks.add(status_task)
         status_task.add_done_callback(background_tasks.discard)
         
+        # 워커 간 브로드캐스트 중계 (공유 상태 백엔드가 아니면 바로 종료)
+        relay_task = asyncio.create_task(relay_shared_updates())
+        background_tasks.add(relay_task)
+        relay_task.add_done_callback(background_tasks.discard)
+        
         # WebSocket 연결 상태 모니터링 태스크 시작
         health_task = asyncio.create_task(monitor_connection_health())
         background_tasks.add(health_task)
@@ -374,6 +399,20 @@ async def start_background_tasks():
     except Exception as e:
         logger.error(f"백그라운드 태스크 시작 중 오류: {e}")
 
+async def run_when_leader(election, task_factory):
+    """리더가 된 뒤 태스크 실행 (리더 워커가 종료되면 대기 중인 워커가 이어받음)"""
+    await election.wait_for_leadership()
+    logger.info("리더로 선출되어 상태 수집을 시작합니다")
+    
+    # 이전 리더/종료된 워커가 남긴 웹훅 아웃박스 메시지 즉시 재개
+    try:
+        from core.webhook_sender import request_outbox_recovery
+        request_outbox_recovery()
+    except Exception as e:
+        logger.warning(f"웹훅 아웃박스 복구 요청 실패: {e}")
+    
+    await task_factory()
+
 async def stop_background_tasks():
     """백그라운드 태스크 중지"""
     from utils.logger import get_logger
@@ -410,8 +449,29 @@ async def cleanup_resources():
             except Exception:
                 pass
         
-        manager.active_connections.clear()
-        manager.client_info.clear()
+        manager.shutdown()
+        
+        # 공유 웹훅 전송자 종료 (남은 메시지는 아웃박스에 남아 다음 실행에서 재개)
+        from core.webhook_sender import shutdown_webhook_sender
+        await asyncio.to_thread(shutdown_webhook_sender)
+        
+        # 버퍼링된 웹훅 로그 기록 및 데이터베이스 연결 종료
+        from database import get_db
+        get_db().close_all()
+        
+        # 시스템 메트릭 샘플러 중지
+        from core.metrics_sampler import stop_metrics_sampler
+        stop_metrics_sampler()
+        
+        # InfoMax 프록시 HTTP 클라이언트 종료
+        from core.infomax_proxy_client import close_infomax_proxy_client
+        await close_infomax_proxy_client()
+        
+        # 리더 잠금 해제 및 상태 백엔드 종료
+        from core.leader_election import get_leader_election
+        from core.state_backend import set_state_backend
+        get_leader_election().release()
+        set_state_backend(None)
         
         # 임시 파일 정리 등
         logger.info("리소스 정리 완료")
@@ -442,7 +502,9 @@ def main():
         
         # 개발 모드에서만 자동 리로드 활성화
         if not debug_mode:
-            server_config["workers"] = 1
+            server_config["workers"] = settings.workers
+            if settings.workers > 1 and settings.state_backend == "memory":
+                logger.warning("여러 워커에서 memory 상태 백엔드를 사용하면 워커마다 상태가 달라집니다 (state_backend=sqlite 권장)")
         
         logger.info(f"서버 설정: {server_config}")
         
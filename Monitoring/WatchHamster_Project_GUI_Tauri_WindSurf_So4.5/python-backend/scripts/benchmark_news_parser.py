@@ -0,0 +1,106 @@
+"""
+뉴스 파서 추출 성능 마이크로 벤치마크
+
+번들된 샘플 뉴스(core/POSCO_News_250808/posco_news_250808_historical.json)를 대상으로
+패턴을 하나씩 re.search 하던 기존 방식과 PatternExtractionEngine 단일 패스 방식의
+기사당 처리 시간을 비교합니다.
+
+사용법:
+    python scripts/benchmark_news_parser.py [--rounds 200] [--sample PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.news_parser import NewsDataParser
+
+DEFAULT_SAMPLE = Path(__file__).resolve().parents[4] / "core" / "POSCO_News_250808" / "posco_news_250808_historical.json"
+
+# 샘플 파일이 없을 때 사용할 기본 기사
+FALLBACK_ARTICLES = [
+    ('exchange-rate', '원달러 환율 1,350원 마감 원달러 환율이 전일 대비 5원 상승한 1,350원에 마감했습니다.'),
+    ('newyork-market-watch', '뉴욕증시 상승 마감 다우존스 35,000포인트, 나스닥 14,000포인트로 상승 마감'),
+    ('kospi-close', '코스피 2,500포인트 상승 마감 코스피가 전일 대비 20포인트 상승한 2,500포인트에 마감'),
+]
+
+
+def load_articles(sample_path: Path):
+    """샘플 파일에서 (뉴스 타입, 본문) 목록 로드"""
+    if not sample_path.exists():
+        print(f"⚠️ 샘플 파일 없음, 기본 기사 사용: {sample_path}")
+        return FALLBACK_ARTICLES
+
+    with sample_path.open("r", encoding="utf-8") as fp:
+        data = json.load(fp)
+
+    articles = []
+    for day in data.get("historical_data", {}).values():
+        for news_type, news in day.get("data", {}).items():
+            if isinstance(news, dict) and news.get("title"):
+                articles.append((news_type, f"{news['title']} {news.get('content') or ''}"))
+    return articles or FALLBACK_ARTICLES
+
+
+def legacy_extract(parser: NewsDataParser, text: str):
+    """기존 방식: 필드별로 패턴 문자열을 순서대로 re.search"""
+    hits = {}
+    for field_name, patterns in {**parser.currency_patterns, **parser.index_patterns}.items():
+        for pattern in patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                try:
+                    hits[field_name] = (float(match.group(1).replace(',', '')), match.start())
+                    break
+                except ValueError:
+                    continue
+    return hits
+
+
+def bench(label: str, func, articles, rounds: int):
+    """기사당 평균 처리 시간 측정"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for article in articles:
+            func(article)
+    elapsed = time.perf_counter() - start
+    per_article_us = elapsed / (rounds * len(articles)) * 1_000_000
+    print(f"   - {label:<28} {per_article_us:10.1f} µs/기사  ({rounds * len(articles) / elapsed:,.0f} 기사/초)")
+    return per_article_us
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="뉴스 파서 추출 성능 벤치마크")
+    arg_parser.add_argument("--rounds", type=int, default=200)
+    arg_parser.add_argument("--sample", type=Path, default=DEFAULT_SAMPLE)
+    args = arg_parser.parse_args()
+
+    parser = NewsDataParser()
+    articles = load_articles(args.sample)
+
+    print("⏱️ 뉴스 파서 추출 벤치마크")
+    print("-" * 80)
+    print(f"   기사 수: {len(articles)}개, 반복: {args.rounds}회")
+    print()
+
+    legacy = bench("기존 패턴별 re.search", lambda a: legacy_extract(parser, a[1]), articles, args.rounds)
+    engine = bench("단일 패스 추출 엔진", lambda a: parser.extraction_engine.best_hits(a[1]), articles, args.rounds)
+
+    loop = asyncio.new_event_loop()
+    bench("전문 데이터 파싱 전체",
+          lambda a: loop.run_until_complete(parser._parse_specialized_data(a[0], a[1], '')),
+          articles, max(1, args.rounds // 10))
+    loop.close()
+
+    print()
+    print(f"✅ 추출 속도 향상: {legacy / engine:.2f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+채권 체결정보 스트리밍 내보내기 테스트
+"""
+
+import csv
+import io
+
+import pytest
+
+from core.bond_export import (
+    CSV_ERROR_MARKER,
+    BondExportPipeline,
+    CompiledFilters,
+    ExportFilter,
+    iter_date_pages,
+)
+
+
+class FakeBondApi:
+    """날짜 구간별 mn_hist 행과 stdcd별 basic_info를 돌려주는 업스트림"""
+
+    def __init__(self):
+        self.calls = []
+        self.trades = [
+            {'bonddate': "20240105", 'stdcd': "KR1", 'market': "장내", 'yld': 3.5, 'volume': 100},
+            {'bonddate': "20240105", 'stdcd': "KR1", 'market': "장내", 'yld': 3.5, 'volume': 100},
+            {'bonddate': "20240120", 'stdcd': "KR2", 'market': "장외", 'yld': 4.1, 'volume': 50},
+            {'bonddate': "20240210", 'stdcd': "KR1", 'market': "장외", 'yld': 3.7, 'volume': 70},
+            {'bonddate': "20240215", 'stdcd': "KR3", 'market': "장내", 'yld': 5.0, 'volume': 10},
+        ]
+        self.basic_info = {
+            "KR1": {'stdcd': "KR1", 'bondnm': "포스코 채권", 'compnm': "POSCO"},
+            "KR2": {'stdcd': "KR2", 'bondnm': "국고채", 'compnm': "정부"},
+        }
+
+    async def __call__(self, endpoint, params):
+        self.calls.append((endpoint, dict(params)))
+        if endpoint == "bond/basic_info":
+            info = self.basic_info.get(params['stdcd'])
+            return [info] if info else []
+        return [
+            dict(row) for row in self.trades
+            if params['startDate'] <= row['bonddate'] <= params['endDate']
+        ]
+
+
+def _read_csv(chunks):
+    text = b"".join(chunks).decode("utf-8-sig")
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+class TestBondExportPipeline:
+    """페이지 조회/조인/필터/기록 테스트"""
+
+    @pytest.mark.unit
+    def test_date_pages(self):
+        """기간을 page_days 단위로 분할"""
+        assert list(iter_date_pages("20240101", "20240305", page_days=31)) == [
+            ("20240101", "20240131"), ("20240201", "20240302"), ("20240303", "20240305")
+        ]
+        with pytest.raises(ValueError):
+            list(iter_date_pages("20240201", "20240101"))
+
+    @pytest.mark.unit
+    async def test_keyed_join_and_paging(self):
+        """basic_info는 stdcd 키로 조인되고 종목당 한 번만 조회"""
+        api = FakeBondApi()
+        pipeline = BondExportPipeline(api, "20240101", "20240229", page_days=31,
+                                      columns=['bonddate', 'stdcd', 'bondnm', 'compnm'])
+
+        rows = _read_csv([chunk async for chunk in pipeline.stream_csv()])
+
+        assert [(row['bonddate'], row['stdcd'], row['bondnm']) for row in rows] == [
+            ("20240105", "KR1", "포스코 채권"),
+            ("20240120", "KR2", "국고채"),
+            ("20240210", "KR1", "포스코 채권"),
+            ("20240215", "KR3", ""),
+        ]
+        assert pipeline.stats.pages == 2
+        assert sorted(params['stdcd'] for endpoint, params in api.calls if endpoint == "bond/basic_info") == \
+            ["KR1", "KR2", "KR3"]
+
+    @pytest.mark.unit
+    async def test_filters_and_korean_headers(self):
+        """필터 조건 결합 및 한글 머리글"""
+        api = FakeBondApi()
+        pipeline = BondExportPipeline(
+            api, "20240101", "20240229",
+            filters=[
+                ExportFilter(field='yld', op='range', start="3.6", end="4.5"),
+                ExportFilter(field='compnm', op='contains', value="posco", logic="or"),
+            ],
+            columns=['stdcd', 'yld', 'compnm'],
+            korean_headers=True
+        )
+
+        rows = _read_csv([chunk async for chunk in pipeline.stream_csv()])
+
+        assert list(rows[0]) == ["표준코드", "거래수익률", "회사명"]
+        assert [(row['표준코드'], row['거래수익률']) for row in rows] == [("KR1", "3.5"), ("KR2", "4.1"), ("KR1", "3.7")]
+
+    @pytest.mark.unit
+    async def test_join_skipped_when_not_needed(self):
+        """basic_info 열/필터가 없으면 조회하지 않음"""
+        api = FakeBondApi()
+        pipeline = BondExportPipeline(api, "20240101", "20240131", columns=['stdcd', 'volume'])
+
+        [chunk async for chunk in pipeline.stream_csv()]
+
+        assert all(endpoint == "bond/market/mn_hist" for endpoint, _ in api.calls)
+
+    @pytest.mark.unit
+    async def test_csv_failure_before_first_chunk_propagates(self):
+        """첫 청크 전 업스트림 오류는 스트림 밖으로 전파"""
+        async def failing(endpoint, params):
+            raise RuntimeError("upstream down")
+
+        chunks = BondExportPipeline(failing, "20240101", "20240229").stream_csv()
+        with pytest.raises(RuntimeError):
+            await chunks.__anext__()
+
+    @pytest.mark.unit
+    async def test_csv_failure_mid_stream_writes_marker(self):
+        """이후 페이지 오류는 오류 표시 행을 기록하고 중단"""
+        api = FakeBondApi()
+
+        async def flaky(endpoint, params):
+            if endpoint == "bond/market/mn_hist" and params['startDate'] >= "20240201":
+                raise RuntimeError("upstream down")
+            return await api(endpoint, params)
+
+        pipeline = BondExportPipeline(flaky, "20240101", "20240229", page_days=31, columns=['bonddate', 'stdcd'])
+        text = b"".join([chunk async for chunk in pipeline.stream_csv()]).decode("utf-8-sig")
+        lines = text.strip().splitlines()
+
+        assert lines[0] == "bonddate,stdcd"
+        assert lines[-1] == f"{CSV_ERROR_MARKER},upstream down"
+        assert len(lines) == 4  # 머리글 + 1월 2행 + 오류 표시
+
+    @pytest.mark.unit
+    async def test_csv_endpoint_reports_early_upstream_error(self, monkeypatch):
+        """첫 페이지 업스트림 오류는 스트리밍 전에 502 응답"""
+        import httpx
+        from fastapi import HTTPException
+
+        from api import infomax
+        from core.infomax_proxy_client import InfoMaxProxyClient
+
+        proxy = InfoMaxProxyClient(base_url="https://infomax.test/api",
+                                   transport=httpx.MockTransport(lambda request: httpx.Response(503)))
+        monkeypatch.setattr(infomax, "get_infomax_proxy_client", lambda: proxy)
+        try:
+            with pytest.raises(HTTPException) as error:
+                await infomax.export_bond_market_hist(
+                    infomax.BondExportRequest(startDate="20240101", endDate="20240229"),
+                    authorization="Bearer t"
+                )
+        finally:
+            await proxy.close()
+
+        assert error.value.status_code == 502
+
+    @pytest.mark.unit
+    def test_isna_and_unknown_op(self):
+        """값 없음 필터 및 지원하지 않는 연산"""
+        filters = CompiledFilters([ExportFilter(field='compnm', op='isna')])
+        assert filters.mask({'compnm': ["POSCO", None, ""]}, 3) == [False, True, True]
+
+        with pytest.raises(ValueError):
+            CompiledFilters([ExportFilter(field='yld', op='regex')])
+
+    @pytest.mark.unit
+    async def test_xlsx_write_only(self, temp_dir):
+        """XLSX는 write-only 워크북으로 기록"""
+        openpyxl = pytest.importorskip("openpyxl")
+        api = FakeBondApi()
+        api.trades[0]['market'] = "장\x02내"
+        path = temp_dir / "bond.xlsx"
+
+        stats = await BondExportPipeline(api, "20240101", "20240229",
+                                         columns=['stdcd', 'market']).write_file(str(path), "xlsx")
+
+        sheet = openpyxl.load_workbook(path).active
+        assert stats.written_rows == 4
+        assert [cell.value for cell in sheet[2]] == ["KR1", "장내"]
@@ -0,0 +1,132 @@
+"""
+데이터베이스 연결 재사용 및 웹훅 로그 일괄 기록 테스트
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from database.db import Database
+
+
+def _log(log_id: str, message_type: str = "test", company_id: str = "posco"):
+    return {
+        'id': log_id,
+        'company_id': company_id,
+        'message_type': message_type,
+        'bot_type': "TEST",
+        'priority': "LOW",
+        'endpoint': "NEWS_MAIN",
+        'status': "success",
+        'message_id': log_id,
+        'metadata': {'n': log_id}
+    }
+
+
+@pytest.fixture
+def db(temp_dir):
+    database = Database(str(temp_dir / "watchhamster.db"), log_flush_interval=0.05)
+    yield database
+    database.close_all()
+
+
+class TestDatabaseConnections:
+    """스레드별 장기 연결 테스트"""
+
+    @pytest.mark.unit
+    def test_connection_reused_per_thread(self, db):
+        """같은 스레드는 연결을 재사용하고 다른 스레드는 별도 연결 사용"""
+        first = db.connect()
+        db.get_all_companies()
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(db.connect()))
+        thread.start()
+        thread.join()
+
+        assert db.connect() is first
+        assert other[0] is not first
+        assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert first.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    @pytest.mark.unit
+    def test_close_all_closes_every_thread_connection(self, db):
+        """close_all은 다른 스레드의 연결까지 모두 닫고, 이후 호출은 새 연결 사용"""
+        first = db.connect()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(db.connect()))
+        thread.start()
+        thread.join()
+
+        db.close_all()
+
+        for conn in (first, other[0]):
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        assert db.connect() is not first
+
+    @pytest.mark.unit
+    def test_failed_call_leaves_no_open_transaction(self, db):
+        """실패한 호출 후에도 재사용 연결에 트랜잭션이 남지 않음"""
+        db.create_company({'id': "posco", 'name': "POSCO", 'display_name': "포스코"})
+
+        with pytest.raises(ValueError):
+            db.create_company({'id': "posco", 'name': "POSCO", 'display_name': "포스코"})
+
+        assert not db.connect().in_transaction
+        assert db.get_company("posco")['name'] == "POSCO"
+
+    @pytest.mark.unit
+    def test_covering_index_used_for_log_queries(self, db):
+        """회사/유형별 최신순 조회가 커버링 인덱스로 정렬 없이 처리"""
+        plan = db.connect().execute(
+            "EXPLAIN QUERY PLAN SELECT status, timestamp FROM webhook_logs "
+            "WHERE company_id = ? AND message_type = ? ORDER BY timestamp DESC",
+            ("posco", "test")
+        ).fetchall()
+        detail = " ".join(row['detail'] for row in plan)
+
+        assert "COVERING INDEX idx_webhook_logs_company_type_time" in detail
+        assert "TEMP B-TREE" not in detail
+
+
+class TestWebhookLogBatching:
+    """웹훅 로그 일괄 기록 테스트"""
+
+    @pytest.mark.unit
+    def test_batch_insert_skips_duplicates(self, db):
+        """일괄 기록 중 중복 ID가 있으면 나머지만 기록"""
+        db.create_webhook_log(_log("a"))
+
+        written = db.create_webhook_logs([_log("a"), _log("b"), _log("c")])
+
+        assert written == 2
+        assert sorted(log['id'] for log in db.get_webhook_logs("posco")) == ["a", "b", "c"]
+
+    @pytest.mark.unit
+    def test_queued_logs_visible_to_reads(self, db):
+        """버퍼링된 로그도 조회/통계에 즉시 반영"""
+        for n in range(3):
+            db.queue_webhook_log(_log(f"q{n}", message_type="status"))
+
+        logs = db.get_webhook_logs("posco", message_type="status")
+
+        assert len(logs) == 3
+        assert logs[0]['metadata'] == {'n': logs[0]['id']}
+        assert db.get_webhook_stats("posco")['total_sent'] == 3
+
+    @pytest.mark.unit
+    def test_writer_flushes_after_interval(self, db):
+        """조회가 없어도 지연 시간이 지나면 백그라운드 기록"""
+        db.queue_webhook_log(_log("late"))
+
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            count = db.connect().execute("SELECT COUNT(*) FROM webhook_logs").fetchone()[0]
+            if count:
+                break
+            time.sleep(0.02)
+
+        assert count == 1
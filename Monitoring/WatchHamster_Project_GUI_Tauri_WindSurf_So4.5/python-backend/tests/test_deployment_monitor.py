@@ -0,0 +1,97 @@
+"""
+배포 모니터 롤링 메트릭 저장소 테스트
+"""
+
+import os
+import random
+
+import pytest
+
+from core.deployment_monitor import DeploymentMonitor, DeploymentPhase
+from core.rolling_metrics import P2Quantile, RunningStats
+
+
+def run_session(monitor, session_id, phases, success=True):
+    monitor.start_deployment_monitoring(session_id)
+    for phase in phases:
+        monitor.update_deployment_phase(phase)
+    monitor.stop_deployment_monitoring(success=success, error_message=None if success else "실패")
+
+
+@pytest.fixture
+def monitor(temp_dir):
+    instance = DeploymentMonitor(logs_dir=str(temp_dir))
+    instance.monitoring_interval = 0.01
+    return instance
+
+
+class TestRollingMetrics:
+    """스트리밍 집계 테스트"""
+
+    @pytest.mark.unit
+    def test_p2_quantile_tracks_exact_quantiles(self):
+        """P² 추정값이 정확한 분위수에 근접하고 상태 복원 후에도 이어서 갱신"""
+        rng = random.Random(7)
+        values = [rng.expovariate(1.0) for _ in range(5000)]
+        median, p95 = P2Quantile(0.5), P2Quantile(0.95)
+        for value in values[:2500]:
+            median.add(value)
+            p95.add(value)
+        median = P2Quantile.from_state(median.state())
+        for value in values[2500:]:
+            median.add(value)
+            p95.add(value)
+
+        ordered = sorted(values)
+        assert median.value() == pytest.approx(ordered[2500], rel=0.05)
+        assert p95.value() == pytest.approx(ordered[4750], rel=0.05)
+
+    @pytest.mark.unit
+    def test_running_stats_small_sample(self):
+        """값이 적을 때는 정확한 분위수"""
+        stats = RunningStats()
+        for value in (4.0, 1.0, 3.0, 2.0):
+            stats.add(value)
+
+        assert stats.to_dict() == {
+            'count': 4, 'mean': 2.5, 'min': 1.0, 'max': 4.0, 'last': 2.0,
+            'p50': 2.5, 'p95': pytest.approx(3.85)
+        }
+
+
+class TestDeploymentMetricsStore:
+    """DeploymentMonitor 롤링 저장소 테스트"""
+
+    @pytest.mark.unit
+    def test_phase_completion_updates_statistics(self, monitor):
+        """단계가 끝날 때마다 집계 갱신, 조회는 파일을 읽지 않음"""
+        phases = [DeploymentPhase.PRE_CHECK, DeploymentPhase.BACKUP]
+        run_session(monitor, "s1", phases)
+        run_session(monitor, "s2", phases, success=False)
+
+        os.remove(monitor.metrics_log)
+        os.remove(monitor.performance_log)
+        stats = monitor.get_performance_statistics()
+
+        assert stats["phase_statistics"]["pre_check"]["count"] == 2
+        # 마지막 단계도 모니터링 중지 시 완료 처리
+        assert stats["phase_statistics"]["backup"]["count"] == 2
+        assert stats["session_statistics"]["total"] == 2
+        assert stats["session_statistics"]["failed"] == 1
+        assert stats["summary"]["success_rate"] == 50.0
+        assert len(monitor.get_phase_durations(DeploymentPhase.PRE_CHECK)) == 2
+        assert [m["session_id"] for m in monitor.get_deployment_history(1)] == ["s2"]
+
+    @pytest.mark.unit
+    def test_restart_restores_aggregates(self, monitor, temp_dir):
+        """재시작 시 저장된 집계 상태와 이력 복원"""
+        run_session(monitor, "s1", [DeploymentPhase.PRE_CHECK, DeploymentPhase.BACKUP])
+        before = monitor.get_performance_statistics()
+
+        restarted = DeploymentMonitor(logs_dir=str(temp_dir))
+        after = restarted.get_performance_statistics()
+
+        assert after["phase_statistics"] == before["phase_statistics"]
+        assert after["session_statistics"] == before["session_statistics"]
+        assert len(restarted.get_phase_durations(DeploymentPhase.BACKUP)) == 1
+        assert restarted.get_deployment_history()[0]["session_id"] == "s1"
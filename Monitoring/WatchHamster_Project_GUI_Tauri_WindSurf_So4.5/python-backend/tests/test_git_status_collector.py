@@ -0,0 +1,99 @@
+"""
+비동기 Git 상태 수집기 테스트
+"""
+
+import subprocess
+
+import pytest
+
+from core.git_status_collector import AsyncGitStatusCollector, parse_porcelain_v2
+
+
+def _git(repo, *args):
+    subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(temp_dir):
+    _git(temp_dir, 'init', '-q', '-b', 'main')
+    _git(temp_dir, 'config', 'user.email', 'test@example.com')
+    _git(temp_dir, 'config', 'user.name', 'test')
+    (temp_dir / 'a.txt').write_text("a\n")
+    _git(temp_dir, 'add', 'a.txt')
+    _git(temp_dir, 'commit', '-q', '-m', '첫 커밋')
+    return temp_dir
+
+
+class TestParsePorcelainV2:
+    """porcelain v2 출력 파싱 테스트"""
+
+    @pytest.mark.unit
+    def test_parse_branch_and_entries(self):
+        """브랜치 헤더, 변경/이름변경/충돌/미추적 항목 파싱"""
+        output = "\n".join([
+            "# branch.oid 1234abcd",
+            "# branch.head main",
+            "# branch.upstream origin/main",
+            "# branch.ab +2 -3",
+            "1 .M N... 100644 100644 100644 aaa bbb src/app.py",
+            "2 R. N... 100644 100644 100644 aaa bbb R100 new name.py\told.py",
+            "u UU N... 100644 100644 100644 100644 aaa bbb ccc conflict.py",
+            "? notes.txt",
+        ])
+
+        parsed = parse_porcelain_v2(output)
+
+        assert (parsed['branch'], parsed['oid'], parsed['upstream']) == ("main", "1234abcd", "origin/main")
+        assert (parsed['ahead'], parsed['behind']) == (2, 3)
+        assert parsed['modified_files'] == ["src/app.py", "new name.py"]
+        assert parsed['conflicted_files'] == ["conflict.py"]
+        assert parsed['untracked_files'] == ["notes.txt"]
+
+
+class TestAsyncGitStatusCollector:
+    """변경 감지 기반 수집 테스트"""
+
+    @pytest.mark.unit
+    async def test_collect_and_cache_until_index_changes(self, repo):
+        """HEAD/index가 그대로면 캐시, 스테이징 후에는 다시 수집"""
+        collector = AsyncGitStatusCollector(str(repo), max_age=None)
+
+        first = await collector.collect()
+        again = await collector.collect()
+
+        assert first.status == "최신"
+        assert first.branch == "main"
+        assert first.last_commit_message == "첫 커밋"
+        assert again is first
+        assert (collector.runs, collector.cache_hits) == (1, 1)
+
+        (repo / 'a.txt').write_text("b\n")
+        _git(repo, 'add', 'a.txt')
+        changed = await collector.collect()
+
+        assert collector.runs == 2
+        assert changed.status == "변경사항 있음"
+        assert changed.modified_files == ["a.txt"]
+
+    @pytest.mark.unit
+    async def test_commit_invalidates_cache(self, repo):
+        """새 커밋으로 브랜치 ref가 바뀌면 다시 수집"""
+        collector = AsyncGitStatusCollector(str(repo), max_age=None)
+        before = await collector.collect()
+
+        _git(repo, 'commit', '-q', '--allow-empty', '-m', '두 번째 커밋')
+        after = await collector.collect()
+
+        assert after.last_commit != before.last_commit
+        assert after.last_commit_message == "두 번째 커밋"
+        assert (await collector.get_commit('main'))['message'] == "두 번째 커밋"
+
+    @pytest.mark.unit
+    async def test_not_a_repository(self, temp_dir):
+        """Git 저장소가 아니면 오류 상태"""
+        collector = AsyncGitStatusCollector(str(temp_dir))
+
+        status = await collector.collect()
+
+        assert status.status == "오류"
+        assert await collector.get_commit('origin/publish') is None
@@ -0,0 +1,226 @@
+"""
+INFOMAX API 클라이언트 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.infomax_client import InfomaxAPIClient, TokenBucketRateLimiter
+from core.news_response_cache import NewsResponseCache
+
+
+def _make_client(**kwargs) -> InfomaxAPIClient:
+    """네트워크 호출 없이 사용할 수 있는 클라이언트 생성"""
+    kwargs.setdefault("cache_enabled", False)
+    client = InfomaxAPIClient(max_retries=0, **kwargs)
+    client.session = object()  # 세션 생성 건너뛰기
+
+    async def fake_fetch(news_type, date):
+        await asyncio.sleep(0.01)
+        return {"exchange-rate": {"title": f"환율 {date}"}}
+
+    client._fetch_news_data_internal = fake_fetch
+    return client
+
+
+class TestTokenBucketRateLimiter:
+    """토큰 버킷 속도 제한기 테스트"""
+
+    @pytest.mark.unit
+    async def test_burst_then_throttle(self):
+        """버스트 이후에는 rate에 맞춰 대기"""
+        limiter = TokenBucketRateLimiter(rate=20, burst=2)
+
+        start = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # 버스트 2개 이후 2개는 각각 약 50ms 대기
+        assert elapsed >= 0.09
+
+    @pytest.mark.unit
+    def test_invalid_rate(self):
+        """0 이하 rate는 거부"""
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(rate=0)
+
+
+class TestHistoricalBackfill:
+    """과거 데이터 동시 조회 테스트"""
+
+    @pytest.mark.unit
+    async def test_iter_historical_data_streams_business_days(self):
+        """영업일만 스트리밍으로 반환"""
+        client = _make_client(rate_limit=100, rate_burst=10)
+
+        dates = [date async for date, data in client.iter_historical_data("20250106", "20250112")]
+
+        # 2025-01-06(월) ~ 2025-01-10(금)
+        assert sorted(dates) == ["20250106", "20250107", "20250108", "20250109", "20250110"]
+
+    @pytest.mark.unit
+    async def test_concurrency_is_bounded(self):
+        """동시 요청 수가 max_concurrency를 넘지 않음"""
+        client = _make_client(rate_limit=1000, rate_burst=100, max_concurrency=3)
+        in_flight = 0
+        peak = 0
+
+        async def tracking_fetch(news_type, date):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"kospi-close": {"title": date}}
+
+        client._fetch_news_data_internal = tracking_fetch
+
+        result = await client.get_historical_data("20250101", "20250131", concurrent=True)
+
+        assert len(result) == 23
+        assert list(result) == sorted(result)
+        assert peak <= 3
+
+    @pytest.mark.unit
+    async def test_failed_dates_yield_none(self):
+        """실패한 날짜는 None으로 반환되고 나머지는 계속 진행"""
+        client = _make_client(rate_limit=100, rate_burst=10)
+
+        async def flaky_fetch(news_type, date):
+            if date == "20250107":
+                raise ValueError("유효하지 않은 응답 데이터")
+            return {"exchange-rate": {"title": date}}
+
+        client._fetch_news_data_internal = flaky_fetch
+
+        results = dict([item async for item in client.iter_historical_data("20250106", "20250108")])
+
+        assert results["20250107"] is None
+        assert results["20250106"] is not None
+
+
+class TestNewsResponseCache:
+    """뉴스 응답 디스크 캐시 테스트"""
+
+    @pytest.mark.unit
+    def test_past_date_is_kept_forever(self, temp_dir):
+        """지난 날짜 응답은 TTL과 무관하게 유효"""
+        cache = NewsResponseCache(temp_dir, today_ttl=0)
+        cache.store("exchange-rate", "20240102", {"exchange-rate": {"title": "환율"}})
+
+        assert cache.get_fresh("exchange-rate", "20240102") == {"exchange-rate": {"title": "환율"}}
+
+    @pytest.mark.unit
+    def test_incomplete_past_payload_uses_ttl(self, temp_dir):
+        """빈 응답이나 뉴스 필드가 없는 본문은 지난 날짜라도 확정으로 보관하지 않음"""
+        cache = NewsResponseCache(temp_dir, today_ttl=0)
+        cache.store("exchange-rate", "20240102", {})
+        cache.store("kospi-close", "20240102", {"error": "maintenance"})
+        cache.store("exchange-rate", "20240102", {"items": []}, scope="list")
+        cache.store("kospi-close", "20240102", {"items": [{"title": "코스피"}]}, scope="list")
+
+        assert cache.get_fresh("exchange-rate", "20240102") is None
+        assert cache.get_fresh("kospi-close", "20240102") is None
+        assert cache.get_fresh("exchange-rate", "20240102", "list") is None
+        assert cache.get_fresh("kospi-close", "20240102", "list") == {"items": [{"title": "코스피"}]}
+        assert cache.get_stats()["final_entries"] == 1
+
+    @pytest.mark.unit
+    def test_index_writes_are_batched(self, temp_dir):
+        """연속 저장은 인덱스 파일을 바로 쓰지 않고 flush 시 한 번에 기록"""
+        cache = NewsResponseCache(temp_dir, index_save_delay=60)
+        for day in ("20240102", "20240103", "20240104"):
+            cache.store("exchange-rate", day, {"exchange-rate": {"title": day}})
+
+        assert not cache.index_file.exists()
+        cache.flush()
+        assert NewsResponseCache(temp_dir).get_stats()["entries"] == 3
+
+    @pytest.mark.unit
+    def test_today_expires_and_keeps_validators(self, temp_dir):
+        """오늘 응답은 TTL 이후 만료되고 조건부 요청 헤더를 제공"""
+        cache = NewsResponseCache(temp_dir, today_ttl=0)
+        cache.store("kospi-close", None, {"kospi-close": {"title": "코스피"}},
+                    etag='"abc"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+
+        assert cache.get_fresh("kospi-close", None) is None
+        assert cache.conditional_headers("kospi-close", None) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+        assert cache.get_stale("kospi-close", None) == {"kospi-close": {"title": "코스피"}}
+
+    @pytest.mark.unit
+    def test_survives_restart_and_dedupes_bodies(self, temp_dir):
+        """재시작 후에도 유지되며 동일 본문은 한 번만 저장"""
+        body = {"exchange-rate": {"title": "환율"}}
+        cache = NewsResponseCache(temp_dir)
+        cache.store("exchange-rate", "20240102", body)
+        cache.store("exchange-rate", "20240103", body)
+        cache.flush()
+
+        reloaded = NewsResponseCache(temp_dir)
+
+        assert reloaded.get_fresh("exchange-rate", "20240103") == body
+        assert len(list(reloaded.objects_dir.glob("*.json"))) == 1
+
+    @pytest.mark.unit
+    def test_invalidate(self, temp_dir):
+        """조건에 맞는 항목만 무효화"""
+        cache = NewsResponseCache(temp_dir)
+        cache.store("exchange-rate", "20240102", {"a": 1})
+        cache.store("kospi-close", "20240102", {"b": 2})
+
+        assert cache.invalidate(news_type="exchange-rate") == 1
+        assert cache.get_fresh("exchange-rate", "20240102") is None
+        assert cache.get_fresh("kospi-close", "20240102") == {"b": 2}
+
+    @pytest.mark.unit
+    def test_scopes_do_not_collide(self, temp_dir):
+        """같은 이름이라도 URL/파라미터가 다르면 별도 항목"""
+        cache = NewsResponseCache(temp_dir)
+        type_scope = NewsResponseCache.make_scope("https://api/news")
+        limit_5 = NewsResponseCache.make_scope("https://api/news/exchange-rate", {"limit": 5, "date": "20240102"})
+        limit_10 = NewsResponseCache.make_scope("https://api/news/exchange-rate/", {"limit": 10})
+        cache.store("exchange-rate", "20240102", {"a": 1}, scope=type_scope)
+        cache.store("exchange-rate", "20240102", {"b": 2}, scope=limit_5)
+
+        assert cache.get_fresh("exchange-rate", "20240102", type_scope) == {"a": 1}
+        assert cache.get_fresh("exchange-rate", "20240102", limit_5) == {"b": 2}
+        assert cache.get_fresh("exchange-rate", "20240102", limit_10) is None
+        assert cache.invalidate(news_type="exchange-rate") == 2
+
+    @pytest.mark.unit
+    def test_store_removes_replaced_body(self, temp_dir):
+        """갱신으로 참조가 없어진 본문 파일은 삭제 (공유 중인 본문은 유지)"""
+        cache = NewsResponseCache(temp_dir)
+        cache.store("kospi-close", "20240102", {"v": 1})
+        cache.store("exchange-rate", "20240102", {"shared": True})
+        cache.store("kospi-close", "20240103", {"shared": True})
+        cache.store("kospi-close", "20240102", {"v": 2})
+        cache.store("kospi-close", "20240103", {"v": 3})
+
+        assert len(list(cache.objects_dir.glob("*.json"))) == 3
+        assert cache.get_fresh("exchange-rate", "20240102") == {"shared": True}
+
+    @pytest.mark.unit
+    async def test_backfill_skips_cached_days(self, temp_dir):
+        """캐시된 과거 날짜는 API를 호출하지 않음"""
+        cache = NewsResponseCache(temp_dir)
+        client = _make_client(cache_enabled=True, cache=cache, rate_limit=100, rate_burst=10)
+        cache.store("exchange-rate", "20250106", {"exchange-rate": {"title": "cached"}}, scope=client.cache_scope)
+        requested = []
+
+        async def tracking_fetch(news_type, date):
+            requested.append(date)
+            return {"exchange-rate": {"title": date}}
+
+        client._fetch_news_data_internal = tracking_fetch
+
+        result = await client.get_historical_data("20250106", "20250107", "exchange-rate", concurrent=True)
+
+        assert requested == ["20250107"]
+        assert result["20250106"]["exchange-rate"]["title"] == "cached"
@@ -0,0 +1,136 @@
+"""
+InfoMax 프록시 클라이언트 연결 풀 및 응답 캐시 테스트
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from core.infomax_proxy_client import InfoMaxProxyClient, ProxyResponseCache
+
+TODAY = datetime.now().strftime("%Y%m%d")
+YESTERDAY = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
+
+
+class TestProxyResponseCache:
+    """캐시 정책 및 무효화 테스트"""
+
+    @pytest.mark.unit
+    def test_cacheable_requests(self):
+        """stock/code와 지난 날짜 조회만 캐시 대상"""
+        cache = ProxyResponseCache()
+
+        assert cache.make_key("stock/code", {"search": "포스코"}, "t") is not None
+        assert cache.make_key("bond/market/mn_hist", {"endDate": YESTERDAY}, "t") is not None
+        assert cache.make_key("bond/market/mn_hist", {"endDate": TODAY}, "t") is None
+        assert cache.make_key("bond/market/mn_hist", {"endDate": ""}, "t") is None
+        assert cache.make_key("bond/marketvaluation", {"stdcd": "KR1"}, "t") is None
+
+    @pytest.mark.unit
+    def test_key_normalization_and_token_isolation(self):
+        """빈 값/공백/순서가 달라도 같은 키, 토큰이 다르면 다른 키"""
+        cache = ProxyResponseCache()
+
+        first = cache.make_key("stock/code", {"search": " 포스코 ", "code": ""}, "t1")
+        second = cache.make_key("stock/code", {"market": "", "search": "포스코"}, "t1")
+        other = cache.make_key("stock/code", {"search": "포스코"}, "t2")
+
+        assert first == second
+        assert first != other
+
+    @pytest.mark.unit
+    def test_ttl_and_invalidate(self, monkeypatch):
+        """TTL 만료 및 엔드포인트별 무효화"""
+        now = [1000.0]
+        monkeypatch.setattr("core.infomax_proxy_client.time.monotonic", lambda: now[0])
+        cache = ProxyResponseCache(policies={"stock/code": (60, None), "stock/hist": (60, "endDate")})
+
+        code_key = cache.make_key("stock/code", {"search": "a"}, "t")
+        hist_key = cache.make_key("stock/hist", {"code": "005490", "endDate": YESTERDAY}, "t")
+        cache.store(code_key, {"data": 1})
+        cache.store(hist_key, {"data": 2})
+
+        assert cache.get(code_key) == {"data": 1}
+        assert cache.invalidate("stock/code") == 1
+        assert cache.get(code_key) is None
+
+        now[0] += 61
+        assert cache.get(hist_key) is None
+        assert len(cache) == 0
+
+
+class TestInfoMaxProxyClient:
+    """공유 클라이언트 테스트"""
+
+    @pytest.mark.unit
+    async def test_requests_share_one_client(self):
+        """요청마다 클라이언트를 새로 만들지 않고 인증 헤더는 요청별로 전달"""
+        seen = []
+
+        def handler(request: httpx.Request):
+            seen.append((request.url.path, request.headers["Authorization"]))
+            return httpx.Response(200, json={"ok": True})
+
+        proxy = InfoMaxProxyClient(base_url="https://infomax.test/api", transport=httpx.MockTransport(handler))
+        await proxy.start()
+        client = proxy._client
+        try:
+            first = await proxy.get("stock/code", {"search": "a"}, "t1")
+            second = await proxy.get("/stock/hist", {"code": "005490"}, "t2")
+        finally:
+            await proxy.close()
+
+        assert proxy._client is None
+        assert client.is_closed
+        assert json.loads(first.text) == {"ok": True} and second.status_code == 200
+        assert seen == [("/api/stock/code", "Bearer t1"), ("/api/stock/hist", "Bearer t2")]
+
+    @pytest.mark.unit
+    def test_loop_change_closes_previous_client(self):
+        """이벤트 루프가 바뀌어 새 클라이언트를 만들 때 이전 클라이언트는 닫힘"""
+        proxy = InfoMaxProxyClient(base_url="https://infomax.test/api",
+                                   transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+
+        async def current_client():
+            return proxy._get_client()
+
+        async def switch_client():
+            client = proxy._get_client()
+            await asyncio.gather(*list(proxy._closing))
+            await proxy.close()
+            return client
+
+        first = asyncio.run(current_client())
+        second = asyncio.run(switch_client())
+
+        assert first is not second
+        assert first.is_closed and second.is_closed
+        assert not proxy._closing
+
+    @pytest.mark.unit
+    async def test_endpoint_serves_cached_response(self, monkeypatch):
+        """캐시 대상 요청은 두 번째 호출부터 업스트림 없이 응답"""
+        from api import infomax
+
+        calls = []
+
+        def handler(request: httpx.Request):
+            calls.append(request.url.params.get("search"))
+            return httpx.Response(200, json={"items": ["POSCO"]})
+
+        proxy = InfoMaxProxyClient(base_url="https://infomax.test/api", transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(infomax, "get_infomax_proxy_client", lambda: proxy)
+        try:
+            first = await infomax.get_stock_code(authorization="Bearer t", search="포스코", code="", name="",
+                                                 isin="", market="", type="")
+            second = await infomax.get_stock_code(authorization="Bearer t", search="포스코", code="", name="",
+                                                  isin="", market="", type="")
+        finally:
+            await proxy.close()
+
+        assert calls == ["포스코"]
+        assert json.loads(first.body)["data"] == {"items": ["POSCO"]}
+        assert json.loads(second.body)["cached"] is True
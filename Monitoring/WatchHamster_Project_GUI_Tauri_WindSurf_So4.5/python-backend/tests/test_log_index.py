@@ -0,0 +1,164 @@
+"""
+로그 사이드카 인덱스 테스트
+"""
+
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.logs import _collect_log_statistics, _query_logs, _search_logs
+from utils import log_index as log_index_module
+from utils.log_index import LogFileIndex
+
+
+def _line(timestamp: datetime, level: str, message: str, logger_name: str = "core.monitor") -> str:
+    return f"{timestamp.strftime('%Y-%m-%d %H:%M:%S')},000 - {logger_name} - {level} - {message}\n"
+
+
+def _write_log(path, lines, mode="w"):
+    with open(path, mode, encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+@pytest.fixture
+def sample_log(temp_dir):
+    """3시간에 걸친 로그 (1분 간격, 15번째마다 ERROR)"""
+    base = datetime(2025, 1, 2, 9, 0)
+    lines = []
+    for minute in range(180):
+        level = "ERROR" if minute % 15 == 0 else "INFO"
+        lines.append(_line(base + timedelta(minutes=minute), level, f"메시지 {minute}"))
+    path = temp_dir / "watchhamster.log"
+    _write_log(path, lines)
+    return path, base
+
+
+class TestLogFileIndex:
+    """인덱스 구축 및 증분 갱신 테스트"""
+
+    @pytest.mark.unit
+    def test_buckets_by_hour(self, sample_log):
+        """시간 버킷별 건수와 ERROR 오프셋 기록"""
+        path, _ = sample_log
+        index = LogFileIndex(path)
+
+        assert index.refresh() is True
+
+        assert [bucket.hour for bucket in index.buckets] == ["2025-01-02 09", "2025-01-02 10", "2025-01-02 11"]
+        assert all(bucket.lines == 60 for bucket in index.buckets)
+        assert index.buckets[0].levels == {"ERROR": 4, "INFO": 56}
+        assert index.read_line_at(index.buckets[1].marks["ERROR"][0]).endswith("메시지 60")
+
+    @pytest.mark.unit
+    def test_incremental_append_and_partial_line(self, sample_log):
+        """추가분만 인덱싱하고 미완성 줄은 다음 갱신으로 미룸"""
+        path, base = sample_log
+        index = LogFileIndex(path)
+        index.refresh()
+        indexed = index.indexed_size
+
+        _write_log(path, [_line(base + timedelta(hours=3), "WARNING", "새 경고"), "2025-01-02 12:00:01,000 - x"], mode="a")
+        index.refresh()
+
+        assert index.indexed_size > indexed
+        assert index.buckets[-1].hour == "2025-01-02 12"
+        assert index.buckets[-1].lines == 1
+        assert index.indexed_size < path.stat().st_size
+
+    @pytest.mark.unit
+    def test_truncation_rebuilds(self, sample_log):
+        """파일이 잘리면 인덱스 재생성"""
+        path, base = sample_log
+        index = LogFileIndex(path)
+        index.refresh()
+
+        _write_log(path, [_line(base, "INFO", "새 파일")])
+        index.refresh()
+
+        assert len(index.buckets) == 1
+        assert index.buckets[0].lines == 1
+
+    @pytest.mark.unit
+    def test_sidecar_survives_restart(self, sample_log):
+        """저장된 사이드카를 다시 읽어 추가분만 처리"""
+        path, _ = sample_log
+        LogFileIndex(path).refresh()
+
+        reloaded = LogFileIndex(path)
+        reloaded._load()
+
+        assert reloaded.indexed_size == path.stat().st_size
+        assert reloaded.refresh() is False
+        assert len(reloaded.buckets) == 3
+
+    @pytest.mark.unit
+    def test_reverse_read_across_blocks(self, sample_log, monkeypatch):
+        """블록 경계와 무관하게 줄 역순 반환"""
+        monkeypatch.setattr(log_index_module, "READ_BLOCK_SIZE", 100)
+        path, _ = sample_log
+        index = LogFileIndex(path)
+
+        lines = list(index.iter_lines_reverse())
+
+        expected = [line.rstrip("\n") for line in reversed(path.read_text(encoding="utf-8").splitlines(True))]
+        assert lines == expected
+
+
+class TestIndexedLogQueries:
+    """인덱스 기반 API 조회 테스트"""
+
+    @pytest.mark.unit
+    def test_query_paginates_newest_first(self, sample_log):
+        """최신순 페이지네이션"""
+        path, _ = sample_log
+
+        logs = _query_logs(LogFileIndex(path), 5, 10, None, None, None, None)
+
+        assert [log.message for log in logs] == [f"메시지 {n}" for n in range(169, 164, -1)]
+
+    @pytest.mark.unit
+    def test_query_level_and_time_range(self, sample_log):
+        """레벨과 시간 범위 필터"""
+        path, base = sample_log
+
+        logs = _query_logs(LogFileIndex(path), 100, 0, "error", None,
+                           base + timedelta(minutes=50), base + timedelta(minutes=130))
+
+        assert [log.message for log in logs] == [f"메시지 {n}" for n in (120, 105, 90, 75, 60)]
+
+    @pytest.mark.unit
+    def test_search_returns_newest_matches(self, sample_log):
+        """정규식 검색은 최신 매칭부터 반환"""
+        path, _ = sample_log
+
+        logs = _search_logs(LogFileIndex(path), re.compile(r"메시지 1\d$"), 3)
+
+        assert [log.message for log in logs] == ["메시지 19", "메시지 18", "메시지 17"]
+
+    @pytest.mark.unit
+    def test_statistics_match_line_scan(self, sample_log):
+        """버킷 집계 통계가 줄 단위 집계와 동일"""
+        path, base = sample_log
+        cutoff = base + timedelta(minutes=95)
+
+        stats = _collect_log_statistics(LogFileIndex(path), cutoff)
+
+        assert stats["total_logs"] == 85
+        assert stats["level_counts"]["ERROR"] == 5
+        assert stats["hourly_counts"] == {"2025-01-02 10:00": 25, "2025-01-02 11:00": 60}
+        assert stats["top_loggers"] == {"core.monitor": 85}
+        assert len(stats["error_messages"]) == 5
+
+    @pytest.mark.unit
+    def test_error_messages_capped_newest_first(self, temp_dir):
+        """에러 메시지는 전체 합계 기준 20개, 최신순 (부분 버킷 포함)"""
+        base = datetime(2025, 1, 2, 9, 0)
+        lines = [_line(base + timedelta(minutes=minute), "ERROR", f"오류 {minute}") for minute in range(180)]
+        path = temp_dir / "errors.log"
+        _write_log(path, lines)
+
+        stats = _collect_log_statistics(LogFileIndex(path), base + timedelta(minutes=30))
+        messages = [entry["message"] for entry in stats["error_messages"]]
+
+        assert messages == [f"오류 {minute}" for minute in range(179, 159, -1)]
@@ -0,0 +1,115 @@
+"""
+공유 로그 테일러 테스트
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from utils.log_tailer import LogTailer, TailSubscription
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+async def _next(subscription: TailSubscription, timeout: float = 2.0):
+    return await asyncio.wait_for(subscription.get(), timeout)
+
+
+@pytest.fixture
+def log_file(temp_dir):
+    path = temp_dir / "watchhamster.log"
+    path.write_text("2025-01-02 09:00:00,000 - core - INFO - 기존 로그\n", encoding="utf-8")
+    return path
+
+
+class TestLogTailer:
+    """파일 테일링 및 분배 테스트"""
+
+    @pytest.mark.unit
+    async def test_fan_out_shares_parsed_event(self, log_file):
+        """새 줄을 한 번만 파싱하여 모든 구독자에게 같은 항목 전달"""
+        tailer = LogTailer(log_file, poll_interval=0.05, use_inotify=False)
+        first = tailer.subscribe()
+        second = tailer.subscribe()
+        try:
+            await asyncio.sleep(0.1)
+            _append(log_file, "2025-01-02 09:00:01,000 - core - ERROR - 새 오류\n2025-01-02 09:00:02")
+
+            event_a = await _next(first)
+            event_b = await _next(second)
+
+            assert event_a is event_b
+            assert event_a.entry['level'] == "ERROR"
+            assert event_a.entry['message'] == "새 오류"
+            assert '"level": "ERROR"' in event_a.to_json()
+            # 줄바꿈 없는 마지막 조각은 완성될 때까지 보류
+            await asyncio.sleep(0.15)
+            assert len(first) == 0
+
+            _append(log_file, ",000 - core - INFO - 이어짐\n")
+            assert (await _next(first)).entry['message'] == "이어짐"
+        finally:
+            first.close()
+            second.close()
+
+    @pytest.mark.unit
+    async def test_slow_subscriber_drops_oldest(self, log_file):
+        """버퍼가 가득 차면 가장 오래된 항목부터 폐기"""
+        tailer = LogTailer(log_file, poll_interval=0.05, use_inotify=False)
+        subscription = tailer.subscribe(maxsize=3)
+        try:
+            await asyncio.sleep(0.1)
+            _append(log_file, "".join(f"2025-01-02 09:00:0{n},000 - core - INFO - {n}\n" for n in range(5)))
+            await asyncio.sleep(0.2)
+
+            assert [event.entry['message'] for event in subscription.drain()] == ["2", "3", "4"]
+            assert subscription.dropped == 2
+        finally:
+            subscription.close()
+
+    @pytest.mark.unit
+    async def test_truncation_restarts_from_beginning(self, log_file):
+        """파일이 비워지면 처음부터 다시 읽음"""
+        tailer = LogTailer(log_file, poll_interval=0.05, use_inotify=False)
+        subscription = tailer.subscribe()
+        try:
+            await asyncio.sleep(0.1)
+            log_file.write_text("2025-01-02 10:00:00,000 - core - INFO - 새 파일\n", encoding="utf-8")
+
+            assert (await _next(subscription)).entry['message'] == "새 파일"
+        finally:
+            subscription.close()
+
+    @pytest.mark.unit
+    async def test_stops_after_last_unsubscribe(self, log_file):
+        """마지막 구독자가 떠나면 테일러 종료"""
+        tailer = LogTailer(log_file, poll_interval=0.05, use_inotify=False)
+        subscription = tailer.subscribe()
+        await asyncio.sleep(0.1)
+        assert tailer.mode == "polling"
+
+        subscription.close()
+        await asyncio.sleep(0.05)
+
+        assert tailer.subscriber_count == 0
+        assert tailer.mode == "stopped"
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify는 Linux 전용")
+    async def test_inotify_wakes_without_polling(self, log_file):
+        """inotify 모드에서는 폴링 주기와 무관하게 즉시 전달"""
+        tailer = LogTailer(log_file, poll_interval=5)
+        subscription = tailer.subscribe()
+        try:
+            await asyncio.sleep(0.1)
+            assert tailer.mode == "inotify"
+
+            _append(log_file, "2025-01-02 09:00:01,000 - core - WARNING - 즉시\n")
+
+            assert (await _next(subscription, timeout=1.0)).entry['message'] == "즉시"
+        finally:
+            subscription.close()
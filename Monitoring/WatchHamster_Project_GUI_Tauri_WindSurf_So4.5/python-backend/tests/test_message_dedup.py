@@ -0,0 +1,102 @@
+"""
+메시지 중복 방지 저장소 테스트
+"""
+
+import pytest
+
+from core.message_dedup import MessageDedupCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMessageDedupCache:
+    """시간 창 기반 LRU 중복 방지 테스트"""
+
+    @pytest.mark.unit
+    def test_duplicate_within_window(self):
+        """창 안의 같은 해시는 중복, 창이 지나면 다시 허용"""
+        clock = FakeClock()
+        cache = MessageDedupCache(default_window=60, clock=clock)
+
+        assert cache.check_and_add("a") is False
+        clock.now = 59
+        assert cache.check_and_add("a") is True
+        clock.now = 61
+        assert cache.check_and_add("a") is False
+
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses'], stats['expirations']) == (1, 2, 1)
+
+    @pytest.mark.unit
+    def test_per_entry_window(self):
+        """항목별 창 적용"""
+        clock = FakeClock()
+        cache = MessageDedupCache(default_window=3600, clock=clock)
+
+        cache.check_and_add("error", window=10)
+        cache.check_and_add("report")
+        clock.now = 20
+
+        assert cache.check_and_add("error") is False
+        assert cache.check_and_add("report") is True
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self):
+        """용량 초과 시 가장 오래 사용되지 않은 항목부터 제거"""
+        clock = FakeClock()
+        cache = MessageDedupCache(max_entries=2, clock=clock)
+
+        cache.check_and_add("old")
+        cache.check_and_add("recent")
+        cache.check_and_add("old")       # 적중 → 최근 사용으로 이동
+        cache.check_and_add("new")       # "recent" 제거
+
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.check_and_add("old") is True
+        assert cache.check_and_add("recent") is False
+
+    @pytest.mark.unit
+    def test_expired_entries_purged_before_live_eviction(self):
+        """사용 순서 뒤쪽의 만료 항목을 먼저 정리하고 살아 있는 항목은 유지"""
+        clock = FakeClock()
+        cache = MessageDedupCache(max_entries=2, default_window=3600, clock=clock)
+
+        cache.check_and_add("live")
+        cache.check_and_add("short", window=10)   # 사용 순서상 "live" 뒤에 있지만 먼저 만료
+        clock.now = 20
+        cache.check_and_add("new")
+
+        assert cache.evictions == 0
+        assert cache.expirations == 1
+        assert cache.check_and_add("live") is True
+
+    @pytest.mark.unit
+    def test_short_window_behind_long_window_expires(self):
+        """긴 창 항목 뒤에 등록된 짧은 창 항목도 만료 시 정리"""
+        clock = FakeClock()
+        cache = MessageDedupCache(default_window=3600, clock=clock)
+
+        cache.check_and_add("report")
+        cache.check_and_add("error", window=10)
+        clock.now = 20
+        cache.check_and_add("other")
+
+        assert len(cache) == 2
+        assert cache.expirations == 1
+
+    @pytest.mark.unit
+    def test_discard_allows_resend(self):
+        """제거한 해시는 즉시 다시 허용"""
+        cache = MessageDedupCache()
+        cache.check_and_add("a")
+
+        cache.discard("a")
+
+        assert cache.check_and_add("a") is False
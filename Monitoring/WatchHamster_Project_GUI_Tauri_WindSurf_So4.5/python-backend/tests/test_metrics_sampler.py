@@ -0,0 +1,110 @@
+"""
+시스템 메트릭 샘플러 및 링 버퍼 테스트
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from core.metrics_sampler import MetricRingBuffer, MetricsSampler
+from core.system_monitor import HISTORY_CAPACITY, SystemMonitor
+
+
+class TestMetricRingBuffer:
+    """고정 크기 링 버퍼 테스트"""
+
+    @pytest.mark.unit
+    def test_wraparound_keeps_latest_samples(self):
+        """용량을 넘으면 가장 오래된 샘플부터 덮어씀"""
+        buffer = MetricRingBuffer(3, ('cpu',))
+        for n in range(5):
+            buffer.append(float(n), {'cpu': n * 10.0})
+
+        assert len(buffer) == 3
+        assert buffer.values('cpu') == [20.0, 30.0, 40.0]
+        assert buffer.latest() == {'timestamp': 4.0, 'cpu': 40.0}
+        assert [row['timestamp'] for row in buffer.last(2)] == [3.0, 4.0]
+
+    @pytest.mark.unit
+    def test_window_and_aggregate(self):
+        """시간 창 안의 샘플만 조회/집계"""
+        buffer = MetricRingBuffer(10, ('cpu', 'memory'))
+        for n in range(6):
+            buffer.append(100.0 + n, {'cpu': float(n)})
+
+        assert [row['cpu'] for row in buffer.window(2.5, now=105.0)] == [3.0, 4.0, 5.0]
+        assert buffer.values('memory', seconds=1, now=105.0) == [0.0, 0.0]
+
+        stats = buffer.aggregate('cpu', seconds=2.5, now=105.0)
+        assert stats['count'] == 3
+        assert stats['avg'] == pytest.approx(4.0)
+        assert (stats['min'], stats['max'], stats['last']) == (3.0, 5.0, 5.0)
+
+    @pytest.mark.unit
+    def test_clear(self):
+        """초기화 후 빈 버퍼"""
+        buffer = MetricRingBuffer(2, ('cpu',))
+        buffer.append(1.0, {'cpu': 1.0})
+
+        assert buffer.clear() == 1
+        assert buffer.latest() is None
+        assert buffer.aggregate('cpu', seconds=60)['count'] == 0
+
+
+class TestMetricsSampler:
+    """백그라운드 샘플러 테스트"""
+
+    @pytest.mark.unit
+    def test_sampler_records_in_background(self):
+        """시작 즉시 첫 샘플을 기록하고 스냅샷은 psutil 호출 없이 반환"""
+        sampler = MetricsSampler(interval=0.05, capacity=10)
+        sampler.start()
+        try:
+            deadline = time.monotonic() + 2
+            while len(sampler.buffer) < 2 and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            snapshot = sampler.snapshot()
+            assert len(sampler.buffer) >= 2
+            assert 0.0 <= snapshot['cpu_percent'] <= 100.0
+            assert snapshot['memory_total_gb'] > 0
+            assert isinstance(snapshot['sampled_at'], datetime)
+        finally:
+            sampler.stop()
+
+        assert not sampler.is_running
+
+
+class TestSystemMonitorHistory:
+    """SystemMonitor 히스토리 링 버퍼 테스트"""
+
+    @pytest.mark.unit
+    def test_history_bounded_and_windowed(self):
+        """히스토리는 용량 안에서 유지되고 기존 dict 형태로 조회"""
+        monitor = SystemMonitor()
+        now = time.time()
+        for n in range(HISTORY_CAPACITY + 20):
+            monitor.cpu_history.append(now - (HISTORY_CAPACITY + 20 - n), {'percent': 10.0})
+
+        history = monitor.get_resource_history('cpu', minutes=1)
+
+        assert len(monitor.cpu_history) == HISTORY_CAPACITY
+        assert 55 <= len(history) <= 60
+        assert isinstance(history[0]['timestamp'], datetime)
+        assert history[-1]['percent'] == 10.0
+        assert monitor.get_resource_history('disk') == []
+
+    @pytest.mark.unit
+    def test_trends_use_window_values(self):
+        """트렌드는 시간 창 안의 값으로 판단"""
+        monitor = SystemMonitor()
+        now = time.time()
+        for n in range(10):
+            monitor.cpu_history.append(now - 10 + n, {'percent': 10.0 if n < 5 else 50.0})
+        monitor.memory_history.append(now, {'percent': 40.0})
+
+        trends = monitor.check_resource_trends(minutes=1)
+
+        assert trends['cpu'] == 'increasing'
+        assert trends['memory'] == 'insufficient_data'
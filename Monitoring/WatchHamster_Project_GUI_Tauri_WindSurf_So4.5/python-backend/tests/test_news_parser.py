@@ -0,0 +1,145 @@
+"""
+통합 뉴스 파서 테스트
+"""
+
+import pytest
+
+from core.news_parser import NewsDataParser, PatternExtractionEngine
+
+
+SAMPLE_NEWS = {
+    'exchange-rate': {
+        'title': '원달러 환율 1,350원 마감',
+        'content': '원달러 환율이 전일 대비 5원 상승한 1,350원에 마감했습니다. 엔화 905.3원',
+        'date': '20250102',
+        'time': '163000'
+    },
+    'newyork-market-watch': {
+        'title': '뉴욕증시 상승 마감',
+        'content': '다우존스 35,000포인트, 나스닥 14,000포인트로 상승 마감',
+        'date': '20250102',
+        'time': '060000'
+    },
+    'kospi-close': {
+        'title': '코스피 2,500포인트 상승 마감',
+        'content': '코스피가 전일 대비 20포인트 상승한 2,500포인트에 마감. 외국인 1,200억 순매수',
+        'date': '20250102',
+        'time': '154000'
+    }
+}
+
+
+class TestPatternExtractionEngine:
+    """단일 패스 추출 엔진 테스트"""
+
+    @pytest.mark.unit
+    def test_scan_returns_hits_with_positions(self):
+        """모든 매칭 결과를 위치와 함께 반환"""
+        engine = PatternExtractionEngine({
+            'usd_krw': [r'원달러\s*([0-9,]+\.?[0-9]*)'],
+            'kospi': [r'코스피\s*([0-9,]+\.?[0-9]*)']
+        })
+        text = '원달러 1,350 그리고 코스피 2,500'
+
+        hits = engine.scan(text)
+
+        assert [(hit.field, hit.value) for hit in hits] == [('usd_krw', 1350.0), ('kospi', 2500.0)]
+        assert text[hits[1].start:hits[1].end] == '코스피 2,500'
+
+    @pytest.mark.unit
+    def test_best_hits_respects_pattern_priority(self):
+        """앞선 패턴이 뒤에 있더라도 우선순위가 높은 패턴 선택"""
+        engine = PatternExtractionEngine({
+            'dow': [r'다우존스\s*([0-9,]+)', r'DOW\s*([0-9,]+)']
+        })
+
+        best = engine.best_hits('DOW 100 ... 다우존스 200')
+
+        assert best['dow'].value == 200.0
+        assert best['dow'].pattern_index == 0
+
+    @pytest.mark.unit
+    def test_pattern_without_capture_group_is_rejected(self):
+        """값 캡처 그룹이 없는 패턴은 거부"""
+        with pytest.raises(ValueError):
+            PatternExtractionEngine({'bad': [r'코스피\s*(?:지수)?']})
+
+
+class TestNewsDataParser:
+    """뉴스 파서 전문 데이터 테스트"""
+
+    @pytest.mark.unit
+    async def test_parse_specialized_data(self):
+        """타입별 전문 데이터가 추출 엔진 결과로 채워짐"""
+        parser = NewsDataParser()
+
+        parsed = await parser.parse_news_data(SAMPLE_NEWS)
+
+        exchange = parsed['exchange-rate'].specialized_data
+        assert exchange['usd_krw_rate']['rate'] == 1350.0
+        assert exchange['major_currencies'][0]['currency_pair'] == 'JPY/KRW'
+
+        indices = parsed['newyork-market-watch'].specialized_data['major_indices']
+        assert [index['name'] for index in indices] == ['다우존스', '나스닥']
+
+        kospi = parsed['kospi-close'].specialized_data
+        assert kospi['main_indices'][0]['value'] == 2500.0
+        assert kospi['trading_flow']['foreign_net'] == 1200.0
+
+
+class TestParseMany:
+    """기간 단위 일괄 파싱 테스트"""
+
+    @pytest.mark.unit
+    def test_columnar_result_sorted_by_date(self):
+        """날짜순 컬럼형 결과 반환"""
+        parser = NewsDataParser()
+        later = {
+            'kospi-close': {'title': '코스피 2,550포인트 마감', 'content': '', 'date': '20250103', 'time': '154000'}
+        }
+
+        result = parser.parse_many({'20250103': later, '20250102': SAMPLE_NEWS})
+
+        assert result.dates == ['20250102', '20250103']
+        kospi = result.instruments['kospi']
+        assert kospi.dates == ['20250102', '20250103']
+        assert kospi.values.tolist() == [2500.0, 2550.0]
+        assert result.instruments['usd_krw'].values.tolist() == [1350.0]
+        assert result.market_situations['kospi-close']['20250102'] == '상승'
+
+    @pytest.mark.unit
+    def test_accepts_list_of_raw_responses(self):
+        """날짜 키 없이 원시 응답 목록도 처리"""
+        parser = NewsDataParser()
+
+        result = parser.parse_many([SAMPLE_NEWS])
+
+        assert result.dates == ['20250102']
+        assert set(result.instruments) >= {'usd_krw', 'dow', 'nasdaq', 'kospi'}
+
+    @pytest.mark.slow
+    def test_process_pool_matches_sequential(self):
+        """프로세스 풀 분산 결과가 순차 결과와 동일"""
+        parser = NewsDataParser()
+        raw_days = {f"2025{month:02d}{day:02d}": SAMPLE_NEWS for month in range(1, 4) for day in range(1, 21)}
+
+        sequential = parser.parse_many(raw_days)
+        parallel = parser.parse_many(raw_days, max_workers=2, chunk_size=16)
+
+        assert parallel.to_dict() == sequential.to_dict()
+
+    @pytest.mark.slow
+    def test_process_pool_uses_custom_patterns(self):
+        """프로세스 풀 작업자도 호출한 파서의 사용자 지정 패턴/키워드 사용"""
+        parser = NewsDataParser()
+        parser.extraction_engine = PatternExtractionEngine({'kospi': [r'종합지수\s*([0-9,]+\.?[0-9]*)']})
+        parser.market_keywords = {'positive': ['껑충'], 'negative': [], 'mixed': []}
+        day = {'kospi-close': {'title': '종합지수 2,600 껑충', 'content': '코스피 2,500', 'date': '20250102'}}
+        raw_days = {f"202501{day_index:02d}": day for day_index in range(1, 21)}
+
+        sequential = parser.parse_many(raw_days)
+        parallel = parser.parse_many(raw_days, max_workers=2, chunk_size=4)
+
+        assert parallel.to_dict() == sequential.to_dict()
+        assert set(parallel.instruments['kospi'].values.tolist()) == {2600.0}
+        assert set(parallel.market_situations['kospi-close'].values()) == {'상승'}
@@ -0,0 +1,192 @@
+"""
+뉴스 스냅샷 서비스 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from core.news_snapshot import NewsSnapshotService
+
+
+class FakeFetcher:
+    """호출 횟수를 기록하는 업스트림"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = []
+        self.responses = {}
+
+    async def __call__(self, news_type, date=None):
+        self.calls.append((news_type, date))
+        await asyncio.sleep(self.delay)
+        response = self.responses.get(news_type, {"title": f"{news_type} 뉴스"})
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class TestNewsSnapshotService:
+    """단일 실행 조회 및 버전 관리 테스트"""
+
+    @pytest.mark.unit
+    async def test_concurrent_gets_share_one_upstream_call(self):
+        """동시에 들어온 같은 타입 조회는 업스트림 한 번으로 합류"""
+        fetcher = FakeFetcher()
+        service = NewsSnapshotService(fetcher)
+
+        results = await asyncio.gather(*(service.get("kospi-close") for _ in range(5)))
+
+        assert fetcher.calls == [("kospi-close", None)]
+        assert all(result is results[0] for result in results)
+        assert service.coalesced == 4
+
+    @pytest.mark.unit
+    async def test_fresh_snapshot_served_without_fetch(self):
+        """max_age 안에서는 보관된 스냅샷 반환, force는 새로 조회"""
+        now = [0.0]
+        fetcher = FakeFetcher(delay=0)
+        service = NewsSnapshotService(fetcher, max_age=30, clock=lambda: now[0])
+
+        await service.get("exchange-rate")
+        now[0] = 10
+        await service.get("exchange-rate")
+        assert len(fetcher.calls) == 1
+
+        await service.get("exchange-rate", force=True)
+        now[0] = 50
+        await service.get("exchange-rate")
+        assert len(fetcher.calls) == 3
+
+    @pytest.mark.unit
+    async def test_version_bumps_only_on_change(self):
+        """데이터가 바뀔 때만 버전 증가 및 구독자 알림"""
+        fetcher = FakeFetcher(delay=0)
+        service = NewsSnapshotService(fetcher, max_age=0)
+        notified = []
+        service.subscribe(lambda snapshot: notified.append(snapshot.version))
+
+        first = await service.get("kospi-close")
+        same = await service.get("kospi-close")
+        fetcher.responses["kospi-close"] = RuntimeError("업스트림 오류")
+        failed = await service.get("kospi-close")
+
+        assert (first.version, same.version, failed.version) == (1, 1, 2)
+        assert failed.status == "error"
+        assert failed.error == "업스트림 오류"
+        assert notified == [1, 2]
+
+    @pytest.mark.unit
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self):
+        """한 호출자가 취소되어도 진행 중인 조회는 다른 호출자에게 완료"""
+        fetcher = FakeFetcher(delay=0.1)
+        service = NewsSnapshotService(fetcher)
+
+        cancelled = asyncio.ensure_future(service.get("newyork-market-watch"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(service.get("newyork-market-watch"))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+
+        snapshot = await waiter
+        assert snapshot.data == {"title": "newyork-market-watch 뉴스"}
+        assert len(fetcher.calls) == 1
+
+    @pytest.mark.unit
+    async def test_timeout_cancels_unshared_fetch(self):
+        """기다리는 호출자가 없어지면 업스트림 조회 취소"""
+        fetcher = FakeFetcher(delay=1)
+        service = NewsSnapshotService(fetcher)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await service.get("kospi-close", timeout=0.05)
+        await asyncio.sleep(0)
+
+        assert service.cancelled == 1
+        assert service.get_stats()['inflight'] == 0
+        assert service.latest("kospi-close") is None
+
+
+class TestParallelNewsRefresh:
+    """api/news 뉴스 타입별 동시 갱신 테스트"""
+
+    @pytest.fixture
+    def news_module(self, monkeypatch):
+        from api import news
+
+        fetcher = FakeFetcher()
+        monkeypatch.setattr(news, "news_snapshot_service", NewsSnapshotService(fetcher))
+        monkeypatch.setattr(news, "last_refresh_results", {})
+        monkeypatch.setattr(news, "applied_snapshots", {})
+        return news, fetcher
+
+    @pytest.mark.unit
+    async def test_types_refresh_concurrently(self, news_module):
+        """타입별 조회가 동시에 실행되어 전체 시간이 가장 느린 타입 수준"""
+        news, fetcher = news_module
+        fetcher.delay = 0.2
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        results = await news._refresh_news_task(["exchange-rate", "newyork-market-watch", "kospi-close"], force=True)
+        elapsed = loop.time() - started
+
+        assert elapsed < 0.4
+        assert {result['status'] for result in results.values()} == {"success"}
+        assert all(result['latency_ms'] >= 150 for result in results.values())
+        assert news.last_refresh_results == results
+
+    @pytest.mark.unit
+    async def test_slow_type_times_out_alone(self, news_module):
+        """느린 타입만 시간 초과 처리되고 나머지는 즉시 반영"""
+        news, fetcher = news_module
+
+        async def fetch(news_type, date=None):
+            await asyncio.sleep(1 if news_type == "kospi-close" else 0)
+            return {"title": news_type}
+
+        news.news_snapshot_service.fetcher = fetch
+        results = await news._refresh_news_task(["exchange-rate", "kospi-close"], force=True, timeout=0.1)
+
+        assert results["exchange-rate"]['status'] == "success"
+        assert news.news_status_store["exchange-rate"]["status"] == "latest"
+        assert results["kospi-close"]['status'] == "error"
+        assert "시간 초과" in news.news_status_store["kospi-close"]["error_message"]
+
+    @pytest.mark.unit
+    async def test_latency_reports_upstream_fetch_time(self, news_module, monkeypatch):
+        """지연 시간은 대기 시간이 아닌 스냅샷의 업스트림 조회 시간"""
+        news, fetcher = news_module
+        fetcher.delay = 0.05
+        service = news.news_snapshot_service
+        original_get = service.get
+
+        async def delayed_get(*args, **kwargs):
+            await asyncio.sleep(0.3)  # 대기열/락 대기 흉내
+            return await original_get(*args, **kwargs)
+
+        monkeypatch.setattr(service, "get", delayed_get)
+        results = await news._refresh_news_task(["exchange-rate"], force=True)
+
+        assert results["exchange-rate"]['status'] == "success"
+        assert 40 <= results["exchange-rate"]['latency_ms'] < 250
+
+    @pytest.mark.unit
+    async def test_cached_snapshot_reported_and_not_reapplied(self, news_module):
+        """보관된 스냅샷은 캐시 적중으로 보고하고 이력에 다시 추가하지 않음"""
+        news, fetcher = news_module
+        fetcher.delay = 0
+        first = await news._refresh_news_task(["exchange-rate"], force=True)
+        history_count = len(news.news_history_store)
+
+        second = await news._refresh_news_task(["exchange-rate"])
+        snapshot = news.news_snapshot_service.latest("exchange-rate")
+
+        assert first["exchange-rate"]["cached"] is False
+        assert second["exchange-rate"]["cached"] is True
+        assert second["exchange-rate"]["status"] == "success"
+        assert len(fetcher.calls) == 1
+        assert len(news.news_history_store) == history_count
+        status = news.news_status_store["exchange-rate"]
+        assert status["status"] == "latest"
+        assert status["last_update"] == snapshot.fetched_at
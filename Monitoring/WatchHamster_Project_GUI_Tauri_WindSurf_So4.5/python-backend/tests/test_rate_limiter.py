@@ -0,0 +1,118 @@
+"""
+슬라이딩 윈도 레이트 리미터 및 미들웨어 테스트
+"""
+
+import uuid
+
+import pytest
+
+from utils.rate_limiter import (
+    SHARED_MEMORY_AVAILABLE,
+    RateLimiter,
+    SharedMemoryRateLimitBackend,
+    parse_route_limits,
+)
+
+
+class TestRateLimiter:
+    """한도/경로/정리 테스트"""
+
+    @pytest.mark.unit
+    def test_sliding_window(self):
+        """이전 윈도 요청은 경과 비율만큼 가중치가 줄어듦"""
+        limiter = RateLimiter(calls=10, period=60)
+
+        assert all(limiter.check("1.1.1.1", "/api/x", now=50).allowed for _ in range(10))
+        blocked = limiter.check("1.1.1.1", "/api/x", now=59)
+        assert not blocked.allowed and 0 < blocked.retry_after <= 2
+
+        # 다음 윈도 중간: 이전 윈도 10건 × 0.5 = 5건으로 추정
+        allowed = [limiter.check("1.1.1.1", "/api/x", now=90).allowed for _ in range(6)]
+        assert allowed == [True] * 5 + [False]
+        assert limiter.check("2.2.2.2", "/api/x", now=90).allowed
+        assert limiter.get_stats()["throttled"] == 2
+
+    @pytest.mark.unit
+    def test_route_limits(self):
+        """가장 긴 접두사 한도 적용, None은 제한 없음"""
+        limiter = RateLimiter(calls=100, period=60, route_limits=parse_route_limits(
+            "/api=100/60,/api/infomax=1/60,/health=0"
+        ))
+
+        assert limiter.check("ip", "/api/infomax/stock", now=0).allowed
+        assert not limiter.check("ip", "/api/infomax/stock", now=1).allowed
+        assert limiter.check("ip", "/api/news", now=1).allowed
+        assert limiter.check("ip", "/health", now=1) is None
+        assert limiter.get_stats()["throttled_by_route"] == {"/api/infomax": 1}
+
+    @pytest.mark.unit
+    def test_idle_eviction(self):
+        """유휴 클라이언트는 주기적으로 제거"""
+        limiter = RateLimiter(calls=5, period=60, idle_timeout=120, evict_interval=30)
+        for index in range(100):
+            limiter.check(f"10.0.0.{index}", "/", now=limiter._next_eviction - 1)
+
+        limiter.check("10.0.1.1", "/", now=limiter._next_eviction + 200)
+
+        assert len(limiter.backend) == 1
+        assert limiter.evicted == 100
+
+
+@pytest.mark.skipif(not SHARED_MEMORY_AVAILABLE, reason="shared_memory 미지원")
+class TestSharedMemoryBackend:
+    """워커 간 공유 테스트 (같은 이름의 백엔드 두 개로 워커 흉내)"""
+
+    @pytest.mark.unit
+    def test_limit_shared_between_workers(self, temp_dir):
+        name = f"wh_test_{uuid.uuid4().hex[:8]}"
+        lock_path = str(temp_dir / "ratelimit.lock")
+        first = SharedMemoryRateLimitBackend(name=name, slots=64, lock_path=lock_path)
+        second = SharedMemoryRateLimitBackend(name=name, slots=64, lock_path=lock_path)
+        try:
+            worker_a = RateLimiter(calls=3, period=60, backend=first, totals_flush=1)
+            worker_b = RateLimiter(calls=3, period=60, backend=second, totals_flush=1)
+
+            results = [worker.check("ip", "/", now=10).allowed for worker in (worker_a, worker_b, worker_a, worker_b)]
+
+            assert first.created and not second.created
+            assert results == [True, True, True, False]
+            assert worker_a.get_stats()["all_workers"] == {"allowed": 3, "throttled": 1, "overflow": 0}
+            assert first.evict_idle(now=1000, idle_timeout=60) == 1
+            assert len(second) == 0
+        finally:
+            second.close()
+            first.close(unlink=True)
+
+
+class TestRateLimitMiddleware:
+    """미들웨어 응답 테스트"""
+
+    @pytest.mark.unit
+    def test_429_and_headers(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from utils.middleware import RateLimitMiddleware
+
+        app = FastAPI()
+        limiter = RateLimiter(calls=2, period=60, route_limits={"/health": None})
+        app.add_middleware(RateLimitMiddleware, limiter=limiter)
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        @app.get("/health")
+        async def health():
+            return {"ok": True}
+
+        client = TestClient(app)
+        first = client.get("/ping")
+        client.get("/ping")
+        blocked = client.get("/ping")
+
+        assert first.headers["X-RateLimit-Remaining"] == "1"
+        assert blocked.status_code == 429
+        assert int(blocked.headers["Retry-After"]) >= 1
+        assert client.get("/health").status_code == 200
+        assert limiter.get_stats()["allowed"] == 2
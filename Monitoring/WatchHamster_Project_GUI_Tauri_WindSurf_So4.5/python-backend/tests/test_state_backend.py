@@ -0,0 +1,127 @@
+"""
+런타임 상태 백엔드 및 리더 선출 테스트
+"""
+
+import pytest
+
+from core.leader_election import LeaderElection
+from core.state_backend import (
+    MemoryStateBackend,
+    SQLiteStateBackend,
+    StateBackend,
+    StateLog,
+    StateNamespace,
+    set_state_backend,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, temp_dir):
+    if request.param == "memory":
+        instance = MemoryStateBackend()
+    else:
+        instance = SQLiteStateBackend(str(temp_dir / "state.db"))
+    yield instance
+    instance.close()
+
+
+class TestStateBackend:
+    """백엔드 공통 동작 테스트"""
+
+    @pytest.mark.unit
+    def test_key_value_and_changes(self, backend):
+        """merge는 일부 필드만 갱신하고 changes_since는 이후 변경만 반환"""
+        backend.set("ns", "a", {"status": "ok", "count": 1})
+        revision, _ = backend.changes_since("ns", 0)
+        backend.set("ns", "b", {"status": "new"})
+
+        merged = backend.merge("ns", "a", {"count": 2})
+        latest, changed = backend.changes_since("ns", revision)
+
+        assert merged == {"status": "ok", "count": 2}
+        assert set(changed) == {"a", "b"} and latest > revision
+        assert backend.changes_since("ns", latest) == (latest, {})
+        assert backend.delete("ns", "b") and backend.get("ns", "b") is None
+
+    @pytest.mark.unit
+    def test_log_trim_match_and_tail(self, backend):
+        """로그는 max_items개만 유지하고 match/tail로 조회"""
+        for index in range(5):
+            backend.append("log", {"type": "a" if index % 2 else "b", "index": index}, max_items=3)
+
+        assert [entry["index"] for entry in backend.entries("log")] == [2, 3, 4]
+        assert backend.entries("log", match={"type": "a"}) == [{"type": "a", "index": 3}]
+        assert backend.count("log", match={"type": "b"}) == 2
+
+        seq, _ = backend.tail("log", 0)
+        backend.append("log", {"type": "c", "index": 5})
+        assert backend.tail("log", seq)[1] == [{"type": "c", "index": 5}]
+        assert backend.clear("log", match={"type": "b"}) == 2
+        assert backend.count("log") == 2
+
+    @pytest.mark.unit
+    def test_incomplete_backend_fails_at_instantiation(self):
+        """필수 메서드가 빠진 백엔드는 요청 처리 중이 아니라 생성 시점에 실패"""
+        class PartialBackend(StateBackend):
+            def get(self, namespace, key, default=None):
+                return default
+
+        with pytest.raises(TypeError):
+            PartialBackend()
+
+
+class TestSharedState:
+    """sqlite 백엔드를 공유하는 두 워커 흉내"""
+
+    @pytest.mark.unit
+    def test_workers_share_namespace_and_log(self, temp_dir):
+        db_path = str(temp_dir / "shared.db")
+        first = SQLiteStateBackend(db_path)
+        second = SQLiteStateBackend(db_path)
+        try:
+            set_state_backend(first)
+            store = StateNamespace("news", defaults={"x": {"status": "unknown"}})
+            history = StateLog("news_history", max_items=10)
+            store.merge("x", status="latest")
+            history.append({"type": "x"})
+
+            # 두 번째 워커는 기본값으로 덮어쓰지 않고 기존 상태를 읽음
+            set_state_backend(second)
+            assert store["x"]["status"] == "latest"
+            assert len(history) == 1
+        finally:
+            set_state_backend(None)
+            first.close()
+
+
+class TestLeaderElection:
+    """잠금 파일 기반 리더 선출 테스트"""
+
+    @pytest.mark.unit
+    def test_single_leader(self, temp_dir):
+        lock_path = str(temp_dir / "leader.lock")
+        first = LeaderElection(lock_path)
+        second = LeaderElection(lock_path)
+        try:
+            assert first.try_acquire()
+            assert not second.try_acquire()
+
+            first.release()
+            assert second.try_acquire()
+            assert second.get_status()["is_leader"]
+        finally:
+            first.release()
+            second.release()
+
+    @pytest.mark.unit
+    async def test_wait_for_leadership(self, temp_dir):
+        lock_path = str(temp_dir / "leader.lock")
+        leader = LeaderElection(lock_path)
+        follower = LeaderElection(lock_path, retry_interval=0.01)
+        assert leader.try_acquire()
+
+        leader.release()
+        await follower.wait_for_leadership()
+
+        assert follower.is_leader
+        follower.release()
@@ -0,0 +1,128 @@
+"""
+버전 관리 상태 채널(스냅샷 + JSON Patch 델타) 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from utils.state_channel import StateChannel, apply_patch, make_patch
+
+
+class FakeWebSocket:
+    """전송 메시지를 기록하는 WebSocket"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        self.sent.append(message)
+
+
+class TestJsonPatch:
+    """패치 계산/적용 테스트"""
+
+    @pytest.mark.unit
+    def test_round_trip(self):
+        """make_patch 결과를 적용하면 새 문서와 같아짐"""
+        old = {"cpu": 10, "services": {"a": {"status": "running"}, "b/c": 1}, "files": ["x"]}
+        new = {"cpu": 12, "services": {"a": {"status": "stopped"}, "d": 2}, "files": ["x", "y"]}
+
+        ops = make_patch(old, new)
+
+        assert apply_patch(old, ops) == new
+        assert {"op": "remove", "path": "/services/b~1c"} in ops
+        assert {"op": "replace", "path": "/services/a/status", "value": "stopped"} in ops
+        assert old["cpu"] == 10
+
+    @pytest.mark.unit
+    def test_no_change(self):
+        """같은 문서면 빈 패치"""
+        assert make_patch({"a": [1, 2]}, {"a": [1, 2]}) == []
+
+
+class TestStateChannel:
+    """버전/직렬화 공유 테스트"""
+
+    @pytest.mark.unit
+    def test_versions_and_shared_messages(self):
+        """변경 시에만 버전이 오르고 메시지는 버전마다 한 번만 직렬화"""
+        channel = StateChannel("system_metrics", "system_metrics_update")
+        services = {f"service-{i}": {"status": "running", "pid": i} for i in range(20)}
+
+        assert channel.update({"cpu": 10, "services": services})
+        assert not channel.update({"cpu": 10, "services": services})
+        assert channel.snapshot_message() is channel.snapshot_message()
+        assert channel.update({"cpu": 20, "services": services})
+
+        delta = json.loads(channel.delta_message(2))
+        assert channel.version == 2 and channel.unchanged == 1
+        assert delta["base_version"] == 1
+        assert delta["ops"] == [{"op": "replace", "path": "/cpu", "value": 20}]
+        assert json.loads(channel.snapshot_message())["data"]["cpu"] == 20
+
+    @pytest.mark.unit
+    def test_history_limit(self):
+        """보관 범위를 넘은 델타는 제공하지 않음"""
+        channel = StateChannel("git_status", "git_status_update", history=2)
+        for value in range(5):
+            channel.update({"value": value, "padding": "x" * 50})
+
+        assert channel.delta_message(3) is None
+        assert channel.delta_message(5) is not None
+
+
+class TestConnectionManagerStateChannels:
+    """클라이언트별 델타/스냅샷 선택 테스트"""
+
+    @pytest.mark.unit
+    async def test_delta_clients_and_legacy_clients(self):
+        """델타 사용 클라이언트는 스냅샷 1회 후 델타, 기존 클라이언트는 전체 문서"""
+        from api.websocket import ConnectionManager
+
+        manager = ConnectionManager()
+        channel = StateChannel("service_status", "service_status_update")
+        channel.update({"services": {"a": {"status": "running"}, "b": {"status": "running"}}})
+        delta_client, legacy_client = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(delta_client, "delta")
+        await manager.connect(legacy_client, "legacy")
+
+        manager.enable_state_channels(delta_client, [channel])
+        channel.update({"services": {"a": {"status": "stopped"}, "b": {"status": "running"}}})
+        await manager.publish_state(channel, "service_events")
+        await asyncio.sleep(0.01)
+
+        snapshot, patch = (json.loads(message) for message in delta_client.sent)
+        assert snapshot["snapshot"] is True and snapshot["version"] == 1
+        assert patch["type"] == "state_patch" and patch["base_version"] == 1
+        assert apply_patch(snapshot["data"], patch["ops"]) == json.loads(legacy_client.sent[0])["data"]
+        assert legacy_client.sent[0] is channel.snapshot_message()
+        manager.shutdown()
+
+    @pytest.mark.unit
+    async def test_unacknowledged_client_gets_snapshot(self):
+        """확인 버전이 보관 범위보다 뒤처지면 델타 대신 스냅샷"""
+        from api.websocket import ConnectionManager
+
+        manager = ConnectionManager()
+        channel = StateChannel("git_status", "git_status_update", history=2)
+        client = FakeWebSocket()
+        await manager.connect(client, "client")
+
+        for modified_files in range(5):
+            channel.update({"branch": "main", "modified_files": modified_files, "padding": "x" * 50})
+            if modified_files == 0:
+                manager.enable_state_channels(client, [channel])
+            else:
+                await manager.publish_state(channel, "git_updates")
+            if modified_files == 2:
+                manager.ack_state(client, "git_status", 3)
+        await asyncio.sleep(0.01)
+
+        kinds = [json.loads(message).get("snapshot", False) for message in client.sent]
+        assert kinds == [True, False, True, False, False]
+        manager.shutdown()
@@ -0,0 +1,155 @@
+"""
+비동기 웹훅 디스패처 테스트
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pytest
+
+from core.webhook_dispatcher import AsyncWebhookDispatcher
+from core.webhook_sender import MessagePriority, WebhookEndpoint
+
+
+@dataclass
+class FakeMessage:
+    id: str
+    endpoint: WebhookEndpoint
+    priority: MessagePriority
+    retry_count: int = 0
+    max_retries: int = 3
+
+
+def _make_dispatcher(send_func, **kwargs) -> AsyncWebhookDispatcher:
+    dispatcher = AsyncWebhookDispatcher(
+        send_func=send_func,
+        endpoints=[WebhookEndpoint.NEWS_MAIN, WebhookEndpoint.WATCHHAMSTER],
+        **kwargs
+    )
+    dispatcher.start()
+    return dispatcher
+
+
+class TestAsyncWebhookDispatcher:
+    """디스패처 동작 테스트"""
+
+    @pytest.mark.unit
+    def test_retry_does_not_block_critical_alert(self):
+        """재시도 대기 중인 메시지가 긴급 알림을 막지 않음"""
+        delivered = []
+
+        async def send(message, client):
+            if message.id == "report":
+                return SimpleNamespace(success=False)
+            delivered.append((message.id, time.monotonic()))
+            return SimpleNamespace(success=True)
+
+        dispatcher = _make_dispatcher(send, workers_per_endpoint=1, retry_delay_func=lambda m: 0.5)
+        try:
+            started = time.monotonic()
+            dispatcher.submit(FakeMessage("report", WebhookEndpoint.NEWS_MAIN, MessagePriority.LOW, max_retries=1))
+            time.sleep(0.05)
+            dispatcher.submit(FakeMessage("critical", WebhookEndpoint.NEWS_MAIN, MessagePriority.CRITICAL))
+
+            assert dispatcher.wait_until_idle(timeout=3) == 0
+            assert delivered[0][0] == "critical"
+            assert delivered[0][1] - started < 0.4
+        finally:
+            dispatcher.shutdown(timeout=1)
+
+    @pytest.mark.unit
+    def test_final_failure_callback(self):
+        """최대 재시도 초과 시 실패 콜백 호출"""
+        failures = []
+        retries = []
+
+        async def send(message, client):
+            return SimpleNamespace(success=False)
+
+        dispatcher = _make_dispatcher(
+            send,
+            retry_delay_func=lambda m: 0.01,
+            on_retry=lambda m, r: retries.append(m.retry_count),
+            on_final_failure=lambda m, r: failures.append(m.id)
+        )
+        try:
+            dispatcher.submit(FakeMessage("broken", WebhookEndpoint.WATCHHAMSTER, MessagePriority.HIGH, max_retries=2))
+
+            assert dispatcher.wait_until_idle(timeout=3) == 0
+            assert retries == [1, 2]
+            assert failures == ["broken"]
+        finally:
+            dispatcher.shutdown(timeout=1)
+
+    @pytest.mark.unit
+    def test_workers_send_concurrently(self):
+        """엔드포인트별 작업자가 동시에 전송"""
+        async def send(message, client):
+            await asyncio.sleep(0.2)
+            return SimpleNamespace(success=True)
+
+        dispatcher = _make_dispatcher(send, workers_per_endpoint=4)
+        try:
+            started = time.monotonic()
+            for index in range(4):
+                dispatcher.submit(FakeMessage(f"m{index}", WebhookEndpoint.NEWS_MAIN, MessagePriority.NORMAL))
+
+            assert dispatcher.wait_until_idle(timeout=3) == 0
+            assert time.monotonic() - started < 0.6
+        finally:
+            dispatcher.shutdown(timeout=1)
+
+    @pytest.mark.unit
+    def test_submit_unknown_endpoint(self):
+        """등록되지 않은 엔드포인트는 거부"""
+        async def send(message, client):
+            return SimpleNamespace(success=True)
+
+        dispatcher = _make_dispatcher(send)
+        try:
+            with pytest.raises(ValueError):
+                dispatcher.submit(FakeMessage("x", WebhookEndpoint.TEST, MessagePriority.LOW))
+        finally:
+            dispatcher.shutdown(timeout=1)
+
+
+class TestSharedWebhookSender:
+    """공유 전송자 및 디스패처 지연 시작 테스트"""
+
+    @pytest.mark.unit
+    def test_dispatcher_starts_once_on_demand(self):
+        """전송자를 만들어도 디스패처 스레드는 시작되지 않고, start()는 한 번만 시작"""
+        from core.webhook_sender import DoorayWebhookSender
+
+        sender = DoorayWebhookSender(test_mode=True, durable=False, recover_backlog=False)
+        try:
+            assert not sender.dispatcher.is_running
+
+            sender.start()
+            thread = sender.dispatcher._thread
+            sender.start()
+
+            assert sender.dispatcher.is_running
+            assert sender.dispatcher._thread is thread
+        finally:
+            sender.shutdown(timeout=1)
+
+    @pytest.mark.unit
+    def test_get_webhook_sender_is_shared(self, monkeypatch):
+        """get_webhook_sender는 같은 인스턴스를 돌려주고 종료 시 비움"""
+        from core import webhook_sender
+
+        monkeypatch.setattr(webhook_sender, "_shared_sender", None)
+        monkeypatch.setattr(
+            webhook_sender, "DoorayWebhookSender",
+            lambda: webhook_sender.WebhookSender(test_mode=True, durable=False, recover_backlog=False)
+        )
+
+        first = webhook_sender.get_webhook_sender()
+        assert webhook_sender.get_webhook_sender() is first
+
+        webhook_sender.shutdown_webhook_sender(timeout=1)
+        assert webhook_sender._shared_sender is None
+        assert not first.is_running
@@ -0,0 +1,251 @@
+"""
+웹훅 아웃박스 테스트
+"""
+
+import subprocess
+import time
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from core.webhook_dispatcher import AsyncWebhookDispatcher
+from core.webhook_outbox import WebhookOutbox
+from core.webhook_sender import BotType, MessagePriority, WebhookEndpoint, WebhookMessage
+from database.db import Database
+
+
+def _make_message(message_id: str, priority: MessagePriority = MessagePriority.NORMAL,
+                  endpoint: WebhookEndpoint = WebhookEndpoint.NEWS_MAIN) -> WebhookMessage:
+    return WebhookMessage(
+        id=message_id,
+        bot_type=BotType.NEWS_STATUS,
+        priority=priority,
+        endpoint=endpoint,
+        bot_name="POSCO 뉴스",
+        bot_icon="",
+        title=f"제목 {message_id}",
+        content="본문",
+        color="#0066cc",
+        timestamp=datetime(2025, 1, 2, 9, 0)
+    )
+
+
+@pytest.fixture
+def outbox(temp_dir):
+    db = Database(str(temp_dir / "outbox.db"))
+    return WebhookOutbox(db, decode=WebhookMessage.from_dict)
+
+
+def _dead_owner_outbox(outbox) -> WebhookOutbox:
+    """이미 종료된 프로세스가 점유자인 아웃박스 (이전 실행 흉내)"""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    previous = WebhookOutbox(outbox.db, decode=WebhookMessage.from_dict)
+    previous.owner = f"{previous.hostname}:{process.pid}:previous"
+    return previous
+
+
+def _make_dispatcher(outbox, send, **kwargs) -> AsyncWebhookDispatcher:
+    dispatcher = AsyncWebhookDispatcher(
+        send_func=send,
+        endpoints=[WebhookEndpoint.NEWS_MAIN, WebhookEndpoint.WATCHHAMSTER],
+        retry_delay_func=lambda m: 0.01,
+        outbox=outbox,
+        **kwargs
+    )
+    dispatcher.start()
+    return dispatcher
+
+
+class TestWebhookOutboxTable:
+    """아웃박스 테이블 동작 테스트"""
+
+    @pytest.mark.unit
+    def test_message_round_trip(self):
+        """메시지 직렬화/복원 왕복"""
+        message = _make_message("m1", MessagePriority.HIGH)
+
+        restored = WebhookMessage.from_dict(message.to_dict())
+
+        assert restored == message
+
+    @pytest.mark.unit
+    def test_claim_in_priority_batches(self, outbox):
+        """대기 메시지를 우선순위 순으로 일괄 점유"""
+        for message_id, priority in [("low", MessagePriority.LOW), ("normal", MessagePriority.NORMAL),
+                                     ("critical", MessagePriority.CRITICAL), ("high", MessagePriority.HIGH)]:
+            outbox.enqueue(_make_message(message_id, priority), claimed=False)
+
+        first, first_rows = outbox.claim(WebhookEndpoint.NEWS_MAIN, 2)
+        second, _ = outbox.claim(WebhookEndpoint.NEWS_MAIN, 2)
+        rest, rest_rows = outbox.claim(WebhookEndpoint.NEWS_MAIN, 2)
+
+        assert [m.id for m in first] == ["critical", "high"]
+        assert first_rows == 2
+        assert [m.id for m in second] == ["normal", "low"]
+        assert (rest, rest_rows) == ([], 0)
+
+    @pytest.mark.unit
+    def test_duplicate_id_rejected(self, outbox):
+        """같은 ID는 한 번만 기록"""
+        outbox.enqueue(_make_message("dup"))
+
+        with pytest.raises(ValueError):
+            outbox.enqueue(_make_message("dup"))
+
+    @pytest.mark.unit
+    def test_stats_from_outbox_rows(self, outbox):
+        """전송 통계와 웹훅 로그 통계가 아웃박스에서 집계됨"""
+        ok = _make_message("ok")
+        bad = _make_message("bad")
+        outbox.enqueue(ok)
+        outbox.enqueue(bad)
+        outbox.enqueue(_make_message("waiting"))
+        ok.retry_count = 1
+        outbox.complete(ok, SimpleNamespace(processing_time=0.2, error_message=None), True)
+        outbox.complete(bad, SimpleNamespace(processing_time=0.1, error_message="HTTP 500"), False)
+
+        stats = outbox.get_stats()
+        assert stats['total_sent'] == 2
+        assert stats['successful_sends'] == 1
+        assert stats['failed_sends'] == 1
+        assert stats['unsent'] == 1
+        assert stats['retry_attempts'] == 1
+        assert stats['average_response_time'] == pytest.approx(0.2)
+
+        webhook_stats = outbox.db.get_webhook_stats('posco')
+        assert webhook_stats['total_sent'] == 2
+        assert webhook_stats['retry_attempts'] == 1
+
+        assert outbox.dismiss_failed() == 1
+        assert outbox.get_stats()['failed_messages'] == 0
+        assert outbox.get_stats()['failed_sends'] == 1
+
+    @pytest.mark.unit
+    def test_logged_outbox_message_counted_once(self, outbox):
+        """같은 메시지의 웹훅 로그와 아웃박스 행은 한 번만 집계되고 로그는 전송 결과로 갱신"""
+        message = _make_message("logged")
+        outbox.enqueue(message)
+        outbox.db.queue_webhook_log({
+            'id': "logged", 'company_id': 'posco', 'message_type': 'status', 'bot_type': 'NEWS_STATUS',
+            'priority': 'NORMAL', 'endpoint': 'NEWS_MAIN', 'status': 'pending', 'message_id': "logged"
+        })
+
+        assert outbox.db.get_webhook_stats('posco')['total_sent'] == 0
+
+        outbox.complete(message, SimpleNamespace(processing_time=0.1, error_message=None), True)
+
+        stats = outbox.db.get_webhook_stats('posco')
+        assert (stats['total_sent'], stats['successful_sends']) == (1, 1)
+        assert outbox.db.get_webhook_logs('posco')[0]['status'] == 'success'
+
+
+class TestClaimRecovery:
+    """점유자/점유 기간 기반 복구 테스트"""
+
+    @pytest.mark.unit
+    def test_live_claims_are_kept(self, outbox):
+        """같은 프로세스의 다른 전송자가 점유한 메시지는 되돌리지 않음"""
+        other_sender = WebhookOutbox(outbox.db, decode=WebhookMessage.from_dict)
+        other_sender.enqueue(_make_message("in-flight"))
+        _dead_owner_outbox(outbox).enqueue(_make_message("orphan"))
+
+        assert outbox.recover([WebhookEndpoint.NEWS_MAIN]) == 1
+        messages, _ = outbox.claim(WebhookEndpoint.NEWS_MAIN, 10)
+        assert [m.id for m in messages] == ["orphan"]
+
+    @pytest.mark.unit
+    def test_expired_lease_on_other_host(self, outbox):
+        """생존 여부를 알 수 없는 점유자는 점유 기간이 지나야 되돌림"""
+        remote = WebhookOutbox(outbox.db, decode=WebhookMessage.from_dict)
+        remote.owner = "other-host:1:remote"
+        remote.enqueue(_make_message("remote"))
+
+        assert outbox.recover([WebhookEndpoint.NEWS_MAIN]) == 0
+
+        stale = (datetime.now() - timedelta(seconds=outbox.lease_seconds + 1)).isoformat()
+        conn = outbox.db.connect()
+        conn.execute("UPDATE webhook_outbox SET claimed_at = ?", (stale,))
+        conn.commit()
+        outbox.db.close()
+
+        assert outbox.recover([WebhookEndpoint.NEWS_MAIN]) == 1
+
+
+class TestDurableDispatcher:
+    """아웃박스 연동 디스패처 테스트"""
+
+    @pytest.mark.unit
+    def test_completion_updates_outbox(self, outbox):
+        """전송 완료와 최종 실패가 아웃박스에 기록됨"""
+        async def send(message, client):
+            return SimpleNamespace(success=message.id == "ok", processing_time=0.01, error_message=None)
+
+        dispatcher = _make_dispatcher(outbox, send)
+        try:
+            dispatcher.submit(_make_message("ok"))
+            failing = _make_message("fail", endpoint=WebhookEndpoint.WATCHHAMSTER)
+            failing.max_retries = 1
+            dispatcher.submit(failing)
+
+            assert dispatcher.wait_until_idle(timeout=3) == 0
+        finally:
+            dispatcher.shutdown(timeout=1)
+
+        stats = outbox.get_stats()
+        assert (stats['successful_sends'], stats['failed_sends'], stats['unsent']) == (1, 1, 0)
+        assert outbox.get_failed_messages()[0]['attempts'] == 2
+
+    @pytest.mark.unit
+    def test_resume_unsent_after_restart(self, outbox):
+        """재시작 시 미전송 메시지를 우선순위 순으로 재개"""
+        # 이전 실행에서 점유된 채 종료된 메시지
+        previous = _dead_owner_outbox(outbox)
+        previous.enqueue(_make_message("low", MessagePriority.LOW))
+        previous.enqueue(_make_message("critical", MessagePriority.CRITICAL))
+        previous.enqueue(_make_message("normal", MessagePriority.NORMAL))
+        delivered = []
+
+        async def send(message, client):
+            delivered.append(message.id)
+            return SimpleNamespace(success=True, processing_time=0.01, error_message=None)
+
+        dispatcher = _make_dispatcher(outbox, send, workers_per_endpoint=1, claim_batch_size=2)
+        try:
+            assert dispatcher.wait_until_idle(timeout=3) == 0
+            assert dispatcher.get_status()['recovered'] == 3
+        finally:
+            dispatcher.shutdown(timeout=1)
+
+        assert delivered == ["critical", "normal", "low"]
+        assert outbox.get_stats()['unsent'] == 0
+
+    @pytest.mark.unit
+    def test_periodic_recovery_only_when_leader(self, outbox):
+        """실행 중 종료된 워커가 남긴 메시지는 리더일 때 주기적 복구로 재개"""
+        delivered = []
+        leader = {"value": False}
+
+        async def send(message, client):
+            delivered.append(message.id)
+            return SimpleNamespace(success=True, processing_time=0.01, error_message=None)
+
+        dispatcher = _make_dispatcher(outbox, send, recovery_interval=0.05, should_recover=lambda: leader["value"])
+        try:
+            _dead_owner_outbox(outbox).enqueue(_make_message("orphan"))
+            time.sleep(0.2)
+            assert delivered == []
+
+            leader["value"] = True
+            dispatcher.request_recovery()
+            deadline = time.time() + 3
+            while not delivered and time.time() < deadline:
+                time.sleep(0.02)
+            assert dispatcher.wait_until_idle(timeout=3) == 0
+        finally:
+            dispatcher.shutdown(timeout=1)
+
+        assert delivered == ["orphan"]
+        assert outbox.get_stats()['unsent'] == 0
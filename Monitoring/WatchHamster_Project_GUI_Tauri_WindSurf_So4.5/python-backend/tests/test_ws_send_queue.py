@@ -0,0 +1,121 @@
+"""
+WebSocket 클라이언트별 송신 큐 및 토픽 브로드캐스트 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from utils.ws_send_queue import PRIORITY_LOW, PRIORITY_URGENT, ClientSendQueue
+
+
+class FakeWebSocket:
+    """전송 지연을 흉내내는 WebSocket"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("연결 끊김")
+        self.sent.append(message)
+
+
+class TestClientSendQueue:
+    """우선순위/합치기/한도 테스트"""
+
+    @pytest.mark.unit
+    async def test_priority_and_coalescing(self):
+        """대기 중인 상태 메시지는 최신 값으로 합쳐지고 긴급 메시지가 먼저 전송"""
+        ws = FakeWebSocket()
+        queue = ClientSendQueue(ws.send_text, lambda: None)
+
+        queue.put("metrics-1", PRIORITY_LOW, coalesce_key="metrics")
+        queue.put("metrics-2", PRIORITY_LOW, coalesce_key="metrics")
+        queue.put("alert", PRIORITY_URGENT)
+        queue.start()
+        await asyncio.sleep(0.01)
+        queue.close()
+
+        assert ws.sent == ["alert", "metrics-2"]
+        assert queue.coalesced == 1
+
+    @pytest.mark.unit
+    async def test_overflow_drops_lowest_priority(self):
+        """한도를 넘으면 낮은 우선순위의 오래된 메시지부터 폐기"""
+        queue = ClientSendQueue(FakeWebSocket().send_text, lambda: None, max_pending=2)
+
+        queue.put("low", PRIORITY_LOW)
+        queue.put("urgent-1", PRIORITY_URGENT)
+        queue.put("urgent-2", PRIORITY_URGENT)
+
+        assert queue.pending == 2
+        assert queue.dropped == 1
+        assert [queue._pop(), queue._pop()] == ["urgent-1", "urgent-2"]
+
+    @pytest.mark.unit
+    async def test_send_timeout_calls_failure(self):
+        """전송 시간 초과 시 실패 콜백 호출"""
+        failed = []
+        queue = ClientSendQueue(FakeWebSocket(delay=1).send_text, lambda: failed.append(True), send_timeout=0.05)
+
+        queue.start()
+        queue.put("message")
+        await asyncio.sleep(0.1)
+
+        assert failed == [True]
+
+
+class TestConnectionManagerFanOut:
+    """ConnectionManager 송신 큐 브로드캐스트 테스트"""
+
+    @pytest.mark.unit
+    async def test_slow_client_does_not_delay_others(self):
+        """느린 클라이언트가 있어도 브로드캐스트는 바로 반환되고 다른 클라이언트는 즉시 수신"""
+        from api.websocket import ConnectionManager
+
+        manager = ConnectionManager()
+        slow, fast = FakeWebSocket(delay=0.5), FakeWebSocket()
+        await manager.connect(slow, "slow")
+        await manager.connect(fast, "fast")
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await manager.broadcast("hello")
+        elapsed = loop.time() - started
+        await asyncio.sleep(0.01)
+
+        assert elapsed < 0.1
+        assert fast.sent == ["hello"]
+        assert slow.sent == []
+        manager.shutdown()
+
+    @pytest.mark.unit
+    async def test_topic_index_and_failed_client(self):
+        """토픽 구독 인덱스로 대상 선택, 전송 실패 클라이언트는 연결 해제"""
+        from api.websocket import ConnectionManager
+
+        manager = ConnectionManager()
+        metrics, news, broken = FakeWebSocket(), FakeWebSocket(), FakeWebSocket(fail=True)
+        for name, ws in (("metrics", metrics), ("news", news), ("broken", broken)):
+            await manager.connect(ws, name)
+        manager.subscribe(metrics, ["system_metrics"])
+        manager.subscribe(news, ["news_updates"])
+
+        await manager.broadcast("m1", event_type="system_metrics", coalesce_key="metrics")
+        await manager.broadcast("n1", event_type="news_updates")
+        await asyncio.sleep(0.01)
+
+        assert metrics.sent == ["m1"]
+        assert news.sent == ["n1"]
+        assert broken not in manager.active_connections
+        assert manager.topic_subscribers["system_metrics"] == {metrics}
+        assert manager.get_send_stats()["slow_disconnects"] == 1
+        manager.shutdown()
@@ -10,6 +10,7 @@ from .middleware import (
     RequestLoggingMiddleware,
     RateLimitMiddleware
 )
+from .rate_limiter import RateLimiter, get_rate_limiter
 
 __all__ = [
     "get_settings",
@@ -19,5 +20,7 @@ __all__ = [
     "TimingMiddleware",
     "SecurityHeadersMiddleware", 
     "RequestLoggingMiddleware",
-    "RateLimitMiddleware"
+    "RateLimitMiddleware",
+    "RateLimiter",
+    "get_rate_limiter"
 ]
\ No newline at end of file
@@ -37,10 +37,23 @@ class Settings(BaseSettings):
     # 데이터베이스 설정 (향후 사용)
     database_url: str = "sqlite:///./watchhamster.db"
     
+    # 런타임 상태 저장소 (memory: 단일 워커, sqlite: 여러 워커 공유)
+    state_backend: str = "memory"
+    state_db_path: str = "data/runtime_state.db"
+    leader_lock_path: str = ""  # 비우면 임시 디렉터리의 포트별 잠금 파일
+    workers: int = 1  # 2 이상이면 state_backend를 sqlite로 설정해야 워커 간 상태가 공유됨
+    
     # 보안 설정
     secret_key: str = "your-secret-key-here"
     access_token_expire_minutes: int = 30
     
+    # 레이트 리미트 설정
+    rate_limit_enabled: bool = False
+    rate_limit_calls: int = 100
+    rate_limit_period: int = 60
+    rate_limit_routes: str = ""  # 예: "/api/infomax=30/60,/health=0"
+    rate_limit_backend: str = "memory"  # memory | shared (여러 워커가 한도 공유)
+    
     # 외부 서비스 설정
     webhook_timeout: int = 30
     max_webhook_retries: int = 3
@@ -0,0 +1,97 @@
+"""
+프로세스 간 파일 잠금
+여러 uvicorn 워커가 공유 자원(공유 메모리 등)에 접근할 때 사용 (POSIX: fcntl, Windows: msvcrt)
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+    import msvcrt
+
+
+class InterProcessLock:
+    """잠금 파일 기반 프로세스 간 상호 배제 (같은 프로세스의 스레드 사이도 배제)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 잠금 파일 경로 (없으면 생성)
+        """
+        self.path = path
+        self._fd: Optional[int] = None
+        self._thread_lock = threading.Lock()
+
+    def _open(self) -> int:
+        if self._fd is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _try_lock(self, fd: int) -> bool:
+        try:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        잠금 획득
+
+        Args:
+            blocking: False면 즉시 반환
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            bool: 획득 여부
+        """
+        if not self._thread_lock.acquire(blocking, -1 if timeout is None else timeout):
+            return False
+
+        fd = self._open()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.0005
+        while not self._try_lock(fd):
+            if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                self._thread_lock.release()
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        return True
+
+    def release(self):
+        """잠금 해제"""
+        try:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            self._thread_lock.release()
+
+    def close(self):
+        """잠금 파일 닫기 (보유 중인 잠금도 해제됨)"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
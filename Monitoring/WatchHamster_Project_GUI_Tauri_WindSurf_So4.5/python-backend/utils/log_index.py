@@ -0,0 +1,311 @@
+"""
+로그 파일 사이드카 인덱스
+대용량 로그 파일을 매 요청마다 전체 읽지 않도록 바이트 오프셋 인덱스를 유지
+
+- 시간 버킷(1시간) 단위로 바이트 범위, 레벨별/로거별 건수 기록
+- WARNING 이상 레벨은 줄 단위 바이트 오프셋까지 기록
+- 파일이 커지면 새로 추가된 부분만 증분 인덱싱, 잘림/교체 시 재생성
+- 조회는 파일 끝(EOF)에서부터 역방향으로 필요한 줄만 읽음
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_DIR_NAME = ".index"
+OFFSET_INDEXED_LEVELS = ("WARNING", "ERROR", "CRITICAL")
+READ_BLOCK_SIZE = 64 * 1024
+HEAD_SIGNATURE_SIZE = 256
+BUCKET_FORMAT = "%Y-%m-%d %H"
+SAVE_INTERVAL = 30  # 사이드카 저장 최소 간격 (초), 저장 전 추가분은 재시작 시 다시 인덱싱
+
+# 기본 로그 포맷: 2024-01-01 12:00:00,123 - logger_name - LEVEL - message
+_LINE_PATTERN = re.compile(rb'(\d{4}-\d{2}-\d{2} \d{2}):\d{2}:\d{2},\d{3} - ([^-]+) - (\w+) - ')
+
+
+@dataclass
+class LogBucket:
+    """한 시간 구간에 해당하는 연속된 바이트 범위"""
+    hour: str
+    start: int
+    end: int
+    lines: int = 0
+    levels: Dict[str, int] = field(default_factory=dict)
+    loggers: Dict[str, int] = field(default_factory=dict)
+    marks: Dict[str, List[int]] = field(default_factory=dict)
+
+    @property
+    def hour_start(self) -> Optional[datetime]:
+        try:
+            return datetime.strptime(self.hour, BUCKET_FORMAT)
+        except ValueError:
+            return None
+
+    def overlaps(self, start_time: Optional[datetime], end_time: Optional[datetime]) -> bool:
+        """버킷 시간 구간이 조회 범위와 겹치는지 확인 (시간 미상 버킷은 항상 포함)"""
+        begin = self.hour_start
+        if begin is None:
+            return True
+        if start_time and begin + timedelta(hours=1) <= start_time:
+            return False
+        if end_time and begin > end_time:
+            return False
+        return True
+
+
+class LogFileIndex:
+    """단일 로그 파일의 증분 사이드카 인덱스"""
+
+    def __init__(self, log_path: Path, index_path: Optional[Path] = None):
+        """
+        Args:
+            log_path: 로그 파일 경로
+            index_path: 사이드카 인덱스 경로 (기본: 로그 디렉토리/.index/<파일명>.idx.json)
+        """
+        self.log_path = Path(log_path)
+        self.index_path = Path(index_path) if index_path else (
+            self.log_path.parent / INDEX_DIR_NAME / f"{self.log_path.name}.idx.json"
+        )
+        self.indexed_size = 0
+        self.head_signature = ""
+        self.buckets: List[LogBucket] = []
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._last_saved = 0.0
+
+    # ------------------------------------------------------------------
+    # 인덱스 유지
+    # ------------------------------------------------------------------
+    def refresh(self) -> bool:
+        """
+        파일 변경분을 인덱스에 반영
+
+        Returns:
+            bool: 인덱스가 갱신되었으면 True
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+
+            if not self.log_path.exists():
+                self._reset()
+                return False
+
+            size = self.log_path.stat().st_size
+            rebuilt = False
+            if size < self.indexed_size or (
+                self.indexed_size and self._read_head(len(self.head_signature) // 2) != self.head_signature
+            ):
+                # 잘림 또는 로테이션으로 다른 파일이 됨 → 처음부터 재생성
+                logger.info(f"로그 인덱스 재생성: {self.log_path.name}")
+                self._reset()
+                rebuilt = True
+
+            if size == self.indexed_size:
+                return False
+
+            self._index_range(self.indexed_size, size)
+            if len(self.head_signature) // 2 < HEAD_SIGNATURE_SIZE:
+                self.head_signature = self._read_head(min(self.indexed_size, HEAD_SIGNATURE_SIZE))
+            if rebuilt or time.monotonic() - self._last_saved >= SAVE_INTERVAL:
+                self._save()
+            return True
+
+    def _reset(self):
+        self.indexed_size = 0
+        self.head_signature = ""
+        self.buckets = []
+
+    def _read_head(self, size: int) -> str:
+        """파일 앞부분 바이트 (교체 감지용)"""
+        with open(self.log_path, 'rb') as f:
+            return f.read(size).hex()
+
+    def _index_range(self, start: int, size: int):
+        """start부터 size까지의 완성된 줄을 인덱싱 (마지막 미완성 줄은 다음 갱신으로 미룸)"""
+        with open(self.log_path, 'rb') as f:
+            f.seek(start)
+            position = start
+            for raw_line in f:
+                if not raw_line.endswith(b'\n') or position + len(raw_line) > size:
+                    break
+                self._index_line(raw_line, position)
+                position += len(raw_line)
+        self.indexed_size = position
+
+    def _index_line(self, raw_line: bytes, position: int):
+        """한 줄을 버킷 통계에 반영"""
+        end = position + len(raw_line)
+        if not raw_line.strip():
+            if self.buckets:
+                self.buckets[-1].end = end
+            return
+
+        match = _LINE_PATTERN.match(raw_line)
+        if match:
+            hour = match.group(1).decode('ascii')
+            logger_name = match.group(2).decode('utf-8', 'replace').strip()
+            level = match.group(3).decode('ascii', 'replace').upper()
+        else:
+            # 여러 줄 메시지(트레이스백 등)는 직전 버킷에 포함, 파서 기본값과 같이 INFO/unknown으로 집계
+            hour = self.buckets[-1].hour if self.buckets else ""
+            logger_name = "unknown"
+            level = "INFO"
+
+        bucket = self.buckets[-1] if self.buckets else None
+        if bucket is None or bucket.hour != hour:
+            bucket = LogBucket(hour=hour, start=position, end=position)
+            self.buckets.append(bucket)
+
+        bucket.end = end
+        bucket.lines += 1
+        bucket.levels[level] = bucket.levels.get(level, 0) + 1
+        bucket.loggers[logger_name] = bucket.loggers.get(logger_name, 0) + 1
+        if level in OFFSET_INDEXED_LEVELS:
+            bucket.marks.setdefault(level, []).append(position)
+
+    def _load(self):
+        """사이드카 인덱스 로드 (형식이 맞지 않으면 무시)"""
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != INDEX_VERSION:
+                return
+            self.indexed_size = data['indexed_size']
+            self.head_signature = data['head_signature']
+            self.buckets = [LogBucket(**bucket) for bucket in data['buckets']]
+        except Exception as e:
+            logger.warning(f"로그 인덱스 로드 실패, 재생성합니다: {e}")
+            self._reset()
+
+    def _save(self):
+        """사이드카 인덱스 원자적 저장"""
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.index_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': INDEX_VERSION,
+                    'log_file': self.log_path.name,
+                    'indexed_size': self.indexed_size,
+                    'head_signature': self.head_signature,
+                    'buckets': [asdict(bucket) for bucket in self.buckets]
+                }, f, separators=(',', ':'))
+            os.replace(temp_path, self.index_path)
+            self._last_saved = time.monotonic()
+        except Exception as e:
+            logger.warning(f"로그 인덱스 저장 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 역방향 읽기
+    # ------------------------------------------------------------------
+    def iter_lines_reverse(self, level: Optional[str] = None,
+                           start_time: Optional[datetime] = None,
+                           end_time: Optional[datetime] = None) -> Iterator[str]:
+        """
+        최신 줄부터 역순으로 반환 (인덱스로 해당 없는 버킷은 건너뜀)
+
+        Args:
+            level: 레벨 필터 (WARNING 이상은 오프셋 목록으로 직접 접근)
+            start_time: 시작 시간
+            end_time: 종료 시간
+        """
+        self.refresh()
+        level = level.upper() if level else None
+        with self._lock:
+            buckets = [
+                bucket for bucket in self.buckets
+                if bucket.overlaps(start_time, end_time) and (not level or bucket.levels.get(level))
+            ]
+
+        with open(self.log_path, 'rb') as f:
+            for bucket in reversed(buckets):
+                if level in OFFSET_INDEXED_LEVELS:
+                    for position in reversed(bucket.marks.get(level, [])):
+                        f.seek(position)
+                        yield f.readline().decode('utf-8', 'replace').rstrip('\r\n')
+                else:
+                    yield from _read_range_reverse(f, bucket.start, bucket.end)
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+    def buckets_since(self, cutoff: datetime) -> Tuple[List[LogBucket], List[LogBucket]]:
+        """
+        cutoff 이후 버킷 분류
+
+        Returns:
+            (전체가 범위 안인 버킷, cutoff가 걸쳐 있어 줄 단위 확인이 필요한 버킷)
+        """
+        self.refresh()
+        full, partial = [], []
+        with self._lock:
+            for bucket in self.buckets:
+                begin = bucket.hour_start
+                if begin is None:
+                    partial.append(bucket)
+                elif begin >= cutoff:
+                    full.append(bucket)
+                elif begin + timedelta(hours=1) > cutoff:
+                    partial.append(bucket)
+        return full, partial
+
+    def read_line_at(self, position: int) -> str:
+        """지정 오프셋의 한 줄 읽기"""
+        with open(self.log_path, 'rb') as f:
+            f.seek(position)
+            return f.readline().decode('utf-8', 'replace').rstrip('\r\n')
+
+    def read_bucket_lines(self, bucket: LogBucket) -> List[str]:
+        """버킷 범위의 줄을 정순으로 읽기"""
+        with open(self.log_path, 'rb') as f:
+            f.seek(bucket.start)
+            data = f.read(bucket.end - bucket.start)
+        return data.decode('utf-8', 'replace').splitlines()
+
+
+def _read_range_reverse(f, start: int, end: int) -> Iterator[str]:
+    """[start, end) 바이트 범위를 블록 단위로 뒤에서부터 읽어 줄 역순으로 반환"""
+    position = end
+    remainder = b''
+    while position > start:
+        read_size = min(READ_BLOCK_SIZE, position - start)
+        position -= read_size
+        f.seek(position)
+        block = f.read(read_size) + remainder
+        lines = block.split(b'\n')
+        # 첫 조각은 앞 블록과 이어질 수 있으므로 보류
+        remainder = lines[0] if position > start else b''
+        chunk = lines[1:] if position > start else lines
+        for raw_line in reversed(chunk):
+            if raw_line.strip():
+                yield raw_line.decode('utf-8', 'replace').rstrip('\r')
+    if remainder.strip():
+        yield remainder.decode('utf-8', 'replace').rstrip('\r')
+
+
+# 로그 파일별 인덱스 인스턴스
+_log_indexes: Dict[Path, LogFileIndex] = {}
+_log_indexes_lock = threading.Lock()
+
+
+def get_log_index(log_path: Path) -> LogFileIndex:
+    """로그 파일 인덱스 인스턴스 가져오기"""
+    key = Path(log_path).resolve()
+    with _log_indexes_lock:
+        if key not in _log_indexes:
+            _log_indexes[key] = LogFileIndex(Path(log_path))
+        return _log_indexes[key]
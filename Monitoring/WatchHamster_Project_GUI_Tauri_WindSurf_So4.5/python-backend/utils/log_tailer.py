@@ -0,0 +1,367 @@
+"""
+공유 로그 파일 테일러
+로그 파일마다 하나의 백그라운드 테일러가 새 줄을 읽어 모든 구독자에게 분배
+
+- Linux에서는 inotify로 변경 알림을 받고, 사용할 수 없으면 주기적 폴링으로 대체
+- 새 줄은 한 번만 파싱하고(JSON 직렬화도 한 번), 구독자별 제한 버퍼로 전달
+- 느린 구독자는 가장 오래된 항목부터 버려 다른 구독자와 테일러를 막지 않음
+- 구독자가 모두 떠나면 테일러 태스크 종료
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import re
+import struct
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_SUBSCRIBER_BUFFER = 1000
+
+# 기본 로그 포맷: 2024-01-01 12:00:00,123 - logger_name - LEVEL - message
+_LOG_LINE_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),(\d{3}) - ([^-]+) - (\w+) - (.+)')
+
+# inotify 상수 (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_EVENT_HEADER = struct.Struct("iIII")
+
+
+def parse_log_record(line: str) -> Optional[Dict[str, Any]]:
+    """
+    로그 라인을 LogEntry 필드 딕셔너리로 파싱
+
+    형식이 맞지 않는 줄은 현재 시각/INFO/unknown 기본값으로 반환하고, 빈 줄은 None
+    """
+    if not line.strip():
+        return None
+
+    match = _LOG_LINE_PATTERN.match(line)
+    if match:
+        return {
+            'timestamp': datetime.strptime(f"{match.group(1)}.{match.group(2)}", "%Y-%m-%d %H:%M:%S.%f"),
+            'level': match.group(4).strip(),
+            'logger_name': match.group(3).strip(),
+            'message': match.group(5).strip(),
+            'module': None,
+            'line_number': None,
+            'thread_id': None
+        }
+
+    return {
+        'timestamp': datetime.now(),
+        'level': "INFO",
+        'logger_name': "unknown",
+        'message': line,
+        'module': None,
+        'line_number': None,
+        'thread_id': None
+    }
+
+
+@dataclass
+class TailEvent:
+    """테일러가 읽은 한 줄 (모든 구독자가 같은 객체를 공유)"""
+    path: Path
+    line: str
+    entry: Dict[str, Any]
+    _json: Optional[str] = field(default=None, repr=False)
+
+    def to_json(self) -> str:
+        """LogEntry 형식 JSON (최초 요청 시 한 번만 직렬화)"""
+        if self._json is None:
+            self._json = json.dumps(self.entry, default=str)
+        return self._json
+
+
+class TailSubscription:
+    """구독자별 제한 버퍼 (가득 차면 가장 오래된 항목 폐기)"""
+
+    def __init__(self, maxsize: int = DEFAULT_SUBSCRIBER_BUFFER):
+        self.maxsize = maxsize
+        self._buffer: Deque[TailEvent] = deque()
+        self._event = asyncio.Event()
+        self._tailers: Set["LogTailer"] = set()
+        self.dropped = 0
+        self.delivered = 0
+        self.closed = False
+
+    def _push(self, event: TailEvent):
+        if len(self._buffer) >= self.maxsize:
+            self._buffer.popleft()
+            self.dropped += 1
+        self._buffer.append(event)
+        self._event.set()
+
+    async def get(self) -> TailEvent:
+        """다음 항목 대기"""
+        while not self._buffer:
+            self._event.clear()
+            await self._event.wait()
+        self.delivered += 1
+        return self._buffer.popleft()
+
+    def drain(self) -> List[TailEvent]:
+        """쌓인 항목을 모두 꺼냄 (대기하지 않음)"""
+        events = list(self._buffer)
+        self._buffer.clear()
+        self.delivered += len(events)
+        return events
+
+    def close(self):
+        """모든 테일러에서 구독 해제"""
+        if self.closed:
+            return
+        self.closed = True
+        for tailer in list(self._tailers):
+            tailer.unsubscribe(self)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+
+class _InotifyWatch:
+    """디렉토리 inotify 감시 (ctypes, Linux 전용)"""
+
+    def __init__(self, fd: int):
+        self.fd = fd
+
+    @classmethod
+    def create(cls, directory: Path) -> Optional["_InotifyWatch"]:
+        if not sys.platform.startswith("linux") or not directory.is_dir():
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_CREATE | _IN_DELETE | _IN_MOVED_FROM | _IN_MOVED_TO
+            if libc.inotify_add_watch(fd, str(directory).encode(), mask) < 0:
+                os.close(fd)
+                return None
+            return cls(fd)
+        except Exception as e:
+            logger.debug(f"inotify 사용 불가, 폴링으로 대체: {e}")
+            return None
+
+    def read_names(self) -> Set[str]:
+        """대기 중인 이벤트를 모두 읽어 변경된 파일명 집합 반환"""
+        names = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            except OSError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset + _IN_EVENT_HEADER.size <= len(data):
+                _, _, _, name_length = _IN_EVENT_HEADER.unpack_from(data, offset)
+                offset += _IN_EVENT_HEADER.size
+                names.add(data[offset:offset + name_length].rstrip(b"\0").decode("utf-8", "replace"))
+                offset += name_length
+        return names
+
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class LogTailer:
+    """단일 로그 파일 공유 테일러"""
+
+    def __init__(self, path: Path, poll_interval: float = DEFAULT_POLL_INTERVAL, use_inotify: bool = True):
+        """
+        Args:
+            path: 로그 파일 경로
+            poll_interval: 폴링 간격 (초, inotify 사용 시에는 안전망 주기의 기준)
+            use_inotify: inotify 사용 여부
+        """
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self._subscribers: Set[TailSubscription] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._position = 0
+        self._inode: Optional[int] = None
+        self._remainder = b""
+        self.mode = "stopped"
+        self.lines_read = 0
+
+    # ------------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------------
+    def subscribe(self, subscription: Optional[TailSubscription] = None,
+                  maxsize: int = DEFAULT_SUBSCRIBER_BUFFER) -> TailSubscription:
+        """구독 추가 (첫 구독 시 테일러 시작, 이벤트 루프 안에서 호출)"""
+        subscription = subscription or TailSubscription(maxsize)
+        self._subscribers.add(subscription)
+        subscription._tailers.add(self)
+        self._ensure_running()
+        return subscription
+
+    def unsubscribe(self, subscription: TailSubscription):
+        """구독 해제 (마지막 구독자면 테일러 종료)"""
+        self._subscribers.discard(subscription)
+        subscription._tailers.discard(self)
+        if not self._subscribers and self._task:
+            self._task.cancel()
+            self._task = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _ensure_running(self):
+        loop = asyncio.get_running_loop()
+        if self._task and not self._task.done() and self._task.get_loop() is loop:
+            return
+        # 현재 파일 끝에서 시작 (기존 내용은 보내지 않음)
+        self._seek_end()
+        self._task = loop.create_task(self._run())
+
+    def _seek_end(self):
+        try:
+            stat = self.path.stat()
+            self._position = stat.st_size
+            self._inode = stat.st_ino
+        except FileNotFoundError:
+            self._position = 0
+            self._inode = None
+        self._remainder = b""
+
+    # ------------------------------------------------------------------
+    # 테일링
+    # ------------------------------------------------------------------
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        watch = _InotifyWatch.create(self.path.parent) if self.use_inotify else None
+
+        if watch:
+            def on_readable():
+                if self.path.name in watch.read_names():
+                    self._wakeup.set()
+            loop.add_reader(watch.fd, on_readable)
+            self.mode = "inotify"
+            # inotify 누락 대비 안전망 주기
+            timeout = self.poll_interval * 10
+        else:
+            self.mode = "polling"
+            timeout = self.poll_interval
+
+        logger.info(f"로그 테일러 시작: {self.path} ({self.mode})")
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                self._read_new_lines()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if watch:
+                loop.remove_reader(watch.fd)
+                watch.close()
+            if self._task is None or self._task is asyncio.current_task():
+                self.mode = "stopped"
+            logger.info(f"로그 테일러 종료: {self.path}")
+
+    def _read_new_lines(self):
+        """추가된 내용을 읽어 완성된 줄만 분배 (잘림/교체 시 처음부터)"""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._position = 0
+            self._inode = None
+            self._remainder = b""
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._position:
+            # 로테이션으로 새 파일이 생겼거나 내용이 비워짐
+            self._inode = stat.st_ino
+            self._position = 0
+            self._remainder = b""
+
+        if stat.st_size == self._position:
+            return
+
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._position)
+                data = f.read(stat.st_size - self._position)
+        except OSError as e:
+            logger.warning(f"로그 파일 읽기 실패: {self.path} - {e}")
+            return
+
+        self._position += len(data)
+        data = self._remainder + data
+        lines = data.split(b"\n")
+        self._remainder = lines.pop()
+
+        for raw_line in lines:
+            line = raw_line.decode("utf-8", "replace").rstrip("\r")
+            entry = parse_log_record(line.strip())
+            if entry is None:
+                continue
+            self.lines_read += 1
+            event = TailEvent(path=self.path, line=line, entry=entry)
+            for subscription in self._subscribers:
+                subscription._push(event)
+
+    def get_status(self) -> Dict[str, Any]:
+        """테일러 상태"""
+        return {
+            'path': str(self.path),
+            'mode': self.mode,
+            'subscribers': len(self._subscribers),
+            'position': self._position,
+            'lines_read': self.lines_read,
+            'dropped': sum(subscription.dropped for subscription in self._subscribers)
+        }
+
+
+# 로그 파일별 테일러 인스턴스
+_log_tailers: Dict[Path, LogTailer] = {}
+
+
+def get_log_tailer(path: Path) -> LogTailer:
+    """로그 파일 테일러 인스턴스 가져오기"""
+    key = Path(path).resolve()
+    if key not in _log_tailers:
+        _log_tailers[key] = LogTailer(Path(path))
+    return _log_tailers[key]
+
+
+def subscribe_log_files(paths: Iterable[Path], maxsize: int = DEFAULT_SUBSCRIBER_BUFFER) -> TailSubscription:
+    """여러 로그 파일을 하나의 구독 버퍼로 구독"""
+    subscription = TailSubscription(maxsize)
+    for path in paths:
+        get_log_tailer(path).subscribe(subscription)
+    return subscription
+
+
+def get_tailer_status() -> List[Dict[str, Any]]:
+    """전체 테일러 상태"""
+    return [tailer.get_status() for tailer in _log_tailers.values()]
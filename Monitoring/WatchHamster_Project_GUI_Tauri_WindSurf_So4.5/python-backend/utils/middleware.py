@@ -2,8 +2,9 @@
 미들웨어 유틸리티
 """
 
+import math
 import time
-from typing import Callable
+from typing import Callable, Dict, Optional, Tuple
 from fastapi import Request, Response
 try:
     from fastapi.middleware.base import BaseHTTPMiddleware
@@ -12,6 +13,7 @@ except ImportError:
     from starlette.middleware.base import BaseHTTPMiddleware
 
 from .logger import get_logger
+from .rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
@@ -96,38 +98,36 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         return response
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """간단한 레이트 리미팅 미들웨어"""
+    """레이트 리미팅 미들웨어 (슬라이딩 윈도 카운터, 요청당 O(1))"""
     
-    def __init__(self, app, calls: int = 100, period: int = 60):
+    def __init__(self, app, calls: int = 100, period: int = 60,
+                 route_limits: Optional[Dict[str, Optional[Tuple[int, float]]]] = None,
+                 limiter: Optional[RateLimiter] = None):
         super().__init__(app)
-        self.calls = calls
-        self.period = period
-        self.clients = {}
+        self.limiter = limiter or RateLimiter(calls=calls, period=period, route_limits=route_limits)
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         client_ip = request.client.host if request.client else "unknown"
-        current_time = time.time()
+        decision = self.limiter.check(client_ip, request.url.path)
         
-        # 클라이언트별 요청 기록 관리
-        if client_ip not in self.clients:
-            self.clients[client_ip] = []
-        
-        # 오래된 요청 기록 제거
-        self.clients[client_ip] = [
-            req_time for req_time in self.clients[client_ip]
-            if current_time - req_time < self.period
-        ]
+        # 제한 없는 경로
+        if decision is None:
+            return await call_next(request)
         
         # 레이트 리미트 체크
-        if len(self.clients[client_ip]) >= self.calls:
-            logger.warning(f"레이트 리미트 초과: {client_ip}")
+        if not decision.allowed:
+            logger.warning(f"레이트 리미트 초과: {client_ip} {request.url.path}")
             return Response(
                 content="Too Many Requests",
                 status_code=429,
-                headers={"Retry-After": str(self.period)}
+                headers={
+                    "Retry-After": str(max(math.ceil(decision.retry_after), 1)),
+                    "X-RateLimit-Limit": str(decision.limit),
+                    "X-RateLimit-Remaining": "0"
+                }
             )
         
-        # 현재 요청 기록
-        self.clients[client_ip].append(current_time)
-        
-        return await call_next(request)
\ No newline at end of file
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(decision.limit)
+        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
+        return response
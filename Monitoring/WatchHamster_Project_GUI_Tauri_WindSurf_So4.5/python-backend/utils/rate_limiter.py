@@ -0,0 +1,395 @@
+"""
+슬라이딩 윈도 카운터 레이트 리미터
+요청마다 타임스탬프 목록을 다시 만들지 않고 키마다 (현재 윈도, 이전 윈도) 카운터 두 개로 근사 - 요청당 O(1)
+
+- 경로 접두사별 한도 (가장 긴 접두사 우선, None이면 제한 없음)
+- 일정 시간 요청이 없는 클라이언트는 주기적으로 제거
+- 백엔드: 프로세스 메모리(기본) 또는 공유 메모리(여러 uvicorn 워커가 한도 공유)
+- 허용/차단 카운터 제공
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .file_lock import InterProcessLock
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from multiprocessing import shared_memory
+    SHARED_MEMORY_AVAILABLE = True
+except ImportError:
+    SHARED_MEMORY_AVAILABLE = False
+
+DEFAULT_IDLE_TIMEOUT = 600.0   # 초
+DEFAULT_EVICT_INTERVAL = 60.0  # 초
+DEFAULT_SHARED_SLOTS = 4096
+SHARED_MEMORY_NAME = "watchhamster_ratelimit"
+
+
+@dataclass
+class RateLimitDecision:
+    """요청 한 건의 판정 결과"""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float = 0.0
+
+
+def _slide(window: int, current: int, previous: int, now_window: int) -> Tuple[int, int]:
+    """저장된 윈도를 현재 윈도 기준 (current, previous)로 이동"""
+    if window == now_window:
+        return current, previous
+    if window == now_window - 1:
+        return 0, current
+    return 0, 0
+
+
+def _evaluate(current: int, previous: int, calls: int, period: float, now: float) -> Tuple[bool, float, int]:
+    """
+    슬라이딩 윈도 추정치로 허용 여부 판단
+
+    Returns:
+        (허용 여부, 재시도 대기 초, 남은 요청 수)
+    """
+    elapsed = (now % period) / period
+    estimated = previous * (1.0 - elapsed) + current
+    if estimated + 1 <= calls:
+        return True, 0.0, max(int(calls - estimated - 1), 0)
+
+    if current + 1 > calls or previous == 0:
+        # 이번 윈도가 끝나야 다시 허용
+        retry_after = period * (1.0 - elapsed)
+    else:
+        # 이전 윈도 비중이 줄어들어 한 건이 들어갈 때까지
+        needed = 1.0 - (calls - current - 1) / previous
+        retry_after = max(needed - elapsed, 0.0) * period
+    return False, retry_after, 0
+
+
+class MemoryRateLimitBackend:
+    """프로세스 메모리 백엔드 (단일 워커)"""
+
+    def __init__(self):
+        # 키 → [윈도 번호, 현재 윈도 요청 수, 이전 윈도 요청 수, 마지막 요청 시각]
+        self._entries: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, calls: int, period: float, now: float) -> Tuple[bool, float, int]:
+        now_window = int(now // period)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                current, previous = 0, 0
+            else:
+                current, previous = _slide(entry[0], entry[1], entry[2], now_window)
+
+            allowed, retry_after, remaining = _evaluate(current, previous, calls, period, now)
+            if allowed:
+                current += 1
+            self._entries[key] = [now_window, current, previous, now]
+        return allowed, retry_after, remaining
+
+    def evict_idle(self, now: float, idle_timeout: float) -> int:
+        with self._lock:
+            idle = [key for key, entry in self._entries.items() if now - entry[3] > idle_timeout]
+            for key in idle:
+                del self._entries[key]
+        return len(idle)
+
+    def add_totals(self, allowed: int, throttled: int):
+        pass
+
+    def get_totals(self) -> Optional[Dict[str, int]]:
+        return None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self):
+        self._entries.clear()
+
+
+class SharedMemoryRateLimitBackend:
+    """
+    공유 메모리 백엔드 (여러 워커 프로세스가 같은 한도 사용)
+
+    고정 크기 해시 테이블(개방 주소법, 최대 MAX_PROBES칸 탐색)을 잠금 파일로 보호.
+    빈 칸이 없으면 요청을 허용(fail-open)하고 overflow로 집계
+    """
+
+    HEADER = struct.Struct("<QQQQ")   # allowed, throttled, overflow, 예약
+    SLOT = struct.Struct("<QqIId")    # 키 해시, 윈도 번호, 현재, 이전, 마지막 요청 시각
+    MAX_PROBES = 8
+
+    def __init__(self, name: str = SHARED_MEMORY_NAME, slots: int = DEFAULT_SHARED_SLOTS,
+                 lock_path: Optional[str] = None):
+        """
+        Args:
+            name: 공유 메모리 이름 (같은 이름을 쓰는 프로세스끼리 한도 공유)
+            slots: 해시 테이블 칸 수 (동시에 추적할 클라이언트×경로 수)
+            lock_path: 잠금 파일 경로 (기본: 임시 디렉터리)
+        """
+        if not SHARED_MEMORY_AVAILABLE:
+            raise RuntimeError("multiprocessing.shared_memory를 사용할 수 없습니다")
+
+        self.name = name
+        self.slots = slots
+        size = self.HEADER.size + self.SLOT.size * slots
+        self._lock = InterProcessLock(lock_path or os.path.join(tempfile.gettempdir(), f"{name}.lock"))
+
+        with self._lock:
+            try:
+                self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+                self.created = True
+            except FileExistsError:
+                self._shm = shared_memory.SharedMemory(name=name)
+                self.created = False
+        # 워커 하나가 종료될 때 resource_tracker가 다른 워커의 공유 메모리를 지우지 않도록 추적 해제
+        if os.name != "nt":
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+            except Exception:
+                pass
+
+        if self._shm.size < size:
+            self._shm.close()
+            raise ValueError(f"기존 공유 메모리 크기가 작습니다: {self._shm.size} < {size}")
+        self._buf = self._shm.buf
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        # 0은 빈 칸 표시이므로 최하위 비트를 켬
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") | 1
+
+    def _offset(self, index: int) -> int:
+        return self.HEADER.size + self.SLOT.size * index
+
+    def _find_slot(self, key_hash: int, now: float, period: float) -> Tuple[Optional[int], bool]:
+        """(칸 번호, 기존 키 여부) - 키가 없으면 비었거나 만료된 첫 칸"""
+        start = key_hash % self.slots
+        free = None
+        for probe in range(self.MAX_PROBES):
+            index = (start + probe) % self.slots
+            stored_hash, _, _, _, last_seen = self.SLOT.unpack_from(self._buf, self._offset(index))
+            if stored_hash == key_hash:
+                return index, True
+            if free is None and (stored_hash == 0 or now - last_seen > 2 * period):
+                free = index
+        return free, False
+
+    def _add_header(self, allowed: int = 0, throttled: int = 0, overflow: int = 0):
+        total_allowed, total_throttled, total_overflow, reserved = self.HEADER.unpack_from(self._buf, 0)
+        self.HEADER.pack_into(self._buf, 0, total_allowed + allowed, total_throttled + throttled,
+                              total_overflow + overflow, reserved)
+
+    def hit(self, key: str, calls: int, period: float, now: float) -> Tuple[bool, float, int]:
+        key_hash = self._hash(key)
+        now_window = int(now // period)
+        with self._lock:
+            index, existing = self._find_slot(key_hash, now, period)
+            if index is None:
+                self._add_header(overflow=1)
+                return True, 0.0, calls
+
+            if existing:
+                _, window, current, previous, _ = self.SLOT.unpack_from(self._buf, self._offset(index))
+                current, previous = _slide(window, current, previous, now_window)
+            else:
+                current, previous = 0, 0
+
+            allowed, retry_after, remaining = _evaluate(current, previous, calls, period, now)
+            if allowed:
+                current += 1
+            self.SLOT.pack_into(self._buf, self._offset(index), key_hash, now_window, current, previous, now)
+        return allowed, retry_after, remaining
+
+    def evict_idle(self, now: float, idle_timeout: float) -> int:
+        evicted = 0
+        empty = bytes(self.SLOT.size)
+        with self._lock:
+            for index in range(self.slots):
+                offset = self._offset(index)
+                stored_hash, _, _, _, last_seen = self.SLOT.unpack_from(self._buf, offset)
+                if stored_hash and now - last_seen > idle_timeout:
+                    self._buf[offset:offset + self.SLOT.size] = empty
+                    evicted += 1
+        return evicted
+
+    def add_totals(self, allowed: int, throttled: int):
+        with self._lock:
+            self._add_header(allowed=allowed, throttled=throttled)
+
+    def get_totals(self) -> Dict[str, int]:
+        """모든 워커 합계"""
+        total_allowed, total_throttled, total_overflow, _ = self.HEADER.unpack_from(self._buf, 0)
+        return {'allowed': total_allowed, 'throttled': total_throttled, 'overflow': total_overflow}
+
+    def __len__(self) -> int:
+        return sum(
+            1 for index in range(self.slots)
+            if self.SLOT.unpack_from(self._buf, self._offset(index))[0]
+        )
+
+    def close(self, unlink: bool = False):
+        """공유 메모리 매핑 해제 (unlink=True면 이름도 삭제)"""
+        self._buf = None
+        self._shm.close()
+        if unlink:
+            if os.name != "nt":
+                # 생성 시 해제한 추적을 다시 등록해야 unlink가 resource_tracker 경고 없이 끝남
+                from multiprocessing import resource_tracker
+                resource_tracker.register(self._shm._name, "shared_memory")
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._lock.close()
+
+
+class RateLimiter:
+    """경로별 한도를 적용하는 레이트 리미터"""
+
+    def __init__(self, calls: int = 100, period: float = 60,
+                 route_limits: Optional[Dict[str, Optional[Tuple[int, float]]]] = None,
+                 backend=None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 evict_interval: float = DEFAULT_EVICT_INTERVAL, totals_flush: int = 100):
+        """
+        Args:
+            calls: 기본 한도 (period 동안 허용할 요청 수)
+            period: 기본 윈도 길이 (초)
+            route_limits: 경로 접두사 → (calls, period), None이면 해당 경로는 제한 없음
+            backend: MemoryRateLimitBackend(기본) 또는 SharedMemoryRateLimitBackend
+            idle_timeout: 이 시간 동안 요청이 없는 클라이언트 상태 제거 (초)
+            evict_interval: 유휴 클라이언트 정리 주기 (초)
+            totals_flush: 공유 백엔드 합계 카운터에 반영하는 요청 단위
+        """
+        self.default_limit = (calls, period)
+        # 가장 긴 접두사가 먼저 일치하도록 정렬
+        self.route_limits = sorted((route_limits or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.backend = backend if backend is not None else MemoryRateLimitBackend()
+        self.idle_timeout = idle_timeout
+        self.evict_interval = evict_interval
+        self.totals_flush = totals_flush
+
+        self._next_eviction = time.time() + evict_interval
+        self._pending_totals = [0, 0]
+        self.allowed = 0
+        self.throttled = 0
+        self.evicted = 0
+        self.throttled_by_route: Dict[str, int] = {}
+
+    def _match(self, path: str) -> Tuple[str, Optional[Tuple[int, float]]]:
+        for prefix, limit in self.route_limits:
+            if path.startswith(prefix):
+                return prefix, limit
+        return "*", self.default_limit
+
+    def check(self, client: str, path: str, now: Optional[float] = None) -> Optional[RateLimitDecision]:
+        """
+        요청 한 건 판정 및 기록
+
+        Returns:
+            RateLimitDecision (제한 없는 경로면 None)
+        """
+        route, limit = self._match(path)
+        if limit is None:
+            return None
+
+        now = time.time() if now is None else now
+        if now >= self._next_eviction:
+            self.evict_idle(now)
+
+        calls, period = limit
+        allowed, retry_after, remaining = self.backend.hit(f"{client}|{route}", calls, period, now)
+        if allowed:
+            self.allowed += 1
+            self._pending_totals[0] += 1
+        else:
+            self.throttled += 1
+            self._pending_totals[1] += 1
+            self.throttled_by_route[route] = self.throttled_by_route.get(route, 0) + 1
+        if sum(self._pending_totals) >= self.totals_flush:
+            self.flush_totals()
+        return RateLimitDecision(allowed, calls, remaining, retry_after)
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """유휴 클라이언트 상태 제거"""
+        now = time.time() if now is None else now
+        self._next_eviction = now + self.evict_interval
+        evicted = self.backend.evict_idle(now, self.idle_timeout)
+        self.evicted += evicted
+        return evicted
+
+    def flush_totals(self):
+        """이 워커의 카운터를 공유 합계에 반영"""
+        allowed, throttled = self._pending_totals
+        self._pending_totals = [0, 0]
+        if allowed or throttled:
+            self.backend.add_totals(allowed, throttled)
+
+    def get_stats(self) -> Dict:
+        """허용/차단 카운터 (공유 백엔드면 전체 워커 합계 포함)"""
+        stats = {
+            'allowed': self.allowed,
+            'throttled': self.throttled,
+            'throttled_by_route': dict(self.throttled_by_route),
+            'tracked_clients': len(self.backend),
+            'evicted': self.evicted,
+            'backend': type(self.backend).__name__
+        }
+        self.flush_totals()
+        totals = self.backend.get_totals()
+        if totals is not None:
+            stats['all_workers'] = totals
+        return stats
+
+
+def parse_route_limits(spec: str) -> Dict[str, Optional[Tuple[int, float]]]:
+    """
+    "접두사=요청수/초" 목록 파싱 (쉼표 구분, 요청수 0은 제한 없음)
+
+    예: "/api/infomax=30/60,/health=0"
+    """
+    limits: Dict[str, Optional[Tuple[int, float]]] = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        prefix, _, value = item.strip().partition("=")
+        calls, _, period = value.partition("/")
+        limits[prefix.strip()] = None if int(calls) == 0 else (int(calls), float(period or 60))
+    return limits
+
+
+# 전역 레이트 리미터
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """설정 기반 레이트 리미터 반환 (싱글톤)"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        from .config import get_settings
+
+        settings = get_settings()
+        backend = None
+        if settings.rate_limit_backend == "shared":
+            try:
+                backend = SharedMemoryRateLimitBackend()
+            except Exception as e:
+                logger.warning(f"공유 메모리 레이트 리미터 초기화 실패, 프로세스 메모리 사용: {e}")
+        _rate_limiter = RateLimiter(
+            calls=settings.rate_limit_calls,
+            period=settings.rate_limit_period,
+            route_limits=parse_route_limits(settings.rate_limit_routes),
+            backend=backend
+        )
+    return _rate_limiter
@@ -0,0 +1,165 @@
+"""
+버전 관리되는 상태 채널 (스냅샷 + JSON Patch 델타)
+뉴스/시스템/서비스/Git 상태 문서를 변경될 때마다 전체 전송하지 않고 변경분만 전송
+
+- 상태가 바뀔 때마다 버전을 올리고 이전 버전 대비 JSON Patch(RFC 6902의 add/remove/replace)를 계산
+- 스냅샷/델타 메시지는 버전마다 한 번만 직렬화하고 같은 토픽의 모든 클라이언트가 공유
+- 최근 델타는 history 개수만큼 보관 (그보다 뒤처진 클라이언트는 스냅샷으로 재동기화)
+
+클라이언트 규칙:
+- 스냅샷 메시지({type, channel, version, snapshot: true, data})를 받으면 상태를 교체
+- state_patch 메시지의 base_version이 현재 버전과 같으면 ops를 적용하고 version으로 갱신
+- version이 현재 버전 이하이면 무시, base_version이 더 크면(누락) state_resync 요청
+- 적용한 버전은 state_ack로 알림
+"""
+
+import json
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+DEFAULT_HISTORY = 32
+PATCH_MESSAGE_TYPE = "state_patch"
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    두 JSON 문서의 차이를 JSON Patch 연산 목록으로 계산
+
+    객체는 키 단위로 재귀 비교하고 리스트/스칼라는 값이 다르면 통째로 replace
+    """
+    if old == new:
+        return []
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    ops = []
+    for key in old:
+        if key not in new:
+            ops.append({"op": "remove", "path": f"{path}/{_escape(str(key))}"})
+    for key, value in new.items():
+        child = f"{path}/{_escape(str(key))}"
+        if key not in old:
+            ops.append({"op": "add", "path": child, "value": value})
+        else:
+            ops.extend(make_patch(old[key], value, child))
+    return ops
+
+
+def apply_patch(document: Any, ops: List[Dict[str, Any]]) -> Any:
+    """JSON Patch 연산 적용 (make_patch가 만드는 add/remove/replace만 지원, 원본은 변경하지 않음)"""
+    document = json.loads(json.dumps(document))
+    for op in ops:
+        if op["path"] == "":
+            if op["op"] == "remove":
+                raise ValueError("문서 루트는 삭제할 수 없습니다")
+            document = op["value"]
+            continue
+
+        *parents, last = [_unescape(token) for token in op["path"].split("/")[1:]]
+        target = document
+        for token in parents:
+            target = target[token]
+
+        if op["op"] == "remove":
+            del target[last]
+        elif op["op"] in ("add", "replace"):
+            target[last] = op["value"]
+        else:
+            raise ValueError(f"지원하지 않는 연산입니다: {op['op']}")
+    return document
+
+
+class StateChannel:
+    """버전 관리되는 상태 문서 하나 (예: 시스템 메트릭)"""
+
+    def __init__(self, name: str, message_type: str, history: int = DEFAULT_HISTORY):
+        """
+        Args:
+            name: 채널 이름 (state_patch 메시지의 channel)
+            message_type: 스냅샷 메시지 타입 (기존 *_update 메시지와 호환)
+            history: 보관할 최근 델타 수
+        """
+        self.name = name
+        self.message_type = message_type
+        self.history = history
+        self.version = 0
+        self.state: Any = None
+
+        self._snapshot_message: Optional[str] = None
+        # 버전 → 직전 버전 대비 델타 메시지 (스냅샷보다 크면 None)
+        self._deltas: "OrderedDict[int, Optional[str]]" = OrderedDict()
+
+        self.updates = 0
+        self.unchanged = 0
+
+    def update(self, data: Any) -> bool:
+        """
+        새 상태 반영
+
+        Returns:
+            bool: 상태가 바뀌어 버전이 올라갔는지
+        """
+        document = json.loads(json.dumps(data, default=str, ensure_ascii=False))
+        if self.version and document == self.state:
+            self.unchanged += 1
+            return False
+
+        previous = self.state
+        self.state = document
+        self.version += 1
+        self.updates += 1
+        self._snapshot_message = None
+
+        if self.version > 1:
+            delta = self._serialize({
+                "type": PATCH_MESSAGE_TYPE,
+                "channel": self.name,
+                "base_version": self.version - 1,
+                "version": self.version,
+                "ops": make_patch(previous, document),
+                "timestamp": datetime.now().isoformat()
+            })
+            # 델타가 스냅샷보다 크면 스냅샷 전송이 이득
+            self._deltas[self.version] = delta if len(delta) < len(self.snapshot_message()) else None
+            while len(self._deltas) > self.history:
+                self._deltas.popitem(last=False)
+        return True
+
+    def snapshot_message(self) -> str:
+        """현재 버전의 스냅샷 메시지 (버전마다 한 번만 직렬화)"""
+        if self._snapshot_message is None:
+            self._snapshot_message = self._serialize({
+                "type": self.message_type,
+                "channel": self.name,
+                "version": self.version,
+                "snapshot": True,
+                "data": self.state,
+                "timestamp": datetime.now().isoformat()
+            })
+        return self._snapshot_message
+
+    def delta_message(self, version: int) -> Optional[str]:
+        """version-1 → version 델타 메시지 (보관 범위를 벗어났거나 스냅샷이 나으면 None)"""
+        return self._deltas.get(version)
+
+    def get_stats(self) -> Dict[str, int]:
+        """채널 통계"""
+        return {
+            'version': self.version,
+            'updates': self.updates,
+            'unchanged': self.unchanged,
+            'retained_deltas': len(self._deltas)
+        }
+
+    @staticmethod
+    def _serialize(payload: Dict[str, Any]) -> str:
+        return json.dumps(payload, default=str, ensure_ascii=False)
@@ -0,0 +1,166 @@
+"""
+WebSocket 클라이언트별 송신 큐
+브로드캐스트는 큐에 넣기만 하고 클라이언트마다 백그라운드 송신 태스크가 전송
+(송신 태스크는 메시지가 들어오면 시작되고 큐가 비면 종료되어 유휴 태스크가 남지 않음)
+
+- 우선순위별 큐: 알림/개인 응답이 메트릭보다 먼저 전송
+- 상태 메시지(메트릭, 뉴스 상태 등)는 coalesce 키로 합쳐 아직 보내지 않은 이전 값은 버림
+- 대기 메시지가 한도를 넘으면 낮은 우선순위의 오래된 메시지부터 버림
+- 전송이 제한 시간을 넘기거나 실패하면 해당 클라이언트만 연결 해제 콜백 호출
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (작을수록 먼저 전송)
+PRIORITY_URGENT = 0   # 개인 응답, 시스템 알림
+PRIORITY_HIGH = 1     # 서비스 이벤트, 뉴스
+PRIORITY_NORMAL = 2   # Git, 웹훅 이벤트, 로그
+PRIORITY_LOW = 3      # 시스템 메트릭
+PRIORITY_LEVELS = 4
+
+DEFAULT_MAX_PENDING = 256
+DEFAULT_SEND_TIMEOUT = 10.0  # 초
+
+# (메시지, coalesce 키)
+_Item = Tuple[str, Optional[str]]
+
+
+class ClientSendQueue:
+    """클라이언트 한 명의 우선순위 송신 큐 + 송신 태스크"""
+
+    def __init__(self, send: Callable[[str], Any], on_failure: Callable[[], Any],
+                 name: str = "client", max_pending: int = DEFAULT_MAX_PENDING,
+                 send_timeout: float = DEFAULT_SEND_TIMEOUT):
+        """
+        Args:
+            send: 메시지 전송 코루틴 함수 (예: websocket.send_text)
+            on_failure: 전송 실패/시간 초과 시 호출 (연결 해제 처리)
+            name: 로그용 클라이언트 이름
+            max_pending: 최대 대기 메시지 수
+            send_timeout: 메시지 하나의 전송 제한 시간 (초)
+        """
+        self._send = send
+        self._on_failure = on_failure
+        self.name = name
+        self.max_pending = max_pending
+        self.send_timeout = send_timeout
+
+        self._queues: List[Deque[_Item]] = [deque() for _ in range(PRIORITY_LEVELS)]
+        # coalesce 키 → 대기 중인 최신 메시지 (큐에는 키만 남아 있고 전송 시 최신 값 사용)
+        self._latest: Dict[str, str] = {}
+        self._pending = 0
+        self._started = False
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def start(self):
+        """송신 시작 (이후 put() 시 송신 태스크를 필요할 때마다 실행)"""
+        self._started = True
+        self._wake()
+
+    def _wake(self):
+        if not self._started or self._closed or not self._pending:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._writer())
+
+    def close(self):
+        """송신 태스크 종료 (대기 메시지 폐기)"""
+        self._closed = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        for queue in self._queues:
+            queue.clear()
+        self._latest.clear()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def put(self, message: str, priority: int = PRIORITY_NORMAL, coalesce_key: Optional[str] = None) -> bool:
+        """
+        메시지 추가 (대기하지 않음)
+
+        Returns:
+            bool: 새로 대기열에 추가되었는지 (이전 상태 메시지를 대체한 경우 False)
+        """
+        if self._closed:
+            return False
+
+        if coalesce_key is not None:
+            if coalesce_key in self._latest:
+                self._latest[coalesce_key] = message
+                self.coalesced += 1
+                return False
+            self._latest[coalesce_key] = message
+
+        priority = min(max(priority, 0), PRIORITY_LEVELS - 1)
+        self._queues[priority].append((message, coalesce_key))
+        self._pending += 1
+        if self._pending > self.max_pending:
+            self._drop_oldest()
+        self._wake()
+        return True
+
+    def _drop_oldest(self):
+        # 가장 낮은 우선순위의 가장 오래된 메시지부터 폐기
+        for queue in reversed(self._queues):
+            if queue:
+                _, coalesce_key = queue.popleft()
+                if coalesce_key is not None:
+                    self._latest.pop(coalesce_key, None)
+                self._pending -= 1
+                self.dropped += 1
+                return
+
+    def _pop(self) -> Optional[str]:
+        for queue in self._queues:
+            if queue:
+                message, coalesce_key = queue.popleft()
+                self._pending -= 1
+                if coalesce_key is not None:
+                    message = self._latest.pop(coalesce_key, message)
+                return message
+        return None
+
+    async def _writer(self):
+        try:
+            while not self._closed:
+                message = self._pop()
+                if message is None:
+                    return
+
+                try:
+                    await asyncio.wait_for(self._send(message), self.send_timeout)
+                    self.sent += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    reason = "시간 초과" if isinstance(e, asyncio.TimeoutError) else str(e)
+                    logger.warning(f"WebSocket 전송 실패 ({self.name}): {reason}")
+                    self._closed = True
+                    result = self._on_failure()
+                    if asyncio.iscoroutine(result):
+                        await result
+                    return
+        except asyncio.CancelledError:
+            pass
+
+    def get_stats(self) -> Dict[str, int]:
+        """송신 통계"""
+        return {
+            'pending': self._pending,
+            'sent': self.sent,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped
+        }